@@ -1,11 +1,47 @@
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from src.aplicacion.dtos.cliente_dto import ClienteDto
 from src.dominio.entities.cliente import Cliente
 
 
 class ClienteMapper:
+    # Campos expuestos por la API, en el orden de dto_to_json; son también las columnas de ClienteModel
+    CAMPOS = ("id", "nombre", "email", "telefono", "direccion", "razon_social", "nit")
+
+    @staticmethod
+    def parsear_campos(fields: Optional[str]) -> Tuple[str, ...]:
+        """
+        Convierte el parámetro `fields` ("id,nombre,nit") en los campos a devolver.
+
+        Sin `fields` se devuelven todos. Los campos quedan en el orden de CAMPOS y sin repetir.
+
+        Raises:
+            ValueError: Si se pide un campo que la API no expone
+        """
+        pedidos = {campo.strip() for campo in (fields or "").split(",") if campo.strip()}
+        if not pedidos:
+            return ClienteMapper.CAMPOS
+        desconocidos = sorted(pedidos.difference(ClienteMapper.CAMPOS))
+        if desconocidos:
+            raise ValueError(
+                f"Campos desconocidos en fields: {', '.join(desconocidos)}. "
+                f"Campos disponibles: {', '.join(ClienteMapper.CAMPOS)}"
+            )
+        return tuple(campo for campo in ClienteMapper.CAMPOS if campo in pedidos)
+
+    @staticmethod
+    def proyectar(cliente_json: Dict[str, Any], campos: Sequence[str]) -> Dict[str, Any]:
+        """Deja en el JSON de un cliente solo los `campos` pedidos."""
+        if len(campos) == len(ClienteMapper.CAMPOS):
+            return cliente_json
+        return {campo: cliente_json[campo] for campo in campos}
+
+    @staticmethod
+    def filas_to_json(campos: Sequence[str], filas: Iterable[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """Convierte filas de columnas (obtener_filas) a JSON, sin pasar por entidades ni DTOs."""
+        return [dict(zip(campos, fila)) for fila in filas]
+
     @staticmethod
     def json_to_dto(cliente: Dict[str, Any]) -> ClienteDto:
         # Generar ID si no se proporciona
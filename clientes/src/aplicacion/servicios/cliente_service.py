@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.dominio.entities.cliente import Cliente
 from src.dominio.repositorios.cliente_repository import ClienteRepository
@@ -15,6 +15,10 @@ class ClienteService:
         clientes = self.cliente_repository.obtener_todos()
         return [c for c in clientes]
 
+    def obtener_filas_clientes(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los clientes."""
+        return self.cliente_repository.obtener_filas(columnas)
+
     def obtener_cliente_por_id(self, cliente_id: str) -> Optional[Cliente]:
         """Obtiene un cliente por su ID."""
         return self.cliente_repository.obtener_por_id(cliente_id)
@@ -35,3 +39,7 @@ class ClienteService:
     def crear_cliente(self, cliente: Cliente) -> Cliente:
         """Crea un nuevo cliente."""
         return self.cliente_repository.crear(cliente)
+
+    def obtener_version_clientes(self) -> int:
+        """Obtiene la versión actual de la tabla de clientes."""
+        return self.cliente_repository.version()
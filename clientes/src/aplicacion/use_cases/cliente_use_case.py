@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.aplicacion.servicios.cliente_service import ClienteService
 from src.dominio.entities.cliente import Cliente
@@ -14,6 +14,10 @@ class ClienteUseCase:
         """Obtiene todos los clientes."""
         return self.cliente_service.obtener_todos_los_clientes()
 
+    def obtener_filas_clientes(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los clientes."""
+        return self.cliente_service.obtener_filas_clientes(columnas)
+
     def obtener_cliente_por_id(self, cliente_id: str) -> Optional[Cliente]:
         """Obtiene un cliente por su ID."""
         return self.cliente_service.obtener_cliente_por_id(cliente_id)
@@ -29,3 +33,7 @@ class ClienteUseCase:
     def crear_cliente(self, cliente: Cliente) -> Cliente:
         """Crea un nuevo cliente."""
         return self.cliente_service.crear_cliente(cliente)
+
+    def obtener_version_clientes(self) -> int:
+        """Obtiene la versión actual de la tabla de clientes."""
+        return self.cliente_service.obtener_version_clientes()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.dominio.entities.cliente import Cliente
 
@@ -12,6 +12,11 @@ class ClienteRepository(ABC):
         """Obtiene todos los clientes."""
         pass
 
+    @abstractmethod
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los clientes, como tuplas."""
+        pass
+
     @abstractmethod
     def obtener_por_id(self, cliente_id: str) -> Optional[Cliente]:
         """Obtiene un cliente por su ID."""
@@ -31,3 +36,8 @@ class ClienteRepository(ABC):
     def crear(self, cliente: Cliente) -> Cliente:
         """Crea un nuevo cliente."""
         pass
+
+    @abstractmethod
+    def version(self) -> int:
+        """Número que cambia con cada creación, actualización o eliminación de clientes."""
+        pass
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from flask import jsonify
 from src.aplicacion.mappers.cliente_mapper import ClienteMapper
@@ -12,18 +12,26 @@ class ClienteCmd:
     def __init__(self, cliente_use_case: ClienteUseCase):
         self.cliente_use_case = cliente_use_case
 
-    def obtener_todos_los_clientes(self):
-        """Obtiene todos los clientes."""
+    def obtener_todos_los_clientes(self, campos: Optional[Sequence[str]] = None):
+        """
+        Obtiene todos los clientes.
+
+        Con `campos` solo se leen esas columnas de la base de datos, sin construir entidades.
+        """
         try:
-            clientes = self.cliente_use_case.obtener_todos_los_clientes()
-            clientes_dto = [ClienteMapper.entity_to_dto(c) for c in clientes]
-            clientes_json = [ClienteMapper.dto_to_json(c) for c in clientes_dto]
+            if campos is None:
+                clientes = self.cliente_use_case.obtener_todos_los_clientes()
+                clientes_dto = [ClienteMapper.entity_to_dto(c) for c in clientes]
+                clientes_json = [ClienteMapper.dto_to_json(c) for c in clientes_dto]
+            else:
+                filas = self.cliente_use_case.obtener_filas_clientes(campos)
+                clientes_json = ClienteMapper.filas_to_json(campos, filas)
 
             return jsonify(clientes_json), 200
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
-    def obtener_cliente_por_id(self, cliente_id: str):
+    def obtener_cliente_por_id(self, cliente_id: str, campos: Optional[Sequence[str]] = None):
         """Obtiene un producto por su ID."""
         try:
             cliente = self.cliente_use_case.obtener_cliente_por_id(cliente_id)
@@ -32,17 +40,21 @@ class ClienteCmd:
 
             cliente_dto = ClienteMapper.entity_to_dto(cliente)
             cliente_json = ClienteMapper.dto_to_json(cliente_dto)
+            if campos is not None:
+                cliente_json = ClienteMapper.proyectar(cliente_json, campos)
 
             return jsonify(cliente_json), 200
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
-    def obtener_clientes_por_categoria(self, categoria: str):
+    def obtener_clientes_por_categoria(self, categoria: str, campos: Optional[Sequence[str]] = None):
         """Obtiene clientes por categoría."""
         try:
             clientes = self.cliente_use_case.obtener_clientes_por_categoria(categoria)
             clientes_dto = [ClienteMapper.entity_to_dto(c) for c in clientes]
             clientes_json = [ClienteMapper.dto_to_json(c) for c in clientes_dto]
+            if campos is not None:
+                clientes_json = [ClienteMapper.proyectar(c, campos) for c in clientes_json]
 
             return (
                 jsonify(clientes_json),
@@ -51,17 +63,26 @@ class ClienteCmd:
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
-    def buscar_clientes_por_nombre(self, nombre: str):
+    def buscar_clientes_por_nombre(self, nombre: str, campos: Optional[Sequence[str]] = None):
         """Busca clientes por nombre."""
         try:
             clientes = self.cliente_use_case.buscar_clientes_por_nombre(nombre)
             clientes_dto = [ClienteMapper.entity_to_dto(c) for c in clientes]
             clientes_json = [ClienteMapper.dto_to_json(c) for c in clientes_dto]
+            if campos is not None:
+                clientes_json = [ClienteMapper.proyectar(c, campos) for c in clientes_json]
 
             return jsonify(clientes_json), 200
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    def version_clientes(self) -> Optional[int]:
+        """Versión actual de los clientes para los ETag; None si no se pudo consultar."""
+        try:
+            return self.cliente_use_case.obtener_version_clientes()
+        except Exception:
+            return None
+
     def crear_cliente(self, cliente_data: dict):
         """Crea un nuevo cliente."""
         try:
@@ -1,8 +1,117 @@
-from flask import Flask
+import functools
+import inspect
+import random
+import time
+from contextlib import contextmanager
+
+from flask import Flask, current_app
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.dml import UpdateBase
+from src.infraestructura.config.motor import PREFIJO_REPLICA
+from src.infraestructura.config.sqlite import configurar_sqlite
+
+# Claves de session.info: la sesión está dentro de un método @solo_lectura / ya escribió
+_LECTURA = "solo_lectura"
+_ESCRIBIO = "escribio"
+
+# Momento (time.monotonic) del último commit con escrituras en este proceso
+_ultima_escritura = float("-inf")
+
+
+class SesionConReplicas(Session):
+    """
+    Sesión que envía a una réplica de lectura las consultas de los métodos marcados con @solo_lectura.
+
+    Todo lo demás va a la base primaria: escrituras, flush y lecturas sin marcar. Para leer
+    las escrituras propias aunque la réplica vaya atrasada, una sesión que ya escribió lee
+    siempre de la primaria, y todo el proceso lo hace durante REPLICAS_VENTANA_SEGUNDOS
+    después de cada commit con escrituras. Sin réplicas configuradas se comporta como la
+    sesión de Flask-SQLAlchemy.
+
+    La ventana es de cada proceso: si la siguiente petición del cliente la atiende otro
+    worker, puede leer de una réplica que todavía no tiene su escritura. Las lecturas que
+    deben ver el dato recién escrito van sin @solo_lectura. Las escrituras de Core sobre
+    session.connection() no pasan por los eventos del ORM y se marcan con marcar_escritura.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.info.get(_LECTURA) and not self._flushing and not isinstance(clause, UpdateBase):
+            replica = self._elegir_replica()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _elegir_replica(self):
+        if self.info.get(_ESCRIBIO):
+            return None
+        if time.monotonic() - _ultima_escritura < current_app.config.get("REPLICAS_VENTANA_SEGUNDOS", 0):
+            return None
+        replicas = [engine for clave, engine in self._db.engines.items() if clave and clave.startswith(PREFIJO_REPLICA)]
+        return random.choice(replicas) if replicas else None
+
+
+@event.listens_for(SesionConReplicas, "after_flush")
+def _marcar_escritura_orm(session, _contexto_flush):
+    session.info[_ESCRIBIO] = True
+
+
+@event.listens_for(SesionConReplicas, "do_orm_execute")
+def _marcar_escritura_dml(estado):
+    if estado.is_insert or estado.is_update or estado.is_delete:
+        estado.session.info[_ESCRIBIO] = True
+
+
+def marcar_escritura(session) -> None:
+    """Marca que la sesión escribió con Core sobre session.connection(), que los eventos del ORM no ven."""
+    session.info[_ESCRIBIO] = True
+
+
+@event.listens_for(SesionConReplicas, "after_commit")
+def _registrar_escritura(session):
+    global _ultima_escritura
+    if session.info.get(_ESCRIBIO):
+        _ultima_escritura = time.monotonic()
+
+
+db_clientes = SQLAlchemy(session_options={"class_": SesionConReplicas})
+
+
+def solo_lectura(metodo):
+    """
+    Marca un método de repositorio de solo lectura: sus consultas pueden ir a una réplica.
+
+    En los generadores la marca dura mientras se consumen las filas.
+    """
+    if inspect.isgeneratorfunction(metodo):
+
+        @functools.wraps(metodo)
+        def generador(*args, **kwargs):
+            with _en_lectura():
+                yield from metodo(*args, **kwargs)
+
+        return generador
+
+    @functools.wraps(metodo)
+    def envoltura(*args, **kwargs):
+        with _en_lectura():
+            return metodo(*args, **kwargs)
+
+    return envoltura
+
 
-db_clientes = SQLAlchemy()
+@contextmanager
+def _en_lectura():
+    info = db_clientes.session.info
+    anterior = info.get(_LECTURA, False)
+    info[_LECTURA] = True
+    try:
+        yield
+    finally:
+        info[_LECTURA] = anterior
 
 
 def init_db_clientes(app: Flask):
     db_clientes.init_app(app)
+    configurar_sqlite(app, db_clientes)
@@ -0,0 +1,162 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from flask import Flask, g, request
+
+# Atributos propios de LogRecord; el resto son campos agregados con extra={...}
+_ATRIBUTOS_LOG_RECORD = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class FormateadorJson(logging.Formatter):
+    """Un objeto JSON por línea: fecha UTC, nivel, logger, mensaje y los campos pasados en `extra`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        datos = {
+            "fecha": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "mensaje": record.getMessage(),
+        }
+        datos.update((clave, valor) for clave, valor in vars(record).items() if clave not in _ATRIBUTOS_LOG_RECORD)
+        if record.exc_info:
+            datos["excepcion"] = self.formatException(record.exc_info)
+        return json.dumps(datos, ensure_ascii=False, default=str)
+
+
+class _ManejadorCola(QueueHandler):
+    """QueueHandler que descarta el registro si la cola está llena en lugar de bloquear la petición."""
+
+    def __init__(self, cola: queue.Queue):
+        super().__init__(cola)
+        self.descartados = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+# Manejadores de cola activos y el listener que vacía cada cola en un hilo aparte
+_oyentes: List[Tuple[_ManejadorCola, QueueListener]] = []
+
+
+def configurar_registro_asincrono(logger: logging.Logger, nivel: int, cola_maxima: Optional[int] = None) -> None:
+    """
+    Hace que `logger` escriba en stderr, como JSON, desde un hilo aparte.
+
+    El hilo de la petición solo encola el registro. Si la cola tiene REGISTRO_COLA_MAXIMA
+    registros (default 10000) porque stderr no da abasto, los nuevos se descartan. Llamarla
+    otra vez sobre el mismo logger solo actualiza el nivel.
+    """
+    logger.setLevel(nivel)
+    if any(isinstance(manejador, _ManejadorCola) for manejador in logger.handlers):
+        return
+
+    cola_maxima = cola_maxima or int(os.environ.get("REGISTRO_COLA_MAXIMA", 10000))
+    salida = logging.StreamHandler(sys.stderr)
+    salida.setFormatter(FormateadorJson())
+    manejador = _ManejadorCola(queue.Queue(cola_maxima))
+    oyente = QueueListener(manejador.queue, salida)
+    oyente.start()
+    _oyentes.append((manejador, oyente))
+
+    logger.addHandler(manejador)
+    logger.propagate = False
+
+
+def _reiniciar_oyentes_tras_fork() -> None:
+    # El hilo del listener no sobrevive al fork (gunicorn con preload): cada proceso hijo usa una cola nueva
+    for indice, (manejador, oyente) in enumerate(_oyentes):
+        manejador.queue = queue.Queue(manejador.queue.maxsize)
+        nuevo = QueueListener(manejador.queue, *oyente.handlers)
+        nuevo.start()
+        _oyentes[indice] = (manejador, nuevo)
+
+
+def _detener_oyentes() -> None:
+    # Escribe lo que quede en las colas antes de terminar el proceso
+    for _, oyente in _oyentes:
+        if oyente._thread is not None:
+            oyente.stop()
+
+
+os.register_at_fork(after_in_child=_reiniciar_oyentes_tras_fork)
+atexit.register(_detener_oyentes)
+
+
+def leer_muestreo(valor: str) -> Dict[str, float]:
+    """
+    Interpreta REGISTRO_ACCESOS_MUESTREO: pares ruta:fracción separados por comas.
+
+    Por ejemplo "/health:0,/productos:0.1" no registra los health checks y registra una
+    de cada diez peticiones bajo /productos.
+    """
+    muestreo = {}
+    for par in valor.split(","):
+        if not par.strip():
+            continue
+        ruta, separador, fraccion = par.strip().rpartition(":")
+        try:
+            tasa = float(fraccion)
+        except ValueError:
+            tasa = -1.0
+        if not separador or not ruta.startswith("/") or not 0 <= tasa <= 1:
+            raise ValueError(f"REGISTRO_ACCESOS_MUESTREO inválido: '{par.strip()}' (se espera /ruta:fracción entre 0 y 1)")
+        muestreo[ruta] = tasa
+    return muestreo
+
+
+def _tasa_muestreo(muestreo: Mapping[str, float], ruta: str) -> float:
+    # Gana el prefijo más largo que coincide con la ruta
+    prefijos = [prefijo for prefijo in muestreo if ruta.startswith(prefijo)]
+    return muestreo[max(prefijos, key=len)] if prefijos else 1.0
+
+
+def registrar_accesos(app: Flask, muestreo: Mapping[str, float]) -> None:
+    """
+    Registra una línea por petición en el logger "request_logger": método, ruta, estado,
+    duración y tamaño de la respuesta.
+
+    El tamaño es el Content-Length (null en las respuestas en streaming, que no se leen para
+    medirlas). Las rutas de `muestreo` se registran solo en esa fracción de las peticiones;
+    las respuestas de error (>= 400) se registran siempre.
+    """
+    logger = logging.getLogger("request_logger")
+
+    @app.before_request
+    def iniciar_registro_acceso():
+        g.inicio_peticion = time.perf_counter()
+        if app.config.get("DEBUG") and logger.isEnabledFor(logging.DEBUG):
+            cabeceras = {nombre: valor for nombre, valor in request.headers if nombre.lower() != "authorization"}
+            logger.debug("cabeceras", extra={"cabeceras": cabeceras})
+
+    @app.after_request
+    def registrar_acceso(response):
+        inicio = g.pop("inicio_peticion", None)
+        if not logger.isEnabledFor(logging.INFO):
+            return response
+        tasa = _tasa_muestreo(muestreo, request.path)
+        if response.status_code < 400 and tasa < 1 and random.random() >= tasa:
+            return response
+
+        campos = {
+            "metodo": request.method,
+            "ruta": request.path,
+            "estado": response.status_code,
+            "duracion_ms": round((time.perf_counter() - inicio) * 1000, 1) if inicio is not None else None,
+            "bytes": response.content_length,
+        }
+        if tasa < 1:
+            campos["muestreo"] = tasa
+        logger.info(f"{request.method} {request.path} {response.status_code}", extra=campos)
+        return response
@@ -0,0 +1,91 @@
+import logging
+import os
+from typing import Dict, Iterable, Mapping
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Pragma -> (variable de entorno, valor por defecto, valores permitidos; None si es un entero).
+# busy_timeout va primero para que el cambio a WAL ya espere si otra conexión tiene la base
+# bloqueada; en synchronous y temp_store la posición de cada valor es el número con que SQLite
+# lo devuelve al leerlo.
+_PRAGMAS = {
+    "busy_timeout": ("SQLITE_BUSY_TIMEOUT_MS", "5000", None),
+    "journal_mode": ("SQLITE_JOURNAL_MODE", "WAL", ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")),
+    "synchronous": ("SQLITE_SYNCHRONOUS", "NORMAL", ("OFF", "NORMAL", "FULL", "EXTRA")),
+    # Negativo: tamaño en KiB (64 MiB por conexión) en lugar de páginas
+    "cache_size": ("SQLITE_CACHE_SIZE", "-65536", None),
+    "mmap_size": ("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024), None),
+    "temp_store": ("SQLITE_TEMP_STORE", "MEMORY", ("DEFAULT", "FILE", "MEMORY")),
+}
+_PRAGMAS_NUMERADOS = ("synchronous", "temp_store")
+
+
+def pragmas_sqlite(entorno: Mapping[str, str] = os.environ) -> Dict[str, str]:
+    """Pragmas por conexión con sus valores por defecto, sobrescribibles por variable de entorno."""
+    pragmas = {}
+    for pragma, (variable, defecto, permitidos) in _PRAGMAS.items():
+        valor = entorno.get(variable, defecto).strip().upper()
+        if permitidos is None:
+            try:
+                valor = str(int(valor))
+            except ValueError:
+                raise ValueError(f"{variable} debe ser un entero") from None
+        elif valor not in permitidos:
+            raise ValueError(f"{variable} debe ser uno de: {', '.join(permitidos)}")
+        pragmas[pragma] = valor
+    return pragmas
+
+
+def registrar_pragmas_sqlite(engine: Engine, pragmas: Mapping[str, str]) -> None:
+    """Ejecuta los pragmas en cada conexión nueva que abre el pool del motor."""
+
+    @event.listens_for(engine, "connect")
+    def aplicar_pragmas(conexion_dbapi, _registro):
+        cursor = conexion_dbapi.cursor()
+        try:
+            for pragma, valor in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma} = {valor}")
+        finally:
+            cursor.close()
+
+
+def leer_pragmas_sqlite(engine: Engine, pragmas: Iterable[str]) -> Dict[str, str]:
+    """Valores efectivos de los pragmas en una conexión del motor, con el mismo formato que pragmas_sqlite."""
+    efectivos = {}
+    with engine.connect() as conexion:
+        for pragma in pragmas:
+            valor = conexion.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            if pragma in _PRAGMAS_NUMERADOS:
+                valor = _PRAGMAS[pragma][2][valor]
+            efectivos[pragma] = str(valor).upper()
+    return efectivos
+
+
+def configurar_sqlite(app: Flask, db: SQLAlchemy) -> None:
+    """
+    Aplica app.config["SQLITE_PRAGMAS"] (por defecto, pragmas_sqlite()) a los motores SQLite de `db`.
+
+    Al arrancar se leen los pragmas de una conexión y se avisa de los que SQLite no aplicó
+    (por ejemplo WAL en un sistema de archivos que no lo soporta). Las bases en memoria no
+    se verifican: no tienen archivo de journal ni mmap.
+    """
+    pragmas = app.config.setdefault("SQLITE_PRAGMAS", pragmas_sqlite())
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name != "sqlite":
+                continue
+            registrar_pragmas_sqlite(engine, pragmas)
+            if engine.url.database in (None, "", ":memory:"):
+                continue
+
+            efectivos = leer_pragmas_sqlite(engine, pragmas)
+            distintos = {pragma: valor for pragma, valor in efectivos.items() if valor != pragmas[pragma]}
+            if distintos:
+                logger.warning(f"SQLite {engine.url.database}: pragmas no aplicados {distintos} (pedidos: {pragmas})")
+            else:
+                logger.info(f"SQLite {engine.url.database}: pragmas activos {efectivos}")
@@ -0,0 +1,47 @@
+from sqlalchemy import event, select
+from src.infraestructura.config.db import db_clientes
+
+
+class SecuenciaCambiosModel(db_clientes.Model):
+    """
+    Contador global de cambios de la tabla (una sola fila).
+
+    Cada inserción, actualización o eliminación hecha con el ORM lo incrementa en la
+    misma transacción; los listados lo usan como versión para sus ETag.
+    """
+
+    __tablename__ = "secuencia_cambios"
+
+    id = db_clientes.Column(db_clientes.Integer, primary_key=True)
+    valor = db_clientes.Column(db_clientes.BigInteger, nullable=False, default=0)
+
+
+_tabla_secuencia = SecuenciaCambiosModel.__table__
+
+
+@event.listens_for(_tabla_secuencia, "after_create")
+def _inicializar_secuencia(tabla, conexion, **kwargs):
+    conexion.execute(tabla.insert().values(id=1, valor=0))
+
+
+def siguiente_secuencia(conexion) -> int:
+    """Incrementa la secuencia en la transacción de `conexion` y devuelve el nuevo valor."""
+    resultado = conexion.execute(_tabla_secuencia.update().values(valor=_tabla_secuencia.c.valor + 1))
+    if resultado.rowcount == 0:
+        conexion.execute(_tabla_secuencia.insert().values(id=1, valor=1))
+    return conexion.execute(select(_tabla_secuencia.c.valor)).scalar_one()
+
+
+def secuencia_actual(conexion) -> int:
+    """Última secuencia confirmada."""
+    return conexion.execute(select(_tabla_secuencia.c.valor)).scalar() or 0
+
+
+def registrar_cambios(modelo) -> None:
+    """Incrementa la secuencia con cada inserción, actualización o eliminación de `modelo` por el ORM."""
+
+    def _incrementar(mapper, conexion, target):
+        siguiente_secuencia(conexion)
+
+    for evento in ("after_insert", "after_update", "after_delete"):
+        event.listen(modelo, evento, _incrementar)
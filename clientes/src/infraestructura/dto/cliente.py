@@ -1,4 +1,5 @@
 from src.infraestructura.config.db import db_clientes
+from src.infraestructura.dto.cambios import registrar_cambios
 
 
 class ClienteModel(db_clientes.Model):
@@ -16,3 +17,6 @@ class ClienteModel(db_clientes.Model):
 
     def __repr__(self):
         return f"<ClienteModel {self.id}: {self.nombre}>"
+
+
+registrar_cambios(ClienteModel)
@@ -0,0 +1,13 @@
+"""
+Migraciones versionadas del esquema de clientes, en orden.
+
+Cada módulo define su propia copia de las tablas tal como eran en esa versión, para que una
+migración no cambie cuando cambian los modelos. Se aplican con `flask migraciones aplicar`.
+"""
+
+from src.infraestructura.migraciones import v0001_esquema_inicial, v0002_secuencia_de_cambios
+
+MIGRACIONES = [
+    v0001_esquema_inicial.MIGRACION,
+    v0002_secuencia_de_cambios.MIGRACION,
+]
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, MetaData, String, Table
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_tablas
+
+clientes = Table(
+    "clientes",
+    MetaData(),
+    Column("id", String, nullable=False, primary_key=True),
+    Column("nombre", String, nullable=False),
+    Column("email", String, nullable=False),
+    Column("telefono", String, nullable=False),
+    Column("direccion", String, nullable=False),
+    Column("razon_social", String, nullable=False),
+    Column("nit", String, nullable=False, unique=True),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Tabla de clientes original; en bases creadas antes de las migraciones ya existe y no se toca."""
+    crear_tablas(engine, clientes)
+
+
+MIGRACION = Migracion(1, "Tabla de clientes", aplicar)
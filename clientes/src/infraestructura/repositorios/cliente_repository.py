@@ -1,11 +1,17 @@
-from typing import List, Optional
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.dominio.entities.cliente import Cliente
 from src.dominio.repositorios.cliente_repository import ClienteRepository
-from src.infraestructura.config.db import db_clientes
+from src.infraestructura.config.db import db_clientes, solo_lectura
+from src.infraestructura.config.metricas import etiquetar_consultas
+from src.infraestructura.dto.cambios import secuencia_actual
 from src.infraestructura.dto.cliente import ClienteModel
 
+logger = logging.getLogger(__name__)
 
+
+@etiquetar_consultas
 class ClienteRepositoryImpl(ClienteRepository):
     """Implementación del repositorio de clientes con base de datos SQLAlchemy."""
 
@@ -33,15 +39,27 @@ class ClienteRepositoryImpl(ClienteRepository):
             nit=entity.nit,
         )
 
+    @solo_lectura
     def obtener_todos(self) -> List[Cliente]:
         """Obtiene todos los clientes."""
         try:
             models = db_clientes.session.query(ClienteModel).all()
             return [self._model_to_entity(model) for model in models]
-        except Exception as e:
-            print(f"Error obteniendo todos los clientes: {e}")
+        except Exception:
+            logger.exception("Error obteniendo todos los clientes")
             return []
 
+    @solo_lectura
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los clientes, sin construir modelos ni entidades."""
+        try:
+            query = db_clientes.session.query(*[getattr(ClienteModel, columna) for columna in columnas])
+            return [tuple(fila) for fila in query.all()]
+        except Exception:
+            logger.exception("Error obteniendo filas de clientes")
+            return []
+
+    @solo_lectura
     def obtener_por_id(self, cliente_id: str) -> Optional[Cliente]:
         """Obtiene un cliente por su ID."""
         try:
@@ -49,8 +67,8 @@ class ClienteRepositoryImpl(ClienteRepository):
             if model:
                 return self._model_to_entity(model)
             return None
-        except Exception as e:
-            print(f"Error obteniendo cliente por ID: {e}")
+        except Exception:
+            logger.exception("Error obteniendo cliente por ID")
             return None
 
     def obtener_por_categoria(self, categoria: str) -> List[Cliente]:
@@ -59,14 +77,15 @@ class ClienteRepositoryImpl(ClienteRepository):
         # Si se necesita esta funcionalidad, se debe agregar categoría a la entidad
         return []
 
+    @solo_lectura
     def buscar_por_nombre(self, nombre: str) -> List[Cliente]:
         """Busca clientes por nombre."""
         try:
             nombre_lower = f"%{nombre.lower()}%"
             models = db_clientes.session.query(ClienteModel).filter(ClienteModel.nombre.ilike(nombre_lower)).all()
             return [self._model_to_entity(model) for model in models]
-        except Exception as e:
-            print(f"Error buscando clientes por nombre: {e}")
+        except Exception:
+            logger.exception("Error buscando clientes por nombre")
             return []
 
     def crear(self, cliente: Cliente) -> Cliente:
@@ -81,7 +100,12 @@ class ClienteRepositoryImpl(ClienteRepository):
             db_clientes.session.add(model)
             db_clientes.session.commit()
             return self._model_to_entity(model)
-        except Exception as e:
+        except Exception:
             db_clientes.session.rollback()
-            print(f"Error creando cliente: {e}")
+            logger.exception("Error creando cliente")
             raise
+
+    @solo_lectura
+    def version(self) -> int:
+        """Última secuencia de cambios confirmada; los errores se propagan."""
+        return secuencia_actual(db_clientes.session.connection())
@@ -1,5 +1,7 @@
 from flask import Blueprint, request
+from src.aplicacion.mappers.cliente_mapper import ClienteMapper
 from src.infraestructura.cmd.cliente_cmd import ClienteCmd
+from src.infraestructura.rutas.condicional import respuesta_condicional
 
 
 def create_cliente_routes(cliente_controller: ClienteCmd) -> Blueprint:
@@ -7,29 +9,54 @@ def create_cliente_routes(cliente_controller: ClienteCmd) -> Blueprint:
 
     cliente_routes = Blueprint("clientes", __name__, url_prefix="/clientes")
 
+    # Listados que responden 304 mientras la tabla no cambie
+    condicional = respuesta_condicional("clientes", cliente_controller.version_clientes)
+
+    def _campos():
+        """Campos pedidos con ?fields=...; devuelve (campos, respuesta de error)."""
+        try:
+            return ClienteMapper.parsear_campos(request.args.get("fields")), None
+        except ValueError as e:
+            return None, ({"error": str(e)}, 400)
+
     @cliente_routes.route("", methods=["GET"])
+    @condicional
     def obtener_todos_los_clientes():
-        """Obtiene todos los clientes."""
-        return cliente_controller.obtener_todos_los_clientes()
+        """Obtiene todos los clientes (?fields=id,nombre limita las columnas leídas y devueltas)."""
+        campos, error = _campos()
+        if error:
+            return error
+        return cliente_controller.obtener_todos_los_clientes(campos)
 
     @cliente_routes.route("/<string:cliente_id>", methods=["GET"])
     def obtener_cliente_por_id(cliente_id: str):
         """Obtiene un cliente por su ID."""
-        return cliente_controller.obtener_cliente_por_id(cliente_id)
+        campos, error = _campos()
+        if error:
+            return error
+        return cliente_controller.obtener_cliente_por_id(cliente_id, campos)
 
     @cliente_routes.route("/categoria/<string:categoria>", methods=["GET"])
+    @condicional
     def obtener_clientes_por_categoria(categoria: str):
         """Obtiene clientes por categoría."""
-        return cliente_controller.obtener_clientes_por_categoria(categoria)
+        campos, error = _campos()
+        if error:
+            return error
+        return cliente_controller.obtener_clientes_por_categoria(categoria, campos)
 
     @cliente_routes.route("/buscar", methods=["GET"])
+    @condicional
     def buscar_clientes_por_nombre():
         """Busca clientes por nombre."""
         nombre = request.args.get("nombre", "")
         if not nombre:
             return {"error": "Parámetro nombre es requerido"}, 400
+        campos, error = _campos()
+        if error:
+            return error
 
-        return cliente_controller.buscar_clientes_por_nombre(nombre)
+        return cliente_controller.buscar_clientes_por_nombre(nombre, campos)
 
     @cliente_routes.route("", methods=["POST"])
     def crear_cliente():
@@ -12,8 +12,8 @@ class AuthService:
     Solo maneja validación de tokens JWT, no autenticación completa.
     """
 
-    def __init__(self, secret_key: str, algorithm: str = "HS256"):
-        self.token_validator = TokenValidator(secret_key, algorithm)
+    def __init__(self, secret_key: str, algorithm: str = "HS256", cache_max_entradas: int = 10000):
+        self.token_validator = TokenValidator(secret_key, algorithm, cache_max_entradas)
         self.access_validator = AccessValidator()
 
     def validate_token(self, authorization_header: Optional[str]) -> bool:
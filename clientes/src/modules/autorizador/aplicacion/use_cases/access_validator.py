@@ -12,6 +12,10 @@ from ...dominio.exceptions import InsufficientPermissionsError
 class AccessValidator:
     """
     Caso de uso para validar acceso basado en roles del token.
+
+    /health y /metrics son públicas porque el servicio solo es accesible dentro de la red
+    interna; desde internet se entra por el gateway, que protege su propio /metrics con
+    METRICAS_TOKEN. Si el servicio se expusiera, /metrics tendría que dejar de ser pública.
     """
 
     def __init__(self):
@@ -26,7 +30,7 @@ class AccessValidator:
         }
 
         # Rutas que no requieren autorización (específicas para clientes)
-        self.public_routes = {"/", "/health", "/auth/resources"}  # Para que el Gateway pueda consultar recursos
+        self.public_routes = {"/", "/health", "/metrics", "/auth/resources"}  # Para que el Gateway pueda consultar recursos
 
     def validate_access(self, token_payload: TokenPayload, route: str, method: str) -> bool:
         """
@@ -161,6 +161,24 @@ class TestClienteMapper:
         assert cliente_resultado.razon_social == cliente_original.razon_social
         assert cliente_resultado.nit == cliente_original.nit
 
+    def test_parsear_campos(self):
+        """Test de que fields se normaliza al orden de CAMPOS y sin repetidos"""
+        from src.aplicacion.mappers.cliente_mapper import ClienteMapper
+
+        assert ClienteMapper.parsear_campos("nit, id,nit") == ("id", "nit")
+        assert ClienteMapper.parsear_campos("") == ClienteMapper.CAMPOS
+        with pytest.raises(ValueError, match="Campos desconocidos en fields: clave"):
+            ClienteMapper.parsear_campos("id,clave")
+
+    def test_proyectar_y_filas_to_json(self):
+        """Test de proyección del JSON de un cliente y de filas de columnas"""
+        from src.aplicacion.mappers.cliente_mapper import ClienteMapper
+
+        cliente_json = dict(zip(ClienteMapper.CAMPOS, ("cli-001", "Hospital", "h@test.com", "1", "Calle", "Razón", "900")))
+
+        assert ClienteMapper.proyectar(cliente_json, ("id", "nit")) == {"id": "cli-001", "nit": "900"}
+        assert ClienteMapper.filas_to_json(("id", "nit"), [("cli-001", "900")]) == [{"id": "cli-001", "nit": "900"}]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -109,6 +109,12 @@ class TestClienteService:
         assert len(clientes) == 0
         assert clientes == []
 
+    def test_obtener_version_clientes(self, cliente_service, mock_repository):
+        """Test de obtener la versión de la tabla de clientes"""
+        mock_repository.version.return_value = 3
+
+        assert cliente_service.obtener_version_clientes() == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
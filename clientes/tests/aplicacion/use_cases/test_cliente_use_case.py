@@ -91,6 +91,12 @@ class TestClienteUseCase:
         assert cliente_creado.id == "cli-001"
         mock_service.crear_cliente.assert_called_once_with(sample_cliente)
 
+    def test_obtener_version_clientes(self, cliente_use_case, mock_service):
+        """Test de obtener la versión de la tabla de clientes"""
+        mock_service.obtener_version_clientes.return_value = 3
+
+        assert cliente_use_case.obtener_version_clientes() == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
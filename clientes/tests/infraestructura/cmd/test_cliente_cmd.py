@@ -172,6 +172,38 @@ class TestClienteCmd:
 
         assert status_code == 500
 
+    def test_obtener_todos_los_clientes_con_campos(self, cliente_cmd, mock_use_case):
+        """Test de que con campos solo se consultan esas columnas"""
+        mock_use_case.obtener_filas_clientes.return_value = [("cli-001", "900111222-3")]
+
+        response, status_code = cliente_cmd.obtener_todos_los_clientes(("id", "nit"))
+
+        assert status_code == 200
+        assert response.json == [{"id": "cli-001", "nit": "900111222-3"}]
+        mock_use_case.obtener_filas_clientes.assert_called_once_with(("id", "nit"))
+        mock_use_case.obtener_todos_los_clientes.assert_not_called()
+
+    def test_obtener_cliente_por_id_con_campos(self, cliente_cmd, mock_use_case, sample_cliente):
+        """Test de obtener un cliente proyectando solo algunos campos"""
+        mock_use_case.obtener_cliente_por_id.return_value = sample_cliente
+
+        response, status_code = cliente_cmd.obtener_cliente_por_id("cli-001", ("nombre",))
+
+        assert status_code == 200
+        assert response.json == {"nombre": "Hospital Test"}
+
+    def test_version_clientes(self, cliente_cmd, mock_use_case):
+        """Test de obtener la versión de los clientes"""
+        mock_use_case.obtener_version_clientes.return_value = 3
+
+        assert cliente_cmd.version_clientes() == 3
+
+    def test_version_clientes_error(self, cliente_cmd, mock_use_case):
+        """Test de que un error al obtener la versión devuelve None (respuesta sin ETag)"""
+        mock_use_case.obtener_version_clientes.side_effect = Exception("Error de base de datos")
+
+        assert cliente_cmd.version_clientes() is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
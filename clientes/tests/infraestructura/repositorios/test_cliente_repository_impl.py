@@ -115,6 +115,23 @@ class TestClienteRepositoryImpl:
         assert isinstance(clientes, list)
         assert len(clientes) == 0
 
+    @patch("src.infraestructura.repositorios.cliente_repository.db_clientes")
+    def test_obtener_filas(self, mock_db, cliente_repository):
+        """Test de que obtener_filas consulta solo las columnas pedidas"""
+        mock_db.session.query.return_value.all.return_value = [("cli-001", "900111222-3")]
+
+        filas = cliente_repository.obtener_filas(("id", "nit"))
+
+        assert filas == [("cli-001", "900111222-3")]
+        assert len(mock_db.session.query.call_args.args) == 2
+
+    @patch("src.infraestructura.repositorios.cliente_repository.db_clientes")
+    def test_obtener_filas_con_error(self, mock_db, cliente_repository):
+        """Test de obtener filas cuando hay un error"""
+        mock_db.session.query.side_effect = Exception("Error de conexión")
+
+        assert cliente_repository.obtener_filas(("id",)) == []
+
     @patch("src.infraestructura.repositorios.cliente_repository.db_clientes")
     def test_obtener_por_id_encontrado(self, mock_db, cliente_repository):
         """Test de obtener cliente por ID cuando existe"""
@@ -294,6 +311,38 @@ class TestClienteRepositoryImpl:
         # Verificar que se hizo rollback
         mock_db.session.rollback.assert_called_once()
 
+    def test_version_cambia_con_cada_escritura(self, cliente_repository):
+        """Test de que la versión avanza al crear y actualizar clientes y no al leer"""
+        from src.dominio.entities.cliente import Cliente
+        from src.infraestructura.config.db import db_clientes
+        from src.infraestructura.dto.cliente import ClienteModel
+
+        session = db_clientes.session
+        inicial = cliente_repository.version()
+
+        try:
+            cliente_repository.crear(
+                Cliente(
+                    id="cli-ver",
+                    nombre="Cliente Versión",
+                    email="version@test.com",
+                    telefono="3000000000",
+                    direccion="Dirección",
+                    razon_social="Razón",
+                    nit="900999999-9",
+                )
+            )
+            creado = cliente_repository.version()
+            session.get(ClienteModel, "cli-ver").nombre = "Cliente Actualizado"
+            session.commit()
+            actualizado = cliente_repository.version()
+            cliente_repository.obtener_todos()
+
+            assert inicial < creado < actualizado == cliente_repository.version()
+        finally:
+            session.query(ClienteModel).filter_by(id="cli-ver").delete()
+            session.commit()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
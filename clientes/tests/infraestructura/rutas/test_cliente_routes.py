@@ -3,6 +3,7 @@ Tests unitarios para las rutas de clientes
 """
 
 import os
+import re
 import sys
 from unittest.mock import MagicMock
 
@@ -71,7 +72,9 @@ class TestClienteRoutes:
         response = client.get("/clientes/cli-001")
 
         assert response.status_code == 200
-        mock_controller.obtener_cliente_por_id.assert_called_once_with("cli-001")
+        from src.aplicacion.mappers.cliente_mapper import ClienteMapper
+
+        mock_controller.obtener_cliente_por_id.assert_called_once_with("cli-001", ClienteMapper.CAMPOS)
 
     def test_route_obtener_clientes_por_categoria(self, client, mock_controller):
         """Test de ruta GET /clientes/categoria/<categoria>"""
@@ -83,7 +86,9 @@ class TestClienteRoutes:
         response = client.get("/clientes/categoria/hospitales")
 
         assert response.status_code == 200
-        mock_controller.obtener_clientes_por_categoria.assert_called_once_with("hospitales")
+        from src.aplicacion.mappers.cliente_mapper import ClienteMapper
+
+        mock_controller.obtener_clientes_por_categoria.assert_called_once_with("hospitales", ClienteMapper.CAMPOS)
 
     def test_route_buscar_clientes_por_nombre(self, client, mock_controller):
         """Test de ruta GET /clientes/buscar?nombre=..."""
@@ -95,7 +100,9 @@ class TestClienteRoutes:
         response = client.get("/clientes/buscar?nombre=Hospital")
 
         assert response.status_code == 200
-        mock_controller.buscar_clientes_por_nombre.assert_called_once_with("Hospital")
+        from src.aplicacion.mappers.cliente_mapper import ClienteMapper
+
+        mock_controller.buscar_clientes_por_nombre.assert_called_once_with("Hospital", ClienteMapper.CAMPOS)
 
     def test_route_buscar_clientes_sin_nombre(self, client, mock_controller):
         """Test de ruta GET /clientes/buscar sin parámetro nombre"""
@@ -136,6 +143,64 @@ class TestClienteRoutes:
         if response.json:
             assert "error" in response.json
 
+    def test_route_fields(self, client, mock_controller):
+        """Test de ?fields= en listado y detalle"""
+        mock_controller.obtener_todos_los_clientes.return_value = ([], 200)
+        mock_controller.obtener_cliente_por_id.return_value = ({}, 200)
+
+        assert client.get("/clientes?fields=nit,nombre").status_code == 200
+        assert client.get("/clientes/cli-001?fields=email").status_code == 200
+
+        mock_controller.obtener_todos_los_clientes.assert_called_once_with(("nombre", "nit"))
+        mock_controller.obtener_cliente_por_id.assert_called_once_with("cli-001", ("email",))
+
+    def test_route_fields_invalido(self, client, mock_controller):
+        """Test de ?fields= con un campo desconocido"""
+        response = client.get("/clientes?fields=nombre,clave")
+
+        assert response.status_code == 400
+        assert "clave" in response.json["error"]
+        mock_controller.obtener_todos_los_clientes.assert_not_called()
+
+    def test_route_listado_responde_etag(self, client, mock_controller):
+        """Test de que GET /clientes incluye un ETag débil derivado de la versión de la tabla"""
+        mock_controller.version_clientes.return_value = 3
+        mock_controller.obtener_todos_los_clientes.return_value = ([], 200)
+
+        response = client.get("/clientes")
+
+        assert response.status_code == 200
+        assert re.fullmatch(r'W/"clientes-3-[0-9a-f]{16}"', response.headers["ETag"])
+        # Cada consulta es otra representación, con su propio ETag
+        assert client.get("/clientes/buscar?nombre=Hosp").headers["ETag"] != response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    @pytest.mark.parametrize("url", ["/clientes", "/clientes/categoria/hospital", "/clientes/buscar?nombre=Hosp"])
+    def test_route_if_none_match_responde_304_sin_consultar(self, client, mock_controller, url):
+        """Test de que con un If-None-Match vigente se responde 304 sin llegar al controlador"""
+        mock_controller.version_clientes.return_value = 3
+        for metodo in ("obtener_todos_los_clientes", "obtener_clientes_por_categoria", "buscar_clientes_por_nombre"):
+            getattr(mock_controller, metodo).return_value = ([], 200)
+        etag = client.get(url).headers["ETag"]
+        mock_controller.reset_mock(return_value=False)
+
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        mock_controller.obtener_todos_los_clientes.assert_not_called()
+        mock_controller.obtener_clientes_por_categoria.assert_not_called()
+        mock_controller.buscar_clientes_por_nombre.assert_not_called()
+
+    def test_route_detalle_sin_etag(self, client, mock_controller):
+        """Test de que el detalle de un cliente no usa respuestas condicionales"""
+        mock_controller.version_clientes.return_value = 3
+        mock_controller.obtener_cliente_por_id.return_value = ({}, 200)
+
+        response = client.get("/clientes/cli-001", headers={"If-None-Match": 'W/"clientes-3"'})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,10 +1,9 @@
-import logging
 import os
-from datetime import datetime
 
 from dotenv import load_dotenv
-from flask import Flask, g, request
+from flask import Flask
 from flask_cors import CORS
+from migraciones import MIGRACIONES
 from modules.autenticador.aplicacion.servicios.auth_service import AuthService
 from modules.autenticador.aplicacion.use_cases.auth_use_case import AuthUseCase
 from modules.autenticador.infraestructura.cmd.auth_cmd import AuthCmd
@@ -19,7 +18,15 @@ from modules.health.infraestructura.rutas.health_routes import create_health_rou
 from modules.productos.infraestructura.rutas.producto_routes import create_producto_routes
 from modules.provedores.infraestructura.rutas.provedores_routes import create_provedores_routes
 
+from .compresion import registrar_compresion
 from .db import db, init_db
+from .metricas import registrar_metricas
+from .migraciones import create_migraciones_cli, verificar_migraciones
+from .motor import normalizar_uri, opciones_motor
+from .perfil_consultas import registrar_perfil_consultas
+from .registro import leer_muestreo, registrar_accesos
+from .sqlite import pragmas_sqlite
+from .trazas import crear_exportador, registrar_trazas
 
 load_dotenv(".env")
 
@@ -51,9 +58,21 @@ class Config:
         # Configurar logging de requests
         self._configure_request_logging()
 
+        # Métricas de peticiones, llamadas a los microservicios y consultas SQL en /metrics
+        self._configure_metrics()
+
+        # Trazas W3C (traceparent) de peticiones, autorización, consultas SQL y serialización
+        self._configure_tracing()
+
+        # Consultas SQL por petición, consultas lentas con su plan y posibles N+1
+        self._configure_query_profiling()
+
         # Configurar CORS
         self._configure_cors()
 
+        # Comprimir respuestas según Accept-Encoding
+        self._configure_compression()
+
         # Configurar base de datos
         self._configure_db()
 
@@ -75,13 +94,41 @@ class Config:
         self.app.config["HOST"] = os.getenv("HOST", "0.0.0.0")
         self.app.config["PORT"] = int(os.getenv("PORT", 5000))
         self.app.config["LOG_LEVEL"] = os.getenv("LOG_LEVEL", "INFO")
+        # Fracción de peticiones registradas por prefijo de ruta, p. ej. "/health:0,/productos:0.1"
+        self.app.config["REGISTRO_ACCESOS_MUESTREO"] = leer_muestreo(os.getenv("REGISTRO_ACCESOS_MUESTREO", ""))
+        # Destino de las trazas ("" las desactiva, "memoria", "archivo:<ruta>" o "modulo:Clase") y fracción muestreada
+        self.app.config["TRAZAS_EXPORTADOR"] = os.getenv("TRAZAS_EXPORTADOR", "")
+        self.app.config["TRAZAS_MUESTREO"] = float(os.getenv("TRAZAS_MUESTREO", 1))
+        # El gateway está expuesto a internet: /metrics solo existe con METRICAS_TOKEN y lo exige como Bearer
+        self.app.config["METRICAS_TOKEN"] = os.getenv("METRICAS_TOKEN", "")
         self.app.config["JWT_SECRET"] = os.getenv("JWT_SECRET", "your-secret-key-here-with-32-plus-chars-for-security")
         self.app.config["ALGORITHM"] = os.getenv("ALGORITHM", "HS256")
         self.app.config["PRODUCTOS_SERVICE_URL"] = os.getenv("PRODUCTOS_SERVICE_URL", "http://127.0.0.1:5001")
         self.app.config["PROVEDORES_SERVICE_URL"] = os.getenv("PROVEDORES_SERVICE_URL", "http://127.0.0.1:5003")
         self.app.config["CLIENTES_SERVICE_URL"] = os.getenv("CLIENTES_SERVICE_URL", "http://clientes:5004")
-        self.app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///app.db")
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = normalizar_uri(os.getenv("DATABASE_URL", "sqlite:///app.db"))
         self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        # Pool de conexiones y statement timeout para un servidor de base de datos (PostgreSQL)
+        self.app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones_motor(self.app.config["SQLALCHEMY_DATABASE_URI"])
+        # Pragmas de SQLite por conexión (WAL, synchronous, cache, mmap, temp_store y busy_timeout)
+        self.app.config["SQLITE_PRAGMAS"] = pragmas_sqlite()
+        # Consultas lentas (se registran con su EXPLAIN) y repetidas en una petición (posible N+1); 0 desactiva el aviso
+        self.app.config["SQL_UMBRAL_LENTA_MS"] = float(os.getenv("SQL_UMBRAL_LENTA_MS", 200))
+        self.app.config["SQL_UMBRAL_REPETICIONES"] = int(os.getenv("SQL_UMBRAL_REPETICIONES", 10))
+
+        # Compresión de respuestas: tamaño mínimo del cuerpo, nivel gzip (1-9) y calidad brotli (0-11)
+        self.app.config["COMPRESION_MINIMO_BYTES"] = int(os.getenv("COMPRESION_MINIMO_BYTES", 1024))
+        self.app.config["COMPRESION_NIVEL_GZIP"] = int(os.getenv("COMPRESION_NIVEL_GZIP", 6))
+        self.app.config["COMPRESION_CALIDAD_BROTLI"] = int(os.getenv("COMPRESION_CALIDAD_BROTLI", 4))
+
+    def _configure_compression(self):
+        """Configura la compresión gzip/brotli de las respuestas (las ya comprimidas por el microservicio se reenvían tal cual)."""
+        registrar_compresion(
+            self.app,
+            self.app.config["COMPRESION_MINIMO_BYTES"],
+            self.app.config["COMPRESION_NIVEL_GZIP"],
+            self.app.config["COMPRESION_CALIDAD_BROTLI"],
+        )
 
     def _configure_cors(self):
         """Configura CORS para permitir peticiones desde el frontend."""
@@ -89,43 +136,39 @@ class Config:
             self.app,
             origins=["http://localhost:4200", "http://127.0.0.1:4200"],
             methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            allow_headers=["Content-Type", "Authorization"],
+            allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+            expose_headers=["X-Total-Count", "ETag"],
             supports_credentials=True,
         )
 
     def _configure_db(self):
+        """Configura la base de datos; el esquema lo crea `flask migraciones aplicar`, no el arranque."""
         init_db(self.app)
         self._import_models()
-        with self.app.app_context():
-            db.create_all()
+        verificar_migraciones(self.app, db, MIGRACIONES)
+        self.app.cli.add_command(create_migraciones_cli(db, MIGRACIONES))
 
     def _configure_request_logging(self):
-        """Configura el middleware para logging de requests y responses."""
-        logger = logging.getLogger("request_logger")
-
-        @self.app.before_request
-        def log_request():
-            """Log cuando entra una petición."""
-            g.start_time = datetime.now().time()
-            logger.info(f"INCOMING REQUEST: {request.method} {request.url}")
-
-            # Log headers si está en modo debug
-            if self.app.config.get("DEBUG"):
-                logger.debug(f"Headers: {dict(request.headers)}")
-                if request.is_json:
-                    logger.debug(f"Request Body: {request.get_json()}")
-
-        @self.app.after_request
-        def log_response(response):
-            """Log cuando sale una respuesta."""
-            if hasattr(g, "start_time"):
-                duration = (datetime.now() - datetime.combine(datetime.today(), g.start_time)).total_seconds()
-                logger.info(
-                    f"OUTGOING RESPONSE: {response.status_code} - Duration: {duration * 1000:.0f}ms - Size: {len(response.get_data())} bytes"
-                )
-            else:
-                logger.info(f"OUTGOING RESPONSE: {response.status_code}")
-            return response
+        """Registra una línea JSON por petición, escrita fuera del hilo de la petición (ver registro.py)."""
+        registrar_accesos(self.app, self.app.config.get("REGISTRO_ACCESOS_MUESTREO", {}))
+
+    def _configure_metrics(self):
+        """Mide peticiones, microservicios y consultas SQL; /metrics solo se expone con METRICAS_TOKEN y lo exige (ver metricas.py)."""
+        token = self.app.config["METRICAS_TOKEN"]
+        registrar_metricas(self.app, exponer=bool(token), token=token)
+
+    def _configure_tracing(self):
+        """Traza cada petición y la exporta a TRAZAS_EXPORTADOR (ver trazas.py)."""
+        registrar_trazas(self.app, crear_exportador(self.app.config["TRAZAS_EXPORTADOR"]), self.app.config["TRAZAS_MUESTREO"])
+
+    def _configure_query_profiling(self):
+        """Perfila las consultas SQL de cada petición; en modo debug lo devuelve en cabeceras (ver perfil_consultas.py)."""
+        registrar_perfil_consultas(
+            self.app,
+            self.app.config["SQL_UMBRAL_LENTA_MS"],
+            self.app.config["SQL_UMBRAL_REPETICIONES"],
+            cabeceras=self.app.config["DEBUG"],
+        )
 
     def _configure_external_services(self):
         # """Configura los servicios externos para monitoreo."""
@@ -1,8 +1,11 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 
+from .sqlite import configurar_sqlite
+
 db = SQLAlchemy()
 
 
 def init_db(app: Flask):
     db.init_app(app)
+    configurar_sqlite(app, db)
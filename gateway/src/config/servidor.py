@@ -0,0 +1,118 @@
+"""
+Configuración de gunicorn, el servidor WSGI de producción del servicio.
+
+Se carga como archivo de configuración (gunicorn -c <ruta a este archivo>), así que solo
+usa la biblioteca estándar: gunicorn lo ejecuta antes de importar la aplicación.
+
+Variables de entorno:
+    GUNICORN_BIND             dirección de escucha (default HOST:PORT, 0.0.0.0:5000)
+    GUNICORN_WORKERS          procesos worker (default: número de CPUs)
+    GUNICORN_THREADS          hilos por worker (default 4)
+    GUNICORN_KEEPALIVE        segundos que se mantiene abierta una conexión inactiva (default 5)
+    GUNICORN_TIMEOUT          segundos sin responder antes de reiniciar un worker (default 30)
+    GUNICORN_GRACEFUL_TIMEOUT segundos para terminar las peticiones en curso al apagar (default 30)
+    GUNICORN_MAX_REQUESTS     peticiones tras las que se recicla un worker; 0 lo desactiva (default 10000)
+    GUNICORN_MAX_REQUESTS_JITTER variación aleatoria de GUNICORN_MAX_REQUESTS (default 1000)
+    GUNICORN_PRELOAD          carga la aplicación en el master antes del fork (default true)
+    GUNICORN_ACCESS_LOG       true para registrar cada petición en stdout (default false)
+    METRICAS_DIRECTORIO       donde cada worker vuelca sus métricas para /metrics (default: un directorio temporal nuevo)
+    METRICAS_INTERVALO_VOLCADO segundos entre volcados de las métricas de cada worker (default 5)
+"""
+
+import multiprocessing
+import os
+import tempfile
+from typing import Mapping
+
+
+def _leer_entero(entorno: Mapping[str, str], variable: str, defecto: int) -> int:
+    try:
+        return int(entorno.get(variable, defecto))
+    except ValueError:
+        raise ValueError(f"{variable} debe ser un entero") from None
+
+
+def _leer_booleano(entorno: Mapping[str, str], variable: str, defecto: bool) -> bool:
+    valor = entorno.get(variable)
+    if valor is None:
+        return defecto
+    if valor.strip().lower() not in ("true", "false", "1", "0"):
+        raise ValueError(f"{variable} debe ser true o false")
+    return valor.strip().lower() in ("true", "1")
+
+
+bind = os.environ.get("GUNICORN_BIND") or f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"
+
+# Cada worker es un proceso con su propio GIL; los hilos cubren la espera de E/S (base de datos, red)
+workers = _leer_entero(os.environ, "GUNICORN_WORKERS", multiprocessing.cpu_count())
+threads = _leer_entero(os.environ, "GUNICORN_THREADS", 4)
+worker_class = "gthread"
+
+keepalive = _leer_entero(os.environ, "GUNICORN_KEEPALIVE", 5)
+timeout = _leer_entero(os.environ, "GUNICORN_TIMEOUT", 30)
+graceful_timeout = _leer_entero(os.environ, "GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# Reciclar los workers acota el crecimiento de memoria; el jitter evita que se reinicien todos a la vez
+max_requests = _leer_entero(os.environ, "GUNICORN_MAX_REQUESTS", 10000)
+max_requests_jitter = _leer_entero(os.environ, "GUNICORN_MAX_REQUESTS_JITTER", 1000)
+
+# Con preload la aplicación se importa una sola vez en el master y los workers comparten
+# esas páginas de memoria (copy-on-write); además un error de arranque detiene el servidor
+preload_app = _leer_booleano(os.environ, "GUNICORN_PRELOAD", True)
+
+# El latido de los workers en memoria: un /tmp sobre disco puede bloquearlos y provocar timeouts
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+loglevel = os.environ.get("LOG_LEVEL", "info").lower()
+errorlog = "-"
+accesslog = "-" if _leer_booleano(os.environ, "GUNICORN_ACCESS_LOG", False) else None
+
+# Cada worker vuelca sus métricas en este directorio y /metrics suma las de todos (ver metricas.py)
+if not os.environ.get("METRICAS_DIRECTORIO"):
+    os.environ["METRICAS_DIRECTORIO"] = tempfile.mkdtemp(prefix="metricas-")
+_INTERVALO_VOLCADO_METRICAS = _leer_entero(os.environ, "METRICAS_INTERVALO_VOLCADO", 5)
+
+
+def _extension(worker, nombre: str):
+    app = getattr(worker, "wsgi", None)
+    return getattr(app, "extensions", {}).get(nombre)
+
+
+def on_starting(server):
+    """Descarta las métricas de un arranque anterior que hayan quedado en METRICAS_DIRECTORIO."""
+    directorio = os.environ["METRICAS_DIRECTORIO"]
+    if os.path.isdir(directorio):
+        for nombre in os.listdir(directorio):
+            if nombre.endswith(".json"):
+                os.remove(os.path.join(directorio, nombre))
+
+
+def post_worker_init(worker):
+    """Prepara el worker recién creado: conexiones propias y tareas en segundo plano."""
+    app = worker.wsgi
+    db = app.extensions.get("sqlalchemy")
+    if db is not None:
+        # Las conexiones que el master abrió al cargar la aplicación no se pueden compartir
+        # entre procesos: se descartan sin cerrarlas y cada worker abre las suyas
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
+    # Los hilos no sobreviven al fork: las tareas y el volcado de métricas se inician en cada worker
+    tareas = _extension(worker, "tareas_en_segundo_plano")
+    if tareas is not None:
+        tareas.start_background_tasks()
+    metricas = _extension(worker, "metricas")
+    if metricas is not None:
+        metricas.iniciar_volcado(os.environ["METRICAS_DIRECTORIO"], _INTERVALO_VOLCADO_METRICAS)
+
+
+def worker_exit(server, worker):
+    """Detiene las tareas en segundo plano del worker y vuelca sus métricas antes de que el proceso termine."""
+    tareas = _extension(worker, "tareas_en_segundo_plano")
+    if tareas is not None:
+        tareas.stop_background_tasks(graceful_timeout)
+    metricas = _extension(worker, "metricas")
+    if metricas is not None:
+        metricas.detener_volcado()
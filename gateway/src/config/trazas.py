@@ -0,0 +1,305 @@
+import contextvars
+import functools
+import importlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from flask import Flask, g, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metricas import medir_upstream, metodo_repositorio
+
+logger = logging.getLogger(__name__)
+
+# version-trace_id-span_id-opciones (W3C Trace Context); las versiones futuras pueden añadir campos
+_TRACEPARENT = re.compile(r"([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?")
+
+# Caracteres del SQL que se guardan en los spans de consultas (los IN de muchos ids son largos)
+_LONGITUD_MAXIMA_SQL = 500
+
+
+def _nuevo_id(bits: int) -> str:
+    # random se vuelve a sembrar tras el fork: los workers no repiten ids
+    return f"{random.getrandbits(bits) or 1:0{bits // 4}x}"
+
+
+class Span:
+    """Operación medida dentro de una traza: su duración, su span padre y sus atributos."""
+
+    __slots__ = ("nombre", "trace_id", "span_id", "padre_id", "atributos", "inicio", "duracion", "error", "_terminados", "_t0")
+
+    def __init__(self, nombre: str, trace_id: str, padre_id: Optional[str], terminados: Optional[list], atributos: dict):
+        self.nombre = nombre
+        self.trace_id = trace_id
+        self.span_id = _nuevo_id(64)
+        self.padre_id = padre_id
+        self.atributos = atributos
+        self.inicio = time.time_ns()
+        self.duracion: Optional[int] = None
+        self.error: Optional[str] = None
+        # Spans terminados de la petición; None si la traza no se muestrea
+        self._terminados = terminados
+        self._t0 = time.perf_counter_ns()
+
+    @property
+    def muestreado(self) -> bool:
+        return self._terminados is not None
+
+    def hijo(self, nombre: str, atributos: dict) -> "Span":
+        return Span(nombre, self.trace_id, self.span_id, self._terminados, atributos)
+
+    def terminar(self, error: Optional[BaseException] = None) -> None:
+        self.duracion = time.perf_counter_ns() - self._t0
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        if self._terminados is not None:
+            self._terminados.append(self)
+
+    def traceparent(self) -> str:
+        """Cabecera traceparent para que otro servicio continúe la traza como hijo de este span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.muestreado else '00'}"
+
+    def a_dict(self) -> dict:
+        return {
+            "nombre": self.nombre,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "padre_id": self.padre_id,
+            "inicio_ns": self.inicio,
+            "duracion_ns": self.duracion,
+            "atributos": self.atributos,
+            "error": self.error,
+        }
+
+
+class Exportador:
+    """
+    Destino de los spans: recibe todos los de una petición muestreada cuando esta termina.
+
+    Para enviarlos a un colector (OpenTelemetry, Jaeger, ...) basta una subclase que implemente
+    exportar, configurada con TRAZAS_EXPORTADOR=modulo:Clase.
+    """
+
+    def exportar(self, spans: Sequence[Span]) -> None:
+        raise NotImplementedError
+
+
+class ExportadorMemoria(Exportador):
+    """Guarda los spans en una lista, para tests y depuración."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def exportar(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class ExportadorArchivo(Exportador):
+    """
+    Escribe los spans como JSON, uno por línea, al final de `ruta`.
+
+    Cada petición es una sola escritura en modo append, así que los workers de gunicorn
+    pueden compartir el archivo sin mezclar líneas.
+    """
+
+    def __init__(self, ruta: str):
+        self._descriptor = os.open(ruta, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def exportar(self, spans: Sequence[Span]) -> None:
+        lineas = "".join(json.dumps(span.a_dict(), ensure_ascii=False) + "\n" for span in spans)
+        os.write(self._descriptor, lineas.encode("utf-8"))
+
+
+def crear_exportador(valor: str) -> Optional[Exportador]:
+    """
+    Crea el exportador de TRAZAS_EXPORTADOR: vacío (sin trazas), "memoria", "archivo:<ruta>"
+    o "<modulo>:<Clase>" para un Exportador propio, que se crea sin argumentos.
+    """
+    if not valor:
+        return None
+    if valor == "memoria":
+        return ExportadorMemoria()
+    tipo, _, argumento = valor.partition(":")
+    if tipo and argumento:
+        if tipo == "archivo":
+            return ExportadorArchivo(argumento)
+        return getattr(importlib.import_module(tipo), argumento)()
+    raise ValueError(f"TRAZAS_EXPORTADOR no válido: {valor!r}")
+
+
+def leer_traceparent(valor: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Lee una cabecera traceparent: (trace_id, span_id del padre, muestreada).
+
+    Devuelve None si falta o no es válida; la petición empieza entonces una traza nueva.
+    """
+    coincidencia = _TRACEPARENT.fullmatch(valor.strip()) if valor else None
+    if coincidencia is None:
+        return None
+    version, trace_id, padre_id, opciones, resto = coincidencia.groups()
+    if version == "ff" or (version == "00" and resto) or not int(trace_id, 16) or not int(padre_id, 16):
+        return None
+    return trace_id, padre_id, bool(int(opciones, 16) & 1)
+
+
+# Span en curso en este contexto (el de la petición o uno de sus hijos)
+_span_actual: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("span_actual", default=None)
+
+
+def span_actual() -> Optional[Span]:
+    """Span en curso, o None fuera de una petición trazada."""
+    return _span_actual.get()
+
+
+@contextmanager
+def span(nombre: str, **atributos) -> Iterator[Optional[Span]]:
+    """Mide el bloque como hijo del span en curso; fuera de una traza muestreada no hace nada y da None."""
+    padre = _span_actual.get()
+    if padre is None or not padre.muestreado:
+        yield None
+        return
+    actual = padre.hijo(nombre, atributos)
+    token = _span_actual.set(actual)
+    error = None
+    try:
+        yield actual
+    except BaseException as excepcion:
+        error = excepcion
+        raise
+    finally:
+        _span_actual.reset(token)
+        actual.terminar(error)
+
+
+def trazar(nombre: str) -> Callable:
+    """Decorador: cada llamada a la función es un span `nombre` (ver span)."""
+
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            with span(nombre):
+                return funcion(*args, **kwargs)
+
+        return envoltura
+
+    return decorador
+
+
+def _con_traceparent(headers: Optional[Mapping[str, str]], valor: str) -> dict:
+    # Sustituye la cabecera que hubiera llegado del cliente, sin importar mayúsculas
+    cabeceras = {
+        clave: dato for clave, dato in dict(headers or {}).items() if clave.lower() not in ("traceparent", "tracestate")
+    }
+    cabeceras["traceparent"] = valor
+    return cabeceras
+
+
+def llamar_servicio(servicio: str, metodo: str, peticion: Callable, *args, **kwargs):
+    """
+    Como medir_upstream, pero dentro de un span de cliente y con la cabecera traceparent
+    en `headers`, para que el servicio continúe la traza de la petición en curso.
+    """
+    actual = _span_actual.get()
+    if actual is None:
+        return medir_upstream(servicio, metodo, peticion, *args, **kwargs)
+    with span(f"{metodo} {servicio}", servicio=servicio) as cliente:
+        kwargs["headers"] = _con_traceparent(kwargs.get("headers"), (cliente or actual).traceparent())
+        respuesta = medir_upstream(servicio, metodo, peticion, *args, **kwargs)
+        if cliente is not None:
+            cliente.atributos["http.estado"] = respuesta.status_code
+        return respuesta
+
+
+class _ProveedorJsonTrazado(DefaultJSONProvider):
+    # Las respuestas de jsonify se miden como serialización
+    def response(self, *args, **kwargs):
+        with span("serializacion", formato="application/json"):
+            return super().response(*args, **kwargs)
+
+
+def _iniciar_span_consulta(conn, cursor, statement, parameters, context, executemany):
+    padre = _span_actual.get()
+    if context is not None and padre is not None and padre.muestreado:
+        atributos = {"db.metodo": metodo_repositorio(), "db.sql": statement[:_LONGITUD_MAXIMA_SQL]}
+        context._span_traza = padre.hijo("db.consulta", atributos)
+
+
+def _terminar_span_consulta(conn, cursor, statement, parameters, context, executemany):
+    actual = getattr(context, "_span_traza", None)
+    if actual is not None:
+        context._span_traza = None
+        actual.terminar()
+
+
+def _error_consulta(contexto_excepcion):
+    actual = getattr(contexto_excepcion.execution_context, "_span_traza", None)
+    if actual is not None:
+        contexto_excepcion.execution_context._span_traza = None
+        actual.terminar(contexto_excepcion.original_exception)
+
+
+def _span_de_peticion(muestreo: float) -> Span:
+    padre = leer_traceparent(request.headers.get("traceparent"))
+    if padre is None:
+        padre = (_nuevo_id(128), None, random.random() < muestreo)
+    trace_id, padre_id, muestreada = padre
+    ruta = request.url_rule.rule if request.url_rule is not None else "sin_ruta"
+    atributos = {"http.metodo": request.method, "http.ruta": ruta}
+    return Span(f"{request.method} {ruta}", trace_id, padre_id, [] if muestreada else None, atributos)
+
+
+def _exportar(exportador: Exportador, raiz: Span) -> None:
+    # Un fallo del exportador no debe convertirse en un error de la petición
+    try:
+        exportador.exportar(raiz._terminados)
+    except Exception:
+        logger.exception("No se pudieron exportar los spans de la traza %s", raiz.trace_id)
+
+
+def registrar_trazas(app: Flask, exportador: Optional[Exportador], muestreo: float = 1.0) -> None:
+    """
+    Traza cada petición con el formato de W3C Trace Context.
+
+    La petición es el span raíz, hijo del de la cabecera traceparent si llega una (p. ej. del
+    gateway); dentro se miden la autorización, cada consulta SQL y la serialización. Las trazas
+    nuevas se muestrean con probabilidad `muestreo`; las que llegan con traceparent respetan la
+    decisión de quien las empezó. Sin exportador no se registra nada.
+    """
+    if exportador is None:
+        return
+    app.extensions["trazas"] = exportador
+    app.json = _ProveedorJsonTrazado(app)
+    if not event.contains(Engine, "before_cursor_execute", _iniciar_span_consulta):
+        event.listen(Engine, "before_cursor_execute", _iniciar_span_consulta)
+        event.listen(Engine, "after_cursor_execute", _terminar_span_consulta)
+        event.listen(Engine, "handle_error", _error_consulta)
+
+    @app.before_request
+    def iniciar_traza():
+        g.span_peticion = _span_de_peticion(muestreo)
+        _span_actual.set(g.span_peticion)
+
+    @app.after_request
+    def anotar_estado(response):
+        raiz = g.get("span_peticion")
+        if raiz is not None:
+            raiz.atributos["http.estado"] = response.status_code
+        return response
+
+    @app.teardown_request
+    def terminar_traza(error=None):
+        raiz = g.pop("span_peticion", None)
+        if raiz is None:
+            return
+        _span_actual.set(None)
+        raiz.terminar(error)
+        if raiz.muestreado:
+            _exportar(exportador, raiz)
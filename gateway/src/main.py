@@ -1,6 +1,7 @@
 import logging
 
 from config import Config
+from config.registro import configurar_registro_asincrono
 from flask import Flask
 
 
@@ -14,17 +15,8 @@ def setup_logging(app: Flask):
         format="%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
     )
 
-    # Configurar el logger específico para requests
-    request_logger = logging.getLogger("request_logger")
-    request_logger.setLevel(getattr(logging, log_level))
-
-    # Evitar que se dupliquen los logs
-    if not request_logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        request_logger.addHandler(handler)
-        request_logger.propagate = False
+    # Registro de accesos en JSON, escrito por un hilo aparte
+    configurar_registro_asincrono(logging.getLogger("request_logger"), getattr(logging, log_level))
 
 
 def create_application():
@@ -0,0 +1,12 @@
+"""
+Migraciones versionadas del esquema del gateway, en orden.
+
+Cada módulo define su propia copia de las tablas tal como eran en esa versión, para que una
+migración no cambie cuando cambian los modelos. Se aplican con `flask migraciones aplicar`.
+"""
+
+from migraciones import v0001_esquema_inicial
+
+MIGRACIONES = [
+    v0001_esquema_inicial.MIGRACION,
+]
@@ -0,0 +1,21 @@
+from config.migraciones import Migracion, crear_tablas
+from sqlalchemy import Column, Enum, MetaData, String, Table
+from sqlalchemy.engine import Engine
+
+users = Table(
+    "users",
+    MetaData(),
+    Column("id", String, nullable=False, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("password", String, nullable=False),
+    Column("email", String, nullable=False, unique=True),
+    Column("role", Enum("ADMIN", "USER", name="role"), nullable=False),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Tabla de usuarios original; en bases creadas antes de las migraciones ya existe y no se toca."""
+    crear_tablas(engine, users)
+
+
+MIGRACION = Migracion(1, "Tabla de usuarios", aplicar)
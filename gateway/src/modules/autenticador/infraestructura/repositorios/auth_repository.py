@@ -1,9 +1,11 @@
+import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
 import jwt
 from config.db import db
+from config.metricas import etiquetar_consultas
 from modules.autenticador.aplicacion.dtos.login_result_dto import LoginResultDto
 from modules.autenticador.aplicacion.dtos.session_dto import SessionDto
 from modules.autenticador.aplicacion.mappers.session_mapper import SessionMapper
@@ -13,7 +15,10 @@ from modules.autenticador.dominio.repositorios.auth_repository import AuthReposi
 from modules.autenticador.infraestructura.dto.user import Role
 from modules.autenticador.infraestructura.dto.user import User as UserModel
 
+logger = logging.getLogger(__name__)
 
+
+@etiquetar_consultas
 class AuthRepositoryImpl(AuthRepository):
     def __init__(self, secret_key: str, algorithm: str):
         self.secret_key = secret_key
@@ -50,8 +55,8 @@ class AuthRepositoryImpl(AuthRepository):
             )
             return LoginResultDto.success(SessionMapper.entity_to_dto(session))
 
-        except Exception as e:
-            print(f"Error in login: {e}")  # Add logging for debugging
+        except Exception:
+            logger.exception("Error in login")
             return LoginResultDto.invalid_credentials_error()
 
     def signUp(self, name: str, email: str, password: str, role: str = "USER") -> SessionDto:
@@ -59,7 +64,7 @@ class AuthRepositoryImpl(AuthRepository):
             # Check if user already exists
             existing_user = db.session.query(UserModel).filter_by(email=email).first()
             if existing_user:
-                print(f"User with email {email} already exists")
+                logger.info("User with email %s already exists", email)
                 return None
 
             # Generate unique user ID
@@ -95,8 +100,8 @@ class AuthRepositoryImpl(AuthRepository):
 
             return SessionMapper.entity_to_dto(session)
 
-        except Exception as e:
-            print(f"Error in signUp: {e}")
+        except Exception:
+            logger.exception("Error in signUp")
             db.session.rollback()
             return None
 
@@ -118,8 +123,8 @@ class AuthRepositoryImpl(AuthRepository):
 
             return SessionMapper.entity_to_dto(logout_session)
 
-        except Exception as e:
-            print(f"Error in signOut: {e}")
+        except Exception:
+            logger.exception("Error in signOut")
             return None
 
     def user_exists(self, email: str) -> bool:
@@ -127,8 +132,8 @@ class AuthRepositoryImpl(AuthRepository):
         try:
             existing_user = db.session.query(UserModel).filter_by(email=email).first()
             return existing_user is not None
-        except Exception as e:
-            print(f"Error checking if user exists: {e}")
+        except Exception:
+            logger.exception("Error checking if user exists")
             return False
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
@@ -141,6 +146,6 @@ class AuthRepositoryImpl(AuthRepository):
                 return None
             # Convert infrastructure model to domain entity
             return UserMapper.infrastructure_to_domain(user_model)
-        except Exception as e:
-            print(f"Error getting user by id: {e}")
+        except Exception:
+            logger.exception("Error getting user by id")
             return None
@@ -1,7 +1,12 @@
 import os
 
 import requests
-from flask import Blueprint, current_app, jsonify, request
+from config.trazas import llamar_servicio
+from flask import Blueprint, Response, current_app, jsonify, request
+
+# Cabeceras de la respuesta del microservicio que se devuelven al cliente (If-None-Match viaja
+# con las cabeceras de la petición, así que el microservicio puede responder 304)
+CABECERAS_REENVIADAS = ("ETag", "Cache-Control")
 
 
 def create_cliente_routes() -> Blueprint:
@@ -27,17 +32,20 @@ def create_cliente_routes() -> Blueprint:
             service_url = get_clientes_service_url()
             url = f"{service_url}{endpoint}"
             if method == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = llamar_servicio("clientes", "GET", requests.get, url, headers=headers, params=params, timeout=30)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                response = llamar_servicio("clientes", "POST", requests.post, url, headers=headers, json=data, timeout=30)
             elif method == "PUT":
-                response = requests.put(url, headers=headers, json=data, timeout=30)
+                response = llamar_servicio("clientes", "PUT", requests.put, url, headers=headers, json=data, timeout=30)
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=30)
+                response = llamar_servicio("clientes", "DELETE", requests.delete, url, headers=headers, timeout=30)
             else:
                 return jsonify({"error": "Método no soportado"}), 405
 
-            return response.json(), response.status_code
+            cabeceras = {nombre: response.headers[nombre] for nombre in CABECERAS_REENVIADAS if nombre in response.headers}
+            if response.status_code == 304:
+                return Response(status=304, headers=cabeceras)
+            return response.json(), response.status_code, cabeceras
 
         except requests.exceptions.RequestException as e:
             return jsonify({"success": False, "error": f"Error conectando con el servicio de clientes: {str(e)}"}), 503
@@ -46,7 +54,7 @@ def create_cliente_routes() -> Blueprint:
     def obtener_todos_los_clientes():
         """Obtiene todos los clientes."""
         headers = request.headers
-        return make_request_to_clientes("/clientes", headers=headers)
+        return make_request_to_clientes("/clientes", params=request.args.to_dict(), headers=headers)
 
     @cliente_routes.route("", methods=["POST"])
     def crear_cliente():
@@ -59,14 +67,14 @@ def create_cliente_routes() -> Blueprint:
     def obtener_cliente_por_id(cliente_id: str):
         """Obtiene un cliente por su ID."""
         headers = request.headers
-        return make_request_to_clientes(f"/clientes/{cliente_id}", headers=headers)
+        return make_request_to_clientes(f"/clientes/{cliente_id}", params=request.args.to_dict(), headers=headers)
 
     @cliente_routes.route("/buscar", methods=["GET"])
     def buscar_clientes_por_nombre():
         """Busca clientes por nombre."""
         headers = request.headers
         nombre = request.args.get("nombre", "")
-        params = {"nombre": nombre} if nombre else None
+        params = request.args.to_dict() if nombre else None
         return make_request_to_clientes("/clientes/buscar", headers=headers, params=params)
 
     return cliente_routes
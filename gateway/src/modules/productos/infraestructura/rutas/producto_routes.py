@@ -1,11 +1,167 @@
 import logging
 import os
+from functools import partial
 
 import requests
-from flask import Blueprint, jsonify, request
+from config.trazas import llamar_servicio
+from flask import Blueprint, Response, jsonify, make_response, request
 
 logger = logging.getLogger(__name__)
 
+# Tamaño de los bloques leídos del microservicio al reenviar respuestas en streaming
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Cabeceras de la respuesta del microservicio que se devuelven al cliente
+CABECERAS_REENVIADAS = ("X-Total-Count", "ETag", "Cache-Control")
+
+# Formatos del listado que se negocian con Accept: JSON para clientes externos (y por defecto),
+# MessagePack para consumidores internos que lo piden
+MIMETYPE_MSGPACK = "application/x-msgpack"
+TIPOS_LISTADO = ("application/json", MIMETYPE_MSGPACK)
+
+
+def _acepta_codificacion(response) -> bool:
+    """Si el cuerpo del microservicio viene comprimido en una codificación que el cliente acepta."""
+    codificacion = response.headers.get("Content-Encoding")
+    return bool(codificacion) and request.accept_encodings.quality(codificacion) > 0
+
+
+def _reenviar_comprimido(response, cabeceras: dict) -> Response:
+    """Devuelve el cuerpo comprimido del microservicio sin descomprimirlo ni volver a comprimirlo."""
+    try:
+        cuerpo = response.raw.read(decode_content=False)
+    finally:
+        response.close()
+    reenviada = Response(
+        cuerpo, status=response.status_code, content_type=response.headers.get("Content-Type"), headers=cabeceras
+    )
+    reenviada.headers["Content-Encoding"] = response.headers["Content-Encoding"]
+    reenviada.vary.add("Accept-Encoding")
+    return reenviada
+
+
+def _reenviar_cuerpo(response, cabeceras: dict) -> Response:
+    """Devuelve el cuerpo del microservicio en su formato, sin decodificarlo ni volver a codificarlo."""
+    try:
+        cuerpo = response.content
+    finally:
+        response.close()
+    return Response(cuerpo, status=response.status_code, content_type=response.headers.get("Content-Type"), headers=cabeceras)
+
+
+def _error_de_conexion(error: requests.exceptions.RequestException):
+    logger.error(f"Error connecting to productos service: {str(error)}")
+    return jsonify({"success": False, "error": f"Error conectando con el servicio de productos: {str(error)}"}), 503
+
+
+def _cabeceras_para_productos(endpoint, headers=None) -> dict:
+    """
+    Cabeceras de la petición al microservicio: las de `headers` más Authorization, If-None-Match
+    y Accept-Encoding de la petición original.
+    """
+    # Si se pasaron headers, convertirlos a dict (EnvironHeaders u otro tipo)
+    headers_dict = dict(headers) if headers else {}
+
+    # Asegurar que el header Authorization se pase correctamente desde la request original
+    auth_header = request.headers.get("Authorization")
+    if auth_header:
+        headers_dict["Authorization"] = auth_header
+        logger.debug(f"Forwarding Authorization header to productos service")
+    else:
+        logger.warning(f"No Authorization header found in request to {endpoint}")
+
+    # Peticiones condicionales: el microservicio responde 304 si el ETag sigue vigente
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        headers_dict["If-None-Match"] = if_none_match
+
+    # El microservicio comprime con una codificación que el cliente acepta, y su cuerpo se
+    # reenvía sin descomprimir; sin la cabecera, requests pide gzip/deflate y lo descomprime
+    accept_encoding = request.headers.get("Accept-Encoding")
+    if accept_encoding:
+        headers_dict["Accept-Encoding"] = accept_encoding
+    return headers_dict
+
+
+def _enviar(method: str, url: str, headers: dict, params=None, data=None):
+    """
+    Envía la petición al microservicio con el método de requests que corresponde.
+
+    stream=True en todos los métodos deja el cuerpo sin leer, para poder reenviarlo comprimido
+    tal como llegó; sin él requests ya lo habría leído y descomprimido y raw quedaría vacío.
+    """
+    if method == "GET":
+        argumentos = {"params": params}
+    elif method == "DELETE":
+        argumentos = {}
+    else:
+        argumentos = {"json": data}
+    enviar = getattr(requests, method.lower())
+    return llamar_servicio("productos", method, enviar, url, headers=headers, **argumentos, timeout=30, stream=True)
+
+
+def _cabeceras_reenviadas(response) -> dict:
+    return {nombre: response.headers[nombre] for nombre in CABECERAS_REENVIADAS if nombre in response.headers}
+
+
+def _respuesta_de_productos(response, reenviar_cuerpo: bool):
+    """Respuesta al cliente: 304, cuerpo comprimido, cuerpo tal cual (`reenviar_cuerpo`) o JSON."""
+    cabeceras = _cabeceras_reenviadas(response)
+    if response.status_code == 304:
+        response.close()
+        return Response(status=304, headers=cabeceras)
+    if _acepta_codificacion(response):
+        return _reenviar_comprimido(response, cabeceras)
+    if reenviar_cuerpo and response.status_code == 200:
+        return _reenviar_cuerpo(response, cabeceras)
+    try:
+        return response.json(), response.status_code, cabeceras
+    finally:
+        response.close()
+
+
+def _reenviar_stream(response) -> Response:
+    """Reenvía en bloques el cuerpo 200 de una exportación, comprimido si el cliente acepta la codificación."""
+    comprimido = _acepta_codificacion(response)
+
+    def reenviar():
+        try:
+            if comprimido:
+                yield from response.raw.stream(STREAM_CHUNK_BYTES, decode_content=False)
+            else:
+                yield from response.iter_content(chunk_size=STREAM_CHUNK_BYTES)
+        finally:
+            response.close()
+
+    passthrough = {k: v for k, v in response.headers.items() if k.lower() == "content-disposition"}
+    passthrough.update(_cabeceras_reenviadas(response))
+    if comprimido:
+        passthrough["Content-Encoding"] = response.headers["Content-Encoding"]
+        passthrough["Vary"] = "Accept-Encoding"
+    return Response(reenviar(), status=200, content_type=response.headers.get("Content-Type"), headers=passthrough)
+
+
+def _peticion_a_productos(
+    servicio_url: str, endpoint, method="GET", params=None, data=None, headers=None, reenviar_cuerpo=False
+):
+    """
+    Hace una petición al microservicio de productos en `servicio_url`.
+
+    Con `reenviar_cuerpo` una respuesta 200 se devuelve tal como llegó, en el formato
+    que haya negociado el Accept de `headers`, sin pasar por response.json() y jsonify.
+    """
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        return jsonify({"error": "Método no soportado"}), 405
+    try:
+        url = f"{servicio_url}{endpoint}"
+        headers_dict = _cabeceras_para_productos(endpoint, headers)
+        logger.debug(f"Making {method} request to {url} with headers: {list(headers_dict.keys())}")
+        response = _enviar(method, url, headers_dict, params, data)
+        logger.debug(f"Response from productos service: {response.status_code}")
+        return _respuesta_de_productos(response, reenviar_cuerpo)
+    except requests.exceptions.RequestException as e:
+        return _error_de_conexion(e)
+
 
 def create_producto_routes() -> Blueprint:
     """
@@ -16,68 +172,84 @@ def create_producto_routes() -> Blueprint:
 
     PRODUCTOS_SERVICE_URL = os.environ.get("PRODUCTOS_SERVICE_URL", "http://localhost:5002")
 
-    def make_request_to_productos(endpoint, method="GET", params=None, data=None, headers=None):
-        """Hace una petición al microservicio de productos."""
-        try:
-            url = f"{PRODUCTOS_SERVICE_URL}{endpoint}"
-
-            # Preparar headers: convertir a diccionario y asegurar Authorization
-            headers_dict = {}
-
-            # Si se pasaron headers, convertirlos a dict
-            if headers:
-                if isinstance(headers, dict):
-                    headers_dict = headers.copy()
-                else:
-                    # Convertir EnvironHeaders u otro tipo a dict
-                    headers_dict = dict(headers)
-
-            # Asegurar que el header Authorization se pase correctamente desde la request original
-            auth_header = request.headers.get("Authorization")
-            if auth_header:
-                headers_dict["Authorization"] = auth_header
-                logger.debug(f"Forwarding Authorization header to productos service")
-            else:
-                logger.warning(f"No Authorization header found in request to {endpoint}")
-
-            logger.debug(f"Making {method} request to {url} with headers: {list(headers_dict.keys())}")
-
-            if method == "GET":
-                response = requests.get(url, headers=headers_dict, params=params, timeout=30)
-            elif method == "POST":
-                response = requests.post(url, headers=headers_dict, json=data, timeout=30)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers_dict, json=data, timeout=30)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers_dict, timeout=30)
-            else:
-                return jsonify({"error": "Método no soportado"}), 405
-
-            logger.debug(f"Response from productos service: {response.status_code}")
-            return response.json(), response.status_code
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error connecting to productos service: {str(e)}")
-            return jsonify({"success": False, "error": f"Error conectando con el servicio de productos: {str(e)}"}), 503
+    make_request_to_productos = partial(_peticion_a_productos, PRODUCTOS_SERVICE_URL)
 
     @producto_routes.route("", methods=["GET"])
     def obtener_todos_los_productos():
-        """Obtiene todos los productos."""
-        # Preparar headers con Authorization si existe
-        headers = {}
-        auth_header = request.headers.get("Authorization")
-        if auth_header:
-            headers["Authorization"] = auth_header
-        return make_request_to_productos("/productos", headers=headers)
+        """
+        Obtiene todos los productos (en JSON, o en MessagePack si el cliente lo pide con Accept).
+
+        Al microservicio se le pide el formato que negoció el cliente y su cuerpo se reenvía
+        tal cual, comprimido si el cliente acepta la codificación, sin decodificarlo aquí.
+        """
+        headers = {"Accept": request.accept_mimetypes.best_match(TIPOS_LISTADO, default="application/json")}
+        respuesta = make_response(
+            make_request_to_productos("/productos", params=request.args.to_dict(), headers=headers, reenviar_cuerpo=True)
+        )
+        respuesta.vary.add("Accept")
+        return respuesta
+
+    @producto_routes.route("/export", methods=["GET"])
+    def exportar_productos():
+        """Exporta el catálogo completo reenviando el stream del microservicio sin almacenarlo."""
+        url = f"{PRODUCTOS_SERVICE_URL}/productos/export"
+        try:
+            response = _enviar("GET", url, _cabeceras_para_productos("/productos/export"), params=request.args)
+        except requests.exceptions.RequestException as e:
+            return _error_de_conexion(e)
+        if response.status_code != 200:
+            # 304 y errores: sin cuerpo que reenviar en streaming
+            return _respuesta_de_productos(response, reenviar_cuerpo=False)
+        return _reenviar_stream(response)
+
+    @producto_routes.route("/cambios", methods=["GET"])
+    def obtener_cambios():
+        """Obtiene los cambios del catálogo posteriores a una secuencia (sincronización incremental)."""
+        return make_request_to_productos("/productos/cambios", params=request.args.to_dict())
+
+    @producto_routes.route("/resumen", methods=["GET"])
+    def resumir_productos():
+        """Cuenta productos y unidades agrupados (agrupar=categoria|id_proveedor|ubicacion)."""
+        return make_request_to_productos("/productos/resumen", params=request.args.to_dict())
+
+    @producto_routes.route("/lote-ids", methods=["POST"])
+    def obtener_productos_por_ids():
+        """Obtiene varios productos por ID en una sola petición."""
+        return make_request_to_productos("/productos/lote-ids", method="POST", data=request.get_json(silent=True))
+
+    @producto_routes.route("/asignacion", methods=["GET"])
+    def planificar_asignacion():
+        """Plan de despacho FEFO de un producto entre sus lotes."""
+        return make_request_to_productos("/productos/asignacion", params=request.args.to_dict())
+
+    @producto_routes.route("/asignaciones", methods=["POST"])
+    def planificar_asignaciones():
+        """Plan de despacho FEFO de un pedido completo."""
+        return make_request_to_productos("/productos/asignaciones", method="POST", data=request.get_json(silent=True))
+
+    @producto_routes.route("/analitica/<any(inventario, vencimientos, estado):recurso>", methods=["GET"])
+    def analitica(recurso: str):
+        """Analítica de inventario: valor por dimensión, vencimientos y estado del snapshot."""
+        return make_request_to_productos(f"/productos/analitica/{recurso}", params=request.args.to_dict())
+
+    @producto_routes.route("/reservas", methods=["POST"])
+    def reservar_stock():
+        """Reserva stock de uno o más productos."""
+        return make_request_to_productos("/productos/reservas", method="POST", data=request.get_json(silent=True))
+
+    @producto_routes.route("/reservas/<string:reserva_id>", methods=["GET"])
+    def obtener_reserva(reserva_id: str):
+        """Obtiene una reserva de stock por su ID."""
+        return make_request_to_productos(f"/productos/reservas/{reserva_id}")
+
+    @producto_routes.route("/reservas/<string:reserva_id>/<any(confirmar, liberar):accion>", methods=["POST"])
+    def finalizar_reserva(reserva_id: str, accion: str):
+        """Confirma o libera una reserva de stock."""
+        return make_request_to_productos(f"/productos/reservas/{reserva_id}/{accion}", method="POST")
 
     @producto_routes.route("/<string:producto_id>", methods=["GET"])
     def obtener_producto_por_id(producto_id: str):
         """Obtiene un producto por su ID."""
-        # Preparar headers con Authorization si existe
-        headers = {}
-        auth_header = request.headers.get("Authorization")
-        if auth_header:
-            headers["Authorization"] = auth_header
-        return make_request_to_productos(f"/productos/{producto_id}", headers=headers)
+        return make_request_to_productos(f"/productos/{producto_id}", params=request.args.to_dict())
 
     return producto_routes
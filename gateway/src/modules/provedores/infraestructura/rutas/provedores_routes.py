@@ -1,7 +1,12 @@
 import os
 
 import requests
-from flask import Blueprint, jsonify, request
+from config.trazas import llamar_servicio
+from flask import Blueprint, Response, jsonify, request
+
+# Cabeceras de la respuesta del microservicio que se devuelven al cliente (If-None-Match viaja
+# con las cabeceras de la petición, así que el microservicio puede responder 304)
+CABECERAS_REENVIADAS = ("ETag", "Cache-Control")
 
 
 def create_provedores_routes() -> Blueprint:
@@ -18,17 +23,20 @@ def create_provedores_routes() -> Blueprint:
         try:
             url = f"{PROVEDORES_SERVICE_URL}{endpoint}"
             if method == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = llamar_servicio("provedores", "GET", requests.get, url, headers=headers, params=params, timeout=30)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                response = llamar_servicio("provedores", "POST", requests.post, url, headers=headers, json=data, timeout=30)
             elif method == "PUT":
-                response = requests.put(url, headers=headers, json=data, timeout=30)
+                response = llamar_servicio("provedores", "PUT", requests.put, url, headers=headers, json=data, timeout=30)
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=30)
+                response = llamar_servicio("provedores", "DELETE", requests.delete, url, headers=headers, timeout=30)
             else:
                 return jsonify({"error": "Método no soportado"}), 405
 
-            return response.json(), response.status_code
+            cabeceras = {nombre: response.headers[nombre] for nombre in CABECERAS_REENVIADAS if nombre in response.headers}
+            if response.status_code == 304:
+                return Response(status=304, headers=cabeceras)
+            return response.json(), response.status_code, cabeceras
 
         except requests.exceptions.RequestException as e:
             return jsonify({"success": False, "error": f"Error conectando con el servicio de provedores: {str(e)}"}), 503
@@ -37,13 +45,19 @@ def create_provedores_routes() -> Blueprint:
     def obtener_todos_los_provedores():
         """Obtiene todos los provedores."""
         headers = request.headers
-        return make_request_to_provedores("/provedores", headers=headers)
+        return make_request_to_provedores("/provedores", params=request.args.to_dict(), headers=headers)
+
+    @provedores_routes.route("/resumen", methods=["GET"])
+    def resumir_provedores():
+        """Cuenta provedores agrupados (agrupar=pais)."""
+        headers = request.headers
+        return make_request_to_provedores("/provedores/resumen", params=request.args.to_dict(), headers=headers)
 
     @provedores_routes.route("/<string:provedor_id>", methods=["GET"])
     def obtener_provedor_por_id(provedor_id: str):
         """Obtiene un provedor por su ID."""
         headers = request.headers
-        return make_request_to_provedores(f"/provedores/{provedor_id}", headers=headers)
+        return make_request_to_provedores(f"/provedores/{provedor_id}", params=request.args.to_dict(), headers=headers)
 
     @provedores_routes.route("", methods=["POST"])
     def registrar_provedor():
@@ -0,0 +1,67 @@
+"""
+Tests unitarios para la compresión de respuestas del gateway
+"""
+
+import gzip
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+from flask import Flask
+
+# Agregar el directorio del gateway al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
+
+
+class TestCompresionGateway:
+    """Tests de la compresión del gateway sobre las respuestas reenviadas"""
+
+    def setup_method(self):
+        """Setup para cada test"""
+        from config import compresion
+        from modules.productos.infraestructura.rutas.producto_routes import create_producto_routes
+        from modules.provedores.infraestructura.rutas.provedores_routes import create_provedores_routes
+
+        self.app = Flask(__name__)
+        self.app.config["TESTING"] = True
+        self.app.register_blueprint(create_producto_routes())
+        self.app.register_blueprint(create_provedores_routes())
+        compresion.registrar_compresion(self.app, minimo_bytes=100)
+        self.client = self.app.test_client()
+
+    @pytest.fixture(autouse=True)
+    def sin_brotli(self, monkeypatch):
+        from config import compresion
+
+        monkeypatch.setattr(compresion, "brotli", None)
+
+    @patch("modules.provedores.infraestructura.rutas.provedores_routes.requests.get")
+    def test_respuesta_sin_comprimir_se_comprime(self, mock_get):
+        """Test de que el JSON sin comprimir de un microservicio se comprime hacia el cliente"""
+        datos = {"success": True, "data": [{"id": i, "nombre": "Proveedor"} for i in range(30)]}
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.status_code = 200
+        mock_response.json.return_value = datos
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/provedores", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.get_data()).startswith(b"{")
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_respuesta_comprimida_no_se_recomprime(self, mock_get):
+        """Test de que un cuerpo ya comprimido por el microservicio no se comprime dos veces"""
+        cuerpo = gzip.compress(b"[" + b'{"id": "prod-001"},' * 50 + b"{}]")
+        mock_response = Mock()
+        mock_response.headers = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_response.raw.read.return_value = cuerpo
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.get_data() == cuerpo
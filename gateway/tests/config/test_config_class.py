@@ -111,6 +111,40 @@ class TestConfig:
         assert len(config.app.before_request_funcs) > 0
         assert len(config.app.after_request_funcs) > 0
 
+    @patch("config.config.init_db")
+    @patch("config.config.db")
+    def test_configure_metrics_sin_token_no_expone_metrics(self, mock_db, mock_init_db):
+        """Test de que sin METRICAS_TOKEN el gateway mide pero no expone /metrics"""
+        from config.config import Config
+        from flask import Flask
+
+        config = Config()
+        config.app = Flask(__name__)
+        config.app.config["METRICAS_TOKEN"] = ""
+        config._configure_metrics()
+
+        assert config.app.test_client().get("/metrics").status_code == 404
+        assert len(config.app.before_request_funcs) > 0
+
+    @patch("config.config.init_db")
+    @patch("config.config.db")
+    def test_configure_metrics_exige_el_token(self, mock_db, mock_init_db):
+        """Test de que con METRICAS_TOKEN /metrics solo responde a ese token como Bearer"""
+        from config.config import Config
+        from flask import Flask
+
+        config = Config()
+        config.app = Flask(__name__)
+        config.app.config["METRICAS_TOKEN"] = "token-de-prometheus"
+        config._configure_metrics()
+        cliente = config.app.test_client()
+
+        assert cliente.get("/metrics").status_code == 401
+        assert cliente.get("/metrics", headers={"Authorization": "Bearer otro"}).status_code == 401
+        respuesta = cliente.get("/metrics", headers={"Authorization": "Bearer token-de-prometheus"})
+        assert respuesta.status_code == 200
+        assert "http_peticiones_total" in respuesta.get_data(as_text=True)
+
     @patch("config.config.init_db")
     @patch("config.config.db")
     def test_configure_external_services(self, mock_db, mock_init_db):
@@ -0,0 +1,30 @@
+"""
+Tests unitarios para las migraciones del gateway
+"""
+
+import os
+import sys
+
+from sqlalchemy import create_engine, inspect
+
+# Agregar el directorio del gateway al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
+
+
+class TestMigracionesGateway:
+    """Tests de las migraciones del esquema del gateway"""
+
+    def test_base_vacia_queda_igual_que_los_modelos(self, tmp_path):
+        """Test de que las migraciones crean la tabla de usuarios del modelo y no repiten lo aplicado"""
+        import modules.autenticador.infraestructura.dto  # noqa: F401
+        from config.db import db
+        from config.migraciones import aplicar_migraciones
+        from migraciones import MIGRACIONES
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+        assert [m.version for m in aplicar_migraciones(engine, MIGRACIONES)] == [1]
+        for tabla in db.metadata.sorted_tables:
+            assert {c["name"] for c in inspect(engine).get_columns(tabla.name)} == set(tabla.columns.keys())
+        assert aplicar_migraciones(engine, MIGRACIONES) == []
+        engine.dispose()
@@ -0,0 +1,31 @@
+"""
+Tests unitarios para las opciones del motor de base de datos del gateway
+"""
+
+import os
+import sys
+
+# Agregar el directorio del gateway al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
+
+
+class TestMotorGateway:
+    """Tests del pool configurado según la URL de la base de datos"""
+
+    def test_postgres_usa_psycopg2_y_pool(self):
+        """Test de que una URL postgres:// se normaliza y recibe pool con pre-ping y statement timeout"""
+        from config.motor import normalizar_uri, opciones_motor
+
+        uri = normalizar_uri("postgres://u:p@db/gateway")
+        opciones = opciones_motor(uri, {"DB_POOL_SIZE": "3"})
+
+        assert uri == "postgresql+psycopg2://u:p@db/gateway"
+        assert opciones["pool_size"] == 3
+        assert opciones["pool_pre_ping"] is True
+        assert opciones["connect_args"] == {"options": "-c statement_timeout=30000"}
+
+    def test_sqlite_sin_opciones(self):
+        """Test de que la base SQLite por defecto del gateway no recibe opciones de pool"""
+        from config.motor import opciones_motor
+
+        assert opciones_motor("sqlite:///app.db", {}) == {}
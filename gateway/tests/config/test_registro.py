@@ -0,0 +1,42 @@
+"""
+Tests unitarios para el registro de accesos del gateway
+"""
+
+import json
+import logging
+import os
+import sys
+
+# Agregar el directorio del gateway al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
+
+
+class TestRegistroGateway:
+    """Tests de la cola de registros tras el fork de los workers"""
+
+    def test_listener_se_reinicia_en_el_proceso_hijo(self, tmp_path, monkeypatch):
+        """Test de que un proceso hijo (worker de gunicorn con preload) sigue escribiendo sus registros"""
+        from config import registro
+
+        salida = open(tmp_path / "registro.log", "w")
+        monkeypatch.setattr(sys, "stderr", salida)
+        logger = logging.getLogger("test_registro_fork")
+        registro.configurar_registro_asincrono(logger, logging.INFO)
+        manejador, oyente = registro._oyentes[-1]
+        try:
+            pid = os.fork()
+            if pid == 0:
+                logger.info("desde el hijo", extra={"pid": os.getpid()})
+                registro._detener_oyentes()
+                os._exit(0)
+            _, estado = os.waitpid(pid, 0)
+        finally:
+            oyente.stop()
+            logger.removeHandler(manejador)
+            registro._oyentes.remove((manejador, oyente))
+            salida.close()
+
+        assert estado == 0
+        datos = json.loads((tmp_path / "registro.log").read_text())
+        assert datos["mensaje"] == "desde el hijo"
+        assert datos["pid"] == pid
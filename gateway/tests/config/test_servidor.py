@@ -0,0 +1,40 @@
+"""
+Tests unitarios para la configuración de gunicorn del gateway
+"""
+
+import os
+import runpy
+import sys
+from types import SimpleNamespace
+
+# Agregar el directorio del gateway al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
+
+
+class TestServidorGateway:
+    """Tests de los valores de gunicorn y del hook de arranque de los workers"""
+
+    def test_bind_y_workers_desde_entorno(self, monkeypatch):
+        """Test de que HOST/PORT definen el bind y GUNICORN_WORKERS el número de procesos"""
+        from config import servidor
+
+        monkeypatch.delenv("GUNICORN_BIND", raising=False)
+        monkeypatch.setenv("HOST", "127.0.0.1")
+        monkeypatch.setenv("PORT", "5001")
+        monkeypatch.setenv("GUNICORN_WORKERS", "2")
+
+        configuracion = runpy.run_path(servidor.__file__)
+
+        assert configuracion["bind"] == "127.0.0.1:5001"
+        assert configuracion["workers"] == 2
+        assert configuracion["worker_class"] == "gthread"
+
+    def test_worker_sin_tareas_en_segundo_plano(self):
+        """Test de que los hooks funcionan con una aplicación sin base de datos ni tareas registradas"""
+        from config import servidor
+        from flask import Flask
+
+        worker = SimpleNamespace(wsgi=Flask(__name__))
+
+        servidor.post_worker_init(worker)
+        servidor.worker_exit(None, worker)
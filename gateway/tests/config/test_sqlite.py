@@ -0,0 +1,42 @@
+"""
+Tests unitarios para los pragmas de SQLite del gateway
+"""
+
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+# Agregar el directorio del gateway al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
+
+
+class TestSqliteGateway:
+    """Tests de los pragmas aplicados por init_db"""
+
+    def test_init_db_activa_wal(self, tmp_path):
+        """Test de que init_db deja WAL y busy_timeout activos en la base del gateway"""
+        from config.db import db, init_db
+        from config.sqlite import leer_pragmas_sqlite, pragmas_sqlite
+
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'app.db'}"
+        app.config["SQLITE_PRAGMAS"] = pragmas_sqlite({"SQLITE_BUSY_TIMEOUT_MS": "1000"})
+
+        init_db(app)
+
+        with app.app_context():
+            efectivos = leer_pragmas_sqlite(db.engine, ("journal_mode", "busy_timeout"))
+        assert efectivos == {"journal_mode": "WAL", "busy_timeout": "1000"}
+
+    def test_pragmas_invalidos(self):
+        """Test de que un modo de journal desconocido se rechaza al arrancar"""
+        from config.sqlite import pragmas_sqlite
+
+        with pytest.raises(ValueError, match="SQLITE_JOURNAL_MODE"):
+            pragmas_sqlite({"SQLITE_JOURNAL_MODE": "RAPIDO"})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,8 +2,12 @@
 Tests unitarios para las rutas de productos del gateway
 """
 
+import gzip
+import json
 import os
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,6 +17,36 @@ from flask import Flask
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "src"))
 
 
+class _ProductosGzip(BaseHTTPRequestHandler):
+    """Microservicio de prueba que responde a cualquier POST con un cuerpo JSON comprimido en gzip."""
+
+    CUERPO = gzip.compress(json.dumps({"resultados": [{"id": f"p{i}", "encontrado": True} for i in range(200)]}).encode())
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(self.CUERPO)))
+        self.end_headers()
+        self.wfile.write(self.CUERPO)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def productos_gzip(monkeypatch):
+    """URL de un microservicio real (HTTP en un hilo) que responde comprimido."""
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _ProductosGzip)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    monkeypatch.setenv("PRODUCTOS_SERVICE_URL", f"http://127.0.0.1:{servidor.server_port}")
+    yield
+    servidor.shutdown()
+    servidor.server_close()
+
+
 class TestProductoRoutes:
     """Tests para las rutas de productos"""
 
@@ -30,19 +64,23 @@ class TestProductoRoutes:
     def test_obtener_todos_los_productos_success(self, mock_get):
         """Test del endpoint GET /productos exitoso"""
         mock_response = Mock()
-        mock_response.json.return_value = {"productos": []}
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = b"[]"
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
         response = self.client.get("/productos")
 
         assert response.status_code == 200
+        assert response.get_json() == []
         mock_get.assert_called_once()
+        mock_response.json.assert_not_called()
 
     @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
     def test_obtener_producto_por_id_success(self, mock_get):
         """Test del endpoint GET /productos/<id> exitoso"""
         mock_response = Mock()
+        mock_response.headers = {}
         mock_response.json.return_value = {"id": "producto-123", "name": "Test Producto"}
         mock_response.status_code = 200
         mock_get.return_value = mock_response
@@ -56,7 +94,8 @@ class TestProductoRoutes:
     def test_obtener_todos_los_productos_with_authorization(self, mock_get):
         """Test del endpoint GET /productos con header Authorization"""
         mock_response = Mock()
-        mock_response.json.return_value = {"productos": []}
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = b"[]"
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -72,6 +111,7 @@ class TestProductoRoutes:
     def test_obtener_producto_por_id_with_authorization(self, mock_get):
         """Test del endpoint GET /productos/<id> con header Authorization"""
         mock_response = Mock()
+        mock_response.headers = {}
         mock_response.json.return_value = {"id": "producto-123"}
         mock_response.status_code = 200
         mock_get.return_value = mock_response
@@ -157,6 +197,462 @@ class TestProductoRoutes:
             elif "PRODUCTOS_SERVICE_URL" in os.environ:
                 del os.environ["PRODUCTOS_SERVICE_URL"]
 
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_exportar_productos_stream(self, mock_get):
+        """Test del endpoint GET /productos/export reenviando el stream"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {
+            "Content-Type": "application/x-ndjson",
+            "Content-Disposition": 'attachment; filename="productos.ndjson"',
+        }
+        mock_response.iter_content.return_value = iter([b'{"id":"p1"}\n', b'{"id":"p2"}\n'])
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/export?formato=ndjson", headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.content_type == "application/x-ndjson"
+        assert response.headers["Content-Disposition"] == 'attachment; filename="productos.ndjson"'
+        assert response.get_data() == b'{"id":"p1"}\n{"id":"p2"}\n'
+        mock_response.close.assert_called_once()
+        call_kwargs = mock_get.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["params"]["formato"] == "ndjson"
+        assert call_kwargs["headers"]["Authorization"] == "Bearer token"
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_exportar_productos_error_upstream(self, mock_get):
+        """Test del endpoint GET /productos/export cuando el microservicio responde con error"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.status_code = 400
+        mock_response.json.return_value = {"error": "Parámetro formato debe ser ndjson o csv"}
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/export?formato=xml")
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+        mock_response.close.assert_called_once()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_exportar_productos_connection_error(self, mock_get):
+        """Test del endpoint GET /productos/export sin conexión al microservicio"""
+        import requests
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        response = self.client.get("/productos/export")
+
+        assert response.status_code == 503
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_obtener_cambios_success(self, mock_get):
+        """Test del endpoint GET /productos/cambios reenviando desde y limite"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"cambios": [], "eliminados": [], "desde": 5, "hasta": 5, "hay_mas": False}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/cambios?desde=5&limite=50")
+
+        assert response.status_code == 200
+        assert response.get_json()["hasta"] == 5
+        assert mock_get.call_args.kwargs["params"] == {"desde": "5", "limite": "50"}
+        assert mock_get.call_args.args[0].endswith("/productos/cambios")
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.post")
+    def test_obtener_productos_por_ids_success(self, mock_post):
+        """Test del endpoint POST /productos/lote-ids reenviando la lista de IDs"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"resultados": [{"id": "p1", "encontrado": False, "producto": None}]}
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        response = self.client.post("/productos/lote-ids", json={"ids": ["p1"]}, headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == 200
+        assert response.get_json()["resultados"][0]["encontrado"] is False
+        assert mock_post.call_args.args[0].endswith("/productos/lote-ids")
+        assert mock_post.call_args.kwargs["json"] == {"ids": ["p1"]}
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer token"
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.post")
+    def test_reservar_stock_conflicto(self, mock_post):
+        """Test del endpoint POST /productos/reservas propagando el 409 por falta de stock"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"error": "Stock insuficiente", "producto_id": "p1", "disponible": 0}
+        mock_response.status_code = 409
+        mock_post.return_value = mock_response
+        cuerpo = {"lineas": [{"producto_id": "p1", "cantidad": 2}]}
+
+        response = self.client.post("/productos/reservas", json=cuerpo, headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == 409
+        assert response.get_json()["producto_id"] == "p1"
+        assert mock_post.call_args.args[0].endswith("/productos/reservas")
+        assert mock_post.call_args.kwargs["json"] == cuerpo
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_obtener_reserva(self, mock_get):
+        """Test del endpoint GET /productos/reservas/<id>"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"id": "r1", "estado": "PENDIENTE"}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/reservas/r1")
+
+        assert response.status_code == 200
+        assert mock_get.call_args.args[0].endswith("/productos/reservas/r1")
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.post")
+    def test_confirmar_y_liberar_reserva(self, mock_post):
+        """Test de los endpoints POST /productos/reservas/<id>/confirmar y /liberar"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"id": "r1"}
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        assert self.client.post("/productos/reservas/r1/confirmar").status_code == 200
+        assert mock_post.call_args.args[0].endswith("/productos/reservas/r1/confirmar")
+        assert self.client.post("/productos/reservas/r1/liberar").status_code == 200
+        assert mock_post.call_args.args[0].endswith("/productos/reservas/r1/liberar")
+        assert self.client.post("/productos/reservas/r1/otra").status_code in (404, 405)
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_planificar_asignacion(self, mock_get):
+        """Test del endpoint GET /productos/asignacion reenviando los parámetros"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"completo": True, "asignaciones": []}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/asignacion?nombre=Gasa&cantidad=3")
+
+        assert response.status_code == 200
+        assert mock_get.call_args.args[0].endswith("/productos/asignacion")
+        assert mock_get.call_args.kwargs["params"] == {"nombre": "Gasa", "cantidad": "3"}
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.post")
+    def test_planificar_asignaciones(self, mock_post):
+        """Test del endpoint POST /productos/asignaciones reenviando el pedido"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"completo": False, "planes": []}
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+        cuerpo = {"lineas": [{"nombre": "Gasa", "cantidad": 3}]}
+
+        response = self.client.post("/productos/asignaciones", json=cuerpo)
+
+        assert response.status_code == 200
+        assert mock_post.call_args.args[0].endswith("/productos/asignaciones")
+        assert mock_post.call_args.kwargs["json"] == cuerpo
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_analitica(self, mock_get):
+        """Test del endpoint GET /productos/analitica/<recurso> reenviando los parámetros"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"productos": 1, "unidades": 2, "valor": 3.0}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/analitica/vencimientos?horizontes=30,60")
+
+        assert response.status_code == 200
+        assert mock_get.call_args.args[0].endswith("/productos/analitica/vencimientos")
+        assert mock_get.call_args.kwargs["params"] == {"horizontes": "30,60"}
+        assert self.client.get("/productos/analitica/otro").status_code == 404
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_resumir_productos(self, mock_get):
+        """Test del endpoint GET /productos/resumen reenviando los parámetros"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"agrupar": "ubicacion", "total": 0, "grupos": []}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/resumen?agrupar=ubicacion")
+
+        assert response.status_code == 200
+        assert mock_get.call_args.args[0].endswith("/productos/resumen")
+        assert mock_get.call_args.kwargs["params"] == {"agrupar": "ubicacion"}
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_fields_se_reenvia(self, mock_get):
+        """Test de que ?fields= se reenvía en listado y detalle"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {}
+        mock_response.content = b"[]"
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        assert self.client.get("/productos?fields=id,nombre").status_code == 200
+        assert mock_get.call_args.kwargs["params"] == {"fields": "id,nombre"}
+        assert self.client.get("/productos/prod-001?fields=lote").status_code == 200
+        assert mock_get.call_args.kwargs["params"] == {"fields": "lote"}
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_filtrado_reenvia_total(self, mock_get):
+        """Test de que los filtros se reenvían y X-Total-Count vuelve al cliente"""
+        mock_response = Mock()
+        mock_response.headers = {"X-Total-Count": "42", "Content-Type": "application/json"}
+        mock_response.content = b'[{"id": "prod-001"}]'
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos?con_stock=true&orden=-valor_unitario&limite=1")
+
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == "42"
+        assert mock_get.call_args.kwargs["params"] == {"con_stock": "true", "orden": "-valor_unitario", "limite": "1"}
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_reenvia_etag(self, mock_get):
+        """Test de que el ETag del microservicio vuelve al cliente tal cual"""
+        mock_response = Mock()
+        mock_response.headers = {"ETag": 'W/"productos-42-1a2b"', "Cache-Control": "private, no-cache"}
+        mock_response.content = b"[]"
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == 'W/"productos-42-1a2b"'
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_if_none_match_responde_304(self, mock_get):
+        """Test de que If-None-Match se reenvía y un 304 del microservicio llega sin cuerpo y con Vary"""
+        mock_response = Mock()
+        mock_response.headers = {"ETag": 'W/"productos-42-1a2b"'}
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos", headers={"If-None-Match": 'W/"productos-42-1a2b"'})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == 'W/"productos-42-1a2b"'
+        assert "Accept" in response.headers["Vary"]
+        assert response.get_data() == b""
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == 'W/"productos-42-1a2b"'
+        mock_response.json.assert_not_called()
+        mock_response.close.assert_called_once()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_exportar_productos_if_none_match_responde_304(self, mock_get):
+        """Test de que la exportación también responde 304 cuando el catálogo no cambió"""
+        mock_response = Mock()
+        mock_response.headers = {"ETag": 'W/"productos-42"'}
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/export", headers={"If-None-Match": 'W/"productos-42"'})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == 'W/"productos-42"'
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == 'W/"productos-42"'
+        mock_response.close.assert_called_once()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_comprimido_se_reenvia_sin_descomprimir(self, mock_get):
+        """Test de que un cuerpo gzip del microservicio llega tal cual al cliente que pidió MessagePack"""
+        cuerpo = gzip.compress(b"\x91\x81\xa2id\xa8prod-001")
+        mock_response = Mock()
+        mock_response.headers = {
+            "Content-Encoding": "gzip",
+            "Content-Type": "application/x-msgpack",
+            "ETag": 'W/"productos-1"',
+        }
+        mock_response.status_code = 200
+        mock_response.raw.read.return_value = cuerpo
+        mock_get.return_value = mock_response
+
+        response = self.client.get(
+            "/productos", headers={"Accept": "application/x-msgpack", "Accept-Encoding": "gzip, deflate"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["ETag"] == 'W/"productos-1"'
+        assert response.get_data() == cuerpo
+        mock_response.raw.read.assert_called_once_with(decode_content=False)
+        mock_response.json.assert_not_called()
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert mock_get.call_args.kwargs["headers"]["Accept-Encoding"] == "gzip, deflate"
+
+    def test_post_comprimido_se_reenvia_con_su_cuerpo(self, productos_gzip):
+        """Test de que un POST cuya respuesta viene en gzip llega comprimido y completo, no vacío"""
+        from modules.productos.infraestructura.rutas.producto_routes import create_producto_routes
+
+        app = Flask(__name__)
+        app.register_blueprint(create_producto_routes())
+
+        response = app.test_client().post("/productos/lote-ids", json={"ids": ["p1"]}, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.get_data() == _ProductosGzip.CUERPO
+        assert len(json.loads(gzip.decompress(response.get_data()))["resultados"]) == 200
+
+    def test_post_comprimido_cliente_sin_gzip(self, productos_gzip):
+        """Test de que si el cliente no acepta gzip el POST se devuelve descomprimido"""
+        from modules.productos.infraestructura.rutas.producto_routes import create_producto_routes
+
+        app = Flask(__name__)
+        app.register_blueprint(create_producto_routes())
+
+        response = app.test_client().post("/productos/lote-ids", json={"ids": ["p1"]}, headers={"Accept-Encoding": "identity"})
+
+        assert "Content-Encoding" not in response.headers
+        assert len(response.get_json()["resultados"]) == 200
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_brotli_se_pide_y_reenvia_sin_recomprimir(self, mock_get):
+        """Test de que un cliente que solo acepta br lo pide al microservicio y recibe su cuerpo tal cual"""
+        cuerpo = b"\x1b\x13\x00cuerpo-brotli"
+        mock_response = Mock()
+        mock_response.headers = {"Content-Encoding": "br", "Content-Type": "application/x-msgpack"}
+        mock_response.status_code = 200
+        mock_response.raw.read.return_value = cuerpo
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos", headers={"Accept": "application/x-msgpack", "Accept-Encoding": "br"})
+
+        assert mock_get.call_args.kwargs["headers"]["Accept-Encoding"] == "br"
+        assert response.headers["Content-Encoding"] == "br"
+        assert response.get_data() == cuerpo
+        mock_response.raw.read.assert_called_once_with(decode_content=False)
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_sin_accept_encoding_no_se_reenvia(self, mock_get):
+        """Test de que sin Accept-Encoding del cliente requests usa el suyo y descomprime"""
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_response.content = b"[]"
+        mock_get.return_value = mock_response
+
+        self.client.get("/productos", headers={"Accept": "application/x-msgpack"}, environ_base={"HTTP_ACCEPT_ENCODING": ""})
+
+        assert "Accept-Encoding" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_comprimido_cliente_sin_gzip(self, mock_get):
+        """Test de que si el cliente no acepta la codificación se reenvía el JSON descomprimido"""
+        mock_response = Mock()
+        mock_response.headers = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_response.content = b'[{"id": "prod-001"}]'
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == [{"id": "prod-001"}]
+        mock_response.raw.read.assert_not_called()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_exportar_productos_comprimido_se_reenvia_sin_descomprimir(self, mock_get):
+        """Test de que el stream gzip de la exportación se reenvía por bloques sin descomprimir"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"}
+        mock_response.raw.stream.return_value = iter([b"\x1f\x8b", b"resto"])
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.get_data() == b"\x1f\x8bresto"
+        mock_response.raw.stream.assert_called_once_with(64 * 1024, decode_content=False)
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_json_comprimido_se_pide_en_json(self, mock_get):
+        """Test de que para un cliente JSON se pide JSON con su Accept-Encoding y el gzip llega tal cual"""
+        cuerpo = gzip.compress(b'[{"id":"prod-001"}]')
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "application/json", "Content-Encoding": "gzip", "X-Total-Count": "1"}
+        mock_response.status_code = 200
+        mock_response.raw.read.return_value = cuerpo
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.get_data() == cuerpo
+        assert response.headers["X-Total-Count"] == "1"
+        assert "Accept" in response.headers["Vary"]
+        assert mock_get.call_args.kwargs["headers"]["Accept"] == "application/json"
+        assert mock_get.call_args.kwargs["headers"]["Accept-Encoding"] == "gzip, br"
+        mock_response.json.assert_not_called()
+        mock_response.close.assert_called_once()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_json_se_reenvia_sin_decodificar(self, mock_get):
+        """Test de que si el microservicio responde en JSON el cuerpo llega al cliente sin re-codificar"""
+        cuerpo = b'[{"fecha_vencimiento":"Wed, 31 Dec 2025 00:00:00 GMT","id":"prod-001"}]'
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_response.content = cuerpo
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos")
+
+        assert response.get_data() == cuerpo
+        assert response.mimetype == "application/json"
+        mock_response.json.assert_not_called()
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_msgpack_para_consumidores_internos(self, mock_get):
+        """Test de que un cliente que pide MessagePack lo recibe tal como lo envía el microservicio"""
+        cuerpo = b"\x91\x81\xa2id\xa8prod-001"
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "application/x-msgpack"}
+        mock_response.status_code = 200
+        mock_response.content = cuerpo
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos", headers={"Accept": "application/x-msgpack, application/json;q=0.9"})
+
+        assert response.get_data() == cuerpo
+        assert response.mimetype == "application/x-msgpack"
+        assert mock_get.call_args.kwargs["headers"]["Accept"] == "application/x-msgpack"
+
+    @patch("modules.productos.infraestructura.rutas.producto_routes.requests.get")
+    def test_listado_error_se_reenvia_como_json(self, mock_get):
+        """Test de que los errores del listado se siguen devolviendo como JSON"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.status_code = 400
+        mock_response.json.return_value = {"error": "Parámetro limite debe estar entre 1 y 1000"}
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/productos?limite=0")
+
+        assert response.status_code == 400
+        assert "limite" in response.get_json()["error"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
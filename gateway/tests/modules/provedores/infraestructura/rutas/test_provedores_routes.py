@@ -30,6 +30,7 @@ class TestProvedoresRoutes:
     def test_obtener_todos_los_provedores_success(self, mock_get):
         """Test del endpoint GET /provedores exitoso"""
         mock_response = Mock()
+        mock_response.headers = {}
         mock_response.json.return_value = {"provedores": []}
         mock_response.status_code = 200
         mock_get.return_value = mock_response
@@ -43,6 +44,7 @@ class TestProvedoresRoutes:
     def test_obtener_provedor_por_id_success(self, mock_get):
         """Test del endpoint GET /provedores/<id> exitoso"""
         mock_response = Mock()
+        mock_response.headers = {}
         mock_response.json.return_value = {"id": "provedor-123", "name": "Test Provedor"}
         mock_response.status_code = 200
         mock_get.return_value = mock_response
@@ -82,6 +84,7 @@ class TestProvedoresRoutes:
     def test_obtener_todos_los_provedores_with_headers(self, mock_get):
         """Test del endpoint GET /provedores con headers"""
         mock_response = Mock()
+        mock_response.headers = {}
         mock_response.json.return_value = {"provedores": []}
         mock_response.status_code = 200
         mock_get.return_value = mock_response
@@ -143,6 +146,97 @@ class TestProvedoresRoutes:
             if original_value:
                 os.environ["PROVEDORES_SERVICE_URL"] = original_value
 
+    @patch("modules.provedores.infraestructura.rutas.provedores_routes.requests.get")
+    def test_resumir_provedores(self, mock_get):
+        """Test del endpoint GET /provedores/resumen reenviando los parámetros"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"success": True, "data": {"agrupar": "pais", "total": 0, "grupos": []}}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/provedores/resumen?agrupar=pais")
+
+        assert response.status_code == 200
+        assert mock_get.call_args.args[0].endswith("/provedores/resumen")
+        assert mock_get.call_args.kwargs["params"] == {"agrupar": "pais"}
+
+    @patch("modules.provedores.infraestructura.rutas.provedores_routes.requests.get")
+    def test_fields_se_reenvia(self, mock_get):
+        """Test de que ?fields= se reenvía en listado y detalle"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"success": True, "data": []}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        assert self.client.get("/provedores?fields=id,nombre").status_code == 200
+        assert mock_get.call_args.kwargs["params"] == {"fields": "id,nombre"}
+        assert self.client.get("/provedores/1?fields=email").status_code == 200
+        assert mock_get.call_args.kwargs["params"] == {"fields": "email"}
+
+    @patch("modules.provedores.infraestructura.rutas.provedores_routes.requests.get")
+    def test_if_none_match_responde_304(self, mock_get):
+        """Test de que If-None-Match se reenvía y un 304 del microservicio llega con su ETag"""
+        mock_response = Mock()
+        mock_response.headers = {"ETag": 'W/"provedores-7"', "Cache-Control": "private, no-cache"}
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        response = self.client.get("/provedores", headers={"If-None-Match": 'W/"provedores-7"'})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == 'W/"provedores-7"'
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == 'W/"provedores-7"'
+        mock_response.json.assert_not_called()
+
+    @patch("modules.provedores.infraestructura.rutas.provedores_routes.requests.get")
+    def test_duracion_upstream_por_servicio_y_estado(self, mock_get):
+        """Test de que cada llamada al microservicio, incluso fallida, queda en upstream_duracion_segundos"""
+        import requests
+        from config.metricas import DURACION_UPSTREAM
+
+        antes = DURACION_UPSTREAM.valores()
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"provedores": []}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        self.client.get("/provedores")
+        mock_get.side_effect = requests.exceptions.RequestException("Connection error")
+        self.client.get("/provedores")
+
+        despues = DURACION_UPSTREAM.valores()
+        for estado in ("200", "error"):
+            serie = ("provedores", "GET", estado)
+            cuenta_antes = sum(antes[serie][:-1]) if serie in antes else 0
+            assert sum(despues[serie][:-1]) == cuenta_antes + 1
+
+    @patch("modules.provedores.infraestructura.rutas.provedores_routes.requests.get")
+    def test_propaga_traceparent_al_microservicio(self, mock_get):
+        """Test de que la llamada al microservicio lleva el traceparent del span de cliente, no el que envió el frontend"""
+        from config.trazas import ExportadorMemoria, registrar_trazas
+
+        exportador = ExportadorMemoria()
+        registrar_trazas(self.app, exportador)
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.json.return_value = {"provedores": []}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+        entrante = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        self.client.get("/provedores", headers={"traceparent": entrante})
+
+        cabeceras = mock_get.call_args.kwargs["headers"]
+        assert [clave for clave in cabeceras if clave.lower() == "traceparent"] == ["traceparent"]
+        spans = {span.nombre: span for span in exportador.spans}
+        cliente, raiz = spans["GET provedores"], spans["GET /provedores"]
+        assert cliente.padre_id == raiz.span_id
+        assert cliente.atributos == {"servicio": "provedores", "http.estado": 200}
+        assert cabeceras["traceparent"] == f"00-4bf92f3577b34da6a3ce929d0e0e4736-{cliente.span_id}-01"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,8 @@
+-- Bases de datos de cada servicio y de sus tests (TEST_DATABASE_URL), creadas al iniciar el contenedor por primera vez
+CREATE DATABASE gateway;
+CREATE DATABASE productos;
+CREATE DATABASE provedores;
+CREATE DATABASE clientes;
+CREATE DATABASE productos_test;
+CREATE DATABASE provedores_test;
+CREATE DATABASE clientes_test;
@@ -0,0 +1,88 @@
+"""
+Benchmark de la analítica de inventario.
+
+Compara el cálculo fila a fila en Python (obtener_todos + bucle) con el snapshot
+columnar: la carga inicial desde /productos/cambios y las consultas posteriores,
+que solo recorren columnas de NumPy.
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_analitica --filas 100000
+"""
+
+import argparse
+import time
+from datetime import date
+
+from benchmarks.bench_serializacion import crear_app, poblar
+from src.aplicacion.servicios.analitica_service import AnaliticaService
+from src.infraestructura.analitica.snapshot_columnar import SnapshotColumnar
+from src.infraestructura.config.db import db_productos
+from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+HORIZONTES = (30, 60, 90)
+
+
+def _por_filas(repositorio: ProductoRepositoryImpl, fecha_referencia: date) -> dict:
+    valor_por_categoria = {}
+    unidades_por_horizonte = dict.fromkeys(HORIZONTES, 0)
+    for producto in repositorio.obtener_todos():
+        valor = producto.valor_unitario * producto.cantidad_disponible
+        valor_por_categoria[producto.categoria] = valor_por_categoria.get(producto.categoria, 0.0) + valor
+        dias = (producto.fecha_vencimiento.date() - fecha_referencia).days
+        for horizonte in HORIZONTES:
+            if 0 <= dias <= horizonte:
+                unidades_por_horizonte[horizonte] += producto.cantidad_disponible
+    return {"valor": valor_por_categoria, "vencimientos": unidades_por_horizonte}
+
+
+def _columnar(service: AnaliticaService, fecha_referencia: date) -> dict:
+    inventario = service.resumen_inventario("categoria")
+    vencimientos = service.resumen_vencimientos(fecha_referencia, HORIZONTES)
+    return {
+        "valor": {grupo.clave: grupo.valor for grupo in inventario.grupos},
+        "vencimientos": {h: resumen.unidades for h, resumen in vencimientos.horizontes.items()},
+    }
+
+
+def _medir(nombre: str, funcion, filas: int, repeticiones: int):
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        db_productos.session.expire_all()
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    print(f"{nombre:<16} {mejor * 1000:>10.1f} ms {filas / mejor:>14,.0f} filas/s")
+    return resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    fecha_referencia = date(2026, 1, 1)
+    app = crear_app()
+    with app.app_context():
+        db_productos.create_all()
+        poblar(args.filas)
+        repositorio = ProductoRepositoryImpl()
+
+        por_filas = _medir("por filas", lambda: _por_filas(repositorio, fecha_referencia), args.filas, args.repeticiones)
+
+        def cargar():
+            service = AnaliticaService(repositorio, SnapshotColumnar, intervalo_refresco=3600)
+            service.refrescar()
+            return service
+
+        service = _medir("carga snapshot", cargar, args.filas, 1)
+        columnar = _medir("consulta", lambda: _columnar(service, fecha_referencia), args.filas, args.repeticiones)
+
+        assert por_filas["vencimientos"] == columnar["vencimientos"], "Las unidades por vencer deben coincidir"
+        for categoria, valor in por_filas["valor"].items():
+            assert abs(valor - columnar["valor"][categoria]) < 1e-6 * max(1.0, valor), "El valor debe coincidir"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark del arranque del servicio: importación de src.main y latencia de la primera petición.
+
+Cada medición corre en un proceso nuevo, como un worker recién creado al escalar, sobre una
+base SQLite temporal con las migraciones aplicadas. La primera petición es un
+GET /productos/<id> autenticado. Informa la mediana de varias ejecuciones y si quedaron
+cargados módulos que solo se usan más adelante (numpy, para la analítica).
+
+Con presupuestos (--importacion-maxima, --primera-peticion-maxima, en segundos) termina con
+código 1 si la mediana los supera o si se cargó algún módulo diferido, para usarlo como
+control de regresiones en un job de rendimiento. tests/test_main.py solo comprueba, sin medir
+tiempos, que el arranque no importa la analítica.
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_arranque --ejecuciones 5
+    python -m benchmarks.bench_arranque --importacion-maxima 5 --primera-peticion-maxima 1
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import jwt
+from benchmarks.bench_servidor import SECRETO, preparar_base
+
+_DIRECTORIO_SERVICIO = Path(__file__).resolve().parent.parent
+
+# Módulos pesados que el arranque no debería importar
+_MODULOS_DIFERIDOS = ("numpy",)
+
+_MEDICION = """
+import json, sys, time
+inicio = time.perf_counter()
+from src.main import app
+importada = time.perf_counter()
+respuesta = app.test_client().get("/productos/prod-0000000", headers={"Authorization": "Bearer " + sys.argv[1]})
+fin = time.perf_counter()
+print(json.dumps({
+    "importacion": importada - inicio,
+    "primera_peticion": fin - importada,
+    "estado": respuesta.status_code,
+    "cargados": [m for m in sys.argv[2:] if m in sys.modules],
+}))
+"""
+
+
+def medir_arranque(ruta_base: str) -> dict:
+    """Arranca el servicio en un proceso nuevo sobre la base SQLite de `ruta_base` y mide los tiempos."""
+    token = jwt.encode({"user_id": "bench", "role": "admin", "exp": datetime.now(timezone.utc) + timedelta(hours=1)}, SECRETO)
+    entorno = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{ruta_base}",
+        "JWT_SECRET": SECRETO,
+        "ALGORITHM": "HS256",
+        "LOG_LEVEL": "WARNING",
+        "RESERVAS_INTERVALO_EXPIRACION": "0",
+    }
+    salida = subprocess.run(
+        [sys.executable, "-c", _MEDICION, token, *_MODULOS_DIFERIDOS],
+        cwd=_DIRECTORIO_SERVICIO,
+        env=entorno,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ejecuciones", type=int, default=5)
+    parser.add_argument("--importacion-maxima", type=float, help="Presupuesto de la importación, en segundos")
+    parser.add_argument("--primera-peticion-maxima", type=float, help="Presupuesto de la primera petición, en segundos")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "productos.db")
+        preparar_base(ruta, 10)
+        mediciones = [medir_arranque(ruta) for _ in range(args.ejecuciones)]
+
+    importacion = statistics.median(m["importacion"] for m in mediciones) * 1000
+    primera = statistics.median(m["primera_peticion"] for m in mediciones) * 1000
+    cargados = sorted({modulo for m in mediciones for modulo in m["cargados"]})
+    print(f"importación      {importacion:>8.1f} ms")
+    print(f"primera petición {primera:>8.1f} ms")
+    print(f"módulos diferidos cargados: {', '.join(cargados) or 'ninguno'}")
+
+    excedidos = [
+        nombre
+        for nombre, mediana, maximo in (
+            ("importación", importacion, args.importacion_maxima),
+            ("primera petición", primera, args.primera_peticion_maxima),
+        )
+        if maximo is not None and mediana > maximo * 1000
+    ]
+    if excedidos or cargados:
+        print(f"regresión del arranque: {', '.join(excedidos + cargados)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark de formatos del listado de productos para llamadas entre servicios.
+
+Para el cuerpo de GET /productos compara JSON (orjson, el camino rápido actual) con
+MessagePack: CPU de codificación en productos, CPU de decodificación en quien lo
+consume y bytes en la red, con y sin gzip. También mide lo que gastaba el gateway al
+decodificar el listado y volver a codificarlo con jsonify, que ahora se evita pidiendo a
+productos el formato que negoció el cliente y reenviando el cuerpo tal como llega.
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_formatos --filas 100000
+"""
+
+import argparse
+import gzip
+import json
+import time
+
+import msgpack
+import orjson
+from benchmarks.bench_serializacion import crear_app, poblar
+from flask import jsonify
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.infraestructura.config.db import db_productos
+from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+
+def _mejor_tiempo(funcion, repeticiones: int):
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def _medir_formato(nombre: str, codificar, decodificar, campos, filas, repeticiones: int):
+    segundos_codificar, cuerpo = _mejor_tiempo(lambda: codificar(campos, filas), repeticiones)
+    segundos_decodificar, productos = _mejor_tiempo(lambda: decodificar(cuerpo), repeticiones)
+    print(
+        f"{nombre:<12} {segundos_codificar * 1000:>12.1f} ms {segundos_decodificar * 1000:>12.1f} ms"
+        f" {len(cuerpo):>14,} B {len(gzip.compress(cuerpo, 6)):>14,} B"
+    )
+    return productos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    app = crear_app()
+    with app.app_context():
+        db_productos.create_all()
+        poblar(args.filas)
+        campos = ProductoMapper.CAMPOS
+        filas = ProductoRepositoryImpl().obtener_filas(campos)
+
+        print(f"{'formato':<12} {'codificar':>15} {'decodificar':>15} {'bytes':>16} {'bytes gzip':>16}")
+        desde_json = _medir_formato("json", ProductoMapper.filas_to_json, orjson.loads, campos, filas, args.repeticiones)
+        desde_msgpack = _medir_formato(
+            "msgpack", ProductoMapper.filas_to_msgpack, msgpack.unpackb, campos, filas, args.repeticiones
+        )
+        assert desde_msgpack == desde_json, "Los dos formatos deben decodificar a los mismos productos"
+
+        # Lo que hacía el gateway con cada listado: decodificar y jsonify
+        cuerpo_json = ProductoMapper.filas_to_json(campos, filas)
+        segundos, _ = _mejor_tiempo(lambda: jsonify(json.loads(cuerpo_json)).get_data(), args.repeticiones)
+        print(f"\ngateway decodificar + jsonify: {segundos * 1000:.1f} ms por listado (reenviando el cuerpo: 0 ms)")
+
+
+if __name__ == "__main__":
+    main()
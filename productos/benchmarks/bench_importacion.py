@@ -0,0 +1,103 @@
+"""
+Benchmark de la importación masiva de productos.
+
+Genera un archivo NDJSON o CSV con N productos y lo importa con el mismo caso de uso
+que usan POST /productos/importar y `flask productos importar`, sobre una base SQLite
+en un archivo temporal. Reporta filas por segundo y, con --medir-memoria, el pico de
+memoria de Python, que debe depender del tamaño de lote y no del número de filas
+(tracemalloc reduce el rendimiento, por eso es opcional).
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_importacion --filas 1000000 --formato ndjson --tamano-lote 1000
+"""
+
+import argparse
+import csv
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import orjson
+from flask import Flask
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.aplicacion.servicios.producto_service import ProductoService
+from src.aplicacion.use_cases.producto_use_case import ProductoUseCase
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.importacion.lectores import LECTORES
+from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+
+def _registros(cantidad: int):
+    base = datetime(2026, 1, 1)
+    for i in range(cantidad):
+        yield {
+            "id": f"prod-{i:08d}",
+            "nombre": f"Producto {i}",
+            "descripcion": f"Descripción del producto {i}",
+            "categoria": ("medicamentos", "insumos", "equipos")[i % 3],
+            "condiciones_almacenamiento": "Temperatura ambiente",
+            "valor_unitario": 10.0 + (i % 500) * 0.25,
+            "cantidad_disponible": i % 1000,
+            "fecha_vencimiento": (base + timedelta(days=i % 730)).isoformat(),
+            "lote": f"LOT-{i % 5000:05d}",
+            "tiempo_estimado_entrega": "3 días",
+            "id_proveedor": f"prov-{i % 50:03d}",
+            "ubicacion": f"Bodega {i % 10}",
+        }
+
+
+def _generar_archivo(ruta: str, formato: str, cantidad: int) -> None:
+    with open(ruta, "wb") as archivo:
+        if formato == "ndjson":
+            for registro in _registros(cantidad):
+                archivo.write(orjson.dumps(registro, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            texto = io.TextIOWrapper(archivo, encoding="utf-8", newline="")
+            escritor = csv.DictWriter(texto, fieldnames=ProductoMapper.CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(_registros(cantidad))
+            texto.flush()
+            texto.detach()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--formato", choices=sorted(LECTORES), default="ndjson")
+    parser.add_argument("--tamano-lote", type=int, default=1000)
+    parser.add_argument("--medir-memoria", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_archivo = os.path.join(directorio, f"productos.{args.formato}")
+        _generar_archivo(ruta_archivo, args.formato, args.filas)
+
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(directorio, 'productos.db')}"
+        init_db_productos(app)
+        with app.app_context():
+            db_productos.create_all()
+            use_case = ProductoUseCase(ProductoService(ProductoRepositoryImpl()))
+
+            if args.medir_memoria:
+                tracemalloc.start()
+            inicio = time.perf_counter()
+            with open(ruta_archivo, "rb") as stream:
+                resultado = use_case.importar_productos(LECTORES[args.formato](stream), args.tamano_lote)
+            duracion = time.perf_counter() - inicio
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    print(f"archivo       {os.path.basename(ruta_archivo)} ({args.filas:,} filas, lotes de {args.tamano_lote})")
+    print(f"guardadas     {resultado.guardadas:,} (errores: {resultado.con_error:,})")
+    print(f"duración      {duracion:.2f} s")
+    print(f"rendimiento   {resultado.procesadas / duracion:,.0f} filas/s")
+    if args.medir_memoria:
+        print(f"pico memoria  {pico / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
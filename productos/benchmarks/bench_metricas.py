@@ -0,0 +1,72 @@
+"""
+Benchmark del registro de métricas con varios hilos: fragmentos por hilo frente a un lock compartido.
+
+Cada hilo observa una duración en un histograma con etiquetas, como hace cada petición al
+terminar. La variante con lock es un histograma equivalente protegido por un único
+threading.Lock, el diseño habitual de un registro de métricas en Python.
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_metricas --hilos 8 --observaciones 200000
+"""
+
+import argparse
+import bisect
+import threading
+import time
+
+from src.infraestructura.config.metricas import CUBETAS_PETICION, RegistroMetricas
+
+
+class _HistogramaConLock:
+    def __init__(self, limites):
+        self.limites = limites
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observar(self, valor, *etiquetas):
+        with self.lock:
+            serie = self.series.get(etiquetas)
+            if serie is None:
+                serie = self.series[etiquetas] = [0] * (len(self.limites) + 2)
+            serie[bisect.bisect_left(self.limites, valor)] += 1
+            serie[-1] += valor
+
+
+def medir(observar, hilos: int, observaciones: int) -> float:
+    """Segundos que tardan `hilos` hilos en hacer `observaciones` observaciones cada uno."""
+    inicio = threading.Barrier(hilos + 1)
+
+    def trabajar():
+        inicio.wait()
+        for indice in range(observaciones):
+            observar(0.012, "GET", "/productos/<producto_id>" if indice % 2 else "/productos")
+
+    trabajadores = [threading.Thread(target=trabajar) for _ in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    inicio.wait()
+    t0 = time.perf_counter()
+    for trabajador in trabajadores:
+        trabajador.join()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hilos", type=int, default=8)
+    parser.add_argument("--observaciones", type=int, default=200000)
+    args = parser.parse_args()
+
+    fragmentado = RegistroMetricas().histograma("bench_segundos", "Benchmark", ("metodo", "ruta"), CUBETAS_PETICION)
+    con_lock = _HistogramaConLock(CUBETAS_PETICION)
+    total = args.hilos * args.observaciones
+    for nombre, observar in (("fragmentos por hilo", fragmentado.observar), ("lock compartido", con_lock.observar)):
+        for hilos in (1, args.hilos):
+            segundos = medir(observar, hilos, args.observaciones)
+            cantidad = hilos * args.observaciones
+            print(f"{nombre:<20} {hilos:>2} hilos  {segundos / cantidad * 1e9:>7.0f} ns/observación")
+    assert sum(sum(serie[:-1]) for serie in fragmentado.valores().values()) == total + args.observaciones
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark de serialización del listado de productos.
+
+Compara el camino original (modelo -> entidad -> DTO -> dict -> jsonify) con el
+camino rápido (tuplas de columnas -> orjson) sobre una base SQLite en memoria.
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_serializacion --filas 100000
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask, jsonify
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.dto.cambios import siguiente_secuencia
+from src.infraestructura.dto.producto import ProductoModel
+from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+
+def crear_app() -> Flask:
+    """App mínima con una base SQLite en memoria, compartida por los benchmarks."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    init_db_productos(app)
+    return app
+
+
+def poblar(cantidad: int) -> None:
+    """Inserta `cantidad` productos sintéticos (prod-0000000, ...) en la base de la app activa."""
+    base = datetime(2026, 1, 1)
+    # Reservar las secuencias en bloque evita un UPDATE del contador por fila
+    primera_secuencia = siguiente_secuencia(db_productos.session.connection(), cantidad) - cantidad + 1
+    filas = [
+        {
+            "id": f"prod-{i:07d}",
+            "nombre": f"Producto {i}",
+            "descripcion": f"Descripción del producto {i}",
+            "categoria": ("medicamentos", "insumos", "equipos")[i % 3],
+            "condiciones_almacenamiento": "Temperatura ambiente",
+            "valor_unitario": 10.0 + (i % 500) * 0.25,
+            "cantidad_disponible": i % 1000,
+            "fecha_vencimiento": base + timedelta(days=i % 730),
+            "lote": f"LOT-{i % 5000:05d}",
+            "tiempo_estimado_entrega": "3 días",
+            "id_proveedor": f"prov-{i % 50:03d}",
+            "ubicacion": f"Bodega {i % 10}",
+            "secuencia": primera_secuencia + i,
+        }
+        for i in range(cantidad)
+    ]
+    db_productos.session.execute(ProductoModel.__table__.insert(), filas)
+    db_productos.session.commit()
+
+
+def _camino_original(repositorio: ProductoRepositoryImpl) -> bytes:
+    productos = repositorio.obtener_todos()
+    productos_json = [ProductoMapper.dto_to_json(ProductoMapper.entity_to_dto(p)) for p in productos]
+    return jsonify(productos_json).get_data()
+
+
+def _camino_rapido(repositorio: ProductoRepositoryImpl) -> bytes:
+    filas = repositorio.obtener_filas(ProductoMapper.CAMPOS)
+    return ProductoMapper.filas_to_json(ProductoMapper.CAMPOS, filas)
+
+
+def _medir(nombre: str, funcion, repositorio: ProductoRepositoryImpl, filas: int, repeticiones: int) -> bytes:
+    mejor = float("inf")
+    cuerpo = b""
+    for _ in range(repeticiones):
+        db_productos.session.expire_all()
+        inicio = time.perf_counter()
+        cuerpo = funcion(repositorio)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    print(f"{nombre:<10} {mejor * 1000:>10.1f} ms {filas / mejor:>14,.0f} filas/s {len(cuerpo):>12,} bytes")
+    return cuerpo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    app = crear_app()
+    with app.app_context():
+        db_productos.create_all()
+        poblar(args.filas)
+        repositorio = ProductoRepositoryImpl()
+
+        original = _medir("original", _camino_original, repositorio, args.filas, args.repeticiones)
+        rapido = _medir("rapido", _camino_rapido, repositorio, args.filas, args.repeticiones)
+
+        assert json.loads(original) == json.loads(rapido), "Los dos caminos deben producir el mismo JSON"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Prueba de carga del servidor de desarrollo de Flask frente a gunicorn.
+
+Levanta el servicio dos veces sobre la misma base SQLite temporal, primero con `flask run`
+y después con gunicorn (src/infraestructura/config/servidor.py), y en cada caso envía
+GET /productos/<id> autenticados desde varios clientes concurrentes con conexiones
+keep-alive. Informa peticiones por segundo y latencias p50/p99.
+
+Uso (desde el directorio productos):
+    python -m benchmarks.bench_servidor --segundos 10 --concurrencia 32
+    GUNICORN_WORKERS=4 GUNICORN_THREADS=8 python -m benchmarks.bench_servidor
+"""
+
+import argparse
+import http.client
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+import jwt
+from benchmarks.bench_serializacion import poblar
+from flask import Flask
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.config.migraciones import aplicar_migraciones
+from src.infraestructura.migraciones import MIGRACIONES
+
+# JWT_SECRET de los servicios que levantan los benchmarks
+SECRETO = "bench-secret-key-with-at-least-32-characters"
+
+
+def preparar_base(ruta: str, filas: int) -> None:
+    """Crea en `ruta` una base SQLite con las migraciones aplicadas y `filas` productos."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{ruta}"
+    init_db_productos(app)
+    with app.app_context():
+        aplicar_migraciones(db_productos.engine, MIGRACIONES)
+        poblar(filas)
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _esperar_servidor(puerto: int, proceso: subprocess.Popen, espera: float = 30.0) -> None:
+    limite = time.monotonic() + espera
+    while time.monotonic() < limite:
+        if proceso.poll() is not None:
+            raise RuntimeError(f"El servidor terminó al arrancar (código {proceso.returncode})")
+        try:
+            conexion = http.client.HTTPConnection("127.0.0.1", puerto, timeout=1)
+            conexion.request("GET", "/health")
+            if conexion.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("El servidor no respondió a /health")
+
+
+def _cliente(puerto: int, token: str, filas: int, hasta: float, latencias: List[float], errores: List[int]) -> None:
+    conexion = http.client.HTTPConnection("127.0.0.1", puerto, timeout=30)
+    cabeceras = {"Authorization": f"Bearer {token}"}
+    propias: List[float] = []
+    fallidas = 0
+    while time.monotonic() < hasta:
+        ruta = f"/productos/prod-{random.randrange(filas):07d}"
+        inicio = time.perf_counter()
+        try:
+            conexion.request("GET", ruta, headers=cabeceras)
+            respuesta = conexion.getresponse()
+            respuesta.read()
+            if respuesta.status != 200:
+                fallidas += 1
+                continue
+        except (OSError, http.client.HTTPException):
+            fallidas += 1
+            conexion.close()
+            conexion = http.client.HTTPConnection("127.0.0.1", puerto, timeout=30)
+            continue
+        propias.append(time.perf_counter() - inicio)
+    conexion.close()
+    latencias.extend(propias)
+    errores.append(fallidas)
+
+
+def _cargar(puerto: int, token: str, filas: int, segundos: float, concurrencia: int) -> Tuple[List[float], int]:
+    latencias: List[float] = []
+    errores: List[int] = []
+    hasta = time.monotonic() + segundos
+    hilos = [
+        threading.Thread(target=_cliente, args=(puerto, token, filas, hasta, latencias, errores)) for _ in range(concurrencia)
+    ]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return sorted(latencias), sum(errores)
+
+
+def _medir(nombre: str, comando: List[str], entorno: dict, args) -> None:
+    puerto = _puerto_libre()
+    comando = [parte.format(puerto=puerto) for parte in comando]
+    entorno = {**entorno, "HOST": "127.0.0.1", "PORT": str(puerto)}
+    proceso = subprocess.Popen(comando, env=entorno, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _esperar_servidor(puerto, proceso)
+        token = jwt.encode(
+            {"user_id": "bench", "role": "admin", "exp": datetime.now(timezone.utc) + timedelta(hours=1)}, SECRETO
+        )
+        # Calentamiento: imports perezosos, caché del repositorio y pool de conexiones
+        _cargar(puerto, token, args.filas, 1, args.concurrencia)
+        latencias, errores = _cargar(puerto, token, args.filas, args.segundos, args.concurrencia)
+    finally:
+        proceso.terminate()
+        proceso.wait(timeout=60)
+
+    if not latencias:
+        print(f"{nombre:<10} sin respuestas correctas ({errores} errores)")
+        return
+    p50 = latencias[len(latencias) // 2] * 1000
+    p99 = latencias[int(len(latencias) * 0.99)] * 1000
+    print(
+        f"{nombre:<10} {len(latencias) / args.segundos:>10,.0f} req/s"
+        f" {p50:>9.1f} ms p50 {p99:>9.1f} ms p99 {errores:>6} errores"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=1000)
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--concurrencia", type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "productos.db")
+        preparar_base(ruta, args.filas)
+        entorno = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{ruta}",
+            "JWT_SECRET": SECRETO,
+            "ALGORITHM": "HS256",
+            "LOG_LEVEL": "WARNING",
+            "RESERVAS_INTERVALO_EXPIRACION": "0",
+        }
+        print(f"{args.concurrencia} clientes, {args.segundos:g} s, {os.cpu_count()} CPUs")
+        _medir(
+            "flask run", [sys.executable, "-m", "flask", "--app", "src/main.py", "run", "--port", "{puerto}"], entorno, args
+        )
+        _medir(
+            "gunicorn",
+            [sys.executable, "-m", "gunicorn", "-c", "src/infraestructura/config/servidor.py", "src.main:app"],
+            entorno,
+            args,
+        )
+
+
+if __name__ == "__main__":
+    main()
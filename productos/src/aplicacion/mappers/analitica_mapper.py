@@ -0,0 +1,34 @@
+from typing import Any, Dict
+
+from src.dominio.entities.analitica import ResumenInventario, ResumenVencimientos
+
+
+class AnaliticaMapper:
+    """Mapper para convertir resúmenes de analítica a JSON."""
+
+    @staticmethod
+    def resumen_inventario_to_json(resumen: ResumenInventario) -> Dict[str, Any]:
+        json_data = {"productos": resumen.productos, "unidades": resumen.unidades, "valor": round(resumen.valor, 2)}
+        if resumen.agrupar_por is not None:
+            json_data["agrupar_por"] = resumen.agrupar_por
+            json_data["grupos"] = [
+                {
+                    "clave": grupo.clave,
+                    "productos": grupo.productos,
+                    "unidades": grupo.unidades,
+                    "valor": round(grupo.valor, 2),
+                }
+                for grupo in resumen.grupos
+            ]
+        return json_data
+
+    @staticmethod
+    def resumen_vencimientos_to_json(resumen: ResumenVencimientos) -> Dict[str, Any]:
+        return {
+            "fecha_referencia": resumen.fecha_referencia.isoformat(),
+            "vencido": AnaliticaMapper.resumen_inventario_to_json(resumen.vencido),
+            "horizontes": [
+                {"dias": dias, **AnaliticaMapper.resumen_inventario_to_json(horizonte)}
+                for dias, horizonte in resumen.horizontes.items()
+            ],
+        }
@@ -1,10 +1,245 @@
-from typing import Any, Dict
+import csv
+import io
+import math
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+import msgpack
+import orjson
 from src.aplicacion.dtos.producto_dto import ProductoDto
+from src.dominio.entities.asignacion import PlanAsignacion, SolicitudAsignacion
+from src.dominio.entities.cambios import CambiosProductos
+from src.dominio.entities.consulta import ConsultaProductos
+from src.dominio.entities.importacion import ResultadoImportacion
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
+from werkzeug.http import http_date, parse_date
+
+_OPCIONES_ORJSON = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _serializar_fecha(valor: Any) -> str:
+    """Serializa fechas con el mismo formato HTTP que usa jsonify."""
+    if isinstance(valor, date):
+        return http_date(valor)
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def _leer_valor_unitario(valor: Any) -> float:
+    if isinstance(valor, bool):
+        raise ValueError("valor_unitario debe ser numérico")
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"valor_unitario debe ser numérico: {valor!r}")
+    if not math.isfinite(numero) or numero < 0:
+        raise ValueError(f"valor_unitario debe ser un número mayor o igual a 0: {valor!r}")
+    return numero
+
+
+def _leer_cantidad(valor: Any) -> int:
+    if isinstance(valor, bool) or (isinstance(valor, float) and not valor.is_integer()):
+        raise ValueError(f"cantidad_disponible debe ser un entero: {valor!r}")
+    try:
+        cantidad = int(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"cantidad_disponible debe ser un entero: {valor!r}")
+    if cantidad < 0:
+        raise ValueError(f"cantidad_disponible no puede ser negativa: {valor!r}")
+    return cantidad
+
+
+def _leer_fecha(valor: Any) -> datetime:
+    """Acepta ISO 8601 (exportación CSV) o fecha HTTP (JSON de la API). Devuelve UTC sin zona."""
+    fecha = valor if isinstance(valor, datetime) else None
+    if fecha is None and isinstance(valor, str):
+        try:
+            fecha = datetime.fromisoformat(valor.replace("Z", "+00:00"))
+        except ValueError:
+            fecha = parse_date(valor)
+    if fecha is None:
+        raise ValueError(f"fecha_vencimiento no es una fecha válida: {valor!r}")
+    if fecha.tzinfo is not None:
+        fecha = fecha.astimezone(timezone.utc).replace(tzinfo=None)
+    return fecha
+
+
+def _leer_parametro(nombre: str, valor: str, convertir):
+    """Convierte un parámetro de consulta, nombrándolo en el error."""
+    try:
+        return convertir(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"Parámetro {nombre} no es válido: {valor!r}")
+
+
+def _leer_booleano(valor: str) -> bool:
+    if valor.lower() in ("true", "1", "si", "sí"):
+        return True
+    if valor.lower() in ("false", "0", "no"):
+        return False
+    raise ValueError(valor)
+
+
+def _leer_numero(valor: str) -> float:
+    numero = float(valor)
+    if not math.isfinite(numero):
+        raise ValueError(valor)
+    return numero
+
+
+def _leer_entero_no_negativo(valor: str) -> int:
+    numero = int(valor)
+    if numero < 0:
+        raise ValueError(valor)
+    return numero
+
+
+def _en_bloques(partes: Iterable[bytes], tamano_bloque: int) -> Iterator[bytes]:
+    """Agrupa partes pequeñas en bloques para no emitir un chunk HTTP por fila."""
+    bloque: List[bytes] = []
+    for parte in partes:
+        bloque.append(parte)
+        if len(bloque) >= tamano_bloque:
+            yield b"".join(bloque)
+            bloque = []
+    if bloque:
+        yield b"".join(bloque)
+
+
+def _lineas_csv(campos: Sequence[str], filas: Iterable[Tuple[Any, ...]]) -> Iterator[bytes]:
+    """Codifica la cabecera y cada fila como una línea CSV. Las fechas van en ISO 8601."""
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+
+    def linea(valores: Iterable[Any]) -> bytes:
+        escritor.writerow(valores)
+        texto = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return texto.encode("utf-8")
+
+    yield linea(campos)
+    for fila in filas:
+        yield linea(valor.isoformat() if isinstance(valor, date) else valor for valor in fila)
 
 
 class ProductoMapper:
+    # Campos que expone la API, en el orden de dto_to_json
+    CAMPOS: Tuple[str, ...] = (
+        "id",
+        "nombre",
+        "descripcion",
+        "valor_unitario",
+        "categoria",
+        "condiciones_almacenamiento",
+        "cantidad_disponible",
+        "fecha_vencimiento",
+        "lote",
+        "tiempo_estimado_entrega",
+        "id_proveedor",
+        "ubicacion",
+    )
+
+    @staticmethod
+    def parsear_campos(fields: Optional[str]) -> Tuple[str, ...]:
+        """
+        Convierte el parámetro `fields` ("id,nombre,valor_unitario") en los campos a devolver.
+
+        Sin `fields` se devuelven todos. Los campos quedan en el orden de CAMPOS y sin repetir.
+
+        Raises:
+            ValueError: Si se pide un campo que la API no expone
+        """
+        pedidos = {campo.strip() for campo in (fields or "").split(",") if campo.strip()}
+        if not pedidos:
+            return ProductoMapper.CAMPOS
+        desconocidos = sorted(pedidos.difference(ProductoMapper.CAMPOS))
+        if desconocidos:
+            raise ValueError(
+                f"Campos desconocidos en fields: {', '.join(desconocidos)}. "
+                f"Campos disponibles: {', '.join(ProductoMapper.CAMPOS)}"
+            )
+        return tuple(campo for campo in ProductoMapper.CAMPOS if campo in pedidos)
+
+    # Parámetros de GET /productos que activan la consulta filtrada
+    PARAMETROS_CONSULTA = (
+        "categoria",
+        "id_proveedor",
+        "ubicacion",
+        "nombre",
+        "valor_min",
+        "valor_max",
+        "con_stock",
+        "vence_desde",
+        "vence_antes",
+        "orden",
+        "limite",
+        "desplazamiento",
+    )
+
+    # Campos por los que se puede ordenar (orden=-valor_unitario,nombre)
+    CAMPOS_ORDENABLES = (
+        "id",
+        "nombre",
+        "categoria",
+        "valor_unitario",
+        "cantidad_disponible",
+        "fecha_vencimiento",
+        "id_proveedor",
+        "ubicacion",
+    )
+
+    @staticmethod
+    def args_to_consulta(args: Mapping[str, str]) -> Optional[ConsultaProductos]:
+        """
+        Convierte los parámetros de GET /productos en una consulta filtrada y paginada.
+
+        Devuelve None si no se usa ningún parámetro de PARAMETROS_CONSULTA.
+
+        Raises:
+            ValueError: Si un parámetro no tiene un valor válido o se ordena por un campo no ordenable
+        """
+        if not any(args.get(parametro) for parametro in ProductoMapper.PARAMETROS_CONSULTA):
+            return None
+
+        orden = []
+        for criterio in (args.get("orden") or "").split(","):
+            criterio = criterio.strip()
+            if not criterio:
+                continue
+            campo = criterio.lstrip("-+")
+            if campo not in ProductoMapper.CAMPOS_ORDENABLES:
+                raise ValueError(
+                    f"Parámetro orden no admite {campo!r}. Campos ordenables: {', '.join(ProductoMapper.CAMPOS_ORDENABLES)}"
+                )
+            orden.append((campo, criterio.startswith("-")))
+
+        def leer(nombre, convertir):
+            valor = args.get(nombre)
+            return _leer_parametro(nombre, valor, convertir) if valor else None
+
+        return ConsultaProductos(
+            categoria=args.get("categoria") or None,
+            id_proveedor=args.get("id_proveedor") or None,
+            ubicacion=args.get("ubicacion") or None,
+            nombre=args.get("nombre") or None,
+            valor_min=leer("valor_min", _leer_numero),
+            valor_max=leer("valor_max", _leer_numero),
+            con_stock=leer("con_stock", _leer_booleano),
+            vence_desde=leer("vence_desde", _leer_fecha),
+            vence_antes=leer("vence_antes", _leer_fecha),
+            orden=tuple(orden),
+            limite=leer("limite", _leer_entero_no_negativo),
+            desplazamiento=leer("desplazamiento", _leer_entero_no_negativo) or 0,
+        )
+
+    @staticmethod
+    def proyectar(producto_json: Dict[str, Any], campos: Sequence[str]) -> Dict[str, Any]:
+        """Deja en el JSON de un producto solo los `campos` pedidos."""
+        if len(campos) == len(ProductoMapper.CAMPOS):
+            return producto_json
+        return {campo: producto_json[campo] for campo in campos}
+
     @staticmethod
     def json_to_dto(producto: Dict[str, Any]) -> ProductoDto:
         return ProductoDto(
@@ -72,3 +307,165 @@ class ProductoMapper:
             id_proveedor=producto.id_proveedor,
             ubicacion=producto.ubicacion,
         )
+
+    @staticmethod
+    def productos_por_ids_to_json(producto_ids: Sequence[str], productos: Dict[str, Producto]) -> Dict[str, Any]:
+        """Resultados en el orden de `producto_ids`, marcando explícitamente los no encontrados."""
+        resultados = []
+        for producto_id in producto_ids:
+            producto = productos.get(producto_id)
+            resultados.append(
+                {
+                    "id": producto_id,
+                    "encontrado": producto is not None,
+                    "producto": ProductoMapper.dto_to_json(ProductoMapper.entity_to_dto(producto)) if producto else None,
+                }
+            )
+        return {"resultados": resultados}
+
+    @staticmethod
+    def conteos_to_json(campo: str, conteos: Sequence[ConteoGrupo]) -> Dict[str, Any]:
+        return {
+            "agrupar": campo,
+            "total": sum(conteo.total for conteo in conteos),
+            "grupos": [{"clave": conteo.clave, "total": conteo.total, "unidades": conteo.unidades} for conteo in conteos],
+        }
+
+    @staticmethod
+    def cambios_to_json(cambios: CambiosProductos, desde: int) -> Dict[str, Any]:
+        return {
+            "desde": desde,
+            "hasta": cambios.hasta,
+            "hay_mas": cambios.hay_mas,
+            "cambios": [
+                {
+                    **ProductoMapper.dto_to_json(ProductoMapper.entity_to_dto(cambio.producto)),
+                    "secuencia": cambio.secuencia,
+                    "updated_at": cambio.updated_at,
+                }
+                for cambio in cambios.cambios
+            ],
+            "eliminados": [
+                {"id": eliminado.id, "secuencia": eliminado.secuencia, "eliminado_en": eliminado.eliminado_en}
+                for eliminado in cambios.eliminados
+            ],
+        }
+
+    @staticmethod
+    def filas_to_json(campos: Sequence[str], filas: Iterable[Tuple[Any, ...]]) -> bytes:
+        """
+        Codifica filas (tuplas con los valores de `campos`) directamente a JSON.
+
+        Camino rápido para listados: evita construir modelos, entidades y DTOs por fila
+        y produce el mismo JSON que jsonify (claves ordenadas, fechas en formato HTTP).
+        """
+        return orjson.dumps([dict(zip(campos, fila)) for fila in filas], default=_serializar_fecha, option=_OPCIONES_ORJSON)
+
+    @staticmethod
+    def filas_to_msgpack(campos: Sequence[str], filas: Iterable[Tuple[Any, ...]]) -> bytes:
+        """
+        Codifica filas en MessagePack, con la misma estructura que filas_to_json.
+
+        Formato compacto para llamadas entre servicios: decodificado, da los mismos valores
+        que el JSON (las fechas también van como texto en formato HTTP).
+        """
+        return msgpack.packb([dict(zip(campos, fila)) for fila in filas], default=_serializar_fecha)
+
+    @staticmethod
+    def filas_to_ndjson(campos: Sequence[str], filas: Iterable[Tuple[Any, ...]], tamano_bloque: int) -> Iterator[bytes]:
+        """Codifica filas como NDJSON (un objeto por línea, mismo formato que filas_to_json), en bloques."""
+        opciones = _OPCIONES_ORJSON | orjson.OPT_APPEND_NEWLINE
+        lineas = (orjson.dumps(dict(zip(campos, fila)), default=_serializar_fecha, option=opciones) for fila in filas)
+        return _en_bloques(lineas, tamano_bloque)
+
+    @staticmethod
+    def filas_to_csv(campos: Sequence[str], filas: Iterable[Tuple[Any, ...]], tamano_bloque: int) -> Iterator[bytes]:
+        """Codifica filas como CSV con cabecera, en bloques."""
+        return _en_bloques(_lineas_csv(campos, filas), tamano_bloque)
+
+    @staticmethod
+    def registro_to_entity(registro: Any) -> Producto:
+        """
+        Valida y convierte un registro importado (fila CSV u objeto NDJSON) en entidad.
+
+        Acepta tanto los valores como texto (CSV) como tipados (JSON); los campos
+        adicionales, como los de seguimiento de cambios, se ignoran.
+
+        Raises:
+            ValueError: Si falta un campo o algún valor no es válido.
+        """
+        if isinstance(registro, ValueError):
+            raise registro
+        if not isinstance(registro, dict):
+            raise ValueError("El registro debe ser un objeto con los campos del producto")
+
+        faltantes = [campo for campo in ProductoMapper.CAMPOS if registro.get(campo) in (None, "")]
+        if faltantes:
+            raise ValueError(f"Campos requeridos faltantes: {', '.join(faltantes)}")
+
+        textos = {}
+        for campo in ProductoMapper.CAMPOS:
+            if campo in ("valor_unitario", "cantidad_disponible", "fecha_vencimiento"):
+                continue
+            if not isinstance(registro[campo], str):
+                raise ValueError(f"{campo} debe ser texto")
+            textos[campo] = registro[campo]
+
+        return Producto(
+            **textos,
+            valor_unitario=_leer_valor_unitario(registro["valor_unitario"]),
+            cantidad_disponible=_leer_cantidad(registro["cantidad_disponible"]),
+            fecha_vencimiento=_leer_fecha(registro["fecha_vencimiento"]),
+        )
+
+    @staticmethod
+    def json_to_solicitud_asignacion(linea: Any) -> SolicitudAsignacion:
+        """
+        Valida y convierte una línea de asignación ({"nombre" | "producto_id", "cantidad"}).
+
+        Raises:
+            ValueError: Si no se indica exactamente uno de nombre o producto_id, o la cantidad no es un entero > 0.
+        """
+        if not isinstance(linea, dict):
+            raise ValueError("La línea debe ser un objeto")
+        nombre = linea.get("nombre")
+        producto_id = linea.get("producto_id")
+        if (nombre is None) == (producto_id is None):
+            raise ValueError("Indique nombre o producto_id (solo uno)")
+        for campo, valor in (("nombre", nombre), ("producto_id", producto_id)):
+            if valor is not None and (not isinstance(valor, str) or not valor):
+                raise ValueError(f"{campo} debe ser texto no vacío")
+        cantidad = linea.get("cantidad")
+        if isinstance(cantidad, bool) or not isinstance(cantidad, int) or cantidad <= 0:
+            raise ValueError("cantidad debe ser un entero mayor que 0")
+        return SolicitudAsignacion(cantidad=cantidad, nombre=nombre, producto_id=producto_id)
+
+    @staticmethod
+    def plan_asignacion_to_json(plan: PlanAsignacion) -> Dict[str, Any]:
+        return {
+            "nombre": plan.nombre,
+            "producto_id": plan.solicitud.producto_id,
+            "encontrado": plan.nombre is not None,
+            "cantidad_solicitada": plan.solicitud.cantidad,
+            "cantidad_asignada": plan.cantidad_asignada,
+            "faltante": plan.faltante,
+            "completo": plan.completo,
+            "asignaciones": [
+                {
+                    "producto_id": asignacion.producto_id,
+                    "lote": asignacion.lote,
+                    "fecha_vencimiento": asignacion.fecha_vencimiento,
+                    "cantidad": asignacion.cantidad,
+                }
+                for asignacion in plan.asignaciones
+            ],
+        }
+
+    @staticmethod
+    def resultado_importacion_to_json(resultado: ResultadoImportacion) -> Dict[str, Any]:
+        return {
+            "procesadas": resultado.procesadas,
+            "guardadas": resultado.guardadas,
+            "con_error": resultado.con_error,
+            "errores": [{"fila": error.fila, "error": error.error} for error in resultado.errores],
+        }
@@ -0,0 +1,41 @@
+from typing import Any, Dict, List
+
+from src.dominio.entities.reserva import LineaReserva, Reserva
+
+
+class ReservaMapper:
+    """Mapper para convertir entre entidades de reserva y JSON."""
+
+    @staticmethod
+    def json_to_lineas(lineas: Any) -> List[LineaReserva]:
+        """
+        Valida y convierte las líneas de una solicitud de reserva.
+
+        Raises:
+            ValueError: Si las líneas no son una lista de {"producto_id": str, "cantidad": int > 0}
+        """
+        if not isinstance(lineas, list) or not lineas:
+            raise ValueError("Parámetro lineas debe ser una lista no vacía")
+
+        resultado = []
+        for posicion, linea in enumerate(lineas):
+            if not isinstance(linea, dict):
+                raise ValueError(f"lineas[{posicion}] debe ser un objeto")
+            producto_id = linea.get("producto_id")
+            cantidad = linea.get("cantidad")
+            if not isinstance(producto_id, str) or not producto_id:
+                raise ValueError(f"lineas[{posicion}].producto_id es requerido")
+            if isinstance(cantidad, bool) or not isinstance(cantidad, int) or cantidad <= 0:
+                raise ValueError(f"lineas[{posicion}].cantidad debe ser un entero mayor que 0")
+            resultado.append(LineaReserva(producto_id=producto_id, cantidad=cantidad))
+        return resultado
+
+    @staticmethod
+    def reserva_to_json(reserva: Reserva) -> Dict[str, Any]:
+        return {
+            "id": reserva.id,
+            "estado": reserva.estado.value,
+            "lineas": [{"producto_id": linea.producto_id, "cantidad": linea.cantidad} for linea in reserva.lineas],
+            "creada_en": reserva.creada_en,
+            "expira_en": reserva.expira_en,
+        }
@@ -0,0 +1,86 @@
+import threading
+import time
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+
+from src.dominio.entities.analitica import ResumenInventario, ResumenVencimientos
+from src.dominio.repositorios.producto_repository import ProductoRepository
+
+if TYPE_CHECKING:
+    from src.infraestructura.analitica.snapshot_columnar import SnapshotColumnar
+
+
+class AnaliticaService:
+    """
+    Servicio de analítica de inventario sobre un snapshot columnar del catálogo.
+
+    La primera consulta carga el snapshot completo recorriendo /productos/cambios desde 0;
+    las siguientes solo aplican los cambios posteriores a la última secuencia vista, y como
+    mucho una vez cada `intervalo_refresco` segundos. El snapshot lo construye `crear_snapshot`
+    en ese primer uso, así que numpy no se importa al arrancar el servicio.
+    """
+
+    def __init__(
+        self,
+        producto_repository: ProductoRepository,
+        crear_snapshot: Callable[[], "SnapshotColumnar"],
+        intervalo_refresco: float = 5.0,
+        tamano_pagina: int = 5000,
+        reloj: Callable[[], float] = time.monotonic,
+    ):
+        self.producto_repository = producto_repository
+        self._crear_snapshot = crear_snapshot
+        self._snapshot: Optional["SnapshotColumnar"] = None
+        self.intervalo_refresco = intervalo_refresco
+        self.tamano_pagina = tamano_pagina
+        self._reloj = reloj
+        self._ultimo_refresco: Optional[float] = None
+        self._lock = threading.Lock()
+        self._lock_snapshot = threading.Lock()
+
+    @property
+    def snapshot(self) -> "SnapshotColumnar":
+        """Snapshot columnar del catálogo, creado en el primer acceso."""
+        if self._snapshot is None:
+            with self._lock_snapshot:
+                if self._snapshot is None:
+                    self._snapshot = self._crear_snapshot()
+        return self._snapshot
+
+    def refrescar(self, forzar: bool = False) -> int:
+        """
+        Aplica al snapshot los cambios pendientes del catálogo.
+
+        Returns:
+            Cantidad de cambios aplicados (0 si no tocaba refrescar)
+        """
+        with self._lock:
+            ahora = self._reloj()
+            if not forzar and self._ultimo_refresco is not None and ahora - self._ultimo_refresco < self.intervalo_refresco:
+                return 0
+
+            aplicados = 0
+            while True:
+                cambios = self.producto_repository.obtener_cambios(self.snapshot.secuencia, self.tamano_pagina)
+                self.snapshot.aplicar(cambios)
+                aplicados += len(cambios.cambios) + len(cambios.eliminados)
+                if not cambios.hay_mas:
+                    break
+            self._ultimo_refresco = ahora
+            return aplicados
+
+    def resumen_inventario(self, agrupar_por: Optional[str] = None) -> ResumenInventario:
+        """Valor del inventario (valor_unitario * cantidad_disponible), opcionalmente agrupado."""
+        self.refrescar()
+        return self.snapshot.resumen_inventario(agrupar_por)
+
+    def resumen_vencimientos(
+        self, fecha_referencia: date, horizontes: Sequence[int], agrupar_por: Optional[str] = None
+    ) -> ResumenVencimientos:
+        """Unidades y valor vencidos y por vencer dentro de cada horizonte en días."""
+        self.refrescar()
+        return self.snapshot.resumen_vencimientos(fecha_referencia, horizontes, agrupar_por)
+
+    def estado(self) -> dict:
+        """Estadísticas del snapshot."""
+        return self.snapshot.estadisticas()
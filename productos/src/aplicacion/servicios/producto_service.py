@@ -1,23 +1,96 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from src.dominio.entities.asignacion import AsignacionLote, PlanAsignacion, SolicitudAsignacion
+from src.dominio.entities.cambios import CambiosProductos
+from src.dominio.entities.consulta import ConsultaProductos, PaginaFilas
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
 from src.dominio.repositorios.producto_repository import ProductoRepository
 
 
 class ProductoService:
     """Servicio de dominio para productos."""
 
-    def __init__(self, producto_repository: ProductoRepository):
+    # Productos con stock pendiente que se publican por llamada a publicar_stock
+    LOTE_PUBLICACION_STOCK = 100
+
+    def __init__(self, producto_repository: ProductoRepository, publicar_stock: Optional[Callable[[int], int]] = None):
+        """
+        Args:
+            producto_repository: Repositorio de productos
+            publicar_stock: Publica en la secuencia de cambios hasta N productos cuyo stock cambió por
+                reservas y devuelve cuántos publicó; se invoca antes de leer los cambios del catálogo
+        """
         self.producto_repository = producto_repository
+        self.publicar_stock = publicar_stock
 
     def obtener_todos_los_productos(self) -> List[Producto]:
         """Obtiene todos los productos."""
         return self.producto_repository.obtener_todos()
 
+    def obtener_filas_productos(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene columnas de todos los productos como tuplas."""
+        return self.producto_repository.obtener_filas(columnas)
+
+    def iterar_filas_productos(self, columnas: Sequence[str], tamano_lote: int) -> Iterator[Tuple[Any, ...]]:
+        """Recorre columnas de todos los productos en lotes."""
+        return self.producto_repository.iterar_filas(columnas, tamano_lote)
+
+    def consultar_filas_productos(self, columnas: Sequence[str], consulta: ConsultaProductos) -> PaginaFilas:
+        """Obtiene columnas de los productos que cumplen la consulta."""
+        return self.producto_repository.consultar_filas(columnas, consulta)
+
     def obtener_producto_por_id(self, producto_id: str) -> Optional[Producto]:
         """Obtiene un producto por su ID."""
         return self.producto_repository.obtener_por_id(producto_id)
 
+    def obtener_productos_por_ids(self, producto_ids: Sequence[str]) -> Dict[str, Producto]:
+        """Obtiene varios productos por ID."""
+        return self.producto_repository.obtener_por_ids(producto_ids)
+
+    def planificar_asignaciones(
+        self, solicitudes: Sequence[SolicitudAsignacion], vencen_desde: datetime
+    ) -> List[PlanAsignacion]:
+        """
+        Planifica el despacho FEFO (primero en vencer, primero en salir) de un pedido completo.
+
+        Resuelve los producto_id a su nombre y carga los lotes de todos los nombres en una sola
+        pasada; luego cada solicitud consume los lotes en orden de vencimiento. Si varias
+        solicitudes piden el mismo producto comparten sus lotes, por lo que el plan nunca asigna
+        más stock del que existe. Solo planifica: no descuenta stock.
+        """
+        ids = [s.producto_id for s in solicitudes if s.nombre is None and s.producto_id]
+        productos = self.producto_repository.obtener_por_ids(ids) if ids else {}
+
+        def nombre_de(solicitud: SolicitudAsignacion) -> Optional[str]:
+            if solicitud.nombre is not None:
+                return solicitud.nombre
+            producto = productos.get(solicitud.producto_id)
+            return producto.nombre if producto else None
+
+        nombres = [nombre_de(s) for s in solicitudes]
+        lotes = self.producto_repository.obtener_lotes_disponibles([n for n in nombres if n is not None], vencen_desde)
+        # Stock restante de cada lote y posición del primer lote no agotado, por nombre
+        restante = {lote.producto_id: lote.cantidad_disponible for lista in lotes.values() for lote in lista}
+        siguiente = dict.fromkeys(lotes, 0)
+
+        planes = []
+        for solicitud, nombre in zip(solicitudes, nombres):
+            asignaciones = []
+            pendiente = solicitud.cantidad
+            lista = lotes.get(nombre, [])
+            while pendiente > 0 and siguiente.get(nombre, 0) < len(lista):
+                lote = lista[siguiente[nombre]]
+                cantidad = min(pendiente, restante[lote.producto_id])
+                asignaciones.append(AsignacionLote(lote.producto_id, lote.lote, lote.fecha_vencimiento, cantidad))
+                restante[lote.producto_id] -= cantidad
+                pendiente -= cantidad
+                if restante[lote.producto_id] == 0:
+                    siguiente[nombre] += 1
+            planes.append(PlanAsignacion(solicitud=solicitud, nombre=nombre, asignaciones=tuple(asignaciones)))
+        return planes
+
     def obtener_productos_por_categoria(self, categoria: str) -> List[Producto]:
         """Obtiene productos por categoría."""
         return self.producto_repository.obtener_por_categoria(categoria)
@@ -25,3 +98,27 @@ class ProductoService:
     def buscar_productos_por_nombre(self, nombre: str) -> List[Producto]:
         """Busca productos por nombre."""
         return self.producto_repository.buscar_por_nombre(nombre)
+
+    def contar_productos_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta productos y unidades agrupados por `campo`."""
+        return self.producto_repository.contar_por(campo)
+
+    def obtener_cambios_productos(self, desde: int, limite: int) -> CambiosProductos:
+        """
+        Obtiene los cambios del catálogo posteriores a una secuencia.
+
+        Antes publica el stock que cambió por reservas y todavía no tiene secuencia, para que
+        el feed no dependa de que el expirador de reservas esté activo ni espere a su ciclo.
+        """
+        if self.publicar_stock is not None:
+            while self.publicar_stock(self.LOTE_PUBLICACION_STOCK) == self.LOTE_PUBLICACION_STOCK:
+                pass
+        return self.producto_repository.obtener_cambios(desde, limite)
+
+    def obtener_version_catalogo(self) -> str:
+        """Obtiene la versión actual del catálogo."""
+        return self.producto_repository.version_catalogo()
+
+    def guardar_productos(self, productos: Sequence[Producto]) -> int:
+        """Inserta o actualiza un lote de productos."""
+        return self.producto_repository.guardar_lote(productos)
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Sequence
+
+from src.dominio.entities.reserva import LineaReserva, Reserva
+from src.dominio.repositorios.reserva_repository import ReservaRepository
+
+
+class ReservaService:
+    """Servicio de dominio para reservas de stock."""
+
+    def __init__(
+        self,
+        reserva_repository: ReservaRepository,
+        ttl_segundos: float = 900,
+        al_cambiar_stock: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            reserva_repository: Repositorio de reservas
+            ttl_segundos: Vigencia por defecto de una reserva pendiente
+            al_cambiar_stock: Se invoca con el ID de cada producto cuyo stock cambió (p. ej. para invalidar caches)
+        """
+        self.reserva_repository = reserva_repository
+        self.ttl_segundos = ttl_segundos
+        self.al_cambiar_stock = al_cambiar_stock
+
+    def _notificar(self, reservas: Sequence[Reserva]) -> None:
+        if self.al_cambiar_stock is None:
+            return
+        for producto_id in {linea.producto_id for reserva in reservas for linea in reserva.lineas}:
+            self.al_cambiar_stock(producto_id)
+
+    def reservar(self, lineas: Sequence[LineaReserva], ttl_segundos: Optional[float] = None) -> Reserva:
+        """Reserva stock de uno o más productos hasta que se confirme, se libere o venza."""
+        expira_en = datetime.utcnow() + timedelta(seconds=ttl_segundos or self.ttl_segundos)
+        reserva = self.reserva_repository.crear(lineas, expira_en)
+        self._notificar([reserva])
+        return reserva
+
+    def obtener_reserva(self, reserva_id: str) -> Optional[Reserva]:
+        """Obtiene una reserva por su ID."""
+        return self.reserva_repository.obtener_por_id(reserva_id)
+
+    def confirmar_reserva(self, reserva_id: str) -> Reserva:
+        """Confirma una reserva; el stock ya estaba descontado, así que no cambia."""
+        return self.reserva_repository.confirmar(reserva_id, datetime.utcnow())
+
+    def liberar_reserva(self, reserva_id: str) -> Reserva:
+        """Libera una reserva pendiente y devuelve su stock."""
+        reserva = self.reserva_repository.liberar(reserva_id)
+        self._notificar([reserva])
+        return reserva
+
+    def expirar_reservas(self, limite: int = 100) -> List[Reserva]:
+        """Expira las reservas pendientes vencidas y devuelve su stock."""
+        reservas = self.reserva_repository.expirar_vencidas(datetime.utcnow(), limite)
+        self._notificar(reservas)
+        return reservas
+
+    def publicar_stock(self, limite: int = 100) -> int:
+        """Publica en la secuencia de cambios del catálogo el stock que cambió por reservas."""
+        return self.reserva_repository.publicar_stock_pendiente(limite)
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional, Sequence
+
+from src.aplicacion.servicios.analitica_service import AnaliticaService
+from src.dominio.entities.analitica import ResumenInventario, ResumenVencimientos
+
+
+class AnaliticaUseCase:
+    """Caso de uso para la analítica de inventario."""
+
+    def __init__(self, analitica_service: AnaliticaService):
+        self.analitica_service = analitica_service
+
+    def resumen_inventario(self, agrupar_por: Optional[str] = None) -> ResumenInventario:
+        """Valor del inventario, opcionalmente agrupado por dimensión."""
+        return self.analitica_service.resumen_inventario(agrupar_por)
+
+    def resumen_vencimientos(self, horizontes: Sequence[int], agrupar_por: Optional[str] = None) -> ResumenVencimientos:
+        """Inventario vencido y por vencer, contado desde hoy (UTC)."""
+        return self.analitica_service.resumen_vencimientos(datetime.utcnow().date(), horizontes, agrupar_por)
+
+    def estado(self) -> dict:
+        """Estadísticas del snapshot de analítica."""
+        return self.analitica_service.estado()
@@ -1,7 +1,14 @@
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
 from src.aplicacion.servicios.producto_service import ProductoService
+from src.dominio.entities.asignacion import PlanAsignacion, SolicitudAsignacion
+from src.dominio.entities.cambios import CambiosProductos
+from src.dominio.entities.consulta import ConsultaProductos, PaginaFilas
+from src.dominio.entities.importacion import ResultadoImportacion
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class ProductoUseCase:
@@ -14,10 +21,33 @@ class ProductoUseCase:
         """Obtiene todos los productos."""
         return self.producto_service.obtener_todos_los_productos()
 
+    def obtener_filas_productos(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene columnas de todos los productos como tuplas."""
+        return self.producto_service.obtener_filas_productos(columnas)
+
+    def iterar_filas_productos(self, columnas: Sequence[str], tamano_lote: int) -> Iterator[Tuple[Any, ...]]:
+        """Recorre columnas de todos los productos en lotes."""
+        return self.producto_service.iterar_filas_productos(columnas, tamano_lote)
+
+    def consultar_filas_productos(self, columnas: Sequence[str], consulta: ConsultaProductos) -> PaginaFilas:
+        """Obtiene columnas de los productos que cumplen la consulta."""
+        return self.producto_service.consultar_filas_productos(columnas, consulta)
+
     def obtener_producto_por_id(self, producto_id: str) -> Optional[Producto]:
         """Obtiene un producto por su ID."""
         return self.producto_service.obtener_producto_por_id(producto_id)
 
+    def obtener_productos_por_ids(self, producto_ids: Sequence[str]) -> Dict[str, Producto]:
+        """Obtiene varios productos por ID."""
+        return self.producto_service.obtener_productos_por_ids(producto_ids)
+
+    def planificar_asignaciones(
+        self, solicitudes: Sequence[SolicitudAsignacion], vigencia_minima_dias: int = 0
+    ) -> List[PlanAsignacion]:
+        """Planifica el despacho FEFO de un pedido, descartando lotes que vencen en menos de `vigencia_minima_dias`."""
+        vencen_desde = datetime.utcnow() + timedelta(days=vigencia_minima_dias)
+        return self.producto_service.planificar_asignaciones(solicitudes, vencen_desde)
+
     def obtener_productos_por_categoria(self, categoria: str) -> List[Producto]:
         """Obtiene productos por categoría."""
         return self.producto_service.obtener_productos_por_categoria(categoria)
@@ -25,3 +55,50 @@ class ProductoUseCase:
     def buscar_productos_por_nombre(self, nombre: str) -> List[Producto]:
         """Busca productos por nombre."""
         return self.producto_service.buscar_productos_por_nombre(nombre)
+
+    def contar_productos_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta productos y unidades agrupados por `campo`."""
+        return self.producto_service.contar_productos_por(campo)
+
+    def obtener_cambios_productos(self, desde: int, limite: int) -> CambiosProductos:
+        """Obtiene los cambios del catálogo posteriores a una secuencia."""
+        return self.producto_service.obtener_cambios_productos(desde, limite)
+
+    def obtener_version_catalogo(self) -> str:
+        """Obtiene la versión actual del catálogo."""
+        return self.producto_service.obtener_version_catalogo()
+
+    def importar_productos(self, registros: Iterable[Tuple[int, Any]], tamano_lote: int) -> ResultadoImportacion:
+        """
+        Valida y guarda productos por lotes a medida que se leen los registros.
+
+        `registros` son pares (número de fila, registro). Cada lote se guarda en su propia
+        transacción: si falla, sus filas se reportan con error y la importación sigue con
+        el siguiente. La memoria usada depende del tamaño del lote, no del total de filas.
+        """
+        resultado = ResultadoImportacion()
+        lote: List[Tuple[int, Producto]] = []
+
+        for numero_fila, registro in registros:
+            resultado.procesadas += 1
+            try:
+                lote.append((numero_fila, ProductoMapper.registro_to_entity(registro)))
+            except ValueError as e:
+                resultado.registrar_error(numero_fila, str(e))
+                continue
+
+            if len(lote) >= tamano_lote:
+                self._guardar_lote(lote, resultado)
+                lote = []
+
+        if lote:
+            self._guardar_lote(lote, resultado)
+        return resultado
+
+    def _guardar_lote(self, lote: List[Tuple[int, Producto]], resultado: ResultadoImportacion) -> None:
+        """Guarda un lote validado y actualiza el resultado."""
+        try:
+            resultado.guardadas += self.producto_service.guardar_productos([producto for _, producto in lote])
+        except Exception as e:
+            primera, ultima = lote[0][0], lote[-1][0]
+            resultado.registrar_error(primera, f"Lote de filas {primera}-{ultima} no guardado: {e}", len(lote))
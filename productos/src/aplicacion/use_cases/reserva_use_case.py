@@ -0,0 +1,35 @@
+from typing import List, Optional, Sequence
+
+from src.aplicacion.servicios.reserva_service import ReservaService
+from src.dominio.entities.reserva import LineaReserva, Reserva
+
+
+class ReservaUseCase:
+    """Caso de uso para reservas de stock."""
+
+    def __init__(self, reserva_service: ReservaService):
+        self.reserva_service = reserva_service
+
+    def reservar(self, lineas: Sequence[LineaReserva], ttl_segundos: Optional[float] = None) -> Reserva:
+        """Reserva stock de uno o más productos."""
+        return self.reserva_service.reservar(lineas, ttl_segundos)
+
+    def obtener_reserva(self, reserva_id: str) -> Optional[Reserva]:
+        """Obtiene una reserva por su ID."""
+        return self.reserva_service.obtener_reserva(reserva_id)
+
+    def confirmar_reserva(self, reserva_id: str) -> Reserva:
+        """Confirma una reserva pendiente."""
+        return self.reserva_service.confirmar_reserva(reserva_id)
+
+    def liberar_reserva(self, reserva_id: str) -> Reserva:
+        """Libera una reserva pendiente."""
+        return self.reserva_service.liberar_reserva(reserva_id)
+
+    def expirar_reservas(self, limite: int = 100) -> List[Reserva]:
+        """Expira las reservas pendientes vencidas."""
+        return self.reserva_service.expirar_reservas(limite)
+
+    def publicar_stock(self, limite: int = 100) -> int:
+        """Publica los cambios de stock de las reservas para la sincronización incremental."""
+        return self.reserva_service.publicar_stock(limite)
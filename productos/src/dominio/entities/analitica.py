@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+# Campos del producto por los que se pueden agrupar los resúmenes de inventario
+DIMENSIONES_ANALITICA = ("categoria", "id_proveedor", "ubicacion")
+
+
+@dataclass(frozen=True)
+class GrupoInventario:
+    """
+    Totales de inventario de un valor de la dimensión agrupada (p. ej. una categoría).
+    """
+
+    clave: str
+    productos: int
+    unidades: int
+    valor: float
+
+
+@dataclass(frozen=True)
+class ResumenInventario:
+    """
+    Totales de inventario (valor = valor_unitario * cantidad_disponible) y, si se pidió,
+    su desglose por dimensión ordenado de mayor a menor valor.
+    """
+
+    productos: int
+    unidades: int
+    valor: float
+    agrupar_por: Optional[str] = None
+    grupos: Tuple[GrupoInventario, ...] = ()
+
+
+@dataclass(frozen=True)
+class ResumenVencimientos:
+    """
+    Inventario ya vencido y el que vence dentro de cada horizonte (en días) desde `fecha_referencia`.
+
+    Los horizontes son acumulados: el de 60 días incluye lo que vence en los primeros 30.
+    """
+
+    fecha_referencia: date
+    vencido: ResumenInventario
+    horizontes: Dict[int, ResumenInventario]
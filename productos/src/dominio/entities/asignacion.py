@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LoteDisponible:
+    """
+    Lote (fila de producto) con stock, candidato para una asignación FEFO.
+    """
+
+    producto_id: str
+    nombre: str
+    lote: str
+    fecha_vencimiento: datetime
+    cantidad_disponible: int
+
+
+@dataclass(frozen=True)
+class SolicitudAsignacion:
+    """
+    Cantidad pedida de un producto, identificado por nombre o por el ID de cualquiera de sus lotes.
+    """
+
+    cantidad: int
+    nombre: Optional[str] = None
+    producto_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AsignacionLote:
+    """
+    Cantidad a despachar de un lote concreto.
+    """
+
+    producto_id: str
+    lote: str
+    fecha_vencimiento: datetime
+    cantidad: int
+
+
+@dataclass(frozen=True)
+class PlanAsignacion:
+    """
+    Plan FEFO (primero en vencer, primero en salir) para una solicitud.
+
+    `nombre` es None si la solicitud indicaba un producto_id inexistente. Si no hay
+    stock vigente suficiente el plan es parcial y `faltante` indica cuánto no se cubrió.
+    """
+
+    solicitud: SolicitudAsignacion
+    nombre: Optional[str]
+    asignaciones: Tuple[AsignacionLote, ...]
+
+    @property
+    def cantidad_asignada(self) -> int:
+        return sum(asignacion.cantidad for asignacion in self.asignaciones)
+
+    @property
+    def faltante(self) -> int:
+        return self.solicitud.cantidad - self.cantidad_asignada
+
+    @property
+    def completo(self) -> bool:
+        return self.faltante == 0
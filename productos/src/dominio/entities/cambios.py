@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+from src.dominio.entities.producto import Producto
+
+
+@dataclass(frozen=True)
+class CambioProducto:
+    """
+    Producto insertado o actualizado, con la secuencia del último cambio.
+    """
+
+    producto: Producto
+    secuencia: int
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class ProductoEliminado:
+    """
+    Producto eliminado (tombstone), con la secuencia de la eliminación.
+    """
+
+    id: str
+    secuencia: int
+    eliminado_en: datetime
+
+
+@dataclass(frozen=True)
+class CambiosProductos:
+    """
+    Página de cambios del catálogo posteriores a una secuencia.
+
+    `hasta` es la secuencia a usar como `desde` en la siguiente consulta; si `hay_mas`
+    es verdadero quedan cambios pendientes y conviene pedir la siguiente página de inmediato.
+    """
+
+    cambios: List[CambioProducto]
+    eliminados: List[ProductoEliminado]
+    hasta: int
+    hay_mas: bool
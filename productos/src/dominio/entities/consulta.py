@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ConsultaProductos:
+    """
+    Filtros, orden y página de un listado de productos.
+
+    Los filtros en None no se aplican. `orden` es una secuencia de (campo, descendente);
+    el ID se agrega siempre como último criterio para que la paginación sea estable.
+    `vence_desde` es inclusivo y `vence_antes` exclusivo.
+    """
+
+    categoria: Optional[str] = None
+    id_proveedor: Optional[str] = None
+    ubicacion: Optional[str] = None
+    nombre: Optional[str] = None
+    valor_min: Optional[float] = None
+    valor_max: Optional[float] = None
+    con_stock: Optional[bool] = None
+    vence_desde: Optional[datetime] = None
+    vence_antes: Optional[datetime] = None
+    orden: Tuple[Tuple[str, bool], ...] = ()
+    limite: Optional[int] = None
+    desplazamiento: int = 0
+
+
+@dataclass(frozen=True)
+class PaginaFilas:
+    """
+    Filas de una página de un listado y el total de productos que cumplen los filtros.
+    """
+
+    filas: List[Tuple[Any, ...]]
+    total: int
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import ClassVar, List
+
+
+@dataclass(frozen=True)
+class ErrorImportacion:
+    """
+    Error de una fila (o de un lote completo) durante una importación.
+    """
+
+    fila: int
+    error: str
+
+
+@dataclass
+class ResultadoImportacion:
+    """
+    Resumen de una importación masiva de productos.
+
+    Solo se conservan los primeros MAX_ERRORES errores para que una importación con
+    millones de filas inválidas no acumule memoria; `con_error` mantiene el total.
+    """
+
+    MAX_ERRORES: ClassVar[int] = 100
+
+    procesadas: int = 0
+    guardadas: int = 0
+    con_error: int = 0
+    errores: List[ErrorImportacion] = field(default_factory=list)
+
+    def registrar_error(self, fila: int, error: str, filas_afectadas: int = 1) -> None:
+        """Registra un error que afecta a una o más filas."""
+        self.con_error += filas_afectadas
+        if len(self.errores) < self.MAX_ERRORES:
+            self.errores.append(ErrorImportacion(fila=fila, error=error))
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Tuple
+
+
+class EstadoReserva(Enum):
+    """Estados de una reserva de stock."""
+
+    PENDIENTE = "PENDIENTE"
+    CONFIRMADA = "CONFIRMADA"
+    LIBERADA = "LIBERADA"
+    EXPIRADA = "EXPIRADA"
+
+
+@dataclass(frozen=True)
+class LineaReserva:
+    """
+    Cantidad reservada de un producto.
+    """
+
+    producto_id: str
+    cantidad: int
+
+
+@dataclass(frozen=True)
+class Reserva:
+    """
+    Reserva de stock de uno o más productos.
+
+    Mientras está PENDIENTE el stock ya se descontó de `cantidad_disponible`; al
+    confirmarse queda descontado definitivamente y al liberarse o expirar se devuelve.
+    """
+
+    id: str
+    estado: EstadoReserva
+    lineas: Tuple[LineaReserva, ...]
+    creada_en: datetime
+    expira_en: datetime
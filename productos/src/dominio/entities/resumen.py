@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConteoGrupo:
+    """
+    Cantidad de productos y unidades en stock de un valor de la columna agrupada.
+    """
+
+    clave: str
+    total: int
+    unidades: int
@@ -0,0 +1,44 @@
+"""
+Excepciones del dominio de productos.
+"""
+
+
+class ReservaError(Exception):
+    """Excepción base para errores de reservas de stock."""
+
+    pass
+
+
+class ProductoNoEncontradoError(ReservaError):
+    """El producto a reservar no existe."""
+
+    def __init__(self, producto_id: str):
+        self.producto_id = producto_id
+        super().__init__(f"Producto no encontrado: {producto_id}")
+
+
+class StockInsuficienteError(ReservaError):
+    """No hay stock disponible para cubrir la cantidad solicitada."""
+
+    def __init__(self, producto_id: str, solicitada: int, disponible: int):
+        self.producto_id = producto_id
+        self.solicitada = solicitada
+        self.disponible = disponible
+        super().__init__(f"Stock insuficiente para {producto_id}: solicitada {solicitada}, disponible {disponible}")
+
+
+class ReservaNoEncontradaError(ReservaError):
+    """La reserva no existe."""
+
+    def __init__(self, reserva_id: str):
+        self.reserva_id = reserva_id
+        super().__init__(f"Reserva no encontrada: {reserva_id}")
+
+
+class EstadoReservaInvalidoError(ReservaError):
+    """La reserva ya no está pendiente (confirmada, liberada o expirada)."""
+
+    def __init__(self, reserva_id: str, estado: str):
+        self.reserva_id = reserva_id
+        self.estado = estado
+        super().__init__(f"La reserva {reserva_id} no está pendiente (estado: {estado})")
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from src.dominio.entities.asignacion import LoteDisponible
+from src.dominio.entities.cambios import CambiosProductos
+from src.dominio.entities.consulta import ConsultaProductos, PaginaFilas
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class ProductoRepository(ABC):
@@ -12,11 +17,40 @@ class ProductoRepository(ABC):
         """Obtiene todos los productos."""
         pass
 
+    @abstractmethod
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los productos, como tuplas."""
+        pass
+
+    @abstractmethod
+    def iterar_filas(self, columnas: Sequence[str], tamano_lote: int) -> Iterator[Tuple[Any, ...]]:
+        """Recorre las columnas indicadas de todos los productos en lotes, sin cargar la tabla completa en memoria."""
+        pass
+
+    @abstractmethod
+    def consultar_filas(self, columnas: Sequence[str], consulta: ConsultaProductos) -> PaginaFilas:
+        """Obtiene las columnas indicadas de los productos que cumplen los filtros, ordenados y paginados."""
+        pass
+
     @abstractmethod
     def obtener_por_id(self, producto_id: str) -> Optional[Producto]:
         """Obtiene un producto por su ID."""
         pass
 
+    @abstractmethod
+    def obtener_por_ids(self, producto_ids: Sequence[str]) -> Dict[str, Producto]:
+        """Obtiene varios productos por ID; los IDs no encontrados no aparecen en el resultado."""
+        pass
+
+    @abstractmethod
+    def obtener_lotes_disponibles(self, nombres: Sequence[str], vencen_desde: datetime) -> Dict[str, List[LoteDisponible]]:
+        """
+        Obtiene los lotes con stock de varios productos (por nombre) que vencen a partir de `vencen_desde`.
+
+        Cada lista viene ordenada por fecha de vencimiento (FEFO); los nombres sin lotes no aparecen.
+        """
+        pass
+
     @abstractmethod
     def obtener_por_categoria(self, categoria: str) -> List[Producto]:
         """Obtiene productos por categoría."""
@@ -26,3 +60,23 @@ class ProductoRepository(ABC):
     def buscar_por_nombre(self, nombre: str) -> List[Producto]:
         """Busca productos por nombre."""
         pass
+
+    @abstractmethod
+    def contar_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta productos y unidades agrupando por una columna, de mayor a menor cantidad de productos."""
+        pass
+
+    @abstractmethod
+    def obtener_cambios(self, desde: int, limite: int) -> CambiosProductos:
+        """Obtiene hasta `limite` productos insertados, actualizados o eliminados después de la secuencia `desde`."""
+        pass
+
+    @abstractmethod
+    def version_catalogo(self) -> str:
+        """Valor que cambia con cada inserción, actualización, eliminación o cambio de stock de productos."""
+        pass
+
+    @abstractmethod
+    def guardar_lote(self, productos: Sequence[Producto]) -> int:
+        """Inserta o actualiza (por ID) un lote de productos en una sola transacción."""
+        pass
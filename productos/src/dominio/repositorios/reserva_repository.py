@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from src.dominio.entities.reserva import LineaReserva, Reserva
+
+
+class ReservaRepository(ABC):
+    """Interfaz del repositorio de reservas de stock."""
+
+    @abstractmethod
+    def crear(self, lineas: Sequence[LineaReserva], expira_en: datetime) -> Reserva:
+        """
+        Descuenta el stock de todas las líneas y registra la reserva en una sola transacción.
+
+        Raises:
+            ProductoNoEncontradoError: Si algún producto no existe
+            StockInsuficienteError: Si algún producto no tiene stock suficiente (no se descuenta nada)
+        """
+        pass
+
+    @abstractmethod
+    def obtener_por_id(self, reserva_id: str) -> Optional[Reserva]:
+        """Obtiene una reserva por su ID."""
+        pass
+
+    @abstractmethod
+    def confirmar(self, reserva_id: str, ahora: datetime) -> Reserva:
+        """
+        Confirma una reserva pendiente y no vencida; el stock queda descontado.
+
+        Raises:
+            ReservaNoEncontradaError: Si la reserva no existe
+            EstadoReservaInvalidoError: Si la reserva no está pendiente o ya venció
+        """
+        pass
+
+    @abstractmethod
+    def liberar(self, reserva_id: str) -> Reserva:
+        """
+        Libera una reserva pendiente y devuelve su stock.
+
+        Raises:
+            ReservaNoEncontradaError: Si la reserva no existe
+            EstadoReservaInvalidoError: Si la reserva no está pendiente
+        """
+        pass
+
+    @abstractmethod
+    def expirar_vencidas(self, ahora: datetime, limite: int) -> List[Reserva]:
+        """Marca como expiradas hasta `limite` reservas pendientes vencidas y devuelve su stock."""
+        pass
+
+    @abstractmethod
+    def publicar_stock_pendiente(self, limite: int) -> int:
+        """
+        Asigna secuencia de cambio a hasta `limite` productos cuyo stock cambió por reservas.
+
+        Returns:
+            Cantidad de productos publicados
+        """
+        pass
@@ -0,0 +1,3 @@
+from .snapshot_columnar import SnapshotColumnar
+
+__all__ = ["SnapshotColumnar"]
@@ -0,0 +1,168 @@
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from src.dominio.entities.analitica import DIMENSIONES_ANALITICA, GrupoInventario, ResumenInventario, ResumenVencimientos
+from src.dominio.entities.cambios import CambiosProductos
+
+
+class SnapshotColumnar:
+    """
+    Copia en memoria, por columnas, de los campos del catálogo que usa la analítica.
+
+    Cada columna es un arreglo de NumPy y las dimensiones de texto se codifican como
+    enteros (diccionario por dimensión), así los agregados agrupados se calculan con
+    np.bincount en lugar de recorrer filas en Python. Se actualiza aplicando páginas
+    de /productos/cambios: las filas modificadas se sobrescriben en su posición, las
+    nuevas se agregan al final y las eliminadas se marcan inactivas hasta compactar.
+    """
+
+    DIMENSIONES = DIMENSIONES_ANALITICA
+
+    # Se compacta cuando las filas inactivas superan esta fracción del total
+    FRACCION_COMPACTACION = 0.25
+
+    def __init__(self, capacidad_inicial: int = 1024):
+        self._lock = threading.RLock()
+        self._capacidad = capacidad_inicial
+        self._filas = 0
+        self._inactivas = 0
+        self._ids: List[Optional[str]] = []
+        self._posicion: Dict[str, int] = {}
+        self._claves: Dict[str, List[str]] = {dimension: [] for dimension in self.DIMENSIONES}
+        self._codigos_por_clave: Dict[str, Dict[str, int]] = {dimension: {} for dimension in self.DIMENSIONES}
+        self._columnas: Dict[str, np.ndarray] = {
+            "activa": np.zeros(capacidad_inicial, dtype=bool),
+            "valor_unitario": np.zeros(capacidad_inicial, dtype=np.float64),
+            "cantidad": np.zeros(capacidad_inicial, dtype=np.int64),
+            # Días desde el 01/01/0001 (date.toordinal) para comparar fechas como enteros
+            "vencimiento": np.zeros(capacidad_inicial, dtype=np.int64),
+            **{dimension: np.zeros(capacidad_inicial, dtype=np.int32) for dimension in self.DIMENSIONES},
+        }
+        self.secuencia = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._filas - self._inactivas
+
+    def _codigo(self, dimension: str, clave: str) -> int:
+        codigos = self._codigos_por_clave[dimension]
+        codigo = codigos.get(clave)
+        if codigo is None:
+            codigo = codigos[clave] = len(self._claves[dimension])
+            self._claves[dimension].append(clave)
+        return codigo
+
+    def _asegurar_capacidad(self, filas: int) -> None:
+        if filas <= self._capacidad:
+            return
+        self._capacidad = max(filas, self._capacidad * 2)
+        for nombre, columna in self._columnas.items():
+            ampliada = np.zeros(self._capacidad, dtype=columna.dtype)
+            ampliada[: self._filas] = columna[: self._filas]
+            self._columnas[nombre] = ampliada
+
+    def _compactar(self) -> None:
+        # Copia: la máscara es una vista de la columna "activa", que también se reescribe
+        activas = self._columnas["activa"][: self._filas].copy()
+        for nombre, columna in self._columnas.items():
+            columna[: len(self)] = columna[: self._filas][activas]
+            columna[len(self) : self._filas] = 0
+        self._ids = [producto_id for producto_id in self._ids if producto_id is not None]
+        self._posicion = {producto_id: fila for fila, producto_id in enumerate(self._ids)}
+        self._filas = len(self._ids)
+        self._inactivas = 0
+
+    def aplicar(self, cambios: CambiosProductos) -> None:
+        """Aplica una página de cambios (altas, modificaciones y eliminaciones) y avanza la secuencia."""
+        with self._lock:
+            nuevas = [c.producto.id for c in cambios.cambios if c.producto.id not in self._posicion]
+            self._asegurar_capacidad(self._filas + len(nuevas))
+            for producto_id in nuevas:
+                self._posicion[producto_id] = self._filas
+                self._ids.append(producto_id)
+                self._filas += 1
+
+            if cambios.cambios:
+                productos = [cambio.producto for cambio in cambios.cambios]
+                filas = np.fromiter((self._posicion[p.id] for p in productos), dtype=np.int64, count=len(productos))
+                columnas = self._columnas
+                columnas["activa"][filas] = True
+                columnas["valor_unitario"][filas] = [p.valor_unitario for p in productos]
+                columnas["cantidad"][filas] = [p.cantidad_disponible for p in productos]
+                columnas["vencimiento"][filas] = [p.fecha_vencimiento.toordinal() for p in productos]
+                for dimension in self.DIMENSIONES:
+                    columnas[dimension][filas] = [self._codigo(dimension, getattr(p, dimension)) for p in productos]
+
+            for eliminado in cambios.eliminados:
+                fila = self._posicion.pop(eliminado.id, None)
+                if fila is not None:
+                    self._columnas["activa"][fila] = False
+                    self._ids[fila] = None
+                    self._inactivas += 1
+
+            if self._inactivas > self.FRACCION_COMPACTACION * self._filas:
+                self._compactar()
+            self.secuencia = max(self.secuencia, cambios.hasta)
+
+    def _resumir(self, mascara: np.ndarray, dimension: Optional[str]) -> ResumenInventario:
+        """Totales de las filas seleccionadas por `mascara` y, opcionalmente, agrupados por `dimension`."""
+        cantidad = self._columnas["cantidad"][: self._filas][mascara]
+        valor = cantidad * self._columnas["valor_unitario"][: self._filas][mascara]
+        if dimension is None:
+            return ResumenInventario(productos=len(cantidad), unidades=int(cantidad.sum()), valor=float(valor.sum()))
+
+        codigos = self._columnas[dimension][: self._filas][mascara]
+        claves = self._claves[dimension]
+        productos = np.bincount(codigos, minlength=len(claves))
+        unidades = np.bincount(codigos, weights=cantidad, minlength=len(claves))
+        valores = np.bincount(codigos, weights=valor, minlength=len(claves))
+        presentes = np.flatnonzero(productos)
+        # Mayor valor primero; a igual valor, orden alfabético para que la respuesta sea estable
+        orden = sorted(presentes.tolist(), key=lambda codigo: (-valores[codigo], claves[codigo]))
+        return ResumenInventario(
+            productos=len(cantidad),
+            unidades=int(cantidad.sum()),
+            valor=float(valor.sum()),
+            agrupar_por=dimension,
+            grupos=tuple(
+                GrupoInventario(
+                    clave=claves[codigo],
+                    productos=int(productos[codigo]),
+                    unidades=int(round(unidades[codigo])),
+                    valor=float(valores[codigo]),
+                )
+                for codigo in orden
+            ),
+        )
+
+    def resumen_inventario(self, dimension: Optional[str] = None) -> ResumenInventario:
+        """Valor y unidades del inventario activo, opcionalmente agrupados por dimensión."""
+        with self._lock:
+            return self._resumir(self._columnas["activa"][: self._filas], dimension)
+
+    def resumen_vencimientos(
+        self, fecha_referencia: date, horizontes: Sequence[int], dimension: Optional[str] = None
+    ) -> ResumenVencimientos:
+        """Inventario vencido y el que vence dentro de cada horizonte (días desde `fecha_referencia`)."""
+        with self._lock:
+            activa = self._columnas["activa"][: self._filas]
+            dias = self._columnas["vencimiento"][: self._filas] - fecha_referencia.toordinal()
+            vigente = activa & (dias >= 0)
+            return ResumenVencimientos(
+                fecha_referencia=fecha_referencia,
+                vencido=self._resumir(activa & (dias < 0), dimension),
+                horizontes={horizonte: self._resumir(vigente & (dias <= horizonte), dimension) for horizonte in horizontes},
+            )
+
+    def estadisticas(self) -> Dict[str, int]:
+        """Tamaño del snapshot y última secuencia aplicada."""
+        with self._lock:
+            return {
+                "productos": self._filas - self._inactivas,
+                "filas_inactivas": self._inactivas,
+                "capacidad": self._capacidad,
+                "secuencia": self.secuencia,
+                "bytes": sum(columna.nbytes for columna in self._columnas.values()),
+            }
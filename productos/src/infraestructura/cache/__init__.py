@@ -0,0 +1,3 @@
+from .cache_lru import CacheLRU
+
+__all__ = ["CacheLRU"]
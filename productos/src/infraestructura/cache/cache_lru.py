@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CacheLRU:
+    """
+    Cache en memoria con expulsión LRU y expiración por TTL.
+
+    Es segura para hilos: todas las operaciones se serializan con un lock,
+    ya que el servidor puede atender peticiones concurrentes en varios hilos.
+    """
+
+    def __init__(self, max_entradas: int = 1000, ttl_segundos: float = 60.0, reloj: Callable[[], float] = time.monotonic):
+        if max_entradas <= 0:
+            raise ValueError("max_entradas debe ser mayor que cero")
+        if ttl_segundos <= 0:
+            raise ValueError("ttl_segundos debe ser mayor que cero")
+
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self._reloj = reloj
+        self._entradas: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._expulsiones = 0
+        self._expiraciones = 0
+
+    def obtener(self, clave: Hashable) -> Tuple[bool, Any]:
+        """
+        Obtiene un valor de la cache.
+
+        Returns:
+            Tupla (encontrado, valor). Permite distinguir un fallo de un valor None guardado.
+        """
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self._fallos += 1
+                return False, None
+
+            expira_en, valor = entrada
+            if expira_en <= self._reloj():
+                del self._entradas[clave]
+                self._expiraciones += 1
+                self._fallos += 1
+                return False, None
+
+            self._entradas.move_to_end(clave)
+            self._aciertos += 1
+            return True, valor
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """Guarda un valor, expulsando la entrada menos usada si se supera la capacidad."""
+        with self._lock:
+            self._entradas[clave] = (self._reloj() + self.ttl_segundos, valor)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self._expulsiones += 1
+
+    def invalidar(self, clave: Hashable) -> None:
+        """Elimina una entrada si existe."""
+        with self._lock:
+            self._entradas.pop(clave, None)
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas sin reiniciar las estadísticas."""
+        with self._lock:
+            self._entradas.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entradas)
+
+    def estadisticas(self) -> Dict[str, Optional[float]]:
+        """Devuelve contadores de uso y la tasa de aciertos."""
+        with self._lock:
+            consultas = self._aciertos + self._fallos
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "ttl_segundos": self.ttl_segundos,
+                "aciertos": self._aciertos,
+                "fallos": self._fallos,
+                "expulsiones": self._expulsiones,
+                "expiraciones": self._expiraciones,
+                "tasa_aciertos": round(self._aciertos / consultas, 4) if consultas else None,
+            }
@@ -0,0 +1,4 @@
+from .producto_cli import create_producto_cli
+from .reserva_cli import create_reserva_cli
+
+__all__ = ["create_producto_cli", "create_reserva_cli"]
@@ -0,0 +1,35 @@
+import json
+import os
+
+import click
+from flask.cli import AppGroup
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.aplicacion.use_cases.producto_use_case import ProductoUseCase
+from src.infraestructura.importacion.lectores import LECTORES
+
+
+def create_producto_cli(producto_use_case: ProductoUseCase, tamano_lote: int) -> AppGroup:
+    """Crea los comandos de línea de comandos para productos (flask productos ...)."""
+
+    producto_cli = AppGroup("productos", help="Administración del catálogo de productos.")
+
+    @producto_cli.command("importar")
+    @click.argument("archivo", type=click.Path(exists=True, dir_okay=False))
+    @click.option(
+        "--formato", type=click.Choice(sorted(LECTORES)), default=None, help="Por defecto se deduce de la extensión."
+    )
+    @click.option("--tamano-lote", type=click.IntRange(min=1), default=tamano_lote, show_default=True)
+    def importar(archivo: str, formato: str, tamano_lote: int):
+        """Importa (inserta o actualiza) productos desde un archivo CSV o NDJSON."""
+        formato = formato or os.path.splitext(archivo)[1].lstrip(".").lower()
+        if formato not in LECTORES:
+            raise click.BadParameter("no se pudo deducir el formato; use --formato csv|ndjson", param_hint="archivo")
+
+        with open(archivo, "rb") as stream:
+            resultado = producto_use_case.importar_productos(LECTORES[formato](stream), tamano_lote)
+
+        click.echo(json.dumps(ProductoMapper.resultado_importacion_to_json(resultado), ensure_ascii=False, indent=2))
+        if resultado.con_error:
+            raise SystemExit(1)
+
+    return producto_cli
@@ -0,0 +1,20 @@
+import click
+from flask.cli import AppGroup
+from src.aplicacion.use_cases.reserva_use_case import ReservaUseCase
+
+
+def create_reserva_cli(reserva_use_case: ReservaUseCase) -> AppGroup:
+    """Crea los comandos de línea de comandos para reservas (flask reservas ...)."""
+
+    reserva_cli = AppGroup("reservas", help="Administración de reservas de stock.")
+
+    @reserva_cli.command("expirar")
+    @click.option("--limite", type=click.IntRange(min=1), default=1000, show_default=True)
+    def expirar(limite: int):
+        """Expira las reservas pendientes vencidas, devuelve su stock y lo publica (alternativa al hilo expirador)."""
+        expiradas = reserva_use_case.expirar_reservas(limite)
+        click.echo(f"Reservas expiradas: {len(expiradas)}")
+        publicados = reserva_use_case.publicar_stock(limite)
+        click.echo(f"Productos con stock publicado: {publicados}")
+
+    return reserva_cli
@@ -0,0 +1,46 @@
+from typing import Optional, Sequence
+
+from flask import jsonify
+from src.aplicacion.mappers.analitica_mapper import AnaliticaMapper
+from src.aplicacion.use_cases.analitica_use_case import AnaliticaUseCase
+from src.dominio.entities.analitica import DIMENSIONES_ANALITICA
+
+
+class AnaliticaCmd:
+    """Controlador para la analítica de inventario."""
+
+    # Dimensiones por las que se puede agrupar
+    DIMENSIONES = DIMENSIONES_ANALITICA
+
+    # Horizontes de vencimiento (días) cuando el cliente no indica otros
+    HORIZONTES_POR_DEFECTO = (30, 60, 90)
+
+    # Horizontes distintos aceptados por consulta y máximo en días
+    LIMITE_HORIZONTES = 10
+    HORIZONTE_MAXIMO_DIAS = 3650
+
+    def __init__(self, analitica_use_case: AnaliticaUseCase):
+        self.analitica_use_case = analitica_use_case
+
+    def resumen_inventario(self, agrupar_por: Optional[str] = None):
+        """Valor del inventario, opcionalmente agrupado."""
+        try:
+            resumen = self.analitica_use_case.resumen_inventario(agrupar_por)
+            return jsonify(AnaliticaMapper.resumen_inventario_to_json(resumen)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def resumen_vencimientos(self, horizontes: Sequence[int], agrupar_por: Optional[str] = None):
+        """Inventario vencido y por vencer en cada horizonte."""
+        try:
+            resumen = self.analitica_use_case.resumen_vencimientos(horizontes, agrupar_por)
+            return jsonify(AnaliticaMapper.resumen_vencimientos_to_json(resumen)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def estado(self):
+        """Estadísticas del snapshot de analítica."""
+        try:
+            return jsonify(self.analitica_use_case.estado()), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
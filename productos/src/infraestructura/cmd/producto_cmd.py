@@ -1,30 +1,118 @@
-from typing import List, Optional
+from itertools import chain
+from typing import List, Optional, Sequence
 
-from flask import jsonify
+from flask import Response, jsonify, stream_with_context
 from src.aplicacion.mappers.producto_mapper import ProductoMapper
 from src.aplicacion.use_cases.producto_use_case import ProductoUseCase
+from src.dominio.entities.asignacion import SolicitudAsignacion
+from src.dominio.entities.consulta import ConsultaProductos
 from src.dominio.entities.producto import Producto
+from src.infraestructura.config.trazas import span
+from src.infraestructura.importacion.lectores import LECTORES
 
 
 class ProductoCmd:
     """Controlador para productos."""
 
-    def __init__(self, producto_use_case: ProductoUseCase):
+    # Formato de exportación -> (mimetype, codificador de filas)
+    FORMATOS_EXPORTACION = {
+        "ndjson": ("application/x-ndjson", ProductoMapper.filas_to_ndjson),
+        "csv": ("text/csv", ProductoMapper.filas_to_csv),
+    }
+
+    # Mimetype negociable con Accept en GET /productos -> codificador de filas. JSON va primero:
+    # es el formato por defecto y el de los clientes externos; MessagePack es para llamadas internas
+    MIMETYPE_MSGPACK = "application/x-msgpack"
+    FORMATOS_LISTADO = {
+        "application/json": ProductoMapper.filas_to_json,
+        MIMETYPE_MSGPACK: ProductoMapper.filas_to_msgpack,
+    }
+    MIMETYPES_LISTADO = tuple(FORMATOS_LISTADO)
+
+    # IDs aceptados por petición en /productos/lote-ids
+    LIMITE_IDS_POR_LOTE = 1000
+
+    # Líneas aceptadas por petición en /productos/asignaciones
+    LIMITE_LINEAS_ASIGNACION = 500
+
+    # Tamaño máximo de página de GET /productos?limite=
+    LIMITE_PAGINA_MAXIMO = 1000
+
+    # Tamaño de página de /productos/cambios
+    LIMITE_CAMBIOS_POR_DEFECTO = 500
+    LIMITE_CAMBIOS_MAXIMO = 1000
+
+    # Columnas por las que se puede agrupar en /productos/resumen
+    CAMPOS_RESUMEN = ("categoria", "id_proveedor", "ubicacion")
+
+    # Formato de importación -> lector de registros en streaming
+    LECTORES_IMPORTACION = LECTORES
+
+    def __init__(
+        self, producto_use_case: ProductoUseCase, tamano_lote_exportacion: int = 1000, tamano_lote_importacion: int = 1000
+    ):
         self.producto_use_case = producto_use_case
+        self.tamano_lote_exportacion = tamano_lote_exportacion
+        self.tamano_lote_importacion = tamano_lote_importacion
+
+    def obtener_todos_los_productos(
+        self,
+        campos: Sequence[str] = ProductoMapper.CAMPOS,
+        consulta: Optional[ConsultaProductos] = None,
+        mimetype: str = "application/json",
+    ):
+        """
+        Obtiene todos los productos usando el camino rápido de serialización.
 
-    def obtener_todos_los_productos(self):
-        """Obtiene todos los productos."""
+        Solo se leen de la base de datos las columnas de `campos`. Con `consulta` se devuelven
+        solo los productos que cumplen sus filtros, en su orden y página; el total de productos
+        que cumplen los filtros va en la cabecera X-Total-Count. `mimetype` es uno de
+        FORMATOS_LISTADO, ya negociado con el Accept de la petición.
+        """
         try:
-            productos = self.producto_use_case.obtener_todos_los_productos()
-            productos_dto = [ProductoMapper.entity_to_dto(p) for p in productos]
-            productos_json = [ProductoMapper.dto_to_json(p) for p in productos_dto]
+            codificar = self.FORMATOS_LISTADO[mimetype]
+            pagina = None
+            if consulta is None:
+                filas = self.producto_use_case.obtener_filas_productos(campos)
+            else:
+                pagina = self.producto_use_case.consultar_filas_productos(campos, consulta)
+                filas = pagina.filas
+            with span("serializacion", formato=mimetype):
+                respuesta = Response(codificar(campos, filas), mimetype=mimetype)
+            if pagina is not None:
+                respuesta.headers["X-Total-Count"] = str(pagina.total)
 
-            return jsonify(productos_json), 200
+            respuesta.vary.add("Accept")
+            return respuesta, 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def exportar_productos(self, formato: str, campos: Sequence[str] = ProductoMapper.CAMPOS):
+        """
+        Exporta el catálogo completo en streaming (chunked) como NDJSON o CSV.
+
+        El primer bloque se genera antes de responder para que un fallo de base de datos
+        todavía pueda devolverse como 500; el resto se emite a medida que se lee.
+        """
+        try:
+            mimetype, codificar = self.FORMATOS_EXPORTACION[formato]
+            filas = self.producto_use_case.iterar_filas_productos(campos, self.tamano_lote_exportacion)
+            bloques = codificar(campos, filas, self.tamano_lote_exportacion)
+            primer_bloque = next(bloques, b"")
+
+            return (
+                Response(
+                    stream_with_context(chain([primer_bloque], bloques)),
+                    mimetype=mimetype,
+                    headers={"Content-Disposition": f'attachment; filename="productos.{formato}"'},
+                ),
+                200,
+            )
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
-    def obtener_producto_por_id(self, producto_id: str):
-        """Obtiene un producto por su ID."""
+    def obtener_producto_por_id(self, producto_id: str, campos: Optional[Sequence[str]] = None):
+        """Obtiene un producto por su ID (la cache guarda la entidad completa; `campos` recorta la respuesta)."""
         try:
             producto = self.producto_use_case.obtener_producto_por_id(producto_id)
             if not producto:
@@ -32,17 +120,53 @@ class ProductoCmd:
 
             producto_dto = ProductoMapper.entity_to_dto(producto)
             producto_json = ProductoMapper.dto_to_json(producto_dto)
+            if campos is not None:
+                producto_json = ProductoMapper.proyectar(producto_json, campos)
 
             return jsonify(producto_json), 200
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
-    def obtener_productos_por_categoria(self, categoria: str):
+    def obtener_productos_por_ids(self, producto_ids: List[str]):
+        """Obtiene varios productos por ID, en el orden pedido y marcando los no encontrados."""
+        try:
+            productos = self.producto_use_case.obtener_productos_por_ids(producto_ids)
+            return jsonify(ProductoMapper.productos_por_ids_to_json(producto_ids, productos)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def planificar_asignacion(self, solicitud: SolicitudAsignacion, vigencia_minima_dias: int = 0):
+        """Planifica el despacho FEFO de un producto entre sus lotes."""
+        try:
+            plan = self.producto_use_case.planificar_asignaciones([solicitud], vigencia_minima_dias)[0]
+            return jsonify(ProductoMapper.plan_asignacion_to_json(plan)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def planificar_asignaciones(self, solicitudes: List[SolicitudAsignacion], vigencia_minima_dias: int = 0):
+        """Planifica el despacho FEFO de un pedido completo en una sola pasada."""
+        try:
+            planes = self.producto_use_case.planificar_asignaciones(solicitudes, vigencia_minima_dias)
+            return (
+                jsonify(
+                    {
+                        "completo": all(plan.completo for plan in planes),
+                        "planes": [ProductoMapper.plan_asignacion_to_json(plan) for plan in planes],
+                    }
+                ),
+                200,
+            )
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def obtener_productos_por_categoria(self, categoria: str, campos: Optional[Sequence[str]] = None):
         """Obtiene productos por categoría."""
         try:
             productos = self.producto_use_case.obtener_productos_por_categoria(categoria)
             productos_dto = [ProductoMapper.entity_to_dto(p) for p in productos]
             productos_json = [ProductoMapper.dto_to_json(p) for p in productos_dto]
+            if campos is not None:
+                productos_json = [ProductoMapper.proyectar(p, campos) for p in productos_json]
 
             return (
                 jsonify(productos_json),
@@ -51,13 +175,48 @@ class ProductoCmd:
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
-    def buscar_productos_por_nombre(self, nombre: str):
+    def buscar_productos_por_nombre(self, nombre: str, campos: Optional[Sequence[str]] = None):
         """Busca productos por nombre."""
         try:
             productos = self.producto_use_case.buscar_productos_por_nombre(nombre)
             productos_dto = [ProductoMapper.entity_to_dto(p) for p in productos]
             productos_json = [ProductoMapper.dto_to_json(p) for p in productos_dto]
+            if campos is not None:
+                productos_json = [ProductoMapper.proyectar(p, campos) for p in productos_json]
 
             return jsonify(productos_json), 200
         except Exception as e:
             return jsonify({"error": str(e)}), 500
+
+    def resumir_productos(self, campo: str):
+        """Cuenta productos y unidades agrupados por `campo`."""
+        try:
+            conteos = self.producto_use_case.contar_productos_por(campo)
+            return jsonify(ProductoMapper.conteos_to_json(campo, conteos)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def obtener_cambios(self, desde: int, limite: int):
+        """Obtiene los productos insertados, actualizados o eliminados después de la secuencia `desde`."""
+        try:
+            cambios = self.producto_use_case.obtener_cambios_productos(desde, limite)
+            return jsonify(ProductoMapper.cambios_to_json(cambios, desde)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def version_catalogo(self) -> Optional[str]:
+        """Versión actual del catálogo para los ETag; None si no se pudo consultar."""
+        try:
+            return self.producto_use_case.obtener_version_catalogo()
+        except Exception:
+            return None
+
+    def importar_productos(self, stream, formato: str):
+        """Importa (inserta o actualiza) productos leyendo un CSV o NDJSON en streaming."""
+        try:
+            registros = self.LECTORES_IMPORTACION[formato](stream)
+            resultado = self.producto_use_case.importar_productos(registros, self.tamano_lote_importacion)
+
+            return jsonify(ProductoMapper.resultado_importacion_to_json(resultado)), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
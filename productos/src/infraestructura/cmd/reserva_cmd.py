@@ -0,0 +1,82 @@
+from typing import List, Optional
+
+from flask import jsonify
+from src.aplicacion.mappers.reserva_mapper import ReservaMapper
+from src.aplicacion.use_cases.reserva_use_case import ReservaUseCase
+from src.dominio.entities.reserva import LineaReserva
+from src.dominio.exceptions import (
+    EstadoReservaInvalidoError,
+    ProductoNoEncontradoError,
+    ReservaNoEncontradaError,
+    StockInsuficienteError,
+)
+
+
+class ReservaCmd:
+    """Controlador para reservas de stock."""
+
+    # Productos distintos aceptados en una misma reserva
+    LIMITE_LINEAS_POR_RESERVA = 100
+
+    # Vigencia máxima que puede pedir el cliente para una reserva pendiente
+    TTL_MAXIMO_SEGUNDOS = 24 * 3600
+
+    def __init__(self, reserva_use_case: ReservaUseCase):
+        self.reserva_use_case = reserva_use_case
+
+    def _respuesta_error(self, error: Exception):
+        """Traduce los errores de reserva a respuestas HTTP."""
+        if isinstance(error, StockInsuficienteError):
+            return (
+                jsonify(
+                    {
+                        "error": str(error),
+                        "producto_id": error.producto_id,
+                        "solicitada": error.solicitada,
+                        "disponible": error.disponible,
+                    }
+                ),
+                409,
+            )
+        if isinstance(error, ProductoNoEncontradoError):
+            return jsonify({"error": str(error), "producto_id": error.producto_id}), 404
+        if isinstance(error, ReservaNoEncontradaError):
+            return jsonify({"error": str(error)}), 404
+        if isinstance(error, EstadoReservaInvalidoError):
+            return jsonify({"error": str(error), "estado": error.estado}), 409
+        return jsonify({"error": str(error)}), 500
+
+    def reservar(self, lineas: List[LineaReserva], ttl_segundos: Optional[int] = None):
+        """Reserva stock de uno o más productos."""
+        try:
+            reserva = self.reserva_use_case.reservar(lineas, ttl_segundos)
+            return jsonify(ReservaMapper.reserva_to_json(reserva)), 201
+        except Exception as e:
+            return self._respuesta_error(e)
+
+    def obtener_reserva(self, reserva_id: str):
+        """Obtiene una reserva por su ID."""
+        try:
+            reserva = self.reserva_use_case.obtener_reserva(reserva_id)
+            if not reserva:
+                return jsonify({"error": "Reserva no encontrada"}), 404
+
+            return jsonify(ReservaMapper.reserva_to_json(reserva)), 200
+        except Exception as e:
+            return self._respuesta_error(e)
+
+    def confirmar_reserva(self, reserva_id: str):
+        """Confirma una reserva pendiente."""
+        try:
+            reserva = self.reserva_use_case.confirmar_reserva(reserva_id)
+            return jsonify(ReservaMapper.reserva_to_json(reserva)), 200
+        except Exception as e:
+            return self._respuesta_error(e)
+
+    def liberar_reserva(self, reserva_id: str):
+        """Libera una reserva pendiente y devuelve su stock."""
+        try:
+            reserva = self.reserva_use_case.liberar_reserva(reserva_id)
+            return jsonify(ReservaMapper.reserva_to_json(reserva)), 200
+        except Exception as e:
+            return self._respuesta_error(e)
@@ -0,0 +1,111 @@
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - está en el Pipfile; sin él (p. ej. en un entorno local) solo se ofrece gzip
+    brotli = None
+
+# Tipos de contenido que vale la pena comprimir (JSON, NDJSON, MessagePack, CSV y texto)
+TIPOS_COMPRIMIBLES = ("application/json", "application/x-ndjson", "application/x-msgpack", "text/")
+
+
+def codificaciones_disponibles() -> tuple:
+    """Codificaciones soportadas, en orden de preferencia ante igual calidad."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def elegir_codificacion(accept_encodings) -> Optional[str]:
+    """Codificación con mayor calidad en Accept-Encoding entre las disponibles, o None."""
+    mejor, mejor_calidad = None, 0
+    for codificacion in codificaciones_disponibles():
+        calidad = accept_encodings.quality(codificacion)
+        if calidad > mejor_calidad:
+            mejor, mejor_calidad = codificacion, calidad
+    return mejor
+
+
+def _compresor(codificacion: str, nivel_gzip: int, calidad_brotli: int):
+    """Compresor incremental con la interfaz (comprimir, terminar)."""
+    if codificacion == "br":
+        compresor = brotli.Compressor(quality=calidad_brotli)
+        return compresor.process, compresor.finish
+    # wbits=31: formato gzip (cabecera y CRC) en lugar de zlib
+    compresor = zlib.compressobj(nivel_gzip, zlib.DEFLATED, 31)
+    return compresor.compress, compresor.flush
+
+
+def comprimir(datos: bytes, codificacion: str, nivel_gzip: int = 6, calidad_brotli: int = 4) -> bytes:
+    """Comprime un cuerpo completo."""
+    procesar, terminar = _compresor(codificacion, nivel_gzip, calidad_brotli)
+    return procesar(datos) + terminar()
+
+
+def comprimir_stream(
+    bloques: Iterable[bytes], codificacion: str, nivel_gzip: int = 6, calidad_brotli: int = 4
+) -> Iterator[bytes]:
+    """Comprime un cuerpo en streaming sin acumularlo en memoria; al terminar cierra `bloques`."""
+    procesar, terminar = _compresor(codificacion, nivel_gzip, calidad_brotli)
+    try:
+        for bloque in bloques:
+            comprimido = procesar(bloque.encode() if isinstance(bloque, str) else bloque)
+            if comprimido:
+                yield comprimido
+        yield terminar()
+    finally:
+        cerrar = getattr(bloques, "close", None)
+        if cerrar is not None:
+            cerrar()
+
+
+def _es_comprimible(response: Response) -> bool:
+    return (
+        request.method != "HEAD"
+        and 200 <= response.status_code < 300
+        and response.status_code not in (204, 206)
+        and not response.direct_passthrough
+        and "Content-Encoding" not in response.headers
+        and response.mimetype.startswith(TIPOS_COMPRIMIBLES)
+    )
+
+
+def registrar_compresion(app: Flask, minimo_bytes: int, nivel_gzip: int = 6, calidad_brotli: int = 4) -> None:
+    """
+    Comprime las respuestas según el Accept-Encoding de la petición.
+
+    Los cuerpos de menos de `minimo_bytes` se envían sin comprimir (el costo supera al
+    ahorro); las respuestas en streaming se comprimen siempre, bloque a bloque. Las que
+    ya traen Content-Encoding (por ejemplo, reenviadas tal cual desde otro servicio) no
+    se tocan.
+    """
+
+    @app.after_request
+    def comprimir_respuesta(response: Response) -> Response:
+        if response.status_code == 304:
+            # El 304 lleva el Vary que tendría la respuesta completa, que sí se comprime
+            response.vary.add("Accept-Encoding")
+            return response
+        if not _es_comprimible(response):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        codificacion = elegir_codificacion(request.accept_encodings)
+        if codificacion is None:
+            return response
+
+        if response.is_streamed:
+            response.response = comprimir_stream(response.response, codificacion, nivel_gzip, calidad_brotli)
+            response.headers.pop("Content-Length", None)
+        else:
+            datos = response.get_data()
+            if len(datos) < minimo_bytes:
+                return response
+            comprimido = comprimir(datos, codificacion, nivel_gzip, calidad_brotli)
+            if len(comprimido) >= len(datos):
+                return response
+            response.set_data(comprimido)
+
+        response.headers["Content-Encoding"] = codificacion
+        return response
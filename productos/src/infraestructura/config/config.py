@@ -1,23 +1,51 @@
-import logging
 import os
-from datetime import datetime
 
 from dotenv import load_dotenv
-from flask import Flask, g, request
+from flask import Flask
 from flask_cors import CORS
+from src.aplicacion.servicios.analitica_service import AnaliticaService
 from src.aplicacion.servicios.producto_service import ProductoService
+from src.aplicacion.servicios.reserva_service import ReservaService
+from src.aplicacion.use_cases.analitica_use_case import AnaliticaUseCase
 from src.aplicacion.use_cases.producto_use_case import ProductoUseCase
+from src.aplicacion.use_cases.reserva_use_case import ReservaUseCase
+from src.infraestructura.cache.cache_lru import CacheLRU
+from src.infraestructura.cli.producto_cli import create_producto_cli
+from src.infraestructura.cli.reserva_cli import create_reserva_cli
+from src.infraestructura.cmd.analitica_cmd import AnaliticaCmd
 from src.infraestructura.cmd.producto_cmd import ProductoCmd
+from src.infraestructura.cmd.reserva_cmd import ReservaCmd
+from src.infraestructura.config.compresion import registrar_compresion
 from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.config.metricas import REGISTRO, registrar_metricas
+from src.infraestructura.config.migraciones import create_migraciones_cli, verificar_migraciones
+from src.infraestructura.config.motor import binds_replicas, normalizar_uri, opciones_motor
+from src.infraestructura.config.perfil_consultas import registrar_perfil_consultas
+from src.infraestructura.config.registro import leer_muestreo, registrar_accesos
+from src.infraestructura.config.sqlite import pragmas_sqlite
+from src.infraestructura.config.trazas import crear_exportador, registrar_trazas, trazar
+from src.infraestructura.migraciones import MIGRACIONES
 from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+from src.infraestructura.repositorios.producto_repository_cache import ProductoRepositoryCache
+from src.infraestructura.repositorios.reserva_repository import ReservaRepositoryImpl
+from src.infraestructura.rutas.analitica_routes import create_analitica_routes
 from src.infraestructura.rutas.producto_routes import create_producto_routes
+from src.infraestructura.rutas.reserva_routes import create_reserva_routes
+from src.infraestructura.tareas.expirador_reservas import ExpiradorReservas
 
 # Módulo de autorización
-from src.modules.autorizador import create_authorization_middleware, create_authorization_module
+from src.modules.autorizador import create_authorization_middleware
 
 load_dotenv(".env")
 
 
+def _crear_snapshot_columnar():
+    # numpy se importa con la primera consulta de analítica, no al arrancar el servicio
+    from src.infraestructura.analitica.snapshot_columnar import SnapshotColumnar
+
+    return SnapshotColumnar()
+
+
 class Config:
     """
     Configuración y factory para la aplicación Flask.
@@ -26,10 +54,13 @@ class Config:
 
     def __init__(self):
         self.app = None
+        self.expirador_reservas = None
 
     def _import_models(self):
         """Importa los modelos de base de datos para que SQLAlchemy los registre."""
+        from src.infraestructura.dto.cambios import ProductoEliminadoModel, SecuenciaCambiosModel  # noqa: F401
         from src.infraestructura.dto.producto import ProductoModel  # noqa: F401
+        from src.infraestructura.dto.reserva import ReservaLineaModel, ReservaModel  # noqa: F401
 
     def create_app(self) -> Flask:
         """
@@ -46,9 +77,21 @@ class Config:
         # Configurar logging de requests
         self._configure_request_logging()
 
+        # Métricas de peticiones y consultas SQL en /metrics
+        self._configure_metrics()
+
+        # Trazas W3C (traceparent) de peticiones, autorización, consultas SQL y serialización
+        self._configure_tracing()
+
+        # Consultas SQL por petición, consultas lentas con su plan y posibles N+1
+        self._configure_query_profiling()
+
         # Configurar CORS
         self._configure_cors()
 
+        # Comprimir respuestas según Accept-Encoding
+        self._configure_compression()
+
         # Configurar base de datos
         self._configure_db()
 
@@ -67,14 +110,64 @@ class Config:
         self.app.config["HOST"] = os.getenv("HOST", "0.0.0.0")
         self.app.config["PORT"] = int(os.getenv("PORT", 5002))
         self.app.config["LOG_LEVEL"] = os.getenv("LOG_LEVEL", "INFO")
+        # Fracción de peticiones registradas por prefijo de ruta, p. ej. "/health:0,/productos:0.1"
+        self.app.config["REGISTRO_ACCESOS_MUESTREO"] = leer_muestreo(os.getenv("REGISTRO_ACCESOS_MUESTREO", ""))
+        # Destino de las trazas ("" las desactiva, "memoria", "archivo:<ruta>" o "modulo:Clase") y fracción muestreada
+        self.app.config["TRAZAS_EXPORTADOR"] = os.getenv("TRAZAS_EXPORTADOR", "")
+        self.app.config["TRAZAS_MUESTREO"] = float(os.getenv("TRAZAS_MUESTREO", 1))
 
         # Configuración JWT para autorización
         self.app.config["JWT_SECRET"] = os.getenv("JWT_SECRET", "your-secret-key-here-with-32-plus-chars-for-security")
         self.app.config["ALGORITHM"] = os.getenv("ALGORITHM", "HS256")
+        # Tokens ya validados que cada proceso recuerda para no verificar su firma en cada petición
+        self.app.config["JWT_CACHE_MAX_ENTRADAS"] = int(os.getenv("JWT_CACHE_MAX_ENTRADAS", 10000))
 
         # Configuración de base de datos
-        self.app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///productos.db")
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = normalizar_uri(os.getenv("DATABASE_URL", "sqlite:///productos.db"))
         self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        # Pool de conexiones y statement timeout para un servidor de base de datos (PostgreSQL)
+        self.app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones_motor(self.app.config["SQLALCHEMY_DATABASE_URI"])
+        # Réplicas de lectura para los métodos @solo_lectura de los repositorios; tras cada escritura
+        # el proceso lee de la primaria durante REPLICAS_VENTANA_SEGUNDOS (retraso máximo esperado)
+        self.app.config["SQLALCHEMY_BINDS"] = binds_replicas()
+        self.app.config["REPLICAS_VENTANA_SEGUNDOS"] = float(os.getenv("REPLICAS_VENTANA_SEGUNDOS", 5))
+        # Pragmas de SQLite por conexión (WAL, synchronous, cache, mmap, temp_store y busy_timeout)
+        self.app.config["SQLITE_PRAGMAS"] = pragmas_sqlite()
+        # Consultas lentas (se registran con su EXPLAIN) y repetidas en una petición (posible N+1); 0 desactiva el aviso
+        self.app.config["SQL_UMBRAL_LENTA_MS"] = float(os.getenv("SQL_UMBRAL_LENTA_MS", 200))
+        self.app.config["SQL_UMBRAL_REPETICIONES"] = int(os.getenv("SQL_UMBRAL_REPETICIONES", 10))
+
+        # Configuración de la cache de catálogo
+        self.app.config["CACHE_MAX_ENTRADAS"] = int(os.getenv("CACHE_MAX_ENTRADAS", 1000))
+        self.app.config["CACHE_TTL_SEGUNDOS"] = float(os.getenv("CACHE_TTL_SEGUNDOS", 60))
+        # Los resúmenes agrupados no se invalidan con cada cambio de stock, por eso su TTL es corto
+        self.app.config["RESUMEN_CACHE_TTL_SEGUNDOS"] = float(os.getenv("RESUMEN_CACHE_TTL_SEGUNDOS", 30))
+
+        # Filas leídas por lote en la exportación en streaming
+        self.app.config["EXPORT_TAMANO_LOTE"] = int(os.getenv("EXPORT_TAMANO_LOTE", 1000))
+
+        # Filas guardadas por transacción en la importación masiva
+        self.app.config["IMPORT_TAMANO_LOTE"] = int(os.getenv("IMPORT_TAMANO_LOTE", 1000))
+
+        # Reservas de stock: vigencia por defecto y cada cuánto se expiran las vencidas (0 desactiva el hilo)
+        self.app.config["RESERVAS_TTL_SEGUNDOS"] = float(os.getenv("RESERVAS_TTL_SEGUNDOS", 900))
+        self.app.config["RESERVAS_INTERVALO_EXPIRACION"] = float(os.getenv("RESERVAS_INTERVALO_EXPIRACION", 30))
+        # Analítica: segundos mínimos entre refrescos incrementales del snapshot columnar
+        self.app.config["ANALITICA_INTERVALO_REFRESCO"] = float(os.getenv("ANALITICA_INTERVALO_REFRESCO", 5))
+
+        # Compresión de respuestas: tamaño mínimo del cuerpo, nivel gzip (1-9) y calidad brotli (0-11)
+        self.app.config["COMPRESION_MINIMO_BYTES"] = int(os.getenv("COMPRESION_MINIMO_BYTES", 1024))
+        self.app.config["COMPRESION_NIVEL_GZIP"] = int(os.getenv("COMPRESION_NIVEL_GZIP", 6))
+        self.app.config["COMPRESION_CALIDAD_BROTLI"] = int(os.getenv("COMPRESION_CALIDAD_BROTLI", 4))
+
+    def _configure_compression(self):
+        """Configura la compresión gzip/brotli de las respuestas."""
+        registrar_compresion(
+            self.app,
+            self.app.config["COMPRESION_MINIMO_BYTES"],
+            self.app.config["COMPRESION_NIVEL_GZIP"],
+            self.app.config["COMPRESION_CALIDAD_BROTLI"],
+        )
 
     def _configure_cors(self):
         """Configura CORS para permitir peticiones desde el frontend."""
@@ -82,77 +175,116 @@ class Config:
             self.app,
             origins=["http://localhost:4200", "http://127.0.0.1:4200"],
             methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            allow_headers=["Content-Type", "Authorization"],
+            allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+            expose_headers=["X-Total-Count", "ETag"],
             supports_credentials=True,
         )
 
     def _configure_db(self):
-        """Configura la base de datos."""
+        """Configura la base de datos; el esquema lo crea `flask migraciones aplicar`, no el arranque."""
         init_db_productos(self.app)
         self._import_models()
-        with self.app.app_context():
-            db_productos.create_all()
+        verificar_migraciones(self.app, db_productos, MIGRACIONES)
+        self.app.cli.add_command(create_migraciones_cli(db_productos, MIGRACIONES))
 
     def _configure_request_logging(self):
-        """Configura el middleware para logging de requests y responses."""
-        logger = logging.getLogger("request_logger")
-
-        @self.app.before_request
-        def log_request():
-            """Log cuando entra una petición."""
-            g.start_time = datetime.now().time()
-            logger.info(f"INCOMING REQUEST: {request.method} {request.url}")
-
-            # Log headers si está en modo debug
-            if self.app.config.get("DEBUG"):
-                logger.debug(f"Headers: {dict(request.headers)}")
-                if request.is_json:
-                    logger.debug(f"Request Body: {request.get_json()}")
-
-        @self.app.after_request
-        def log_response(response):
-            """Log cuando sale una respuesta."""
-            if hasattr(g, "start_time"):
-                duration = (datetime.now() - datetime.combine(datetime.today(), g.start_time)).total_seconds()
-                logger.info(
-                    f"OUTGOING RESPONSE: {response.status_code} - Duration: {duration * 1000:.0f}ms - Size: {len(response.get_data())} bytes"
-                )
-            else:
-                logger.info(f"OUTGOING RESPONSE: {response.status_code}")
-            return response
+        """Registra una línea JSON por petición, escrita fuera del hilo de la petición (ver registro.py)."""
+        registrar_accesos(self.app, self.app.config.get("REGISTRO_ACCESOS_MUESTREO", {}))
+
+    def _configure_metrics(self):
+        """Expone /metrics en el formato de Prometheus: peticiones, consultas SQL y cache de tokens (ver metricas.py)."""
+        registrar_metricas(self.app)
+
+    def _configure_tracing(self):
+        """Traza cada petición y la exporta a TRAZAS_EXPORTADOR (ver trazas.py)."""
+        registrar_trazas(self.app, crear_exportador(self.app.config["TRAZAS_EXPORTADOR"]), self.app.config["TRAZAS_MUESTREO"])
+
+    def _configure_query_profiling(self):
+        """Perfila las consultas SQL de cada petición; en modo debug lo devuelve en cabeceras (ver perfil_consultas.py)."""
+        registrar_perfil_consultas(
+            self.app,
+            self.app.config["SQL_UMBRAL_LENTA_MS"],
+            self.app.config["SQL_UMBRAL_REPETICIONES"],
+            cabeceras=self.app.config["DEBUG"],
+        )
 
     def _setup_dependencies(self):
         """Configura la inyección de dependencias siguiendo arquitectura hexagonal."""
-        # Capa de Infraestructura
-        producto_repository = ProductoRepositoryImpl()
-        # Capa de Dominio
-        producto_service = ProductoService(producto_repository)
+        # Capa de Infraestructura (con cache de lectura delante de la base de datos)
+        max_entradas = self.app.config.get("CACHE_MAX_ENTRADAS")
+        ttl_segundos = self.app.config.get("CACHE_TTL_SEGUNDOS")
+        self.producto_repository = ProductoRepositoryCache(
+            ProductoRepositoryImpl(),
+            cache_por_id=CacheLRU(max_entradas, ttl_segundos),
+            cache_por_categoria=CacheLRU(max_entradas, ttl_segundos),
+            cache_resumen=CacheLRU(len(ProductoCmd.CAMPOS_RESUMEN), self.app.config.get("RESUMEN_CACHE_TTL_SEGUNDOS")),
+        )
+        # Reservas de stock; cada cambio de stock invalida el producto en la cache de catálogo
+        reserva_service = ReservaService(
+            ReservaRepositoryImpl(),
+            ttl_segundos=self.app.config.get("RESERVAS_TTL_SEGUNDOS"),
+            al_cambiar_stock=self.producto_repository.invalidar_producto,
+        )
+        # Capa de Dominio; los cambios del catálogo incluyen el stock que cambió por reservas
+        producto_service = ProductoService(self.producto_repository, publicar_stock=reserva_service.publicar_stock)
         # Capa de Aplicación
         producto_use_case = ProductoUseCase(producto_service)
-        # Capa de Presentación (Controladores)
-        self.producto_controller = ProductoCmd(producto_use_case)
+        # Capa de Presentación (Controladores y CLI)
+        self.producto_controller = ProductoCmd(
+            producto_use_case, self.app.config.get("EXPORT_TAMANO_LOTE"), self.app.config.get("IMPORT_TAMANO_LOTE")
+        )
+        self.app.cli.add_command(create_producto_cli(producto_use_case, self.app.config.get("IMPORT_TAMANO_LOTE")))
+
+        reserva_use_case = ReservaUseCase(reserva_service)
+        self.reserva_controller = ReservaCmd(reserva_use_case)
+        self.app.cli.add_command(create_reserva_cli(reserva_use_case))
+        self.expirador_reservas = ExpiradorReservas(
+            self.app, reserva_use_case, self.app.config.get("RESERVAS_INTERVALO_EXPIRACION")
+        )
 
-        # Configuración del módulo de autorización
-        self.authorization_service = create_authorization_module(
-            self.app.config.get("JWT_SECRET"), self.app.config.get("ALGORITHM")
+        # Analítica de inventario sobre un snapshot columnar que se refresca con los cambios del catálogo
+        analitica_service = AnaliticaService(
+            self.producto_repository,
+            _crear_snapshot_columnar,
+            intervalo_refresco=self.app.config.get("ANALITICA_INTERVALO_REFRESCO"),
         )
+        self.analitica_controller = AnaliticaCmd(AnaliticaUseCase(analitica_service))
 
     def _register_routes(self):
         """Registra todas las rutas de la aplicación."""
-        # Activar middleware de autorización para seguridad del microservicio
-        create_authorization_middleware(self.app, self.app.config.get("JWT_SECRET"), self.app.config.get("ALGORITHM"))
+        # Activar middleware de autorización para seguridad del microservicio; su AuthService
+        # atiende también las rutas /auth
+        auth_service = create_authorization_middleware(
+            self.app,
+            self.app.config.get("JWT_SECRET"),
+            self.app.config.get("ALGORITHM"),
+            self.app.config.get("JWT_CACHE_MAX_ENTRADAS", 10000),
+        )
+        token_validator = auth_service.token_validator
+        REGISTRO.contador_externo(
+            "jwt_cache_consultas_total",
+            "Validaciones de tokens JWT resueltas por la cache (acierto) o verificando la firma (fallo)",
+            ("resultado",),
+            lambda: {("acierto",): token_validator.cache_aciertos, ("fallo",): token_validator.cache_fallos},
+        )
+        # La autorización de cada petición es un span de su traza
+        auth_service.authorize_access = trazar("autorizacion")(auth_service.authorize_access)
 
         # Registrar rutas de productos
         producto_routes = create_producto_routes(self.producto_controller)
         self.app.register_blueprint(producto_routes)
 
+        # Registrar rutas de reservas de stock
+        self.app.register_blueprint(create_reserva_routes(self.reserva_controller))
+
+        # Registrar rutas de analítica de inventario
+        self.app.register_blueprint(create_analitica_routes(self.analitica_controller))
+
         # Registrar rutas de autorización (para que el Gateway pueda usar)
-        from src.modules.autorizador.aplicacion.servicios.auth_service import AuthService
         from src.modules.autorizador.infraestructura.cmd.auth_cmd import AuthCmd
         from src.modules.autorizador.infraestructura.rutas.auth_routes import create_auth_routes
 
-        # Crear servicio y controlador de autorización
-        auth_service = AuthService(self.app.config.get("JWT_SECRET"), self.app.config.get("ALGORITHM"))
+        # Crear controlador de autorización
         auth_controller = AuthCmd(auth_service)
         auth_routes = create_auth_routes(auth_controller)
         self.app.register_blueprint(auth_routes)
@@ -183,7 +315,23 @@ class Config:
         # Ruta de health check
         @self.app.route("/health")
         def health():
-            return {"status": "healthy", "service": "productos", "version": "2.0.0", "auth_enabled": True}
+            return {
+                "status": "healthy",
+                "service": "productos",
+                "version": "2.0.0",
+                "auth_enabled": True,
+                "cache": self.producto_repository.estadisticas(),
+            }
+
+    def start_background_tasks(self):
+        """Inicia las tareas en segundo plano (expiración de reservas) si están habilitadas."""
+        if self.expirador_reservas is not None and self.app.config.get("RESERVAS_INTERVALO_EXPIRACION", 0) > 0:
+            self.expirador_reservas.iniciar()
+
+    def stop_background_tasks(self, timeout=None):
+        """Detiene las tareas en segundo plano, esperando hasta `timeout` segundos a que terminen."""
+        if self.expirador_reservas is not None:
+            self.expirador_reservas.detener(timeout)
 
     def get_app(self) -> Flask:
         """
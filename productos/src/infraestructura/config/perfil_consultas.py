@@ -0,0 +1,178 @@
+import contextvars
+import heapq
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from flask import Flask, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metricas import CUBETAS_PETICION, REGISTRO, metodo_repositorio
+
+logger = logging.getLogger(__name__)
+
+CUBETAS_CONSULTAS_POR_PETICION = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+CONSULTAS_POR_PETICION = REGISTRO.histograma(
+    "db_consultas_por_peticion", "Consultas SQL hechas por cada petición", ("ruta",), CUBETAS_CONSULTAS_POR_PETICION
+)
+TIEMPO_DB_POR_PETICION = REGISTRO.histograma(
+    "db_tiempo_por_peticion_segundos", "Tiempo total de cada petición en la base de datos", ("ruta",), CUBETAS_PETICION
+)
+CONSULTAS_LENTAS = REGISTRO.contador(
+    "db_consultas_lentas_total", "Consultas SQL que superaron SQL_UMBRAL_LENTA_MS", ("metodo",)
+)
+CONSULTAS_REPETIDAS = REGISTRO.contador(
+    "db_consultas_repetidas_total",
+    "Peticiones que repitieron una consulta al menos SQL_UMBRAL_REPETICIONES veces (posible N+1)",
+    ("ruta", "metodo"),
+)
+
+# Consultas más lentas de cada petición que se guardan para las cabeceras
+_MAS_LENTAS = 3
+
+# Prefijo que pide el plan de una consulta sin ejecutarla, por dialecto
+_EXPLICAR = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+
+
+class _Ajustes:
+    # Los fija registrar_perfil_consultas; valen también fuera de las peticiones (CLI, tareas)
+    umbral_lenta = 0.0
+    umbral_repeticiones = 0
+
+
+_ajustes = _Ajustes()
+
+
+class PerfilConsultas:
+    """Consultas SQL de una petición: cuántas, cuánto tiempo en total, las más lentas y las repetidas."""
+
+    __slots__ = ("cantidad", "segundos", "mas_lentas", "repeticiones")
+
+    def __init__(self):
+        self.cantidad = 0
+        self.segundos = 0.0
+        # Montículo de (segundos, método, SQL) con las _MAS_LENTAS más lentas
+        self.mas_lentas: List[Tuple[float, str, str]] = []
+        # SQL -> [veces, método que la hizo primero]
+        self.repeticiones: Dict[str, list] = {}
+
+    def registrar(self, segundos: float, sql: str, metodo: str, executemany: bool) -> None:
+        self.cantidad += 1
+        self.segundos += segundos
+        if len(self.mas_lentas) < _MAS_LENTAS:
+            heapq.heappush(self.mas_lentas, (segundos, metodo, sql))
+        else:
+            heapq.heappushpop(self.mas_lentas, (segundos, metodo, sql))
+        # Un executemany es un lote de una sola llamada, no una consulta repetida
+        if not executemany:
+            self.repeticiones.setdefault(sql, [0, metodo])[0] += 1
+
+    def repetidas(self, umbral: int) -> List[Tuple[str, int, str]]:
+        """(SQL, veces, método) de las consultas repetidas al menos `umbral` veces."""
+        return [(sql, veces, metodo) for sql, (veces, metodo) in self.repeticiones.items() if veces >= umbral]
+
+
+# Perfil de la petición en curso en este contexto
+_perfil_actual: contextvars.ContextVar[Optional[PerfilConsultas]] = contextvars.ContextVar("perfil_consultas", default=None)
+
+
+def _plan(conn, statement: str, parameters, executemany: bool) -> str:
+    prefijo = _EXPLICAR.get(conn.dialect.name)
+    # Solo lecturas: en PostgreSQL un EXPLAIN fallido abortaría la transacción de la petición
+    if prefijo is None or executemany or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return "(sin plan)"
+    # Cursor DBAPI directo: el EXPLAIN no pasa por los eventos del engine
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefijo + statement, parameters)
+        return "\n".join(str(fila[-1]) for fila in cursor.fetchall())
+    except Exception as error:
+        return f"(no se pudo obtener el plan: {error})"
+    finally:
+        cursor.close()
+
+
+def _iniciar_consulta(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._inicio_perfil = time.perf_counter()
+
+
+def _terminar_consulta(conn, cursor, statement, parameters, context, executemany):
+    inicio = getattr(context, "_inicio_perfil", None)
+    if inicio is None:
+        return
+    segundos = time.perf_counter() - inicio
+    metodo = metodo_repositorio()
+    perfil = _perfil_actual.get()
+    if perfil is not None:
+        perfil.registrar(segundos, statement, metodo, executemany)
+    if _ajustes.umbral_lenta and segundos >= _ajustes.umbral_lenta:
+        CONSULTAS_LENTAS.inc(metodo)
+        plan = _plan(conn, statement, parameters, executemany)
+        logger.warning("Consulta lenta (%.1f ms) en %s: %s\nPlan:\n%s", segundos * 1000, metodo, statement, plan)
+
+
+def _ruta() -> str:
+    return request.url_rule.rule if request.url_rule is not None else "sin_ruta"
+
+
+def _cabeceras(response, perfil: PerfilConsultas) -> None:
+    milisegundos = perfil.segundos * 1000
+    response.headers["X-Consultas-SQL"] = str(perfil.cantidad)
+    response.headers["X-Tiempo-SQL-Ms"] = f"{milisegundos:.1f}"
+    response.headers["Server-Timing"] = f'db;dur={milisegundos:.1f};desc="{perfil.cantidad} consultas"'
+    if perfil.mas_lentas:
+        mas_lentas = sorted(perfil.mas_lentas, reverse=True)
+        response.headers["X-Consultas-SQL-Lentas"] = ", ".join(f"{s * 1000:.1f}ms {metodo}" for s, metodo, _ in mas_lentas)
+
+
+def _publicar(perfil: PerfilConsultas) -> None:
+    ruta = _ruta()
+    CONSULTAS_POR_PETICION.observar(perfil.cantidad, ruta)
+    TIEMPO_DB_POR_PETICION.observar(perfil.segundos, ruta)
+    if not _ajustes.umbral_repeticiones:
+        return
+    for sql, veces, metodo in perfil.repetidas(_ajustes.umbral_repeticiones):
+        CONSULTAS_REPETIDAS.inc(ruta, metodo)
+        logger.warning("Posible N+1 en %s %s: %s repitió %d veces %s", request.method, ruta, metodo, veces, sql)
+
+
+def registrar_perfil_consultas(app: Flask, umbral_lenta_ms: float, umbral_repeticiones: int, cabeceras: bool = False) -> None:
+    """
+    Perfila las consultas SQL de cada petición.
+
+    Cada petición publica en /metrics cuántas consultas hizo y cuánto tiempo pasó en la base de
+    datos; con `cabeceras` (modo debug) también los devuelve en la respuesta, con sus consultas
+    más lentas. Las consultas de más de `umbral_lenta_ms` se registran con su plan (EXPLAIN) y
+    una misma consulta repetida `umbral_repeticiones` veces en una petición, como posible N+1.
+    Un umbral 0 desactiva su aviso.
+    """
+    _ajustes.umbral_lenta = umbral_lenta_ms / 1000
+    _ajustes.umbral_repeticiones = umbral_repeticiones
+    if not event.contains(Engine, "before_cursor_execute", _iniciar_consulta):
+        event.listen(Engine, "before_cursor_execute", _iniciar_consulta)
+        event.listen(Engine, "after_cursor_execute", _terminar_consulta)
+
+    @app.before_request
+    def iniciar_perfil():
+        g.perfil_consultas = PerfilConsultas()
+        _perfil_actual.set(g.perfil_consultas)
+
+    if cabeceras:
+
+        @app.after_request
+        def cabeceras_perfil(response):
+            perfil = g.get("perfil_consultas")
+            if perfil is not None:
+                _cabeceras(response, perfil)
+            return response
+
+    # En teardown, para contar también las consultas de las respuestas en streaming
+    @app.teardown_request
+    def terminar_perfil(_error=None):
+        perfil = g.pop("perfil_consultas", None)
+        if perfil is not None:
+            _perfil_actual.set(None)
+            _publicar(perfil)
@@ -0,0 +1,117 @@
+from datetime import datetime
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from src.infraestructura.config.db import db_productos
+
+# INSERT ... ON CONFLICT por dialecto
+_INSERT_CON_CONFLICTO = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class SecuenciaCambiosModel(db_productos.Model):
+    """
+    Contador global de cambios del catálogo (una sola fila).
+
+    Cada inserción, actualización o eliminación toma el siguiente valor. Como el
+    incremento bloquea la fila hasta el commit, las transacciones que escriben se
+    confirman en el mismo orden que sus secuencias: un cliente que ya vio la
+    secuencia N nunca recibe después un cambio confirmado con una secuencia menor.
+    """
+
+    __tablename__ = "secuencia_cambios"
+
+    id = db_productos.Column(db_productos.Integer, primary_key=True)
+    valor = db_productos.Column(db_productos.BigInteger, nullable=False, default=0)
+
+
+class ProductoEliminadoModel(db_productos.Model):
+    """Marca (tombstone) de un producto eliminado, para la sincronización incremental."""
+
+    __tablename__ = "productos_eliminados"
+
+    id = db_productos.Column(db_productos.String, primary_key=True)
+    secuencia = db_productos.Column(db_productos.BigInteger, nullable=False, index=True)
+    eliminado_en = db_productos.Column(db_productos.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class StockPendienteModel(db_productos.Model):
+    """
+    Productos cuyo stock cambió por una reserva y que todavía no tienen secuencia de ese cambio.
+
+    Tomar la secuencia global en cada reserva bloquearía la fila del contador hasta el commit,
+    y todas las reservas, de cualquier producto, esperarían a la anterior. Las reservas solo
+    marcan aquí el producto (una fila por producto) y el expirador de reservas les asigna la
+    secuencia después, en lote. `cambios` cuenta los cambios de stock que acumuló la fila,
+    para que la versión del catálogo cambie con cada uno aunque todavía no tenga secuencia.
+    """
+
+    __tablename__ = "productos_stock_pendiente"
+
+    producto_id = db_productos.Column(db_productos.String, primary_key=True)
+    cambios = db_productos.Column(db_productos.BigInteger, nullable=False, default=1, server_default="1")
+
+
+_tabla_secuencia = SecuenciaCambiosModel.__table__
+_tabla_stock_pendiente = StockPendienteModel.__table__
+
+
+@event.listens_for(_tabla_secuencia, "after_create")
+def _inicializar_secuencia(tabla, conexion, **kwargs):
+    conexion.execute(tabla.insert().values(id=1, valor=0))
+
+
+def siguiente_secuencia(conexion, cantidad: int = 1) -> int:
+    """
+    Reserva `cantidad` secuencias en la transacción de `conexion`.
+
+    Returns:
+        La última secuencia del bloque reservado (el bloque es [valor - cantidad + 1, valor]).
+    """
+    resultado = conexion.execute(_tabla_secuencia.update().values(valor=_tabla_secuencia.c.valor + cantidad))
+    if resultado.rowcount == 0:
+        conexion.execute(_tabla_secuencia.insert().values(id=1, valor=cantidad))
+    return conexion.execute(select(_tabla_secuencia.c.valor)).scalar_one()
+
+
+def secuencia_actual(conexion) -> int:
+    """Última secuencia confirmada."""
+    return conexion.execute(select(_tabla_secuencia.c.valor)).scalar() or 0
+
+
+def version_actual(conexion) -> str:
+    """
+    Versión del catálogo: la última secuencia y, si hay cambios de stock sin publicar, su cantidad.
+
+    Entre dos publicaciones la cantidad solo crece, y cada publicación avanza la secuencia,
+    así que la versión cambia con cada escritura. Se leen las dos en una sola consulta para
+    que ambas salgan de la misma instantánea.
+    """
+    pendientes = select(func.coalesce(func.sum(_tabla_stock_pendiente.c.cambios), 0)).scalar_subquery()
+    secuencia, cambios = conexion.execute(select(_tabla_secuencia.c.valor, pendientes)).first() or (0, 0)
+    return f"{secuencia}.{cambios}" if cambios else str(secuencia)
+
+
+def secuencia_por_defecto(contexto) -> int:
+    """Default de columna: asigna secuencia también a INSERT/UPDATE de Core que no pasan por el ORM."""
+    return siguiente_secuencia(contexto.connection)
+
+
+def marcar_stock_pendiente(conexion, producto_id: str) -> None:
+    """Marca en la transacción de `conexion` que el stock del producto cambió; si ya estaba marcado suma un cambio."""
+    insert = _INSERT_CON_CONFLICTO.get(conexion.dialect.name)
+    if insert is not None:
+        sentencia = insert(_tabla_stock_pendiente).values(producto_id=producto_id)
+        conexion.execute(
+            sentencia.on_conflict_do_update(
+                index_elements=[_tabla_stock_pendiente.c.producto_id],
+                set_={"cambios": _tabla_stock_pendiente.c.cambios + 1},
+            )
+        )
+        return
+    actualizada = conexion.execute(
+        _tabla_stock_pendiente.update()
+        .where(_tabla_stock_pendiente.c.producto_id == producto_id)
+        .values(cambios=_tabla_stock_pendiente.c.cambios + 1)
+    )
+    if actualizada.rowcount == 0:
+        conexion.execute(_tabla_stock_pendiente.insert().values(producto_id=producto_id))
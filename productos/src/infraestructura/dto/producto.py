@@ -1,12 +1,23 @@
 from datetime import datetime
 
+from sqlalchemy import event
 from src.infraestructura.config.db import db_productos
+from src.infraestructura.dto.cambios import ProductoEliminadoModel, secuencia_por_defecto, siguiente_secuencia
 
 
 class ProductoModel(db_productos.Model):
     """Modelo de base de datos para Producto."""
 
     __tablename__ = "productos"
+    __table_args__ = (
+        # Cada fila es un lote: la asignación FEFO recorre los lotes de un nombre por fecha de vencimiento
+        db_productos.Index("ix_productos_nombre_fecha_vencimiento", "nombre", "fecha_vencimiento"),
+        # Filtros y orden de GET /productos
+        db_productos.Index("ix_productos_categoria", "categoria"),
+        db_productos.Index("ix_productos_id_proveedor", "id_proveedor"),
+        db_productos.Index("ix_productos_valor_unitario", "valor_unitario"),
+        db_productos.Index("ix_productos_fecha_vencimiento", "fecha_vencimiento"),
+    )
 
     id = db_productos.Column(db_productos.String, nullable=False, primary_key=True)
     nombre = db_productos.Column(db_productos.String, nullable=False)
@@ -21,5 +32,36 @@ class ProductoModel(db_productos.Model):
     id_proveedor = db_productos.Column(db_productos.String, nullable=False)
     ubicacion = db_productos.Column(db_productos.String, nullable=False)
 
+    # Seguimiento de cambios para la sincronización incremental (/productos/cambios)
+    updated_at = db_productos.Column(db_productos.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    secuencia = db_productos.Column(
+        db_productos.BigInteger, nullable=False, index=True, default=secuencia_por_defecto, onupdate=secuencia_por_defecto
+    )
+
     def __repr__(self):
         return f"<ProductoModel {self.id}: {self.nombre}>"
+
+
+_tabla_eliminados = ProductoEliminadoModel.__table__
+
+
+@event.listens_for(ProductoModel, "after_insert")
+def _retirar_tombstone(mapper, conexion, producto):
+    """Un producto reinsertado deja de figurar como eliminado."""
+    conexion.execute(_tabla_eliminados.delete().where(_tabla_eliminados.c.id == producto.id))
+
+
+@event.listens_for(ProductoModel, "after_delete")
+def _registrar_tombstone(mapper, conexion, producto):
+    """
+    Registra la eliminación para que los clientes la reciban en /productos/cambios.
+
+    Solo aplica a eliminaciones por el ORM (session.delete); un DELETE masivo de Core
+    debe registrar sus tombstones explícitamente.
+    """
+    conexion.execute(_tabla_eliminados.delete().where(_tabla_eliminados.c.id == producto.id))
+    conexion.execute(
+        _tabla_eliminados.insert().values(
+            id=producto.id, secuencia=siguiente_secuencia(conexion), eliminado_en=datetime.utcnow()
+        )
+    )
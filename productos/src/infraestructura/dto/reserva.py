@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from src.infraestructura.config.db import db_productos
+
+
+class ReservaModel(db_productos.Model):
+    """Modelo de base de datos para una reserva de stock."""
+
+    __tablename__ = "reservas"
+    # El expirador busca reservas pendientes ordenadas por vencimiento
+    __table_args__ = (db_productos.Index("ix_reservas_estado_expira_en", "estado", "expira_en"),)
+
+    id = db_productos.Column(db_productos.String, primary_key=True)
+    estado = db_productos.Column(db_productos.String, nullable=False)
+    creada_en = db_productos.Column(db_productos.DateTime, nullable=False, default=datetime.utcnow)
+    expira_en = db_productos.Column(db_productos.DateTime, nullable=False)
+    actualizada_en = db_productos.Column(db_productos.DateTime, nullable=False, default=datetime.utcnow)
+
+    lineas = db_productos.relationship(
+        "ReservaLineaModel", lazy="selectin", order_by="ReservaLineaModel.producto_id", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self):
+        return f"<ReservaModel {self.id}: {self.estado}>"
+
+
+class ReservaLineaModel(db_productos.Model):
+    """Modelo de base de datos para una línea de reserva."""
+
+    __tablename__ = "reserva_lineas"
+
+    reserva_id = db_productos.Column(db_productos.String, db_productos.ForeignKey("reservas.id"), primary_key=True)
+    producto_id = db_productos.Column(db_productos.String, primary_key=True)
+    cantidad = db_productos.Column(db_productos.Integer, nullable=False)
@@ -0,0 +1,3 @@
+from .lectores import LECTORES, leer_csv, leer_ndjson
+
+__all__ = ["LECTORES", "leer_csv", "leer_ndjson"]
@@ -0,0 +1,44 @@
+import csv
+import io
+from typing import IO, Any, Callable, Dict, Iterator, Tuple
+
+import orjson
+
+
+def _con_buffer(stream: IO[bytes]) -> IO[bytes]:
+    """Los streams crudos (p. ej. el cuerpo de la petición) leen byte a byte al buscar líneas."""
+    return io.BufferedReader(stream) if isinstance(stream, io.RawIOBase) else stream
+
+
+def leer_csv(stream: IO[bytes]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lee un CSV con cabecera fila por fila, sin cargarlo completo en memoria.
+
+    Returns:
+        Pares (número de línea en el archivo, fila como diccionario).
+    """
+    texto = io.TextIOWrapper(_con_buffer(stream), encoding="utf-8-sig", newline="")
+    lector = csv.DictReader(texto)
+    for fila in lector:
+        yield lector.line_num, fila
+
+
+def leer_ndjson(stream: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+    """
+    Lee NDJSON (un objeto JSON por línea) línea por línea, ignorando las líneas vacías.
+
+    Returns:
+        Pares (número de línea, objeto). Una línea que no es JSON válido se entrega como
+        ValueError, para que se reporte como error de esa fila sin detener la lectura.
+    """
+    for numero_linea, linea in enumerate(_con_buffer(stream), start=1):
+        if not linea.strip():
+            continue
+        try:
+            yield numero_linea, orjson.loads(linea)
+        except orjson.JSONDecodeError as e:
+            yield numero_linea, ValueError(f"JSON inválido: {e}")
+
+
+# Formato de importación -> lector
+LECTORES: Dict[str, Callable[[IO[bytes]], Iterator[Tuple[int, Any]]]] = {"csv": leer_csv, "ndjson": leer_ndjson}
@@ -0,0 +1,28 @@
+"""
+Migraciones versionadas del esquema de productos, en orden.
+
+Cada módulo define su propia copia de las tablas tal como eran en esa versión, para que una
+migración no cambie cuando cambian los modelos. Se aplican con `flask migraciones aplicar`.
+"""
+
+from src.infraestructura.migraciones import (
+    v0001_esquema_inicial,
+    v0002_seguimiento_de_cambios,
+    v0003_version_de_productos,
+    v0004_reservas,
+    v0005_indices_del_catalogo,
+    v0006_stock_pendiente,
+    v0007_cambios_de_stock_pendientes,
+    v0008_sin_version_de_productos,
+)
+
+MIGRACIONES = [
+    v0001_esquema_inicial.MIGRACION,
+    v0002_seguimiento_de_cambios.MIGRACION,
+    v0003_version_de_productos.MIGRACION,
+    v0004_reservas.MIGRACION,
+    v0005_indices_del_catalogo.MIGRACION,
+    v0006_stock_pendiente.MIGRACION,
+    v0007_cambios_de_stock_pendientes.MIGRACION,
+    v0008_sin_version_de_productos.MIGRACION,
+]
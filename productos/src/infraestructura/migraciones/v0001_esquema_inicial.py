@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DateTime, Float, Integer, MetaData, String, Table
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_tablas
+
+productos = Table(
+    "productos",
+    MetaData(),
+    Column("id", String, nullable=False, primary_key=True),
+    Column("nombre", String, nullable=False),
+    Column("descripcion", String, nullable=False),
+    Column("categoria", String, nullable=False),
+    Column("condiciones_almacenamiento", String, nullable=False),
+    Column("valor_unitario", Float, nullable=False),
+    Column("cantidad_disponible", Integer, nullable=False),
+    Column("fecha_vencimiento", DateTime, nullable=False),
+    Column("lote", String, nullable=False),
+    Column("tiempo_estimado_entrega", String, nullable=False),
+    Column("id_proveedor", String, nullable=False),
+    Column("ubicacion", String, nullable=False),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Tabla de productos original; en bases creadas antes de las migraciones ya existe y no se toca."""
+    crear_tablas(engine, productos)
+
+
+MIGRACION = Migracion(1, "Tabla de productos", aplicar)
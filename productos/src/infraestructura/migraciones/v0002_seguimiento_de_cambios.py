@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, MetaData, String, Table, bindparam, func, select
+from sqlalchemy.engine import Connection, Engine
+from src.infraestructura.config.migraciones import (
+    Migracion,
+    agregar_columna,
+    crear_indice,
+    crear_tablas,
+    exigir_no_nula,
+    rellenar_en_lotes,
+)
+
+metadata = MetaData()
+
+secuencia_cambios = Table(
+    "secuencia_cambios",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("valor", BigInteger, nullable=False),
+)
+
+productos_eliminados = Table(
+    "productos_eliminados",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("secuencia", BigInteger, nullable=False, index=True),
+    Column("eliminado_en", DateTime, nullable=False),
+)
+
+# Solo las columnas que usa el relleno
+productos = Table(
+    "productos",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("updated_at", DateTime),
+    Column("secuencia", BigInteger),
+)
+
+
+def _numerar_lote(conexion: Connection, tamano_lote: int) -> int:
+    """Asigna secuencias nuevas, en orden de ID, a un lote de productos que no tienen."""
+    ids = (
+        conexion.execute(
+            select(productos.c.id).where(productos.c.secuencia.is_(None)).order_by(productos.c.id).limit(tamano_lote)
+        )
+        .scalars()
+        .all()
+    )
+    if not ids:
+        return 0
+
+    # Mismo contador que usa la aplicación, así los productos numerados aquí aparecen en /productos/cambios
+    conexion.execute(secuencia_cambios.update().values(valor=secuencia_cambios.c.valor + len(ids)))
+    ultima = conexion.execute(select(secuencia_cambios.c.valor)).scalar_one()
+    conexion.execute(
+        productos.update()
+        .where(productos.c.id == bindparam("b_id"))
+        .values(secuencia=bindparam("b_secuencia"), updated_at=func.coalesce(productos.c.updated_at, datetime.utcnow())),
+        [{"b_id": producto_id, "b_secuencia": secuencia} for secuencia, producto_id in enumerate(ids, ultima - len(ids) + 1)],
+    )
+    return len(ids)
+
+
+def aplicar(engine: Engine) -> None:
+    """
+    Secuencia de cambios, tombstones y columnas updated_at/secuencia de productos.
+
+    Las columnas se agregan nulas, se numeran los productos existentes por lotes y recién
+    después se exige NOT NULL, para no reescribir ni bloquear la tabla completa.
+    """
+    crear_tablas(engine, secuencia_cambios, productos_eliminados)
+    with engine.begin() as conexion:
+        if conexion.execute(select(secuencia_cambios.c.id)).first() is None:
+            conexion.execute(secuencia_cambios.insert().values(id=1, valor=0))
+
+    agregar_columna(engine, "productos", "updated_at", DateTime())
+    agregar_columna(engine, "productos", "secuencia", BigInteger())
+    rellenar_en_lotes(engine, _numerar_lote)
+    crear_indice(engine, "ix_productos_secuencia", "productos", ["secuencia"])
+    exigir_no_nula(engine, "productos", "updated_at")
+    exigir_no_nula(engine, "productos", "secuencia")
+
+
+MIGRACION = Migracion(2, "Seguimiento de cambios del catálogo (updated_at, secuencia y tombstones)", aplicar)
@@ -0,0 +1,11 @@
+from sqlalchemy import Integer
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, agregar_columna
+
+
+def aplicar(engine: Engine) -> None:
+    """Contador de versión para las actualizaciones optimistas de stock; el default constante no reescribe la tabla."""
+    agregar_columna(engine, "productos", "version", Integer(), predeterminado="1", nula=False)
+
+
+MIGRACION = Migracion(3, "Versión de productos para actualizaciones optimistas", aplicar)
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, MetaData, String, Table
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_tablas
+
+metadata = MetaData()
+
+reservas = Table(
+    "reservas",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("estado", String, nullable=False),
+    Column("creada_en", DateTime, nullable=False),
+    Column("expira_en", DateTime, nullable=False),
+    Column("actualizada_en", DateTime, nullable=False),
+    Index("ix_reservas_estado_expira_en", "estado", "expira_en"),
+)
+
+reserva_lineas = Table(
+    "reserva_lineas",
+    metadata,
+    Column("reserva_id", String, ForeignKey("reservas.id"), primary_key=True),
+    Column("producto_id", String, primary_key=True),
+    Column("cantidad", Integer, nullable=False),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Tablas de reservas de stock (nuevas y vacías: sus índices se crean junto con ellas)."""
+    crear_tablas(engine, reservas, reserva_lineas)
+
+
+MIGRACION = Migracion(4, "Reservas de stock", aplicar)
@@ -0,0 +1,21 @@
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_indice
+
+INDICES = {
+    # Asignación FEFO: lotes de un nombre por fecha de vencimiento
+    "ix_productos_nombre_fecha_vencimiento": ["nombre", "fecha_vencimiento"],
+    # Filtros y orden de GET /productos
+    "ix_productos_categoria": ["categoria"],
+    "ix_productos_id_proveedor": ["id_proveedor"],
+    "ix_productos_valor_unitario": ["valor_unitario"],
+    "ix_productos_fecha_vencimiento": ["fecha_vencimiento"],
+}
+
+
+def aplicar(engine: Engine) -> None:
+    """Índices del catálogo, creados de a uno y sin bloquear las escrituras (CONCURRENTLY en PostgreSQL)."""
+    for nombre, columnas in INDICES.items():
+        crear_indice(engine, nombre, "productos", columnas)
+
+
+MIGRACION = Migracion(5, "Índices de asignación FEFO y de filtros del catálogo", aplicar)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, MetaData, String, Table
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_tablas
+
+metadata = MetaData()
+
+productos_stock_pendiente = Table(
+    "productos_stock_pendiente",
+    metadata,
+    Column("producto_id", String, primary_key=True),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Productos con cambios de stock por publicar; las reservas dejan de tomar la secuencia global."""
+    crear_tablas(engine, productos_stock_pendiente)
+
+
+MIGRACION = Migracion(6, "Cambios de stock pendientes de secuencia", aplicar)
@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, agregar_columna
+
+
+def aplicar(engine: Engine) -> None:
+    """Cuenta los cambios de stock sin publicar, que entran en la versión del catálogo; el default constante no reescribe la tabla."""
+    agregar_columna(engine, "productos_stock_pendiente", "cambios", BigInteger(), predeterminado="1", nula=False)
+
+
+MIGRACION = Migracion(7, "Cambios de stock pendientes en la versión del catálogo", aplicar)
@@ -0,0 +1,10 @@
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, eliminar_columna
+
+
+def aplicar(engine: Engine) -> None:
+    """Las reservas no comparan la versión: su única guarda es el UPDATE condicional sobre cantidad_disponible."""
+    eliminar_columna(engine, "productos", "version")
+
+
+MIGRACION = Migracion(8, "Quita la versión de productos, que ninguna actualización comparaba", aplicar)
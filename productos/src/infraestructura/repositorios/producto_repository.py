@@ -1,11 +1,31 @@
-from typing import List, Optional
+import heapq
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from src.dominio.entities.asignacion import LoteDisponible
+from src.dominio.entities.cambios import CambioProducto, CambiosProductos, ProductoEliminado
+from src.dominio.entities.consulta import ConsultaProductos, PaginaFilas
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
 from src.dominio.repositorios.producto_repository import ProductoRepository
-from src.infraestructura.config.db import db_productos
+from src.infraestructura.config.db import db_productos, marcar_escritura, solo_lectura
+from src.infraestructura.config.metricas import etiquetar_consultas
+from src.infraestructura.dto.cambios import ProductoEliminadoModel, secuencia_actual, siguiente_secuencia, version_actual
 from src.infraestructura.dto.producto import ProductoModel
 
+# IDs por consulta IN; mantiene cada sentencia por debajo del límite de parámetros de SQLite
+TAMANO_BLOQUE_IN = 500
 
+# Dialectos con INSERT ... ON CONFLICT DO UPDATE
+_INSERT_CON_CONFLICTO = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+logger = logging.getLogger(__name__)
+
+
+@etiquetar_consultas
 class ProductoRepositoryImpl(ProductoRepository):
     """Implementación del repositorio de productos con base de datos SQLAlchemy."""
 
@@ -43,15 +63,102 @@ class ProductoRepositoryImpl(ProductoRepository):
             ubicacion=entity.ubicacion,
         )
 
+    @solo_lectura
     def obtener_todos(self) -> List[Producto]:
         """Obtiene todos los productos."""
         try:
             models = db_productos.session.query(ProductoModel).all()
             return [self._model_to_entity(model) for model in models]
-        except Exception as e:
-            print(f"Error obteniendo todos los productos: {e}")
+        except Exception:
+            logger.exception("Error obteniendo todos los productos")
+            return []
+
+    @solo_lectura
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los productos, sin construir modelos ni entidades."""
+        try:
+            query = db_productos.session.query(*[getattr(ProductoModel, columna) for columna in columnas])
+            return [tuple(fila) for fila in query.all()]
+        except Exception:
+            logger.exception("Error obteniendo filas de productos")
             return []
 
+    @solo_lectura
+    def iterar_filas(self, columnas: Sequence[str], tamano_lote: int) -> Iterator[Tuple[Any, ...]]:
+        """
+        Recorre las columnas indicadas de todos los productos, ordenados por ID.
+
+        Las filas se leen del cursor de a `tamano_lote` (yield_per), por lo que la memoria
+        usada no depende del tamaño de la tabla. A diferencia de las demás consultas, los
+        errores se propagan: una exportación cortada no debe parecer completa.
+        """
+        query = (
+            db_productos.session.query(*[getattr(ProductoModel, columna) for columna in columnas])
+            .order_by(ProductoModel.id)
+            .yield_per(tamano_lote)
+        )
+        for fila in query:
+            yield tuple(fila)
+
+    def _condiciones(self, consulta: ConsultaProductos) -> list:
+        """Traduce los filtros de la consulta a condiciones WHERE."""
+        condiciones = []
+        for campo in ("categoria", "id_proveedor", "ubicacion"):
+            valor = getattr(consulta, campo)
+            if valor is not None:
+                condiciones.append(getattr(ProductoModel, campo) == valor)
+        if consulta.nombre is not None:
+            condiciones.append(ProductoModel.nombre.ilike(f"%{consulta.nombre}%"))
+        if consulta.valor_min is not None:
+            condiciones.append(ProductoModel.valor_unitario >= consulta.valor_min)
+        if consulta.valor_max is not None:
+            condiciones.append(ProductoModel.valor_unitario <= consulta.valor_max)
+        if consulta.con_stock is not None:
+            stock = ProductoModel.cantidad_disponible
+            condiciones.append(stock > 0 if consulta.con_stock else stock <= 0)
+        if consulta.vence_desde is not None:
+            condiciones.append(ProductoModel.fecha_vencimiento >= consulta.vence_desde)
+        if consulta.vence_antes is not None:
+            condiciones.append(ProductoModel.fecha_vencimiento < consulta.vence_antes)
+        return condiciones
+
+    @solo_lectura
+    def consultar_filas(self, columnas: Sequence[str], consulta: ConsultaProductos) -> PaginaFilas:
+        """
+        Obtiene una página de productos filtrados y ordenados con una sola consulta.
+
+        El total se calcula en la misma sentencia con COUNT(*) OVER (); solo si la página
+        queda vacía por el desplazamiento hace falta un COUNT aparte. Los errores se
+        propagan: una página vacía se confundiría con que ningún producto cumple los filtros.
+        """
+        session = db_productos.session
+        condiciones = self._condiciones(consulta)
+
+        orden = [
+            getattr(ProductoModel, campo).desc() if desc else getattr(ProductoModel, campo) for campo, desc in consulta.orden
+        ]
+        if all(campo != "id" for campo, _ in consulta.orden):
+            orden.append(ProductoModel.id)
+
+        query = (
+            session.query(*[getattr(ProductoModel, columna) for columna in columnas], func.count().over())
+            .filter(*condiciones)
+            .order_by(*orden)
+            .offset(consulta.desplazamiento)
+        )
+        if consulta.limite is not None:
+            query = query.limit(consulta.limite)
+        resultado = query.all()
+
+        if resultado:
+            total = resultado[0][-1]
+        elif consulta.desplazamiento:
+            total = session.query(func.count(ProductoModel.id)).filter(*condiciones).scalar()
+        else:
+            total = 0
+        return PaginaFilas(filas=[tuple(fila)[:-1] for fila in resultado], total=total)
+
+    @solo_lectura
     def obtener_por_id(self, producto_id: str) -> Optional[Producto]:
         """Obtiene un producto por su ID."""
         try:
@@ -59,24 +166,196 @@ class ProductoRepositoryImpl(ProductoRepository):
             if model:
                 return self._model_to_entity(model)
             return None
-        except Exception as e:
-            print(f"Error obteniendo producto por ID: {e}")
+        except Exception:
+            logger.exception("Error obteniendo producto por ID")
             return None
 
+    @solo_lectura
+    def obtener_por_ids(self, producto_ids: Sequence[str]) -> Dict[str, Producto]:
+        """
+        Obtiene varios productos por ID con una consulta IN por cada bloque de TAMANO_BLOQUE_IN IDs.
+
+        Los errores se propagan: devolver un resultado vacío haría pasar por "no encontrados"
+        productos que sí existen.
+        """
+        ids_unicos = list(dict.fromkeys(producto_ids))
+        productos: Dict[str, Producto] = {}
+        for inicio in range(0, len(ids_unicos), TAMANO_BLOQUE_IN):
+            bloque = ids_unicos[inicio : inicio + TAMANO_BLOQUE_IN]
+            models = db_productos.session.query(ProductoModel).filter(ProductoModel.id.in_(bloque)).all()
+            productos.update((model.id, self._model_to_entity(model)) for model in models)
+        return productos
+
+    def obtener_lotes_disponibles(self, nombres: Sequence[str], vencen_desde: datetime) -> Dict[str, List[LoteDisponible]]:
+        """
+        Obtiene los lotes con stock de varios productos en una consulta por bloque de TAMANO_BLOQUE_IN nombres.
+
+        El orden (nombre, fecha_vencimiento) coincide con el índice ix_productos_nombre_fecha_vencimiento,
+        así que la base de datos recorre los lotes de cada nombre ya ordenados sin ordenar en memoria.
+        No es @solo_lectura a propósito: el plan de asignación reserva sobre este stock y una
+        réplica atrasada ofrecería lotes ya agotados. Los errores se propagan.
+        """
+        nombres_unicos = list(dict.fromkeys(nombres))
+        lotes: Dict[str, List[LoteDisponible]] = {}
+        for inicio in range(0, len(nombres_unicos), TAMANO_BLOQUE_IN):
+            bloque = nombres_unicos[inicio : inicio + TAMANO_BLOQUE_IN]
+            filas = (
+                db_productos.session.query(
+                    ProductoModel.id,
+                    ProductoModel.nombre,
+                    ProductoModel.lote,
+                    ProductoModel.fecha_vencimiento,
+                    ProductoModel.cantidad_disponible,
+                )
+                .filter(
+                    ProductoModel.nombre.in_(bloque),
+                    ProductoModel.fecha_vencimiento >= vencen_desde,
+                    ProductoModel.cantidad_disponible > 0,
+                )
+                .order_by(ProductoModel.nombre, ProductoModel.fecha_vencimiento, ProductoModel.id)
+                .all()
+            )
+            for fila in filas:
+                lotes.setdefault(fila.nombre, []).append(LoteDisponible(*fila))
+        return lotes
+
+    @solo_lectura
     def obtener_por_categoria(self, categoria: str) -> List[Producto]:
         """Obtiene productos por categoría."""
         try:
             models = db_productos.session.query(ProductoModel).filter_by(categoria=categoria).all()
             return [self._model_to_entity(model) for model in models]
-        except Exception as e:
-            print(f"Error obteniendo productos por categoría: {e}")
+        except Exception:
+            logger.exception("Error obteniendo productos por categoría")
             return []
 
+    @solo_lectura
     def buscar_por_nombre(self, nombre: str) -> List[Producto]:
         """Busca productos por nombre."""
         try:
             models = db_productos.session.query(ProductoModel).filter(ProductoModel.nombre.ilike(f"%{nombre}%")).all()
             return [self._model_to_entity(model) for model in models]
-        except Exception as e:
-            print(f"Error buscando productos por nombre: {e}")
+        except Exception:
+            logger.exception("Error buscando productos por nombre")
             return []
+
+    @solo_lectura
+    def contar_por(self, campo: str) -> List[ConteoGrupo]:
+        """
+        Cuenta productos y suma su stock por `campo` con un único GROUP BY en la base de datos.
+
+        Los errores se propagan: un resumen vacío se confundiría con un catálogo vacío.
+        """
+        columna = ProductoModel.__table__.c[campo]
+        total = func.count()
+        filas = (
+            db_productos.session.query(columna, total, func.coalesce(func.sum(ProductoModel.cantidad_disponible), 0))
+            .group_by(columna)
+            .order_by(total.desc(), columna)
+            .all()
+        )
+        return [ConteoGrupo(clave=clave, total=cantidad, unidades=int(unidades)) for clave, cantidad, unidades in filas]
+
+    @solo_lectura
+    def obtener_cambios(self, desde: int, limite: int) -> CambiosProductos:
+        """
+        Obtiene los cambios posteriores a `desde`, ordenados por secuencia.
+
+        Ambas consultas se acotan a la secuencia confirmada al inicio (`tope`): así un
+        cambio que se confirme entre las dos consultas no puede adelantar `hasta` por
+        encima de otro que todavía no se leyó. Los errores se propagan, para no
+        responder "sin cambios" cuando la consulta falló.
+        """
+        tope = secuencia_actual(db_productos.session.connection())
+        models = (
+            db_productos.session.query(ProductoModel)
+            .filter(ProductoModel.secuencia > desde, ProductoModel.secuencia <= tope)
+            .order_by(ProductoModel.secuencia)
+            .limit(limite + 1)
+            .all()
+        )
+        eliminados = (
+            db_productos.session.query(ProductoEliminadoModel)
+            .filter(ProductoEliminadoModel.secuencia > desde, ProductoEliminadoModel.secuencia <= tope)
+            .order_by(ProductoEliminadoModel.secuencia)
+            .limit(limite + 1)
+            .all()
+        )
+
+        ordenados = list(heapq.merge(models, eliminados, key=lambda fila: fila.secuencia))
+        hay_mas = len(ordenados) > limite
+        pagina = ordenados[:limite]
+
+        return CambiosProductos(
+            cambios=[
+                CambioProducto(producto=self._model_to_entity(fila), secuencia=fila.secuencia, updated_at=fila.updated_at)
+                for fila in pagina
+                if isinstance(fila, ProductoModel)
+            ],
+            eliminados=[
+                ProductoEliminado(id=fila.id, secuencia=fila.secuencia, eliminado_en=fila.eliminado_en)
+                for fila in pagina
+                if isinstance(fila, ProductoEliminadoModel)
+            ],
+            hasta=pagina[-1].secuencia if hay_mas else max(tope, desde),
+            hay_mas=hay_mas,
+        )
+
+    def version_catalogo(self) -> str:
+        """
+        Última secuencia de cambios confirmada y cambios de stock sin publicar; los errores se propagan.
+
+        Se lee del primario, no de una réplica: una réplica atrasada daría por vigente el ETag
+        de una respuesta vieja.
+        """
+        return version_actual(db_productos.session.connection())
+
+    def guardar_lote(self, productos: Sequence[Producto]) -> int:
+        """
+        Inserta o actualiza (upsert por ID) un lote de productos en una sola transacción.
+
+        En SQLite y PostgreSQL se ejecuta un único INSERT ... ON CONFLICT DO UPDATE con
+        executemany; en otros motores se usa session.merge por fila. Las secuencias de
+        cambio se reservan en bloque y los tombstones de los IDs reinsertados se retiran
+        con un DELETE ... IN por bloque de TAMANO_BLOQUE_IN IDs, ya que estas sentencias
+        de Core no disparan los eventos del ORM. Si el lote falla
+        se revierte completo y el error se propaga.
+        """
+        if not productos:
+            return 0
+
+        session = db_productos.session
+        try:
+            # Si un ID se repite dentro del lote gana su última aparición
+            filas = {producto.id: producto.to_dict() for producto in productos}
+            conexion = session.connection()
+            marcar_escritura(session)
+            ultima_secuencia = siguiente_secuencia(conexion, len(filas))
+            ahora = datetime.utcnow()
+            for secuencia, fila in enumerate(filas.values(), start=ultima_secuencia - len(filas) + 1):
+                fila["secuencia"] = secuencia
+                fila["updated_at"] = ahora
+
+            insert = _INSERT_CON_CONFLICTO.get(conexion.dialect.name)
+            if insert is not None:
+                tabla = ProductoModel.__table__
+                sentencia = insert(tabla)
+                actualizar = {
+                    columna.name: sentencia.excluded[columna.name] for columna in tabla.columns if columna.name != "id"
+                }
+                sentencia = sentencia.on_conflict_do_update(index_elements=[tabla.c.id], set_=actualizar)
+                session.execute(sentencia, list(filas.values()))
+            else:
+                for fila in filas.values():
+                    session.merge(ProductoModel(**fila))
+
+            tabla_eliminados = ProductoEliminadoModel.__table__
+            ids = list(filas)
+            for inicio in range(0, len(ids), TAMANO_BLOQUE_IN):
+                bloque = ids[inicio : inicio + TAMANO_BLOQUE_IN]
+                session.execute(tabla_eliminados.delete().where(tabla_eliminados.c.id.in_(bloque)))
+            session.commit()
+            return len(productos)
+        except Exception:
+            session.rollback()
+            raise
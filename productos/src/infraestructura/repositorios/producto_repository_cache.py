@@ -0,0 +1,153 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.dominio.entities.asignacion import LoteDisponible
+from src.dominio.entities.cambios import CambiosProductos
+from src.dominio.entities.consulta import ConsultaProductos, PaginaFilas
+from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
+from src.dominio.repositorios.producto_repository import ProductoRepository
+from src.infraestructura.cache.cache_lru import CacheLRU
+
+
+class ProductoRepositoryCache(ProductoRepository):
+    """
+    Decorador de lectura (read-through) sobre un ProductoRepository.
+
+    Cachea productos por ID y listas por categoría con expulsión LRU y TTL y, si se
+    indica `cache_resumen`, los conteos agrupados (con un TTL corto: no se invalidan
+    con cada cambio de stock). Las demás consultas se delegan sin cachear. Las entidades son inmutables,
+    por lo que se pueden compartir entre peticiones sin copiarlas.
+    """
+
+    def __init__(
+        self,
+        repositorio: ProductoRepository,
+        cache_por_id: CacheLRU,
+        cache_por_categoria: CacheLRU,
+        cache_resumen: Optional[CacheLRU] = None,
+    ):
+        self.repositorio = repositorio
+        self.cache_por_id = cache_por_id
+        self.cache_por_categoria = cache_por_categoria
+        self.cache_resumen = cache_resumen
+
+    def obtener_todos(self) -> List[Producto]:
+        """Obtiene todos los productos."""
+        return self.repositorio.obtener_todos()
+
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene columnas de todos los productos como tuplas."""
+        return self.repositorio.obtener_filas(columnas)
+
+    def iterar_filas(self, columnas: Sequence[str], tamano_lote: int) -> Iterator[Tuple[Any, ...]]:
+        """Recorre columnas de todos los productos en lotes."""
+        return self.repositorio.iterar_filas(columnas, tamano_lote)
+
+    def consultar_filas(self, columnas: Sequence[str], consulta: ConsultaProductos) -> PaginaFilas:
+        """Obtiene una página filtrada de productos; nunca se cachea."""
+        return self.repositorio.consultar_filas(columnas, consulta)
+
+    def obtener_por_id(self, producto_id: str) -> Optional[Producto]:
+        """Obtiene un producto por su ID, consultando primero la cache."""
+        encontrado, producto = self.cache_por_id.obtener(producto_id)
+        if encontrado:
+            return producto
+
+        producto = self.repositorio.obtener_por_id(producto_id)
+        if producto is not None:
+            self.cache_por_id.guardar(producto_id, producto)
+        return producto
+
+    def obtener_por_ids(self, producto_ids: Sequence[str]) -> Dict[str, Producto]:
+        """Obtiene varios productos por ID, consultando al repositorio solo los que no están en cache."""
+        productos: Dict[str, Producto] = {}
+        faltantes: List[str] = []
+        for producto_id in dict.fromkeys(producto_ids):
+            encontrado, producto = self.cache_por_id.obtener(producto_id)
+            if encontrado:
+                productos[producto_id] = producto
+            else:
+                faltantes.append(producto_id)
+
+        if faltantes:
+            encontrados = self.repositorio.obtener_por_ids(faltantes)
+            for producto_id, producto in encontrados.items():
+                self.cache_por_id.guardar(producto_id, producto)
+            productos.update(encontrados)
+        return productos
+
+    def obtener_lotes_disponibles(self, nombres: Sequence[str], vencen_desde: datetime) -> Dict[str, List[LoteDisponible]]:
+        """Obtiene los lotes con stock por nombre; nunca se cachea porque el stock cambia con cada reserva."""
+        return self.repositorio.obtener_lotes_disponibles(nombres, vencen_desde)
+
+    def obtener_por_categoria(self, categoria: str) -> List[Producto]:
+        """Obtiene productos por categoría, consultando primero la cache."""
+        encontrado, productos = self.cache_por_categoria.obtener(categoria)
+        if encontrado:
+            return list(productos)
+
+        productos = self.repositorio.obtener_por_categoria(categoria)
+        # No se cachean listas vacías: el repositorio también devuelve [] ante errores de base de datos
+        if productos:
+            self.cache_por_categoria.guardar(categoria, tuple(productos))
+        return productos
+
+    def buscar_por_nombre(self, nombre: str) -> List[Producto]:
+        """Busca productos por nombre."""
+        return self.repositorio.buscar_por_nombre(nombre)
+
+    def contar_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta productos agrupados por `campo`, consultando primero la cache de resúmenes."""
+        if self.cache_resumen is None:
+            return self.repositorio.contar_por(campo)
+
+        encontrado, conteos = self.cache_resumen.obtener(campo)
+        if encontrado:
+            return list(conteos)
+
+        conteos = self.repositorio.contar_por(campo)
+        self.cache_resumen.guardar(campo, tuple(conteos))
+        return conteos
+
+    def obtener_cambios(self, desde: int, limite: int) -> CambiosProductos:
+        """Obtiene cambios posteriores a una secuencia; nunca se cachea."""
+        return self.repositorio.obtener_cambios(desde, limite)
+
+    def version_catalogo(self) -> str:
+        """Versión del catálogo; nunca se cachea porque es lo que permite validar las respuestas."""
+        return self.repositorio.version_catalogo()
+
+    def guardar_lote(self, productos: Sequence[Producto]) -> int:
+        """Guarda un lote de productos e invalida sus entradas cacheadas."""
+        guardados = self.repositorio.guardar_lote(productos)
+        for producto in productos:
+            self.cache_por_id.invalidar(producto.id)
+        self.cache_por_categoria.limpiar()
+        self._limpiar_resumen()
+        return guardados
+
+    def invalidar_producto(self, producto_id: str) -> None:
+        """Invalida un producto y las listas por categoría que podrían contenerlo."""
+        self.cache_por_id.invalidar(producto_id)
+        self.cache_por_categoria.limpiar()
+
+    def _limpiar_resumen(self) -> None:
+        if self.cache_resumen is not None:
+            self.cache_resumen.limpiar()
+
+    def invalidar_todo(self) -> None:
+        """Invalida todas las entradas cacheadas."""
+        self.cache_por_id.limpiar()
+        self.cache_por_categoria.limpiar()
+        self._limpiar_resumen()
+
+    def estadisticas(self) -> Dict[str, Dict]:
+        """Estadísticas de uso de las caches."""
+        estadisticas = {
+            "por_id": self.cache_por_id.estadisticas(),
+            "por_categoria": self.cache_por_categoria.estadisticas(),
+        }
+        if self.cache_resumen is not None:
+            estadisticas["resumen"] = self.cache_resumen.estadisticas()
+        return estadisticas
@@ -0,0 +1,256 @@
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from sqlalchemy import bindparam, delete, select, update
+from src.dominio.entities.reserva import EstadoReserva, LineaReserva, Reserva
+from src.dominio.exceptions import (
+    EstadoReservaInvalidoError,
+    ProductoNoEncontradoError,
+    ReservaNoEncontradaError,
+    StockInsuficienteError,
+)
+from src.dominio.repositorios.reserva_repository import ReservaRepository
+from src.infraestructura.config.db import db_productos, marcar_escritura
+from src.infraestructura.config.metricas import etiquetar_consultas
+from src.infraestructura.dto.cambios import StockPendienteModel, marcar_stock_pendiente, siguiente_secuencia
+from src.infraestructura.dto.producto import ProductoModel
+from src.infraestructura.dto.reserva import ReservaLineaModel, ReservaModel
+
+_productos = ProductoModel.__table__
+_reservas = ReservaModel.__table__
+_stock_pendiente = StockPendienteModel.__table__
+
+
+@etiquetar_consultas
+class ReservaRepositoryImpl(ReservaRepository):
+    """
+    Implementación del repositorio de reservas con base de datos SQLAlchemy.
+
+    El stock se descuenta con un UPDATE condicional (`WHERE cantidad_disponible >= n`)
+    en lugar de leer, validar y escribir: la base de datos evalúa la condición y el
+    decremento de forma atómica sobre la fila, así que dos reservas concurrentes nunca
+    pueden dejar el stock negativo y no hace falta bloquear la tabla. Esa condición es la
+    única guarda: no se lee el stock antes ni se compara una versión de la fila. Los cambios
+    de estado usan el mismo patrón (`WHERE estado = 'PENDIENTE'`), de modo que si una
+    liberación y una expiración compiten solo una devuelve el stock.
+
+    Los cambios de stock no toman la secuencia global de cambios del catálogo, que bloquea
+    la fila del contador hasta el commit: solo bloquean la fila de su producto y la marcan
+    como pendiente, sumando un cambio a su marca. La versión del catálogo (el ETag) cuenta
+    esos cambios, así que cambia en el momento; publicar_stock_pendiente les asigna la
+    secuencia después, en lote, y desde entonces aparecen en /productos/cambios.
+
+    Los errores se propagan (tras revertir la transacción) para que el llamador pueda
+    distinguir falta de stock de un fallo de base de datos.
+    """
+
+    def _model_to_entity(self, model: ReservaModel) -> Reserva:
+        """Convierte un modelo de base de datos a una entidad del dominio."""
+        return Reserva(
+            id=model.id,
+            estado=EstadoReserva(model.estado),
+            lineas=tuple(LineaReserva(producto_id=linea.producto_id, cantidad=linea.cantidad) for linea in model.lineas),
+            creada_en=model.creada_en,
+            expira_en=model.expira_en,
+        )
+
+    def _ajustar_stock(self, session, producto_id: str, delta: int) -> bool:
+        """Suma `delta` al stock de un producto; si es negativo solo aplica cuando hay stock suficiente."""
+        sentencia = update(_productos).where(_productos.c.id == producto_id)
+        if delta < 0:
+            sentencia = sentencia.where(_productos.c.cantidad_disponible >= -delta)
+        resultado = session.execute(
+            sentencia.values(
+                cantidad_disponible=_productos.c.cantidad_disponible + delta,
+                # Con un valor explícito no se aplica el onupdate que toma la secuencia global
+                secuencia=_productos.c.secuencia,
+            )
+        )
+        if resultado.rowcount != 1:
+            return False
+        marcar_stock_pendiente(session.connection(), producto_id)
+        marcar_escritura(session)
+        return True
+
+    def _finalizar(self, session, reserva_id: str, estado: EstadoReserva, ahora: datetime) -> bool:
+        """
+        Pasa una reserva de PENDIENTE a `estado`; si sale liberada o expirada devuelve su stock.
+
+        Returns:
+            False si la reserva no estaba pendiente (otro proceso ya la finalizó)
+        """
+        resultado = session.execute(
+            update(_reservas)
+            .where(_reservas.c.id == reserva_id, _reservas.c.estado == EstadoReserva.PENDIENTE.value)
+            .values(estado=estado.value, actualizada_en=ahora)
+        )
+        if resultado.rowcount != 1:
+            return False
+
+        if estado != EstadoReserva.CONFIRMADA:
+            lineas = session.execute(
+                select(ReservaLineaModel.producto_id, ReservaLineaModel.cantidad)
+                .where(ReservaLineaModel.reserva_id == reserva_id)
+                .order_by(ReservaLineaModel.producto_id)
+            ).all()
+            for producto_id, cantidad in lineas:
+                self._ajustar_stock(session, producto_id, cantidad)
+        return True
+
+    def _error_de_estado(self, reserva_id: str, ahora: datetime) -> Exception:
+        """Construye el error para una reserva que no se pudo finalizar."""
+        reserva = self.obtener_por_id(reserva_id)
+        if reserva is None:
+            return ReservaNoEncontradaError(reserva_id)
+        if reserva.estado == EstadoReserva.PENDIENTE and reserva.expira_en <= ahora:
+            return EstadoReservaInvalidoError(reserva_id, EstadoReserva.EXPIRADA.value)
+        return EstadoReservaInvalidoError(reserva_id, reserva.estado.value)
+
+    def crear(self, lineas: Sequence[LineaReserva], expira_en: datetime) -> Reserva:
+        """Descuenta el stock de todas las líneas y registra la reserva en una sola transacción."""
+        session = db_productos.session
+        try:
+            # Líneas repetidas del mismo producto se suman; el orden por ID evita interbloqueos entre reservas
+            cantidades = Counter()
+            for linea in lineas:
+                cantidades[linea.producto_id] += linea.cantidad
+            cantidades = dict(sorted(cantidades.items()))
+
+            for producto_id, cantidad in cantidades.items():
+                if not self._ajustar_stock(session, producto_id, -cantidad):
+                    disponible = session.execute(
+                        select(_productos.c.cantidad_disponible).where(_productos.c.id == producto_id)
+                    ).scalar()
+                    if disponible is None:
+                        raise ProductoNoEncontradoError(producto_id)
+                    raise StockInsuficienteError(producto_id, cantidad, disponible)
+
+            ahora = datetime.utcnow()
+            model = ReservaModel(
+                id=str(uuid.uuid4()),
+                estado=EstadoReserva.PENDIENTE.value,
+                creada_en=ahora,
+                expira_en=expira_en,
+                actualizada_en=ahora,
+                lineas=[ReservaLineaModel(producto_id=p, cantidad=c) for p, c in cantidades.items()],
+            )
+            session.add(model)
+            session.commit()
+            return self._model_to_entity(model)
+        except Exception:
+            session.rollback()
+            raise
+
+    def obtener_por_id(self, reserva_id: str) -> Optional[Reserva]:
+        """Obtiene una reserva por su ID."""
+        model = db_productos.session.get(ReservaModel, reserva_id, populate_existing=True)
+        return self._model_to_entity(model) if model else None
+
+    def confirmar(self, reserva_id: str, ahora: datetime) -> Reserva:
+        """Confirma una reserva pendiente y no vencida."""
+        session = db_productos.session
+        try:
+            resultado = session.execute(
+                update(_reservas)
+                .where(
+                    _reservas.c.id == reserva_id,
+                    _reservas.c.estado == EstadoReserva.PENDIENTE.value,
+                    _reservas.c.expira_en > ahora,
+                )
+                .values(estado=EstadoReserva.CONFIRMADA.value, actualizada_en=ahora)
+            )
+            if resultado.rowcount != 1:
+                session.rollback()
+                raise self._error_de_estado(reserva_id, ahora)
+            session.commit()
+            return self.obtener_por_id(reserva_id)
+        except Exception:
+            session.rollback()
+            raise
+
+    def liberar(self, reserva_id: str) -> Reserva:
+        """Libera una reserva pendiente y devuelve su stock."""
+        session = db_productos.session
+        ahora = datetime.utcnow()
+        try:
+            if not self._finalizar(session, reserva_id, EstadoReserva.LIBERADA, ahora):
+                session.rollback()
+                raise self._error_de_estado(reserva_id, ahora)
+            session.commit()
+            return self.obtener_por_id(reserva_id)
+        except Exception:
+            session.rollback()
+            raise
+
+    def expirar_vencidas(self, ahora: datetime, limite: int) -> List[Reserva]:
+        """
+        Marca como expiradas hasta `limite` reservas pendientes vencidas y devuelve su stock.
+
+        Cada reserva se expira en su propia transacción para no retener bloqueos mientras
+        se procesa el resto; las que otro proceso finalizó antes se omiten.
+        """
+        session = db_productos.session
+        try:
+            vencidas = (
+                session.execute(
+                    select(_reservas.c.id)
+                    .where(_reservas.c.estado == EstadoReserva.PENDIENTE.value, _reservas.c.expira_en <= ahora)
+                    .order_by(_reservas.c.expira_en)
+                    .limit(limite)
+                )
+                .scalars()
+                .all()
+            )
+            session.commit()
+
+            expiradas = []
+            for reserva_id in vencidas:
+                if self._finalizar(session, reserva_id, EstadoReserva.EXPIRADA, ahora):
+                    session.commit()
+                    expiradas.append(self.obtener_por_id(reserva_id))
+                else:
+                    session.rollback()
+            return expiradas
+        except Exception:
+            session.rollback()
+            raise
+
+    def publicar_stock_pendiente(self, limite: int) -> int:
+        """
+        Asigna secuencia de cambio a hasta `limite` productos marcados por las reservas.
+
+        Toma un bloque de la secuencia global para todo el lote, así que el contador se
+        bloquea una vez por lote y no una vez por reserva. Un producto que se reserve de
+        nuevo mientras tanto vuelve a quedar marcado y sale en el lote siguiente.
+        """
+        session = db_productos.session
+        try:
+            ids = (
+                session.execute(select(_stock_pendiente.c.producto_id).order_by(_stock_pendiente.c.producto_id).limit(limite))
+                .scalars()
+                .all()
+            )
+            if not ids:
+                session.commit()
+                return 0
+
+            conexion = session.connection()
+            marcar_escritura(session)
+            ultima_secuencia = siguiente_secuencia(conexion, len(ids))
+            conexion.execute(
+                update(_productos)
+                .where(_productos.c.id == bindparam("b_id"))
+                .values(secuencia=bindparam("b_secuencia"), updated_at=datetime.utcnow()),
+                [
+                    {"b_id": producto_id, "b_secuencia": secuencia}
+                    for secuencia, producto_id in enumerate(ids, start=ultima_secuencia - len(ids) + 1)
+                ],
+            )
+            conexion.execute(delete(_stock_pendiente).where(_stock_pendiente.c.producto_id.in_(ids)))
+            session.commit()
+            return len(ids)
+        except Exception:
+            session.rollback()
+            raise
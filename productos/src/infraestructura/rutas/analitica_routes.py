@@ -0,0 +1,63 @@
+from flask import Blueprint, request
+from src.infraestructura.cmd.analitica_cmd import AnaliticaCmd
+from src.infraestructura.rutas.parametros import con_parametros
+
+
+def _dimension(por_defecto=None):
+    """Parser de ?agrupar_por=...; "ninguno" o vacío no agrupan."""
+
+    def parsear():
+        agrupar_por = request.args.get("agrupar_por", por_defecto)
+        if agrupar_por in ("", "ninguno"):
+            return {"agrupar_por": None}
+        if agrupar_por is not None and agrupar_por not in AnaliticaCmd.DIMENSIONES:
+            raise ValueError(f"Parámetro agrupar_por debe ser uno de: {', '.join(AnaliticaCmd.DIMENSIONES)}")
+        return {"agrupar_por": agrupar_por}
+
+    return parsear
+
+
+def _horizontes():
+    """Horizontes en días de ?horizontes=30,60,90 (HORIZONTES_POR_DEFECTO si no se indica)."""
+    texto = request.args.get("horizontes")
+    if texto is None:
+        return {"horizontes": AnaliticaCmd.HORIZONTES_POR_DEFECTO}
+    try:
+        horizontes = sorted({int(valor) for valor in texto.split(",") if valor.strip()})
+    except ValueError:
+        horizontes = []
+    if (
+        not horizontes
+        or len(horizontes) > AnaliticaCmd.LIMITE_HORIZONTES
+        or not all(0 <= h <= AnaliticaCmd.HORIZONTE_MAXIMO_DIAS for h in horizontes)
+    ):
+        raise ValueError(
+            f"Parámetro horizontes debe ser una lista de hasta {AnaliticaCmd.LIMITE_HORIZONTES} "
+            f"enteros entre 0 y {AnaliticaCmd.HORIZONTE_MAXIMO_DIAS} separados por comas"
+        )
+    return {"horizontes": horizontes}
+
+
+def create_analitica_routes(analitica_controller: AnaliticaCmd) -> Blueprint:
+    """Crea las rutas de analítica de inventario."""
+
+    analitica_routes = Blueprint("analitica", __name__, url_prefix="/productos/analitica")
+
+    @analitica_routes.route("/inventario", methods=["GET"])
+    @con_parametros(_dimension("categoria"))
+    def resumen_inventario(agrupar_por):
+        """Valor del inventario por categoría (o ?agrupar_por=id_proveedor|ubicacion|ninguno)."""
+        return analitica_controller.resumen_inventario(agrupar_por)
+
+    @analitica_routes.route("/vencimientos", methods=["GET"])
+    @con_parametros(_dimension(), _horizontes)
+    def resumen_vencimientos(agrupar_por, horizontes):
+        """Inventario vencido y por vencer (?horizontes=30,60,90&agrupar_por=categoria)."""
+        return analitica_controller.resumen_vencimientos(horizontes, agrupar_por)
+
+    @analitica_routes.route("/estado", methods=["GET"])
+    def estado():
+        """Estadísticas del snapshot de analítica."""
+        return analitica_controller.estado()
+
+    return analitica_routes
@@ -0,0 +1,24 @@
+from functools import wraps
+
+
+def con_parametros(*parsers):
+    """
+    Decorador de vistas: pasa como argumentos con nombre lo que leen `parsers` de la petición.
+
+    Cada parser devuelve un dict de argumentos o lanza ValueError, que se responde con
+    400 y su mensaje sin ejecutar la vista. Los parsers se aplican en orden.
+    """
+
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            try:
+                for parsear in parsers:
+                    kwargs.update(parsear())
+            except ValueError as e:
+                return {"error": str(e)}, 400
+            return vista(*args, **kwargs)
+
+        return envoltura
+
+    return decorador
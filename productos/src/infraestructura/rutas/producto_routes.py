@@ -1,5 +1,115 @@
 from flask import Blueprint, request
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
 from src.infraestructura.cmd.producto_cmd import ProductoCmd
+from src.infraestructura.rutas.condicional import respuesta_condicional
+from src.infraestructura.rutas.parametros import con_parametros
+
+# Content-Type del cuerpo -> formato de importación
+FORMATOS_POR_CONTENT_TYPE = {"text/csv": "csv", "application/x-ndjson": "ndjson", "application/ndjson": "ndjson"}
+
+
+def _campos():
+    """Campos pedidos con ?fields=... (todos si no se indica)."""
+    return {"campos": ProductoMapper.parsear_campos(request.args.get("fields"))}
+
+
+def _consulta():
+    """Filtros, orden y página del listado; consulta None si no se pidió ninguno."""
+    consulta = ProductoMapper.args_to_consulta(request.args)
+    if consulta is not None and consulta.limite is not None:
+        if not 1 <= consulta.limite <= ProductoCmd.LIMITE_PAGINA_MAXIMO:
+            raise ValueError(f"Parámetro limite debe estar entre 1 y {ProductoCmd.LIMITE_PAGINA_MAXIMO}")
+    return {"consulta": consulta}
+
+
+def _nombre():
+    """Nombre buscado, obligatorio."""
+    nombre = request.args.get("nombre", "")
+    if not nombre:
+        raise ValueError("Parámetro nombre es requerido")
+    return {"nombre": nombre}
+
+
+def _formato_exportacion():
+    """Formato de exportación (ndjson por defecto)."""
+    formato = request.args.get("formato", "ndjson").lower()
+    if formato not in ProductoCmd.FORMATOS_EXPORTACION:
+        raise ValueError("Parámetro formato debe ser ndjson o csv")
+    return {"formato": formato}
+
+
+def _formato_importacion():
+    """Formato de importación: ?formato= o, si no se indica, el Content-Type del cuerpo."""
+    formato = request.args.get("formato", "").lower() or FORMATOS_POR_CONTENT_TYPE.get(request.mimetype)
+    if formato not in ProductoCmd.LECTORES_IMPORTACION:
+        raise ValueError("Indique formato=csv|ndjson o un Content-Type text/csv o application/x-ndjson")
+    return {"formato": formato}
+
+
+def _agrupacion():
+    """Campo de agrupación del resumen (categoria por defecto)."""
+    campo = request.args.get("agrupar", "categoria")
+    if campo not in ProductoCmd.CAMPOS_RESUMEN:
+        raise ValueError(f"Parámetro agrupar debe ser uno de: {', '.join(ProductoCmd.CAMPOS_RESUMEN)}")
+    return {"campo": campo}
+
+
+def _cambios():
+    """Secuencia desde la que se leen los cambios y cuántos como máximo."""
+    try:
+        desde = int(request.args.get("desde", 0))
+        limite = int(request.args.get("limite", ProductoCmd.LIMITE_CAMBIOS_POR_DEFECTO))
+    except ValueError:
+        raise ValueError("Parámetros desde y limite deben ser enteros") from None
+    if desde < 0:
+        raise ValueError("Parámetro desde debe ser mayor o igual a 0")
+    if not 1 <= limite <= ProductoCmd.LIMITE_CAMBIOS_MAXIMO:
+        raise ValueError(f"Parámetro limite debe estar entre 1 y {ProductoCmd.LIMITE_CAMBIOS_MAXIMO}")
+    return {"desde": desde, "limite": limite}
+
+
+def _ids():
+    """IDs del cuerpo {"ids": [...]}."""
+    data = request.get_json(silent=True) or {}
+    producto_ids = data.get("ids") if isinstance(data, dict) else None
+    if not isinstance(producto_ids, list) or not all(isinstance(i, str) and i for i in producto_ids):
+        raise ValueError("Parámetro ids debe ser una lista de IDs")
+    if not 1 <= len(producto_ids) <= ProductoCmd.LIMITE_IDS_POR_LOTE:
+        raise ValueError(f"Parámetro ids debe tener entre 1 y {ProductoCmd.LIMITE_IDS_POR_LOTE} IDs")
+    return {"producto_ids": producto_ids}
+
+
+def _asignacion():
+    """Solicitud de un producto y vigencia mínima, de la consulta."""
+    try:
+        cantidad = int(request.args.get("cantidad", ""))
+        vigencia_minima_dias = int(request.args.get("vigencia_minima_dias", 0))
+    except ValueError:
+        raise ValueError("Parámetros cantidad y vigencia_minima_dias deben ser enteros") from None
+    if vigencia_minima_dias < 0:
+        raise ValueError("Parámetro vigencia_minima_dias debe ser mayor o igual a 0")
+    linea = {"cantidad": cantidad, "nombre": request.args.get("nombre"), "producto_id": request.args.get("producto_id")}
+    return {
+        "solicitud": ProductoMapper.json_to_solicitud_asignacion(linea),
+        "vigencia_minima_dias": vigencia_minima_dias,
+    }
+
+
+def _asignaciones():
+    """Solicitudes de las líneas de un pedido y vigencia mínima, del cuerpo JSON."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise ValueError("El cuerpo debe ser un objeto JSON")
+    lineas = data.get("lineas")
+    if not isinstance(lineas, list) or not 1 <= len(lineas) <= ProductoCmd.LIMITE_LINEAS_ASIGNACION:
+        raise ValueError(f"Parámetro lineas debe tener entre 1 y {ProductoCmd.LIMITE_LINEAS_ASIGNACION} líneas")
+    vigencia_minima_dias = data.get("vigencia_minima_dias", 0)
+    if isinstance(vigencia_minima_dias, bool) or not isinstance(vigencia_minima_dias, int) or vigencia_minima_dias < 0:
+        raise ValueError("Parámetro vigencia_minima_dias debe ser un entero mayor o igual a 0")
+    return {
+        "solicitudes": [ProductoMapper.json_to_solicitud_asignacion(linea) for linea in lineas],
+        "vigencia_minima_dias": vigencia_minima_dias,
+    }
 
 
 def create_producto_routes(producto_controller: ProductoCmd) -> Blueprint:
@@ -7,28 +117,91 @@ def create_producto_routes(producto_controller: ProductoCmd) -> Blueprint:
 
     producto_routes = Blueprint("productos", __name__, url_prefix="/productos")
 
+    # Listados que responden 304 mientras el catálogo no cambie (no se aplica a las
+    # rutas servidas desde la cache LRU, que puede quedar atrasada respecto del contador)
+    condicional = respuesta_condicional("productos", producto_controller.version_catalogo)
+    # El listado también se negocia en MessagePack: cada formato tiene su ETag
+    condicional_listado = respuesta_condicional(
+        "productos", producto_controller.version_catalogo, ProductoCmd.MIMETYPES_LISTADO
+    )
+
     @producto_routes.route("", methods=["GET"])
-    def obtener_todos_los_productos():
-        """Obtiene todos los productos."""
-        return producto_controller.obtener_todos_los_productos()
+    @condicional_listado
+    @con_parametros(_campos, _consulta)
+    def obtener_todos_los_productos(campos, consulta):
+        """
+        Obtiene todos los productos (?fields=id,nombre limita las columnas leídas y devueltas).
+
+        Filtros combinables: categoria, id_proveedor, ubicacion, nombre, valor_min, valor_max,
+        con_stock, vence_desde y vence_antes; orden=-valor_unitario,nombre; limite y desplazamiento.
+        Con Accept: application/x-msgpack la respuesta va en MessagePack (llamadas internas).
+        """
+        mimetype = request.accept_mimetypes.best_match(ProductoCmd.MIMETYPES_LISTADO, default="application/json")
+        if consulta is None:
+            return producto_controller.obtener_todos_los_productos(campos, mimetype=mimetype)
+
+        return producto_controller.obtener_todos_los_productos(campos, consulta, mimetype=mimetype)
+
+    @producto_routes.route("/export", methods=["GET"])
+    @condicional
+    @con_parametros(_formato_exportacion, _campos)
+    def exportar_productos(formato, campos):
+        """Exporta el catálogo completo en streaming (formato=ndjson|csv)."""
+        return producto_controller.exportar_productos(formato, campos)
+
+    @producto_routes.route("/cambios", methods=["GET"])
+    @con_parametros(_cambios)
+    def obtener_cambios(desde, limite):
+        """Obtiene los cambios del catálogo posteriores a una secuencia (sincronización incremental)."""
+        return producto_controller.obtener_cambios(desde, limite)
+
+    @producto_routes.route("/resumen", methods=["GET"])
+    @con_parametros(_agrupacion)
+    def resumir_productos(campo):
+        """Cuenta productos y unidades agrupados (agrupar=categoria|id_proveedor|ubicacion)."""
+        return producto_controller.resumir_productos(campo)
+
+    @producto_routes.route("/importar", methods=["POST"])
+    @con_parametros(_formato_importacion)
+    def importar_productos(formato):
+        """Importa productos en bloque desde el cuerpo de la petición (CSV o NDJSON)."""
+        return producto_controller.importar_productos(request.stream, formato)
+
+    @producto_routes.route("/lote-ids", methods=["POST"])
+    @con_parametros(_ids)
+    def obtener_productos_por_ids(producto_ids):
+        """Obtiene varios productos por ID en una sola petición ({"ids": [...]})."""
+        return producto_controller.obtener_productos_por_ids(producto_ids)
+
+    @producto_routes.route("/asignacion", methods=["GET"])
+    @con_parametros(_asignacion)
+    def planificar_asignacion(solicitud, vigencia_minima_dias):
+        """Plan FEFO de un producto (nombre o producto_id, cantidad, vigencia_minima_dias opcional)."""
+        return producto_controller.planificar_asignacion(solicitud, vigencia_minima_dias)
+
+    @producto_routes.route("/asignaciones", methods=["POST"])
+    @con_parametros(_asignaciones)
+    def planificar_asignaciones(solicitudes, vigencia_minima_dias):
+        """Plan FEFO de un pedido completo ({"lineas": [{"nombre" | "producto_id", "cantidad"}]})."""
+        return producto_controller.planificar_asignaciones(solicitudes, vigencia_minima_dias)
 
     @producto_routes.route("/<string:producto_id>", methods=["GET"])
-    def obtener_producto_por_id(producto_id: str):
+    @con_parametros(_campos)
+    def obtener_producto_por_id(producto_id: str, campos):
         """Obtiene un producto por su ID."""
-        return producto_controller.obtener_producto_por_id(producto_id)
+        return producto_controller.obtener_producto_por_id(producto_id, campos)
 
     @producto_routes.route("/categoria/<string:categoria>", methods=["GET"])
-    def obtener_productos_por_categoria(categoria: str):
+    @con_parametros(_campos)
+    def obtener_productos_por_categoria(categoria: str, campos):
         """Obtiene productos por categoría."""
-        return producto_controller.obtener_productos_por_categoria(categoria)
+        return producto_controller.obtener_productos_por_categoria(categoria, campos)
 
     @producto_routes.route("/buscar", methods=["GET"])
-    def buscar_productos_por_nombre():
+    @condicional
+    @con_parametros(_nombre, _campos)
+    def buscar_productos_por_nombre(nombre, campos):
         """Busca productos por nombre."""
-        nombre = request.args.get("nombre", "")
-        if not nombre:
-            return {"error": "Parámetro nombre es requerido"}, 400
-
-        return producto_controller.buscar_productos_por_nombre(nombre)
+        return producto_controller.buscar_productos_por_nombre(nombre, campos)
 
     return producto_routes
@@ -0,0 +1,49 @@
+from flask import Blueprint, request
+from src.aplicacion.mappers.reserva_mapper import ReservaMapper
+from src.infraestructura.cmd.reserva_cmd import ReservaCmd
+
+
+def create_reserva_routes(reserva_controller: ReservaCmd) -> Blueprint:
+    """Crea las rutas para reservas de stock."""
+
+    reserva_routes = Blueprint("reservas", __name__, url_prefix="/productos/reservas")
+
+    @reserva_routes.route("", methods=["POST"])
+    def reservar():
+        """Reserva stock ({"lineas": [{"producto_id", "cantidad"}], "ttl_segundos": opcional})."""
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return {"error": "El cuerpo debe ser un objeto JSON"}, 400
+        try:
+            lineas = ReservaMapper.json_to_lineas(data.get("lineas"))
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if len(lineas) > ReservaCmd.LIMITE_LINEAS_POR_RESERVA:
+            return {"error": f"Una reserva admite como máximo {ReservaCmd.LIMITE_LINEAS_POR_RESERVA} líneas"}, 400
+
+        ttl_segundos = data.get("ttl_segundos")
+        if ttl_segundos is not None and (
+            isinstance(ttl_segundos, bool)
+            or not isinstance(ttl_segundos, int)
+            or not 1 <= ttl_segundos <= ReservaCmd.TTL_MAXIMO_SEGUNDOS
+        ):
+            return {"error": f"Parámetro ttl_segundos debe ser un entero entre 1 y {ReservaCmd.TTL_MAXIMO_SEGUNDOS}"}, 400
+
+        return reserva_controller.reservar(lineas, ttl_segundos)
+
+    @reserva_routes.route("/<string:reserva_id>", methods=["GET"])
+    def obtener_reserva(reserva_id: str):
+        """Obtiene una reserva por su ID."""
+        return reserva_controller.obtener_reserva(reserva_id)
+
+    @reserva_routes.route("/<string:reserva_id>/confirmar", methods=["POST"])
+    def confirmar_reserva(reserva_id: str):
+        """Confirma una reserva pendiente."""
+        return reserva_controller.confirmar_reserva(reserva_id)
+
+    @reserva_routes.route("/<string:reserva_id>/liberar", methods=["POST"])
+    def liberar_reserva(reserva_id: str):
+        """Libera una reserva pendiente y devuelve su stock."""
+        return reserva_controller.liberar_reserva(reserva_id)
+
+    return reserva_routes
@@ -0,0 +1,3 @@
+from .expirador_reservas import ExpiradorReservas
+
+__all__ = ["ExpiradorReservas"]
@@ -0,0 +1,66 @@
+import logging
+import threading
+from typing import Optional
+
+from flask import Flask
+from src.aplicacion.use_cases.reserva_use_case import ReservaUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiradorReservas:
+    """
+    Hilo en segundo plano que expira periódicamente las reservas pendientes vencidas y
+    publica en la secuencia de cambios del catálogo el stock que cambió por reservas.
+
+    Varias instancias (p. ej. varios workers) pueden correr a la vez: cada reserva se
+    expira con un UPDATE condicional, así que su stock se devuelve una sola vez, y un
+    producto publicado dos veces solo recibe una secuencia más.
+    """
+
+    def __init__(self, app: Flask, reserva_use_case: ReservaUseCase, intervalo_segundos: float, limite_por_ciclo: int = 100):
+        self.app = app
+        self.reserva_use_case = reserva_use_case
+        self.intervalo_segundos = intervalo_segundos
+        self.limite_por_ciclo = limite_por_ciclo
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def ejecutar_ciclo(self) -> int:
+        """Expira reservas vencidas hasta agotarlas y publica el stock pendiente; devuelve cuántas expiró."""
+        total = 0
+        with self.app.app_context():
+            while not self._detener.is_set():
+                expiradas = self.reserva_use_case.expirar_reservas(self.limite_por_ciclo)
+                total += len(expiradas)
+                if len(expiradas) < self.limite_por_ciclo:
+                    break
+            # Después de expirar, para que el stock devuelto también se publique en este ciclo
+            while not self._detener.is_set():
+                if self.reserva_use_case.publicar_stock(self.limite_por_ciclo) < self.limite_por_ciclo:
+                    break
+        if total:
+            logger.info(f"Reservas expiradas: {total}")
+        return total
+
+    def _bucle(self):
+        while not self._detener.wait(self.intervalo_segundos):
+            try:
+                self.ejecutar_ciclo()
+            except Exception as e:
+                logger.error(f"Error expirando reservas: {str(e)}")
+
+    def iniciar(self) -> None:
+        """Inicia el hilo (daemon) si no está corriendo."""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._bucle, name="expirador-reservas", daemon=True)
+        self._hilo.start()
+
+    def detener(self, timeout: Optional[float] = None) -> None:
+        """Detiene el hilo y espera a que termine el ciclo en curso."""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+            self._hilo = None
@@ -1,6 +1,8 @@
 import logging
+import os
 
 from src.infraestructura.config import Config
+from src.infraestructura.config.registro import configurar_registro_asincrono
 
 
 def setup_logging(app):
@@ -13,17 +15,13 @@ def setup_logging(app):
         format="%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
     )
 
-    # Configurar el logger específico para requests
-    request_logger = logging.getLogger("request_logger")
-    request_logger.setLevel(getattr(logging, log_level))
+    # Registro de accesos en JSON, escrito por un hilo aparte
+    configurar_registro_asincrono(logging.getLogger("request_logger"), getattr(logging, log_level))
 
-    # Evitar que se dupliquen los logs
-    if not request_logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        request_logger.addHandler(handler)
-        request_logger.propagate = False
+
+def _bajo_gunicorn() -> bool:
+    """gunicorn define SERVER_SOFTWARE antes de cargar la aplicación."""
+    return os.environ.get("SERVER_SOFTWARE", "").startswith("gunicorn/")
 
 
 def create_application():
@@ -42,6 +40,10 @@ def create_application():
         # Crear aplicación
         app = flask_config.create_app()
         setup_logging(app)
+        app.extensions["tareas_en_segundo_plano"] = flask_config
+        # Bajo gunicorn las tareas las inicia cada worker después del fork (ver config/servidor.py)
+        if not _bajo_gunicorn():
+            flask_config.start_background_tasks()
 
         # Inicializar la aplicación
         logger.info("Microservicio de Productos initialized successfully")
@@ -12,6 +12,10 @@ from ...dominio.exceptions import InsufficientPermissionsError
 class AccessValidator:
     """
     Caso de uso para validar acceso basado en roles del token.
+
+    /health y /metrics son públicas porque el servicio solo es accesible dentro de la red
+    interna; desde internet se entra por el gateway, que protege su propio /metrics con
+    METRICAS_TOKEN. Si el servicio se expusiera, /metrics tendría que dejar de ser pública.
     """
 
     def __init__(self):
@@ -22,11 +26,14 @@ class AccessValidator:
                 "POST": (ResourceType.PRODUCTS, ActionType.CREATE),
                 "PUT": (ResourceType.PRODUCTS, ActionType.UPDATE),
                 "DELETE": (ResourceType.PRODUCTS, ActionType.DELETE),
-            }
+            },
+            # Consultas de solo lectura que usan POST para enviar la lista de IDs o líneas en el cuerpo
+            "/productos/lote-ids": {"POST": (ResourceType.PRODUCTS, ActionType.READ)},
+            "/productos/asignaciones": {"POST": (ResourceType.PRODUCTS, ActionType.READ)},
         }
 
         # Rutas que no requieren autorización (específicas para productos)
-        self.public_routes = {"/", "/health", "/auth/resources"}  # Para que el Gateway pueda consultar recursos
+        self.public_routes = {"/", "/health", "/metrics", "/auth/resources"}  # Para que el Gateway pueda consultar recursos
 
     def validate_access(self, token_payload: TokenPayload, route: str, method: str) -> bool:
         """
@@ -2,8 +2,9 @@
 Use case para validar tokens JWT.
 """
 
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 import jwt
 
@@ -15,11 +16,22 @@ class TokenValidator:
     """
     Caso de uso para validar tokens JWT.
     No genera tokens, solo los valida.
+
+    Guarda los payloads de hasta `cache_max_entradas` tokens ya validados para no verificar
+    la firma en cada petición con el mismo token (0 desactiva la cache). Un token en cache
+    deja de aceptarse al expirar.
     """
 
-    def __init__(self, secret_key: str, algorithm: str = "HS256"):
+    def __init__(self, secret_key: str, algorithm: str = "HS256", cache_max_entradas: int = 10000):
         self.secret_key = secret_key
         self.algorithm = algorithm
+        self.cache_max_entradas = cache_max_entradas
+        self._cache: Dict[str, TokenPayload] = {}
+        # Solo las escrituras toman el lock; las lecturas de un dict son atómicas con el GIL
+        self._lock_cache = threading.Lock()
+        # Contadores sin lock: bajo concurrencia pueden perder algún incremento, suficiente para la tasa de aciertos
+        self.cache_aciertos = 0
+        self.cache_fallos = 0
 
     def validate_token(self, token: str) -> TokenPayload:
         """
@@ -39,6 +51,10 @@ class TokenValidator:
         if not token or not isinstance(token, str):
             raise InvalidTokenError("Token debe ser una cadena no vacía")
 
+        en_cache = self._desde_cache(token)
+        if en_cache is not None:
+            return en_cache
+
         try:
             # Decodificar y verificar token
             # jwt.decode automáticamente verifica la firma usando la secret_key
@@ -64,6 +80,7 @@ class TokenValidator:
             if token_payload.is_expired():
                 raise ExpiredTokenError("El token ha expirado")
 
+            self._guardar_en_cache(token, token_payload)
             return token_payload
 
         except jwt.ExpiredSignatureError:
@@ -77,6 +94,31 @@ class TokenValidator:
         except Exception as e:
             raise InvalidTokenError(f"Error al validar token: {str(e)}")
 
+    def estadisticas_cache(self) -> Dict[str, int]:
+        """Devuelve las entradas, aciertos y fallos de la cache de tokens validados."""
+        return {"entradas": len(self._cache), "aciertos": self.cache_aciertos, "fallos": self.cache_fallos}
+
+    def _desde_cache(self, token: str) -> Optional[TokenPayload]:
+        if self.cache_max_entradas <= 0:
+            return None
+        en_cache = self._cache.get(token)
+        if en_cache is not None and not en_cache.is_expired():
+            self.cache_aciertos += 1
+            return en_cache
+        self.cache_fallos += 1
+        return None
+
+    def _guardar_en_cache(self, token: str, token_payload: TokenPayload) -> None:
+        if self.cache_max_entradas <= 0:
+            return
+        with self._lock_cache:
+            # Al llenarse se descartan los tokens expirados y, si aun así no hay espacio, todos; el dict
+            # se reemplaza en lugar de modificarse para no interferir con las lecturas sin lock
+            if len(self._cache) >= self.cache_max_entradas:
+                vigentes = {clave: payload for clave, payload in self._cache.items() if not payload.is_expired()}
+                self._cache = vigentes if len(vigentes) < self.cache_max_entradas else {}
+            self._cache[token] = token_payload
+
     def extract_token_from_header(self, authorization_header: Optional[str]) -> Optional[str]:
         """
         Extrae el token del header Authorization.
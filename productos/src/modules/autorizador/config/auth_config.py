@@ -31,6 +31,9 @@ class AuthConfig:
             "PUT": (ResourceType.PRODUCTS, ActionType.UPDATE),
             "DELETE": (ResourceType.PRODUCTS, ActionType.DELETE),
         },
+        # Consultas de solo lectura que usan POST para enviar la lista de IDs o líneas en el cuerpo
+        "/productos/lote-ids": {"POST": (ResourceType.PRODUCTS, ActionType.READ)},
+        "/productos/asignaciones": {"POST": (ResourceType.PRODUCTS, ActionType.READ)},
         # Proveedores
         "/provedores": {
             "GET": (ResourceType.PROVIDERS, ActionType.READ),
@@ -0,0 +1,44 @@
+"""
+Tests unitarios para AnaliticaMapper
+"""
+
+from datetime import date
+
+from src.aplicacion.mappers.analitica_mapper import AnaliticaMapper
+from src.dominio.entities.analitica import GrupoInventario, ResumenInventario, ResumenVencimientos
+
+
+class TestAnaliticaMapper:
+    """Tests para AnaliticaMapper"""
+
+    def test_resumen_inventario_sin_grupos(self):
+        """Test de un resumen sin agrupar: no incluye grupos y redondea el valor"""
+        json_data = AnaliticaMapper.resumen_inventario_to_json(ResumenInventario(2, 3, 10.005001))
+
+        assert json_data == {"productos": 2, "unidades": 3, "valor": 10.01}
+
+    def test_resumen_vencimientos(self):
+        """Test de conversión de vencimientos con grupos"""
+        grupo = GrupoInventario("insumos", 1, 4, 8.0)
+        resumen = ResumenVencimientos(
+            fecha_referencia=date(2025, 1, 1),
+            vencido=ResumenInventario(0, 0, 0.0, "categoria"),
+            horizontes={30: ResumenInventario(1, 4, 8.0, "categoria", (grupo,))},
+        )
+
+        json_data = AnaliticaMapper.resumen_vencimientos_to_json(resumen)
+
+        assert json_data == {
+            "fecha_referencia": "2025-01-01",
+            "vencido": {"productos": 0, "unidades": 0, "valor": 0.0, "agrupar_por": "categoria", "grupos": []},
+            "horizontes": [
+                {
+                    "dias": 30,
+                    "productos": 1,
+                    "unidades": 4,
+                    "valor": 8.0,
+                    "agrupar_por": "categoria",
+                    "grupos": [{"clave": "insumos", "productos": 1, "unidades": 4, "valor": 8.0}],
+                }
+            ],
+        }
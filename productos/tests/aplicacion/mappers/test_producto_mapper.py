@@ -2,12 +2,20 @@
 Tests unitarios para ProductoMapper
 """
 
+import json
 from datetime import datetime
 
+import msgpack
 import pytest
+from flask import Flask, jsonify
 from src.aplicacion.dtos.producto_dto import ProductoDto
 from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.dominio.entities.asignacion import AsignacionLote, PlanAsignacion, SolicitudAsignacion
+from src.dominio.entities.cambios import CambioProducto, CambiosProductos, ProductoEliminado
+from src.dominio.entities.consulta import ConsultaProductos
+from src.dominio.entities.importacion import ResultadoImportacion
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class TestProductoMapper:
@@ -122,3 +130,307 @@ class TestProductoMapper:
         json_data = ProductoMapper.dto_to_json(dto)
         assert json_data["id"] == "prod-999"
         assert json_data["categoria"] == "deportes"
+
+    def test_filas_to_json_equivale_a_jsonify(self, sample_producto_dto):
+        """Test de que el camino rápido produce el mismo JSON que jsonify"""
+        json_data = ProductoMapper.dto_to_json(sample_producto_dto)
+        fila = tuple(json_data[campo] for campo in ProductoMapper.CAMPOS)
+
+        cuerpo = ProductoMapper.filas_to_json(ProductoMapper.CAMPOS, [fila])
+
+        with Flask(__name__).app_context():
+            esperado = jsonify([json_data]).get_json()
+        assert json.loads(cuerpo) == esperado
+
+    def test_filas_to_json_lista_vacia(self):
+        """Test del camino rápido sin filas"""
+        assert ProductoMapper.filas_to_json(ProductoMapper.CAMPOS, []) == b"[]"
+
+    def test_filas_to_json_tipo_no_serializable(self):
+        """Test del camino rápido con un tipo no serializable"""
+        with pytest.raises(TypeError):
+            ProductoMapper.filas_to_json(("id",), [(object(),)])
+
+    def test_filas_to_msgpack_equivale_a_filas_to_json(self, sample_producto_dto):
+        """Test de que MessagePack decodifica a los mismos valores que el JSON del camino rápido"""
+        json_data = ProductoMapper.dto_to_json(sample_producto_dto)
+        fila = tuple(json_data[campo] for campo in ProductoMapper.CAMPOS)
+
+        cuerpo = ProductoMapper.filas_to_msgpack(ProductoMapper.CAMPOS, [fila])
+
+        assert msgpack.unpackb(cuerpo) == json.loads(ProductoMapper.filas_to_json(ProductoMapper.CAMPOS, [fila]))
+        assert len(cuerpo) < len(ProductoMapper.filas_to_json(ProductoMapper.CAMPOS, [fila]))
+
+    def test_filas_to_ndjson(self):
+        """Test de codificación NDJSON en bloques"""
+        filas = [("prod-001", datetime(2025, 12, 31)), ("prod-002", datetime(2026, 1, 1)), ("prod-003", datetime(2026, 1, 2))]
+
+        bloques = list(ProductoMapper.filas_to_ndjson(("id", "fecha_vencimiento"), filas, tamano_bloque=2))
+
+        assert len(bloques) == 2
+        lineas = b"".join(bloques).decode("utf-8").splitlines()
+        assert len(lineas) == 3
+        assert json.loads(lineas[0]) == {"id": "prod-001", "fecha_vencimiento": "Wed, 31 Dec 2025 00:00:00 GMT"}
+
+    def test_filas_to_csv(self):
+        """Test de codificación CSV con cabecera y fechas ISO"""
+        filas = [("prod-001", "Gasa, estéril", datetime(2025, 12, 31))]
+
+        bloques = list(ProductoMapper.filas_to_csv(("id", "nombre", "fecha_vencimiento"), filas, tamano_bloque=100))
+
+        assert len(bloques) == 1
+        texto = bloques[0].decode("utf-8")
+        assert texto == 'id,nombre,fecha_vencimiento\r\nprod-001,"Gasa, estéril",2025-12-31T00:00:00\r\n'
+
+    def test_filas_to_csv_sin_filas(self):
+        """Test de CSV sin filas: solo la cabecera"""
+        bloques = list(ProductoMapper.filas_to_csv(("id",), [], tamano_bloque=100))
+
+        assert bloques == [b"id\r\n"]
+
+    def test_parsear_campos(self):
+        """Test de que fields se normaliza al orden de CAMPOS y sin repetidos"""
+        assert ProductoMapper.parsear_campos(" valor_unitario,id ,id") == ("id", "valor_unitario")
+
+    @pytest.mark.parametrize("fields", [None, "", " , "])
+    def test_parsear_campos_sin_fields(self, fields):
+        """Test de que sin fields se devuelven todos los campos"""
+        assert ProductoMapper.parsear_campos(fields) == ProductoMapper.CAMPOS
+
+    def test_parsear_campos_desconocido(self):
+        """Test de fields con un campo que la API no expone"""
+        with pytest.raises(ValueError, match="Campos desconocidos en fields: version"):
+            ProductoMapper.parsear_campos("id,version")
+
+    def test_args_to_consulta_sin_parametros(self):
+        """Test de que sin filtros, orden ni página no hay consulta"""
+        assert ProductoMapper.args_to_consulta({"fields": "id", "categoria": ""}) is None
+
+    def test_args_to_consulta(self):
+        """Test de conversión de los parámetros de GET /productos"""
+        consulta = ProductoMapper.args_to_consulta(
+            {
+                "id_proveedor": "prov-001",
+                "valor_min": "10",
+                "valor_max": "99.5",
+                "con_stock": "true",
+                "vence_antes": "2026-03-01",
+                "orden": "-valor_unitario, nombre",
+                "limite": "50",
+                "desplazamiento": "100",
+            }
+        )
+
+        assert consulta == ConsultaProductos(
+            id_proveedor="prov-001",
+            valor_min=10.0,
+            valor_max=99.5,
+            con_stock=True,
+            vence_antes=datetime(2026, 3, 1),
+            orden=(("valor_unitario", True), ("nombre", False)),
+            limite=50,
+            desplazamiento=100,
+        )
+
+    @pytest.mark.parametrize(
+        "args, mensaje",
+        [
+            ({"valor_min": "barato"}, "valor_min"),
+            ({"con_stock": "quizas"}, "con_stock"),
+            ({"vence_antes": "mañana"}, "vence_antes"),
+            ({"limite": "-1"}, "limite"),
+            ({"orden": "-descripcion"}, "orden"),
+        ],
+    )
+    def test_args_to_consulta_invalida(self, args, mensaje):
+        """Test de parámetros de consulta inválidos"""
+        with pytest.raises(ValueError, match=mensaje):
+            ProductoMapper.args_to_consulta(args)
+
+    def test_proyectar(self, sample_producto_dto):
+        """Test de proyección del JSON de un producto"""
+        json_data = ProductoMapper.dto_to_json(sample_producto_dto)
+
+        assert ProductoMapper.proyectar(json_data, ("id", "lote")) == {"id": json_data["id"], "lote": json_data["lote"]}
+        assert ProductoMapper.proyectar(json_data, ProductoMapper.CAMPOS) is json_data
+
+    def test_conteos_to_json(self):
+        """Test de conversión de conteos agrupados a JSON"""
+        json_data = ProductoMapper.conteos_to_json(
+            "ubicacion", [ConteoGrupo("Bodega 1", 3, 10), ConteoGrupo("Bodega 2", 1, 0)]
+        )
+
+        assert json_data == {
+            "agrupar": "ubicacion",
+            "total": 4,
+            "grupos": [
+                {"clave": "Bodega 1", "total": 3, "unidades": 10},
+                {"clave": "Bodega 2", "total": 1, "unidades": 0},
+            ],
+        }
+
+    def test_cambios_to_json(self, sample_producto):
+        """Test de conversión de una página de cambios a JSON"""
+        cambios = CambiosProductos(
+            cambios=[CambioProducto(producto=sample_producto, secuencia=7, updated_at=datetime(2025, 6, 1))],
+            eliminados=[ProductoEliminado(id="prod-002", secuencia=8, eliminado_en=datetime(2025, 6, 2))],
+            hasta=8,
+            hay_mas=False,
+        )
+
+        json_data = ProductoMapper.cambios_to_json(cambios, desde=5)
+
+        assert json_data["desde"] == 5
+        assert json_data["hasta"] == 8
+        assert json_data["hay_mas"] is False
+        assert json_data["cambios"][0]["id"] == sample_producto.id
+        assert json_data["cambios"][0]["secuencia"] == 7
+        assert json_data["cambios"][0]["updated_at"] == datetime(2025, 6, 1)
+        assert json_data["eliminados"] == [{"id": "prod-002", "secuencia": 8, "eliminado_en": datetime(2025, 6, 2)}]
+
+    @staticmethod
+    def _registro(**cambios):
+        registro = {
+            "id": "prod-001",
+            "nombre": "Gasa",
+            "descripcion": "Gasa estéril",
+            "categoria": "insumos",
+            "condiciones_almacenamiento": "Temperatura ambiente",
+            "valor_unitario": "2.50",
+            "cantidad_disponible": "10",
+            "fecha_vencimiento": "2026-01-01T00:00:00",
+            "lote": "LOT-001",
+            "tiempo_estimado_entrega": "1 día",
+            "id_proveedor": "prov-001",
+            "ubicacion": "Bodega 1",
+        }
+        registro.update(cambios)
+        return registro
+
+    def test_registro_to_entity_desde_csv(self):
+        """Test de conversión de una fila CSV (todos los valores como texto)"""
+        producto = ProductoMapper.registro_to_entity(self._registro())
+
+        assert producto.id == "prod-001"
+        assert producto.valor_unitario == 2.5
+        assert producto.cantidad_disponible == 10
+        assert producto.fecha_vencimiento == datetime(2026, 1, 1)
+
+    def test_registro_to_entity_desde_json(self):
+        """Test de conversión de un objeto JSON exportado por la API (fecha HTTP, campos extra)"""
+        registro = self._registro(
+            valor_unitario=3,
+            cantidad_disponible=4.0,
+            fecha_vencimiento="Wed, 31 Dec 2025 00:00:00 GMT",
+            secuencia=12,
+        )
+
+        producto = ProductoMapper.registro_to_entity(registro)
+
+        assert producto.valor_unitario == 3.0
+        assert producto.cantidad_disponible == 4
+        assert producto.fecha_vencimiento == datetime(2025, 12, 31)
+
+    def test_registro_to_entity_fecha_con_zona(self):
+        """Test de que las fechas con zona horaria se normalizan a UTC"""
+        producto = ProductoMapper.registro_to_entity(self._registro(fecha_vencimiento="2026-01-01T05:00:00+05:00"))
+
+        assert producto.fecha_vencimiento == datetime(2026, 1, 1)
+
+    @pytest.mark.parametrize(
+        "cambios, mensaje",
+        [
+            ({"nombre": ""}, "nombre"),
+            ({"lote": None}, "lote"),
+            ({"nombre": 5}, "texto"),
+            ({"valor_unitario": "abc"}, "valor_unitario"),
+            ({"valor_unitario": "-1"}, "valor_unitario"),
+            ({"valor_unitario": "nan"}, "valor_unitario"),
+            ({"valor_unitario": True}, "valor_unitario"),
+            ({"cantidad_disponible": "1.5"}, "cantidad_disponible"),
+            ({"cantidad_disponible": 1.5}, "cantidad_disponible"),
+            ({"cantidad_disponible": -3}, "cantidad_disponible"),
+            ({"fecha_vencimiento": "mañana"}, "fecha_vencimiento"),
+        ],
+    )
+    def test_registro_to_entity_invalido(self, cambios, mensaje):
+        """Test de validación de registros inválidos"""
+        with pytest.raises(ValueError, match=mensaje):
+            ProductoMapper.registro_to_entity(self._registro(**cambios))
+
+    def test_registro_to_entity_no_objeto(self):
+        """Test de registros que no son objetos"""
+        with pytest.raises(ValueError):
+            ProductoMapper.registro_to_entity(["prod-001"])
+        with pytest.raises(ValueError, match="JSON inválido"):
+            ProductoMapper.registro_to_entity(ValueError("JSON inválido"))
+
+    def test_resultado_importacion_to_json(self):
+        """Test de conversión del resultado de importación a JSON"""
+        resultado = ResultadoImportacion(procesadas=3, guardadas=2)
+        resultado.registrar_error(2, "Campo faltante")
+
+        json_data = ProductoMapper.resultado_importacion_to_json(resultado)
+
+        assert json_data == {
+            "procesadas": 3,
+            "guardadas": 2,
+            "con_error": 1,
+            "errores": [{"fila": 2, "error": "Campo faltante"}],
+        }
+
+    def test_productos_por_ids_to_json(self, sample_producto):
+        """Test de resultados por IDs en orden de petición, con no encontrados y duplicados"""
+        json_data = ProductoMapper.productos_por_ids_to_json(
+            ["prod-999", "prod-001", "prod-001"], {"prod-001": sample_producto}
+        )
+
+        resultados = json_data["resultados"]
+        assert [r["id"] for r in resultados] == ["prod-999", "prod-001", "prod-001"]
+        assert resultados[0] == {"id": "prod-999", "encontrado": False, "producto": None}
+        assert resultados[1]["encontrado"] is True
+        assert resultados[1]["producto"]["nombre"] == sample_producto.nombre
+
+    def test_json_to_solicitud_asignacion(self):
+        """Test de conversión de líneas de asignación válidas"""
+        assert ProductoMapper.json_to_solicitud_asignacion({"nombre": "Gasa", "cantidad": 2}) == SolicitudAsignacion(
+            cantidad=2, nombre="Gasa"
+        )
+        assert ProductoMapper.json_to_solicitud_asignacion({"producto_id": "p1", "cantidad": 1}).producto_id == "p1"
+
+    @pytest.mark.parametrize(
+        "linea",
+        [
+            "Gasa",
+            {"cantidad": 1},
+            {"nombre": "Gasa", "producto_id": "p1", "cantidad": 1},
+            {"nombre": "", "cantidad": 1},
+            {"producto_id": 5, "cantidad": 1},
+            {"nombre": "Gasa", "cantidad": 0},
+            {"nombre": "Gasa", "cantidad": "2"},
+            {"nombre": "Gasa", "cantidad": True},
+        ],
+    )
+    def test_json_to_solicitud_asignacion_invalida(self, linea):
+        """Test de validación de líneas de asignación inválidas"""
+        with pytest.raises(ValueError):
+            ProductoMapper.json_to_solicitud_asignacion(linea)
+
+    def test_plan_asignacion_to_json(self):
+        """Test de conversión de un plan FEFO parcial a JSON"""
+        plan = PlanAsignacion(
+            solicitud=SolicitudAsignacion(cantidad=5, producto_id="p1"),
+            nombre="Gasa",
+            asignaciones=(AsignacionLote("p1", "LOT-A", datetime(2026, 1, 1), 3),),
+        )
+
+        assert ProductoMapper.plan_asignacion_to_json(plan) == {
+            "nombre": "Gasa",
+            "producto_id": "p1",
+            "encontrado": True,
+            "cantidad_solicitada": 5,
+            "cantidad_asignada": 3,
+            "faltante": 2,
+            "completo": False,
+            "asignaciones": [{"producto_id": "p1", "lote": "LOT-A", "fecha_vencimiento": datetime(2026, 1, 1), "cantidad": 3}],
+        }
@@ -0,0 +1,57 @@
+"""
+Tests unitarios para ReservaMapper
+"""
+
+from datetime import datetime
+
+import pytest
+from src.aplicacion.mappers.reserva_mapper import ReservaMapper
+from src.dominio.entities.reserva import EstadoReserva, LineaReserva, Reserva
+
+
+class TestReservaMapper:
+    """Tests para ReservaMapper"""
+
+    def test_json_to_lineas(self):
+        """Test de conversión de líneas válidas"""
+        lineas = ReservaMapper.json_to_lineas([{"producto_id": "prod-001", "cantidad": 2}])
+
+        assert lineas == [LineaReserva("prod-001", 2)]
+
+    @pytest.mark.parametrize(
+        "lineas",
+        [
+            None,
+            [],
+            "prod-001",
+            ["prod-001"],
+            [{"cantidad": 1}],
+            [{"producto_id": "", "cantidad": 1}],
+            [{"producto_id": "prod-001"}],
+            [{"producto_id": "prod-001", "cantidad": 0}],
+            [{"producto_id": "prod-001", "cantidad": 1.5}],
+            [{"producto_id": "prod-001", "cantidad": True}],
+        ],
+    )
+    def test_json_to_lineas_invalidas(self, lineas):
+        """Test de validación de líneas inválidas"""
+        with pytest.raises(ValueError):
+            ReservaMapper.json_to_lineas(lineas)
+
+    def test_reserva_to_json(self):
+        """Test de conversión de una reserva a JSON"""
+        reserva = Reserva(
+            id="res-001",
+            estado=EstadoReserva.PENDIENTE,
+            lineas=(LineaReserva("prod-001", 2),),
+            creada_en=datetime(2025, 1, 1),
+            expira_en=datetime(2025, 1, 1, 0, 15),
+        )
+
+        assert ReservaMapper.reserva_to_json(reserva) == {
+            "id": "res-001",
+            "estado": "PENDIENTE",
+            "lineas": [{"producto_id": "prod-001", "cantidad": 2}],
+            "creada_en": datetime(2025, 1, 1),
+            "expira_en": datetime(2025, 1, 1, 0, 15),
+        }
@@ -0,0 +1,87 @@
+"""
+Tests unitarios para AnaliticaService
+"""
+
+from datetime import date, datetime
+
+from src.aplicacion.servicios.analitica_service import AnaliticaService
+from src.dominio.entities.cambios import CambioProducto, CambiosProductos, ProductoEliminado
+from src.infraestructura.analitica.snapshot_columnar import SnapshotColumnar
+
+
+def _pagina(productos=(), eliminados=(), hasta=0, hay_mas=False):
+    return CambiosProductos(
+        cambios=[CambioProducto(p, hasta, datetime(2025, 1, 1)) for p in productos],
+        eliminados=[ProductoEliminado(i, hasta, datetime(2025, 1, 1)) for i in eliminados],
+        hasta=hasta,
+        hay_mas=hay_mas,
+    )
+
+
+class TestAnaliticaService:
+    """Tests para AnaliticaService"""
+
+    def _servicio(self, repositorio, reloj):
+        return AnaliticaService(repositorio, SnapshotColumnar, intervalo_refresco=5.0, tamano_pagina=2, reloj=reloj)
+
+    def test_refrescar_recorre_todas_las_paginas(self, mock_producto_repository, sample_producto):
+        """Test de la carga inicial paginada desde la secuencia 0"""
+        mock_producto_repository.obtener_cambios.side_effect = [
+            _pagina([sample_producto], hasta=7, hay_mas=True),
+            _pagina(eliminados=["prod-x"], hasta=9),
+        ]
+        service = self._servicio(mock_producto_repository, reloj=lambda: 0.0)
+
+        aplicados = service.refrescar()
+
+        assert aplicados == 2
+        assert [c.args for c in mock_producto_repository.obtener_cambios.call_args_list] == [(0, 2), (7, 2)]
+        assert service.estado()["secuencia"] == 9
+        assert service.estado()["productos"] == 1
+
+    def test_refrescar_respeta_intervalo(self, mock_producto_repository):
+        """Test de que dentro del intervalo no se consulta el repositorio salvo que se fuerce"""
+        mock_producto_repository.obtener_cambios.return_value = _pagina(hasta=3)
+        ahora = [0.0]
+        service = self._servicio(mock_producto_repository, reloj=lambda: ahora[0])
+
+        service.refrescar()
+        ahora[0] = 4.0
+        assert service.refrescar() == 0
+        assert mock_producto_repository.obtener_cambios.call_count == 1
+
+        service.refrescar(forzar=True)
+        ahora[0] = 10.0
+        service.refrescar()
+        assert [c.args[0] for c in mock_producto_repository.obtener_cambios.call_args_list] == [0, 3, 3]
+
+    def test_resumenes_refrescan_antes_de_calcular(self, mock_producto_repository, sample_producto):
+        """Test de que los resúmenes reflejan los cambios pendientes"""
+        mock_producto_repository.obtener_cambios.return_value = _pagina([sample_producto], hasta=1)
+        service = self._servicio(mock_producto_repository, reloj=lambda: 0.0)
+
+        inventario = service.resumen_inventario("categoria")
+        vencimientos = service.resumen_vencimientos(date(2025, 12, 1), [30])
+
+        assert inventario.valor == 15000.0
+        assert inventario.grupos[0].clave == "electronicos"
+        assert vencimientos.horizontes[30].unidades == 10
+        mock_producto_repository.obtener_cambios.assert_called_once()
+
+    def test_snapshot_se_crea_en_el_primer_uso(self, mock_producto_repository):
+        """Test de que el snapshot no se construye al crear el servicio sino con la primera consulta"""
+        mock_producto_repository.obtener_cambios.return_value = _pagina(hasta=1)
+        creados = []
+
+        def crear_snapshot():
+            creados.append(SnapshotColumnar())
+            return creados[-1]
+
+        service = AnaliticaService(mock_producto_repository, crear_snapshot, reloj=lambda: 0.0)
+        assert creados == []
+
+        service.resumen_inventario()
+        service.estado()
+
+        assert len(creados) == 1
+        assert service.snapshot is creados[0]
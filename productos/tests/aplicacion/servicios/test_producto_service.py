@@ -3,10 +3,11 @@ Tests unitarios para ProductoService
 """
 
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 from src.aplicacion.servicios.producto_service import ProductoService
+from src.dominio.entities.asignacion import LoteDisponible, SolicitudAsignacion
 from src.dominio.entities.producto import Producto
 
 
@@ -172,3 +173,145 @@ class TestProductoService:
         # Assert
         assert len(result) == 0
         mock_producto_repository.buscar_por_nombre.assert_called_once_with("Inexistente")
+
+    def test_obtener_filas_productos(self, mock_producto_repository):
+        """Test de obtener filas de productos para el camino rápido"""
+        # Arrange
+        mock_producto_repository.obtener_filas.return_value = [("prod-001", "Laptop")]
+        service = ProductoService(mock_producto_repository)
+
+        # Act
+        result = service.obtener_filas_productos(("id", "nombre"))
+
+        # Assert
+        assert result == [("prod-001", "Laptop")]
+        mock_producto_repository.obtener_filas.assert_called_once_with(("id", "nombre"))
+
+    def test_iterar_filas_productos(self, mock_producto_repository):
+        """Test de recorrer filas de productos en lotes"""
+        # Arrange
+        mock_producto_repository.iterar_filas.return_value = iter([("prod-001",)])
+        service = ProductoService(mock_producto_repository)
+
+        # Act
+        result = list(service.iterar_filas_productos(("id",), 500))
+
+        # Assert
+        assert result == [("prod-001",)]
+        mock_producto_repository.iterar_filas.assert_called_once_with(("id",), 500)
+
+    def test_contar_productos_por(self, mock_producto_repository):
+        """Test de conteo agrupado de productos"""
+        mock_producto_repository.contar_por.return_value = []
+        service = ProductoService(mock_producto_repository)
+
+        assert service.contar_productos_por("ubicacion") == []
+        mock_producto_repository.contar_por.assert_called_once_with("ubicacion")
+
+    def test_obtener_cambios_productos(self, mock_producto_repository):
+        """Test de obtener cambios del catálogo"""
+        # Arrange
+        cambios = MagicMock()
+        mock_producto_repository.obtener_cambios.return_value = cambios
+        service = ProductoService(mock_producto_repository)
+
+        # Act
+        result = service.obtener_cambios_productos(10, 100)
+
+        # Assert
+        assert result is cambios
+        mock_producto_repository.obtener_cambios.assert_called_once_with(10, 100)
+
+    def test_obtener_cambios_publica_antes_el_stock_pendiente(self, mock_producto_repository):
+        """Test de que los cambios de stock de reservas se publican antes de leer los cambios"""
+        # Arrange
+        lote = ProductoService.LOTE_PUBLICACION_STOCK
+        orden = MagicMock()
+        orden.publicar_stock.side_effect = [lote, 3]
+        orden.attach_mock(mock_producto_repository.obtener_cambios, "obtener_cambios")
+        service = ProductoService(mock_producto_repository, publicar_stock=orden.publicar_stock)
+
+        # Act
+        service.obtener_cambios_productos(10, 100)
+
+        # Assert
+        assert orden.mock_calls == [
+            call.publicar_stock(lote),
+            call.publicar_stock(lote),
+            call.obtener_cambios(10, 100),
+        ]
+
+    def test_obtener_version_catalogo(self, mock_producto_repository):
+        """Test de obtener la versión del catálogo"""
+        # Arrange
+        mock_producto_repository.version_catalogo.return_value = 42
+        service = ProductoService(mock_producto_repository)
+
+        # Act / Assert
+        assert service.obtener_version_catalogo() == 42
+
+    def test_guardar_productos(self, mock_producto_repository, sample_producto):
+        """Test de guardar un lote de productos"""
+        # Arrange
+        mock_producto_repository.guardar_lote.return_value = 1
+        service = ProductoService(mock_producto_repository)
+
+        # Act
+        result = service.guardar_productos([sample_producto])
+
+        # Assert
+        assert result == 1
+        mock_producto_repository.guardar_lote.assert_called_once_with([sample_producto])
+
+    def test_obtener_productos_por_ids(self, mock_producto_repository, sample_producto):
+        """Test de obtener varios productos por ID"""
+        # Arrange
+        mock_producto_repository.obtener_por_ids.return_value = {"prod-001": sample_producto}
+        service = ProductoService(mock_producto_repository)
+
+        # Act
+        result = service.obtener_productos_por_ids(["prod-001", "prod-002"])
+
+        # Assert
+        assert result == {"prod-001": sample_producto}
+        mock_producto_repository.obtener_por_ids.assert_called_once_with(["prod-001", "prod-002"])
+
+    def test_planificar_asignaciones_fefo(self, mock_producto_repository, sample_producto):
+        """Test de un plan FEFO multi-línea que comparte lotes y resuelve producto_id a nombre"""
+        # Arrange
+        desde = datetime(2025, 1, 1)
+        mock_producto_repository.obtener_por_ids.return_value = {"prod-001": sample_producto}
+        mock_producto_repository.obtener_lotes_disponibles.return_value = {
+            "Laptop": [
+                LoteDisponible("l-1", "Laptop", "LOT-A", datetime(2025, 6, 1), 3),
+                LoteDisponible("l-2", "Laptop", "LOT-B", datetime(2026, 6, 1), 4),
+            ]
+        }
+        service = ProductoService(mock_producto_repository)
+        solicitudes = [
+            SolicitudAsignacion(cantidad=5, nombre="Laptop"),
+            SolicitudAsignacion(cantidad=4, producto_id="prod-001"),
+            SolicitudAsignacion(cantidad=1, producto_id="prod-999"),
+        ]
+
+        # Act
+        planes = service.planificar_asignaciones(solicitudes, desde)
+
+        # Assert
+        assert [(a.producto_id, a.cantidad) for a in planes[0].asignaciones] == [("l-1", 3), ("l-2", 2)]
+        assert planes[0].completo
+        assert [(a.producto_id, a.cantidad) for a in planes[1].asignaciones] == [("l-2", 2)]
+        assert (planes[1].nombre, planes[1].cantidad_asignada, planes[1].faltante) == ("Laptop", 2, 2)
+        assert (planes[2].nombre, planes[2].asignaciones, planes[2].faltante) == (None, (), 1)
+        mock_producto_repository.obtener_por_ids.assert_called_once_with(["prod-001", "prod-999"])
+        mock_producto_repository.obtener_lotes_disponibles.assert_called_once_with(["Laptop", "Laptop"], desde)
+
+    def test_planificar_asignaciones_por_nombre_no_resuelve_ids(self, mock_producto_repository):
+        """Test de que un pedido solo por nombre no consulta productos por ID"""
+        mock_producto_repository.obtener_lotes_disponibles.return_value = {}
+        service = ProductoService(mock_producto_repository)
+
+        planes = service.planificar_asignaciones([SolicitudAsignacion(cantidad=2, nombre="Gasa")], datetime(2025, 1, 1))
+
+        assert planes[0].faltante == 2
+        mock_producto_repository.obtener_por_ids.assert_not_called()
@@ -0,0 +1,99 @@
+"""
+Tests unitarios para ReservaService
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from src.aplicacion.servicios.reserva_service import ReservaService
+from src.dominio.entities.reserva import EstadoReserva, LineaReserva, Reserva
+
+
+def _reserva(*lineas, estado=EstadoReserva.PENDIENTE):
+    return Reserva(
+        id="res-001",
+        estado=estado,
+        lineas=tuple(lineas),
+        creada_en=datetime(2025, 1, 1),
+        expira_en=datetime(2025, 1, 1, 0, 15),
+    )
+
+
+class TestReservaService:
+    """Tests para ReservaService"""
+
+    @pytest.fixture
+    def mock_repository(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def al_cambiar_stock(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def service(self, mock_repository, al_cambiar_stock):
+        return ReservaService(mock_repository, ttl_segundos=600, al_cambiar_stock=al_cambiar_stock)
+
+    def test_reservar_usa_ttl_por_defecto(self, service, mock_repository, al_cambiar_stock):
+        """Test de reservar con la vigencia por defecto y notificar los productos afectados"""
+        lineas = [LineaReserva("prod-001", 2), LineaReserva("prod-002", 1)]
+        mock_repository.crear.return_value = _reserva(*lineas)
+        antes = datetime.utcnow()
+
+        reserva = service.reservar(lineas)
+
+        assert reserva == mock_repository.crear.return_value
+        _, expira_en = mock_repository.crear.call_args.args
+        assert antes + timedelta(seconds=600) <= expira_en <= datetime.utcnow() + timedelta(seconds=600)
+        assert sorted(c.args[0] for c in al_cambiar_stock.call_args_list) == ["prod-001", "prod-002"]
+
+    def test_reservar_con_ttl(self, service, mock_repository):
+        """Test de reservar con una vigencia explícita"""
+        mock_repository.crear.return_value = _reserva(LineaReserva("prod-001", 1))
+
+        service.reservar([LineaReserva("prod-001", 1)], ttl_segundos=30)
+
+        _, expira_en = mock_repository.crear.call_args.args
+        assert expira_en <= datetime.utcnow() + timedelta(seconds=30)
+
+    def test_confirmar_no_notifica(self, service, mock_repository, al_cambiar_stock):
+        """Test de que confirmar no cambia el stock"""
+        mock_repository.confirmar.return_value = _reserva(LineaReserva("prod-001", 1), estado=EstadoReserva.CONFIRMADA)
+
+        assert service.confirmar_reserva("res-001").estado == EstadoReserva.CONFIRMADA
+        al_cambiar_stock.assert_not_called()
+
+    def test_liberar_notifica(self, service, mock_repository, al_cambiar_stock):
+        """Test de liberar una reserva"""
+        mock_repository.liberar.return_value = _reserva(LineaReserva("prod-001", 1), estado=EstadoReserva.LIBERADA)
+
+        service.liberar_reserva("res-001")
+
+        mock_repository.liberar.assert_called_once_with("res-001")
+        al_cambiar_stock.assert_called_once_with("prod-001")
+
+    def test_expirar_reservas(self, service, mock_repository, al_cambiar_stock):
+        """Test de expirar reservas vencidas"""
+        mock_repository.expirar_vencidas.return_value = [_reserva(LineaReserva("prod-001", 1))]
+
+        assert len(service.expirar_reservas(limite=50)) == 1
+        assert mock_repository.expirar_vencidas.call_args.args[1] == 50
+        al_cambiar_stock.assert_called_once_with("prod-001")
+
+    def test_publicar_stock(self, service, mock_repository):
+        """Test de publicar los cambios de stock pendientes"""
+        mock_repository.publicar_stock_pendiente.return_value = 4
+
+        assert service.publicar_stock(limite=50) == 4
+        mock_repository.publicar_stock_pendiente.assert_called_once_with(50)
+
+    def test_obtener_reserva_sin_callback(self, mock_repository):
+        """Test de obtener una reserva con un servicio sin callback de stock"""
+        service = ReservaService(mock_repository)
+        mock_repository.liberar.return_value = _reserva(LineaReserva("prod-001", 1))
+
+        service.liberar_reserva("res-001")
+        service.obtener_reserva("res-001")
+
+        mock_repository.obtener_por_id.assert_called_once_with("res-001")
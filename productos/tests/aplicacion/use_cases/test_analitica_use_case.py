@@ -0,0 +1,38 @@
+"""
+Tests unitarios para AnaliticaUseCase
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.aplicacion.use_cases.analitica_use_case import AnaliticaUseCase
+
+
+class TestAnaliticaUseCase:
+    """Tests para AnaliticaUseCase"""
+
+    def test_resumen_inventario(self):
+        """Test de que delega en el servicio"""
+        service = MagicMock()
+        use_case = AnaliticaUseCase(service)
+
+        assert use_case.resumen_inventario("categoria") is service.resumen_inventario.return_value
+        service.resumen_inventario.assert_called_once_with("categoria")
+
+    def test_resumen_vencimientos_usa_fecha_actual(self):
+        """Test de que los vencimientos se cuentan desde la fecha actual (UTC)"""
+        service = MagicMock()
+        use_case = AnaliticaUseCase(service)
+
+        use_case.resumen_vencimientos([30, 60], "ubicacion")
+
+        fecha, horizontes, agrupar_por = service.resumen_vencimientos.call_args.args
+        assert fecha == datetime.utcnow().date()
+        assert (horizontes, agrupar_por) == ([30, 60], "ubicacion")
+
+    def test_estado(self):
+        """Test de estado del snapshot"""
+        service = MagicMock()
+        service.estado.return_value = {"productos": 0}
+
+        assert AnaliticaUseCase(service).estado() == {"productos": 0}
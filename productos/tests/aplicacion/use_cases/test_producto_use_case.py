@@ -2,11 +2,12 @@
 Tests unitarios para ProductoUseCase
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
 from src.aplicacion.use_cases.producto_use_case import ProductoUseCase
+from src.dominio.entities.asignacion import SolicitudAsignacion
 from src.dominio.entities.producto import Producto
 
 
@@ -148,3 +149,166 @@ class TestProductoUseCase:
         assert len(result) == 1
         assert "Laptop" in result[0].nombre
         mock_service.buscar_productos_por_nombre.assert_called_once_with("Laptop")
+
+    def test_obtener_filas_productos(self):
+        """Test de obtener filas de productos para el camino rápido"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.obtener_filas_productos.return_value = [("prod-001", "Laptop")]
+        use_case = ProductoUseCase(mock_service)
+
+        # Act
+        result = use_case.obtener_filas_productos(("id", "nombre"))
+
+        # Assert
+        assert result == [("prod-001", "Laptop")]
+        mock_service.obtener_filas_productos.assert_called_once_with(("id", "nombre"))
+
+    def test_iterar_filas_productos(self):
+        """Test de recorrer filas de productos en lotes"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.iterar_filas_productos.return_value = iter([("prod-001",)])
+        use_case = ProductoUseCase(mock_service)
+
+        # Act
+        result = list(use_case.iterar_filas_productos(("id",), 500))
+
+        # Assert
+        assert result == [("prod-001",)]
+        mock_service.iterar_filas_productos.assert_called_once_with(("id",), 500)
+
+    def test_contar_productos_por(self):
+        """Test de conteo agrupado de productos"""
+        mock_service = MagicMock()
+        use_case = ProductoUseCase(mock_service)
+
+        result = use_case.contar_productos_por("categoria")
+
+        assert result is mock_service.contar_productos_por.return_value
+        mock_service.contar_productos_por.assert_called_once_with("categoria")
+
+    def test_obtener_cambios_productos(self):
+        """Test de obtener cambios del catálogo"""
+        # Arrange
+        mock_service = MagicMock()
+        cambios = MagicMock()
+        mock_service.obtener_cambios_productos.return_value = cambios
+        use_case = ProductoUseCase(mock_service)
+
+        # Act
+        result = use_case.obtener_cambios_productos(10, 100)
+
+        # Assert
+        assert result is cambios
+        mock_service.obtener_cambios_productos.assert_called_once_with(10, 100)
+
+    def test_obtener_version_catalogo(self):
+        """Test de obtener la versión del catálogo"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.obtener_version_catalogo.return_value = 42
+        use_case = ProductoUseCase(mock_service)
+
+        # Act / Assert
+        assert use_case.obtener_version_catalogo() == 42
+
+    @staticmethod
+    def _registro(producto_id: str) -> dict:
+        return {
+            "id": producto_id,
+            "nombre": "Gasa",
+            "descripcion": "Gasa estéril",
+            "categoria": "insumos",
+            "condiciones_almacenamiento": "Temperatura ambiente",
+            "valor_unitario": "2.5",
+            "cantidad_disponible": "10",
+            "fecha_vencimiento": "2026-01-01",
+            "lote": "LOT-001",
+            "tiempo_estimado_entrega": "1 día",
+            "id_proveedor": "prov-001",
+            "ubicacion": "Bodega 1",
+        }
+
+    def test_importar_productos_por_lotes(self):
+        """Test de importar productos guardándolos en lotes"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.guardar_productos.side_effect = lambda productos: len(productos)
+        use_case = ProductoUseCase(mock_service)
+        registros = [(fila, self._registro(f"prod-{fila}")) for fila in range(1, 6)]
+
+        # Act
+        resultado = use_case.importar_productos(iter(registros), tamano_lote=2)
+
+        # Assert
+        assert resultado.procesadas == 5
+        assert resultado.guardadas == 5
+        assert resultado.con_error == 0
+        assert [len(c.args[0]) for c in mock_service.guardar_productos.call_args_list] == [2, 2, 1]
+
+    def test_importar_productos_con_filas_invalidas(self):
+        """Test de que las filas inválidas se reportan y no detienen la importación"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.guardar_productos.side_effect = lambda productos: len(productos)
+        use_case = ProductoUseCase(mock_service)
+        invalido = {**self._registro("prod-2"), "cantidad_disponible": "-1"}
+        registros = [(1, self._registro("prod-1")), (2, invalido), (3, ValueError("JSON inválido"))]
+
+        # Act
+        resultado = use_case.importar_productos(iter(registros), tamano_lote=100)
+
+        # Assert
+        assert resultado.procesadas == 3
+        assert resultado.guardadas == 1
+        assert resultado.con_error == 2
+        assert [e.fila for e in resultado.errores] == [2, 3]
+
+    def test_importar_productos_lote_fallido(self):
+        """Test de que un lote que falla al guardarse se reporta y la importación continúa"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.guardar_productos.side_effect = [Exception("Error de base de datos"), 1]
+        use_case = ProductoUseCase(mock_service)
+        registros = [(fila, self._registro(f"prod-{fila}")) for fila in range(1, 4)]
+
+        # Act
+        resultado = use_case.importar_productos(iter(registros), tamano_lote=2)
+
+        # Assert
+        assert resultado.guardadas == 1
+        assert resultado.con_error == 2
+        assert resultado.errores[0].fila == 1
+        assert "1-2" in resultado.errores[0].error
+
+    def test_obtener_productos_por_ids(self):
+        """Test de obtener varios productos por ID"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.obtener_productos_por_ids.return_value = {}
+        use_case = ProductoUseCase(mock_service)
+
+        # Act
+        result = use_case.obtener_productos_por_ids(["prod-001"])
+
+        # Assert
+        assert result == {}
+        mock_service.obtener_productos_por_ids.assert_called_once_with(["prod-001"])
+
+    def test_planificar_asignaciones(self):
+        """Test de planificar asignaciones descartando lotes que vencen antes de la vigencia mínima"""
+        # Arrange
+        mock_service = MagicMock()
+        use_case = ProductoUseCase(mock_service)
+        solicitudes = [SolicitudAsignacion(cantidad=1, nombre="Gasa")]
+        antes = datetime.utcnow()
+
+        # Act
+        result = use_case.planificar_asignaciones(solicitudes, vigencia_minima_dias=30)
+
+        # Assert
+        assert result == mock_service.planificar_asignaciones.return_value
+        argumento_solicitudes, vencen_desde = mock_service.planificar_asignaciones.call_args.args
+        assert argumento_solicitudes == solicitudes
+        assert antes + timedelta(days=30) <= vencen_desde <= datetime.utcnow() + timedelta(days=30)
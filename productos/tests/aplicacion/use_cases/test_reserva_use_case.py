@@ -0,0 +1,29 @@
+"""
+Tests unitarios para ReservaUseCase
+"""
+
+from unittest.mock import MagicMock
+
+from src.aplicacion.use_cases.reserva_use_case import ReservaUseCase
+from src.dominio.entities.reserva import LineaReserva
+
+
+class TestReservaUseCase:
+    """Tests para ReservaUseCase"""
+
+    def test_delega_en_el_servicio(self):
+        """Test de que cada operación se delega en el servicio"""
+        mock_service = MagicMock()
+        use_case = ReservaUseCase(mock_service)
+        lineas = [LineaReserva("prod-001", 1)]
+
+        assert use_case.reservar(lineas, 60) == mock_service.reservar.return_value
+        assert use_case.obtener_reserva("res-001") == mock_service.obtener_reserva.return_value
+        assert use_case.confirmar_reserva("res-001") == mock_service.confirmar_reserva.return_value
+        assert use_case.liberar_reserva("res-001") == mock_service.liberar_reserva.return_value
+        assert use_case.expirar_reservas(10) == mock_service.expirar_reservas.return_value
+        assert use_case.publicar_stock(10) == mock_service.publicar_stock.return_value
+
+        mock_service.reservar.assert_called_once_with(lineas, 60)
+        mock_service.expirar_reservas.assert_called_once_with(10)
+        mock_service.publicar_stock.assert_called_once_with(10)
@@ -13,10 +13,14 @@ src_dir = os.path.join(project_root, "src")
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
+# El expirador de reservas no se inicia al importar src.main durante los tests
+os.environ.setdefault("RESERVAS_INTERVALO_EXPIRACION", "0")
+
 import pytest
 from flask import Flask
 from src.aplicacion.dtos.producto_dto import ProductoDto
 from src.dominio.entities.producto import Producto
+from src.infraestructura.config.motor import normalizar_uri, opciones_motor
 
 
 @pytest.fixture(scope="session")
@@ -24,17 +28,22 @@ def app():
     """Crea una aplicación Flask para los tests que requieren contexto de aplicación"""
     test_app = Flask(__name__)
     test_app.config["TESTING"] = True
-    test_app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    # TEST_DATABASE_URL corre la suite contra otro backend, por ejemplo PostgreSQL (ver README)
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = normalizar_uri(os.environ.get("TEST_DATABASE_URL", "sqlite:///:memory:"))
     test_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    test_app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones_motor(test_app.config["SQLALCHEMY_DATABASE_URI"])
 
     # Inicializar la base de datos en el contexto de la app
     from src.infraestructura.config.db import db_productos, init_db_productos
 
     # Importar modelos para que SQLAlchemy los registre
     from src.infraestructura.dto.producto import ProductoModel  # noqa: F401
+    from src.infraestructura.dto.reserva import ReservaModel  # noqa: F401
 
     with test_app.app_context():
         init_db_productos(test_app)
+        # Un servidor de base de datos conserva las tablas entre corridas: se parte de cero
+        db_productos.drop_all()
         db_productos.create_all()
         yield test_app
 
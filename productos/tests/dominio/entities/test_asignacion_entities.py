@@ -0,0 +1,36 @@
+"""
+Tests unitarios para las entidades de asignación FEFO
+"""
+
+from datetime import datetime
+
+from src.dominio.entities.asignacion import AsignacionLote, PlanAsignacion, SolicitudAsignacion
+
+
+class TestPlanAsignacion:
+    """Tests para PlanAsignacion"""
+
+    def test_plan_parcial(self):
+        """Test de cantidades de un plan que no cubre la solicitud"""
+        plan = PlanAsignacion(
+            solicitud=SolicitudAsignacion(cantidad=5, nombre="Gasa"),
+            nombre="Gasa",
+            asignaciones=(
+                AsignacionLote("p1", "LOT-A", datetime(2026, 1, 1), 2),
+                AsignacionLote("p2", "LOT-B", datetime(2027, 1, 1), 1),
+            ),
+        )
+
+        assert plan.cantidad_asignada == 3
+        assert plan.faltante == 2
+        assert plan.completo is False
+
+    def test_plan_completo(self):
+        """Test de un plan que cubre toda la solicitud"""
+        plan = PlanAsignacion(
+            solicitud=SolicitudAsignacion(cantidad=2, producto_id="p1"),
+            nombre="Gasa",
+            asignaciones=(AsignacionLote("p1", "LOT-A", datetime(2026, 1, 1), 2),),
+        )
+
+        assert plan.completo is True
@@ -0,0 +1,38 @@
+"""
+Tests unitarios para las entidades de importación
+"""
+
+from src.dominio.entities.importacion import ErrorImportacion, ResultadoImportacion
+
+
+class TestResultadoImportacion:
+    """Tests para ResultadoImportacion"""
+
+    def test_resultado_inicial(self):
+        """Test de un resultado sin filas procesadas"""
+        resultado = ResultadoImportacion()
+
+        assert resultado.procesadas == 0
+        assert resultado.guardadas == 0
+        assert resultado.con_error == 0
+        assert resultado.errores == []
+
+    def test_registrar_error(self):
+        """Test de registrar errores de una fila y de un lote"""
+        resultado = ResultadoImportacion()
+
+        resultado.registrar_error(3, "Campo faltante")
+        resultado.registrar_error(10, "Lote no guardado", filas_afectadas=5)
+
+        assert resultado.con_error == 6
+        assert resultado.errores == [ErrorImportacion(3, "Campo faltante"), ErrorImportacion(10, "Lote no guardado")]
+
+    def test_registrar_error_limita_detalle(self):
+        """Test de que solo se conserva el detalle de los primeros errores"""
+        resultado = ResultadoImportacion()
+
+        for fila in range(ResultadoImportacion.MAX_ERRORES + 50):
+            resultado.registrar_error(fila, "Error")
+
+        assert resultado.con_error == ResultadoImportacion.MAX_ERRORES + 50
+        assert len(resultado.errores) == ResultadoImportacion.MAX_ERRORES
@@ -0,0 +1,49 @@
+"""
+Tests unitarios para las entidades y excepciones de reservas
+"""
+
+from datetime import datetime
+
+import pytest
+from src.dominio.entities.reserva import EstadoReserva, LineaReserva, Reserva
+from src.dominio.exceptions import EstadoReservaInvalidoError, ReservaError, StockInsuficienteError
+
+
+class TestReserva:
+    """Tests para Reserva y LineaReserva"""
+
+    def test_reserva_inmutable(self):
+        """Test de que la reserva es inmutable"""
+        reserva = Reserva(
+            id="res-001",
+            estado=EstadoReserva.PENDIENTE,
+            lineas=(LineaReserva("prod-001", 2),),
+            creada_en=datetime(2025, 1, 1),
+            expira_en=datetime(2025, 1, 1, 0, 15),
+        )
+
+        with pytest.raises(AttributeError):
+            reserva.estado = EstadoReserva.CONFIRMADA
+
+    def test_estados(self):
+        """Test de los valores de estado"""
+        assert [e.value for e in EstadoReserva] == ["PENDIENTE", "CONFIRMADA", "LIBERADA", "EXPIRADA"]
+
+
+class TestExcepcionesReserva:
+    """Tests para las excepciones de reservas"""
+
+    def test_stock_insuficiente(self):
+        """Test de los datos expuestos por StockInsuficienteError"""
+        error = StockInsuficienteError("prod-001", 5, 2)
+
+        assert isinstance(error, ReservaError)
+        assert (error.producto_id, error.solicitada, error.disponible) == ("prod-001", 5, 2)
+        assert "prod-001" in str(error)
+
+    def test_estado_invalido(self):
+        """Test del estado expuesto por EstadoReservaInvalidoError"""
+        error = EstadoReservaInvalidoError("res-001", "LIBERADA")
+
+        assert error.estado == "LIBERADA"
+        assert "LIBERADA" in str(error)
@@ -36,3 +36,10 @@ class TestProductoRepositoryInterface:
         assert "obtener_por_id" in abstract_methods
         assert "obtener_por_categoria" in abstract_methods
         assert "buscar_por_nombre" in abstract_methods
+        assert "obtener_filas" in abstract_methods
+        assert "iterar_filas" in abstract_methods
+        assert "obtener_cambios" in abstract_methods
+        assert "guardar_lote" in abstract_methods
+        assert "version_catalogo" in abstract_methods
+        assert "obtener_por_ids" in abstract_methods
+        assert "obtener_lotes_disponibles" in abstract_methods
@@ -0,0 +1,26 @@
+"""
+Tests unitarios para la interfaz ReservaRepository
+"""
+
+import pytest
+from src.dominio.repositorios.reserva_repository import ReservaRepository
+
+
+class TestReservaRepositoryInterface:
+    """Tests para la interfaz ReservaRepository"""
+
+    def test_repository_is_abstract(self):
+        """Test de que ReservaRepository es una clase abstracta"""
+        with pytest.raises(TypeError):
+            ReservaRepository()
+
+    def test_repository_has_abstract_methods(self):
+        """Test de que ReservaRepository tiene los métodos abstractos correctos"""
+        assert ReservaRepository.__abstractmethods__ == {
+            "crear",
+            "obtener_por_id",
+            "confirmar",
+            "liberar",
+            "expirar_vencidas",
+            "publicar_stock_pendiente",
+        }
@@ -0,0 +1,164 @@
+"""
+Tests unitarios para SnapshotColumnar
+"""
+
+from dataclasses import replace
+from datetime import date, datetime
+
+import pytest
+from src.dominio.entities.cambios import CambioProducto, CambiosProductos, ProductoEliminado
+from src.dominio.entities.producto import Producto
+from src.infraestructura.analitica.snapshot_columnar import SnapshotColumnar
+
+HOY = date(2025, 1, 1)
+
+
+def _producto(producto_id, categoria="insumos", valor=10.0, cantidad=1, vence=datetime(2025, 3, 1), proveedor="prov-001"):
+    return Producto(
+        id=producto_id,
+        nombre=f"Producto {producto_id}",
+        descripcion="Descripción",
+        categoria=categoria,
+        condiciones_almacenamiento="Temperatura ambiente",
+        valor_unitario=valor,
+        cantidad_disponible=cantidad,
+        fecha_vencimiento=vence,
+        lote="LOT-001",
+        tiempo_estimado_entrega="2 días",
+        id_proveedor=proveedor,
+        ubicacion="Bodega 1",
+    )
+
+
+def _cambios(productos=(), eliminados=(), hasta=1):
+    return CambiosProductos(
+        cambios=[CambioProducto(p, hasta, datetime(2025, 1, 1)) for p in productos],
+        eliminados=[ProductoEliminado(producto_id, hasta, datetime(2025, 1, 1)) for producto_id in eliminados],
+        hasta=hasta,
+        hay_mas=False,
+    )
+
+
+class TestSnapshotColumnar:
+    """Tests para SnapshotColumnar"""
+
+    @pytest.fixture
+    def snapshot(self):
+        snapshot = SnapshotColumnar(capacidad_inicial=2)
+        snapshot.aplicar(
+            _cambios(
+                [
+                    _producto("p-1", "insumos", 10.0, 5),
+                    _producto("p-2", "medicamentos", 2.5, 40, proveedor="prov-002"),
+                    _producto("p-3", "insumos", 1.0, 30),
+                ],
+                hasta=3,
+            )
+        )
+        return snapshot
+
+    def test_aplicar_altas_amplia_capacidad(self, snapshot):
+        """Test de que las altas se agregan ampliando las columnas"""
+        estadisticas = snapshot.estadisticas()
+
+        assert len(snapshot) == 3
+        assert estadisticas["capacidad"] >= 3
+        assert estadisticas["secuencia"] == 3
+
+    def test_resumen_inventario_sin_agrupar(self, snapshot):
+        """Test del valor total del inventario"""
+        resumen = snapshot.resumen_inventario()
+
+        assert (resumen.productos, resumen.unidades, resumen.valor) == (3, 75, 180.0)
+        assert resumen.agrupar_por is None
+        assert resumen.grupos == ()
+
+    def test_resumen_inventario_agrupado_ordenado_por_valor(self, snapshot):
+        """Test del desglose por categoría de mayor a menor valor"""
+        resumen = snapshot.resumen_inventario("categoria")
+
+        assert resumen.agrupar_por == "categoria"
+        assert [(g.clave, g.productos, g.unidades, g.valor) for g in resumen.grupos] == [
+            ("medicamentos", 1, 40, 100.0),
+            ("insumos", 2, 35, 80.0),
+        ]
+
+    def test_aplicar_actualizacion_sobrescribe_fila(self, snapshot):
+        """Test de que un producto modificado reemplaza su fila sin duplicarse"""
+        snapshot.aplicar(_cambios([_producto("p-1", "equipos", 10.0, 1)], hasta=4))
+
+        resumen = snapshot.resumen_inventario("categoria")
+
+        assert len(snapshot) == 3
+        assert {g.clave: g.valor for g in resumen.grupos} == {"medicamentos": 100.0, "insumos": 30.0, "equipos": 10.0}
+
+    def test_aplicar_eliminacion_y_compactacion(self, snapshot):
+        """Test de que los eliminados dejan de contar y el snapshot se compacta"""
+        snapshot.aplicar(_cambios(eliminados=["p-2", "no-existe"], hasta=5))
+
+        assert len(snapshot) == 2
+        assert snapshot.estadisticas()["filas_inactivas"] == 0
+        assert snapshot.resumen_inventario().valor == 80.0
+
+        # Tras compactar, las posiciones siguen siendo coherentes para nuevas altas y modificaciones
+        snapshot.aplicar(_cambios([_producto("p-3", cantidad=0), _producto("p-4", valor=3.0, cantidad=2)], hasta=6))
+        assert snapshot.resumen_inventario().valor == 56.0
+        assert snapshot.secuencia == 6
+
+    def test_producto_eliminado_y_recreado(self, snapshot):
+        """Test de que un producto recreado después de eliminarlo vuelve a contar una sola vez"""
+        snapshot.aplicar(_cambios(eliminados=["p-1"], hasta=4))
+        snapshot.aplicar(_cambios([_producto("p-1", valor=1.0, cantidad=1)], hasta=5))
+
+        assert len(snapshot) == 3
+        assert snapshot.resumen_inventario().valor == 131.0
+
+    def test_resumen_vencimientos_horizontes_acumulados(self):
+        """Test de vencidos y horizontes acumulados, con el día límite incluido"""
+        snapshot = SnapshotColumnar()
+        snapshot.aplicar(
+            _cambios(
+                [
+                    _producto("vencido", cantidad=1, vence=datetime(2024, 12, 31)),
+                    _producto("hoy", cantidad=2, vence=datetime(2025, 1, 1)),
+                    _producto("d30", cantidad=4, vence=datetime(2025, 1, 31)),
+                    _producto("d31", cantidad=8, vence=datetime(2025, 2, 1), categoria="medicamentos"),
+                    _producto("lejano", cantidad=16, vence=datetime(2026, 1, 1)),
+                ]
+            )
+        )
+
+        resumen = snapshot.resumen_vencimientos(HOY, [30, 60], "categoria")
+
+        assert resumen.fecha_referencia == HOY
+        assert resumen.vencido.unidades == 1
+        assert resumen.horizontes[30].unidades == 6
+        assert resumen.horizontes[60].unidades == 14
+        assert [(g.clave, g.unidades) for g in resumen.horizontes[60].grupos] == [("medicamentos", 8), ("insumos", 6)]
+
+    def test_snapshot_vacio(self):
+        """Test de resúmenes sobre un snapshot vacío"""
+        snapshot = SnapshotColumnar()
+
+        assert snapshot.resumen_inventario("ubicacion").grupos == ()
+        assert snapshot.resumen_vencimientos(HOY, [30]).horizontes[30].productos == 0
+
+    def test_coincide_con_calculo_por_filas(self):
+        """Test de que los agregados vectorizados coinciden con el cálculo fila a fila"""
+        productos = [
+            _producto(f"p-{i}", f"cat-{i % 7}", valor=0.5 + i % 13, cantidad=i % 17, vence=datetime(2025, 1, 1 + i % 28))
+            for i in range(500)
+        ]
+        snapshot = SnapshotColumnar()
+        snapshot.aplicar(_cambios(productos))
+        snapshot.aplicar(_cambios([replace(p, cantidad_disponible=3) for p in productos[::5]], eliminados=["p-1"], hasta=2))
+
+        esperados = {}
+        for producto in productos:
+            if producto.id == "p-1":
+                continue
+            cantidad = 3 if int(producto.id[2:]) % 5 == 0 else producto.cantidad_disponible
+            esperados[producto.categoria] = esperados.get(producto.categoria, 0) + cantidad * producto.valor_unitario
+
+        grupos = {g.clave: g.valor for g in snapshot.resumen_inventario("categoria").grupos}
+        assert grupos == pytest.approx(esperados)
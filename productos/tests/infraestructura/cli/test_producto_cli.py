@@ -0,0 +1,74 @@
+"""
+Tests unitarios para los comandos CLI de productos
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from src.dominio.entities.importacion import ResultadoImportacion
+from src.infraestructura.cli.producto_cli import create_producto_cli
+
+
+class TestProductoCli:
+    """Tests para el comando flask productos importar"""
+
+    @pytest.fixture
+    def mock_use_case(self):
+        use_case = MagicMock()
+        use_case.importar_productos.side_effect = lambda registros, tamano_lote: ResultadoImportacion(
+            procesadas=len(list(registros)), guardadas=1
+        )
+        return use_case
+
+    @pytest.fixture
+    def runner(self, mock_use_case):
+        app = Flask(__name__)
+        app.cli.add_command(create_producto_cli(mock_use_case, tamano_lote=500))
+        return app.test_cli_runner()
+
+    def test_importar_deduce_formato_por_extension(self, runner, mock_use_case, tmp_path):
+        """Test de importar un NDJSON deduciendo el formato por la extensión"""
+        archivo = tmp_path / "productos.ndjson"
+        archivo.write_bytes(b'{"id": "prod-001"}\n')
+
+        result = runner.invoke(args=["productos", "importar", str(archivo)])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["procesadas"] == 1
+        assert mock_use_case.importar_productos.call_args.args[1] == 500
+
+    def test_importar_con_formato_y_tamano_lote(self, runner, mock_use_case, tmp_path):
+        """Test de importar indicando formato y tamaño de lote"""
+        archivo = tmp_path / "productos.txt"
+        archivo.write_bytes(b"id\nprod-001\n")
+
+        result = runner.invoke(args=["productos", "importar", str(archivo), "--formato", "csv", "--tamano-lote", "50"])
+
+        assert result.exit_code == 0
+        assert mock_use_case.importar_productos.call_args.args[1] == 50
+
+    def test_importar_formato_desconocido(self, runner, mock_use_case, tmp_path):
+        """Test de importar un archivo cuyo formato no se puede deducir"""
+        archivo = tmp_path / "productos.xml"
+        archivo.write_bytes(b"<productos/>")
+
+        result = runner.invoke(args=["productos", "importar", str(archivo)])
+
+        assert result.exit_code != 0
+        mock_use_case.importar_productos.assert_not_called()
+
+    def test_importar_con_errores_termina_con_codigo_1(self, runner, mock_use_case, tmp_path):
+        """Test de que una importación con errores termina con código de salida 1"""
+        resultado = ResultadoImportacion(procesadas=1)
+        resultado.registrar_error(1, "Campo faltante")
+        mock_use_case.importar_productos.side_effect = None
+        mock_use_case.importar_productos.return_value = resultado
+        archivo = tmp_path / "productos.csv"
+        archivo.write_bytes(b"id\nprod-001\n")
+
+        result = runner.invoke(args=["productos", "importar", str(archivo)])
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["errores"] == [{"fila": 1, "error": "Campo faltante"}]
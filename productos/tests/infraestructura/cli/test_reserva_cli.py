@@ -0,0 +1,28 @@
+"""
+Tests unitarios para los comandos CLI de reservas
+"""
+
+from unittest.mock import MagicMock
+
+from flask import Flask
+from src.infraestructura.cli.reserva_cli import create_reserva_cli
+
+
+class TestReservaCli:
+    """Tests para el comando flask reservas expirar"""
+
+    def test_expirar(self):
+        """Test de expirar reservas vencidas desde la línea de comandos"""
+        mock_use_case = MagicMock()
+        mock_use_case.expirar_reservas.return_value = ["r1", "r2"]
+        mock_use_case.publicar_stock.return_value = 3
+        app = Flask(__name__)
+        app.cli.add_command(create_reserva_cli(mock_use_case))
+
+        result = app.test_cli_runner().invoke(args=["reservas", "expirar", "--limite", "50"])
+
+        assert result.exit_code == 0
+        assert "Reservas expiradas: 2" in result.output
+        assert "Productos con stock publicado: 3" in result.output
+        mock_use_case.expirar_reservas.assert_called_once_with(50)
+        mock_use_case.publicar_stock.assert_called_once_with(50)
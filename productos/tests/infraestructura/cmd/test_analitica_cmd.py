@@ -0,0 +1,48 @@
+"""
+Tests unitarios para AnaliticaCmd
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.dominio.entities.analitica import ResumenInventario, ResumenVencimientos
+from src.infraestructura.cmd.analitica_cmd import AnaliticaCmd
+
+
+class TestAnaliticaCmd:
+    """Tests para AnaliticaCmd"""
+
+    def test_resumen_inventario(self, app_context):
+        """Test de resumen de inventario exitoso"""
+        use_case = MagicMock()
+        use_case.resumen_inventario.return_value = ResumenInventario(1, 2, 3.0)
+
+        response, status_code = AnaliticaCmd(use_case).resumen_inventario(None)
+
+        assert status_code == 200
+        assert response.get_json() == {"productos": 1, "unidades": 2, "valor": 3.0}
+
+    def test_resumen_vencimientos(self, app_context):
+        """Test de resumen de vencimientos exitoso"""
+        use_case = MagicMock()
+        use_case.resumen_vencimientos.return_value = ResumenVencimientos(
+            date(2025, 1, 1), ResumenInventario(0, 0, 0.0), {30: ResumenInventario(1, 2, 3.0)}
+        )
+
+        response, status_code = AnaliticaCmd(use_case).resumen_vencimientos([30], None)
+
+        assert status_code == 200
+        assert response.get_json()["horizontes"] == [{"dias": 30, "productos": 1, "unidades": 2, "valor": 3.0}]
+        use_case.resumen_vencimientos.assert_called_once_with([30], None)
+
+    def test_errores(self, app_context):
+        """Test de que los errores se devuelven como 500"""
+        use_case = MagicMock()
+        use_case.resumen_inventario.side_effect = Exception("Database error")
+        use_case.resumen_vencimientos.side_effect = Exception("Database error")
+        use_case.estado.side_effect = Exception("Database error")
+        cmd = AnaliticaCmd(use_case)
+
+        for response, status_code in (cmd.resumen_inventario(), cmd.resumen_vencimientos([30]), cmd.estado()):
+            assert status_code == 500
+            assert response.get_json() == {"error": "Database error"}
@@ -2,59 +2,119 @@
 Tests unitarios para ProductoCmd
 """
 
+import io
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import msgpack
 import pytest
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.dominio.entities.asignacion import AsignacionLote, PlanAsignacion, SolicitudAsignacion
+from src.dominio.entities.cambios import CambiosProductos, ProductoEliminado
+from src.dominio.entities.consulta import ConsultaProductos, PaginaFilas
+from src.dominio.entities.importacion import ResultadoImportacion
 from src.dominio.entities.producto import Producto
+from src.dominio.entities.resumen import ConteoGrupo
 from src.infraestructura.cmd.producto_cmd import ProductoCmd
 
 
 class TestProductoCmd:
     """Tests para ProductoCmd"""
 
-    @patch("src.infraestructura.cmd.producto_cmd.ProductoMapper")
-    def test_obtener_todos_los_productos_exitoso(self, mock_mapper, app_context):
+    def test_obtener_todos_los_productos_exitoso(self, app_context):
         """Test de obtener todos los productos exitosamente"""
         # Arrange
         mock_use_case = MagicMock()
-        productos = [
-            Producto(
-                id="prod-001",
-                nombre="Producto 1",
-                descripcion="Descripción 1",
-                categoria="electronicos",
-                condiciones_almacenamiento="Temperatura ambiente",
-                valor_unitario=100.00,
-                cantidad_disponible=10,
-                fecha_vencimiento=datetime(2025, 12, 31),
-                lote="LOT-001",
-                tiempo_estimado_entrega="5 días",
-                id_proveedor="prov-001",
-                ubicacion="Almacén A - Estante 1",
-            ),
-        ]
-        mock_use_case.obtener_todos_los_productos.return_value = productos
+        fila = (
+            "prod-001",
+            "Producto 1",
+            "Descripción 1",
+            "electronicos",
+            "Temperatura ambiente",
+            100.00,
+            10,
+            datetime(2025, 12, 31),
+            "LOT-001",
+            "5 días",
+            "prov-001",
+            "Almacén A - Estante 1",
+        )
+        mock_use_case.obtener_filas_productos.return_value = [fila]
+        cmd = ProductoCmd(mock_use_case)
 
-        mock_dto = MagicMock()
-        mock_json = {"id": "prod-001", "nombre": "Producto 1"}
-        mock_mapper.entity_to_dto.return_value = mock_dto
-        mock_mapper.dto_to_json.return_value = mock_json
+        # Act
+        response, status_code = cmd.obtener_todos_los_productos()
 
+        # Assert
+        assert status_code == 200
+        assert response.mimetype == "application/json"
+        data = response.get_json()
+        assert len(data) == 1
+        assert data[0]["id"] == "prod-001"
+        assert data[0]["fecha_vencimiento"] == "Wed, 31 Dec 2025 00:00:00 GMT"
+        mock_use_case.obtener_filas_productos.assert_called_once()
+
+    def test_obtener_todos_los_productos_con_campos(self, app_context):
+        """Test de que la proyección se aplica en la consulta y en el JSON"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_filas_productos.return_value = [("prod-001", 100.0)]
         cmd = ProductoCmd(mock_use_case)
 
         # Act
-        response, status_code = cmd.obtener_todos_los_productos()
+        response, status_code = cmd.obtener_todos_los_productos(("id", "valor_unitario"))
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json() == [{"id": "prod-001", "valor_unitario": 100.0}]
+        mock_use_case.obtener_filas_productos.assert_called_once_with(("id", "valor_unitario"))
+
+    def test_obtener_todos_los_productos_con_consulta(self, app_context):
+        """Test de la consulta filtrada: página de filas y total en X-Total-Count"""
+        # Arrange
+        mock_use_case = MagicMock()
+        consulta = ConsultaProductos(con_stock=True, limite=1)
+        mock_use_case.consultar_filas_productos.return_value = PaginaFilas(filas=[("prod-001",)], total=7)
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_todos_los_productos(("id",), consulta)
 
         # Assert
         assert status_code == 200
-        mock_use_case.obtener_todos_los_productos.assert_called_once()
+        assert response.get_json() == [{"id": "prod-001"}]
+        assert response.headers["X-Total-Count"] == "7"
+        assert "Accept" in response.headers["Vary"]
+        mock_use_case.consultar_filas_productos.assert_called_once_with(("id",), consulta)
+        mock_use_case.obtener_filas_productos.assert_not_called()
+
+    def test_obtener_todos_los_productos_msgpack(self, app_context):
+        """Test de que el listado en MessagePack decodifica a los mismos valores que el JSON"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_filas_productos.return_value = [("prod-001", datetime(2025, 12, 31))]
+        cmd = ProductoCmd(mock_use_case)
+        campos = ("id", "fecha_vencimiento")
+
+        # Act
+        response, status_code = cmd.obtener_todos_los_productos(campos, mimetype=ProductoCmd.MIMETYPE_MSGPACK)
+        json_response, _ = cmd.obtener_todos_los_productos(campos)
+
+        # Assert
+        assert status_code == 200
+        assert response.mimetype == "application/x-msgpack"
+        assert msgpack.unpackb(response.get_data()) == json_response.get_json()
+        assert "Accept" in response.headers["Vary"]
+
+    def test_mimetypes_listado(self):
+        """Test de que JSON va antes que MessagePack: es el formato por defecto"""
+        assert ProductoCmd.MIMETYPES_LISTADO == ("application/json", "application/x-msgpack")
 
     def test_obtener_todos_los_productos_error(self, app_context):
         """Test de obtener todos los productos con error"""
         # Arrange
         mock_use_case = MagicMock()
-        mock_use_case.obtener_todos_los_productos.side_effect = Exception("Error de base de datos")
+        mock_use_case.obtener_filas_productos.side_effect = Exception("Error de base de datos")
         cmd = ProductoCmd(mock_use_case)
 
         # Act
@@ -99,6 +159,20 @@ class TestProductoCmd:
         assert status_code == 200
         mock_use_case.obtener_producto_por_id.assert_called_once_with("prod-001")
 
+    def test_obtener_producto_por_id_con_campos(self, app_context, sample_producto):
+        """Test de obtener un producto proyectando solo algunos campos"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_producto_por_id.return_value = sample_producto
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_producto_por_id(sample_producto.id, ("id", "cantidad_disponible"))
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json() == {"id": sample_producto.id, "cantidad_disponible": sample_producto.cantidad_disponible}
+
     def test_obtener_producto_por_id_no_encontrado(self, app_context):
         """Test de obtener producto por ID cuando no existe"""
         # Arrange
@@ -229,3 +303,239 @@ class TestProductoCmd:
         # Assert
         assert status_code == 500
         assert "error" in response.get_json()
+
+    def test_exportar_productos_ndjson(self, app):
+        """Test de exportar productos en streaming como NDJSON"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.iterar_filas_productos.return_value = iter(
+            [tuple(f"{campo}-{i}" for campo in ProductoMapper.CAMPOS) for i in range(3)]
+        )
+        cmd = ProductoCmd(mock_use_case, tamano_lote_exportacion=2)
+
+        # Act
+        with app.test_request_context("/productos/export"):
+            response, status_code = cmd.exportar_productos("ndjson")
+            cuerpo = b"".join(response.response)
+
+        # Assert
+        assert status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == "application/x-ndjson"
+        assert response.headers["Content-Disposition"] == 'attachment; filename="productos.ndjson"'
+        assert len(cuerpo.splitlines()) == 3
+        mock_use_case.iterar_filas_productos.assert_called_once_with(ProductoMapper.CAMPOS, 2)
+
+    def test_exportar_productos_csv(self, app):
+        """Test de exportar productos en streaming como CSV"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.iterar_filas_productos.return_value = iter([])
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        with app.test_request_context("/productos/export?formato=csv"):
+            response, status_code = cmd.exportar_productos("csv")
+            cuerpo = b"".join(response.response)
+
+        # Assert
+        assert status_code == 200
+        assert response.mimetype == "text/csv"
+        assert cuerpo.decode("utf-8").startswith("id,nombre,")
+
+    def test_exportar_productos_error_antes_de_responder(self, app):
+        """Test de que un error al leer el primer bloque devuelve 500"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.iterar_filas_productos.side_effect = Exception("Error de base de datos")
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        with app.test_request_context("/productos/export"):
+            response, status_code = cmd.exportar_productos("ndjson")
+
+        # Assert
+        assert status_code == 500
+        assert "error" in response.get_json()
+
+    def test_resumir_productos(self, app_context):
+        """Test de resumen agrupado de productos"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.contar_productos_por.return_value = [ConteoGrupo("insumos", 2, 7), ConteoGrupo("equipos", 1, 0)]
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.resumir_productos("categoria")
+
+        # Assert
+        assert status_code == 200
+        data = response.get_json()
+        assert data["agrupar"] == "categoria"
+        assert data["total"] == 3
+        assert data["grupos"][0] == {"clave": "insumos", "total": 2, "unidades": 7}
+        mock_use_case.contar_productos_por.assert_called_once_with("categoria")
+
+    def test_resumir_productos_error(self, app_context):
+        """Test de resumen agrupado con error"""
+        mock_use_case = MagicMock()
+        mock_use_case.contar_productos_por.side_effect = Exception("Error de base de datos")
+
+        response, status_code = ProductoCmd(mock_use_case).resumir_productos("categoria")
+
+        assert status_code == 500
+        assert "error" in response.get_json()
+
+    def test_obtener_cambios_exitoso(self, app_context):
+        """Test de obtener cambios del catálogo exitosamente"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_cambios_productos.return_value = CambiosProductos(
+            cambios=[],
+            eliminados=[ProductoEliminado(id="prod-001", secuencia=12, eliminado_en=datetime(2025, 6, 1))],
+            hasta=12,
+            hay_mas=False,
+        )
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_cambios(10, 100)
+
+        # Assert
+        assert status_code == 200
+        data = response.get_json()
+        assert data["desde"] == 10
+        assert data["hasta"] == 12
+        assert data["eliminados"][0]["id"] == "prod-001"
+        mock_use_case.obtener_cambios_productos.assert_called_once_with(10, 100)
+
+    def test_obtener_cambios_error(self, app_context):
+        """Test de obtener cambios del catálogo con error"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_cambios_productos.side_effect = Exception("Error de base de datos")
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_cambios(10, 100)
+
+        # Assert
+        assert status_code == 500
+        assert "error" in response.get_json()
+
+    def test_version_catalogo(self):
+        """Test de obtener la versión del catálogo"""
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_version_catalogo.return_value = 42
+
+        assert ProductoCmd(mock_use_case).version_catalogo() == 42
+
+    def test_version_catalogo_error(self):
+        """Test de que un error al obtener la versión devuelve None (respuesta sin ETag)"""
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_version_catalogo.side_effect = Exception("Error de base de datos")
+
+        assert ProductoCmd(mock_use_case).version_catalogo() is None
+
+    def test_importar_productos_exitoso(self, app_context):
+        """Test de importar productos desde un stream"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.importar_productos.return_value = ResultadoImportacion(procesadas=1, guardadas=1)
+        cmd = ProductoCmd(mock_use_case, tamano_lote_importacion=250)
+
+        # Act
+        response, status_code = cmd.importar_productos(io.BytesIO(b'{"id": "prod-001"}\n'), "ndjson")
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json() == {"procesadas": 1, "guardadas": 1, "con_error": 0, "errores": []}
+        registros, tamano_lote = mock_use_case.importar_productos.call_args.args
+        assert list(registros) == [(1, {"id": "prod-001"})]
+        assert tamano_lote == 250
+
+    def test_importar_productos_error(self, app_context):
+        """Test de importar productos con error inesperado"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.importar_productos.side_effect = Exception("Error de base de datos")
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.importar_productos(io.BytesIO(b""), "csv")
+
+        # Assert
+        assert status_code == 500
+        assert "error" in response.get_json()
+
+    def test_obtener_productos_por_ids_exitoso(self, app_context, sample_producto):
+        """Test de obtener varios productos por ID"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_productos_por_ids.return_value = {"prod-001": sample_producto}
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_productos_por_ids(["prod-002", "prod-001"])
+
+        # Assert
+        assert status_code == 200
+        resultados = response.get_json()["resultados"]
+        assert [(r["id"], r["encontrado"]) for r in resultados] == [("prod-002", False), ("prod-001", True)]
+
+    def test_obtener_productos_por_ids_error(self, app_context):
+        """Test de obtener varios productos por ID con error"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_productos_por_ids.side_effect = Exception("Error de base de datos")
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_productos_por_ids(["prod-001"])
+
+        # Assert
+        assert status_code == 500
+        assert "error" in response.get_json()
+
+    def test_planificar_asignacion(self, app_context):
+        """Test de planificar el despacho FEFO de un producto"""
+        # Arrange
+        solicitud = SolicitudAsignacion(cantidad=2, nombre="Gasa")
+        mock_use_case = MagicMock()
+        mock_use_case.planificar_asignaciones.return_value = [
+            PlanAsignacion(solicitud, "Gasa", (AsignacionLote("p1", "LOT-A", datetime(2026, 1, 1), 2),))
+        ]
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.planificar_asignacion(solicitud, 30)
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json()["completo"] is True
+        mock_use_case.planificar_asignaciones.assert_called_once_with([solicitud], 30)
+
+    def test_planificar_asignaciones(self, app_context):
+        """Test de planificar un pedido completo con una línea sin stock suficiente"""
+        # Arrange
+        solicitudes = [SolicitudAsignacion(cantidad=1, nombre="Gasa"), SolicitudAsignacion(cantidad=1, nombre="Suero")]
+        mock_use_case = MagicMock()
+        mock_use_case.planificar_asignaciones.return_value = [PlanAsignacion(s, s.nombre, ()) for s in solicitudes]
+        cmd = ProductoCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.planificar_asignaciones(solicitudes)
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json()["completo"] is False
+        assert [p["nombre"] for p in response.get_json()["planes"]] == ["Gasa", "Suero"]
+
+    def test_planificar_asignaciones_error(self, app_context):
+        """Test de error al planificar asignaciones"""
+        mock_use_case = MagicMock()
+        mock_use_case.planificar_asignaciones.side_effect = Exception("Error de base de datos")
+        cmd = ProductoCmd(mock_use_case)
+
+        assert cmd.planificar_asignaciones([])[1] == 500
+        assert cmd.planificar_asignacion(None)[1] == 500
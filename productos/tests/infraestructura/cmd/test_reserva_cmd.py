@@ -0,0 +1,125 @@
+"""
+Tests unitarios para ReservaCmd
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from src.dominio.entities.reserva import EstadoReserva, LineaReserva, Reserva
+from src.dominio.exceptions import (
+    EstadoReservaInvalidoError,
+    ProductoNoEncontradoError,
+    ReservaNoEncontradaError,
+    StockInsuficienteError,
+)
+from src.infraestructura.cmd.reserva_cmd import ReservaCmd
+
+
+@pytest.fixture
+def reserva():
+    return Reserva(
+        id="res-001",
+        estado=EstadoReserva.PENDIENTE,
+        lineas=(LineaReserva("prod-001", 2),),
+        creada_en=datetime(2025, 1, 1),
+        expira_en=datetime(2025, 1, 1, 0, 15),
+    )
+
+
+class TestReservaCmd:
+    """Tests para ReservaCmd"""
+
+    def test_reservar_exitoso(self, app_context, reserva):
+        """Test de reservar exitosamente"""
+        mock_use_case = MagicMock()
+        mock_use_case.reservar.return_value = reserva
+        cmd = ReservaCmd(mock_use_case)
+
+        response, status_code = cmd.reservar([LineaReserva("prod-001", 2)], 60)
+
+        assert status_code == 201
+        assert response.get_json()["id"] == "res-001"
+        assert response.get_json()["estado"] == "PENDIENTE"
+        mock_use_case.reservar.assert_called_once_with([LineaReserva("prod-001", 2)], 60)
+
+    def test_reservar_stock_insuficiente(self, app_context):
+        """Test de que la falta de stock responde 409 con el detalle"""
+        mock_use_case = MagicMock()
+        mock_use_case.reservar.side_effect = StockInsuficienteError("prod-001", 5, 2)
+        cmd = ReservaCmd(mock_use_case)
+
+        response, status_code = cmd.reservar([LineaReserva("prod-001", 5)])
+
+        assert status_code == 409
+        data = response.get_json()
+        assert (data["producto_id"], data["solicitada"], data["disponible"]) == ("prod-001", 5, 2)
+
+    def test_reservar_producto_no_encontrado(self, app_context):
+        """Test de reservar un producto inexistente"""
+        mock_use_case = MagicMock()
+        mock_use_case.reservar.side_effect = ProductoNoEncontradoError("prod-999")
+        cmd = ReservaCmd(mock_use_case)
+
+        response, status_code = cmd.reservar([LineaReserva("prod-999", 1)])
+
+        assert status_code == 404
+        assert response.get_json()["producto_id"] == "prod-999"
+
+    def test_reservar_error(self, app_context):
+        """Test de un error inesperado al reservar"""
+        mock_use_case = MagicMock()
+        mock_use_case.reservar.side_effect = Exception("Error de base de datos")
+        cmd = ReservaCmd(mock_use_case)
+
+        response, status_code = cmd.reservar([LineaReserva("prod-001", 1)])
+
+        assert status_code == 500
+        assert response.get_json()["error"] == "Error de base de datos"
+
+    def test_obtener_reserva(self, app_context, reserva):
+        """Test de obtener una reserva existente e inexistente"""
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_reserva.side_effect = [reserva, None]
+        cmd = ReservaCmd(mock_use_case)
+
+        assert cmd.obtener_reserva("res-001")[1] == 200
+        assert cmd.obtener_reserva("res-999")[1] == 404
+
+    def test_confirmar_reserva(self, app_context, reserva):
+        """Test de confirmar una reserva"""
+        mock_use_case = MagicMock()
+        mock_use_case.confirmar_reserva.return_value = reserva
+        cmd = ReservaCmd(mock_use_case)
+
+        response, status_code = cmd.confirmar_reserva("res-001")
+
+        assert status_code == 200
+        mock_use_case.confirmar_reserva.assert_called_once_with("res-001")
+
+    def test_confirmar_reserva_estado_invalido(self, app_context):
+        """Test de confirmar una reserva expirada"""
+        mock_use_case = MagicMock()
+        mock_use_case.confirmar_reserva.side_effect = EstadoReservaInvalidoError("res-001", "EXPIRADA")
+        cmd = ReservaCmd(mock_use_case)
+
+        response, status_code = cmd.confirmar_reserva("res-001")
+
+        assert status_code == 409
+        assert response.get_json()["estado"] == "EXPIRADA"
+
+    def test_liberar_reserva_no_encontrada(self, app_context):
+        """Test de liberar una reserva inexistente"""
+        mock_use_case = MagicMock()
+        mock_use_case.liberar_reserva.side_effect = ReservaNoEncontradaError("res-999")
+        cmd = ReservaCmd(mock_use_case)
+
+        assert cmd.liberar_reserva("res-999")[1] == 404
+
+    def test_liberar_reserva(self, app_context, reserva):
+        """Test de liberar una reserva"""
+        mock_use_case = MagicMock()
+        mock_use_case.liberar_reserva.return_value = reserva
+        cmd = ReservaCmd(mock_use_case)
+
+        assert cmd.liberar_reserva("res-001")[1] == 200
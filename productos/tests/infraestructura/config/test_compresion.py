@@ -0,0 +1,142 @@
+"""
+Tests unitarios para la compresión de respuestas
+"""
+
+import gzip
+
+import pytest
+from flask import Flask, Response, jsonify, stream_with_context
+from src.infraestructura.config import compresion
+from src.infraestructura.config.compresion import comprimir, comprimir_stream, elegir_codificacion, registrar_compresion
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+
+class TestCompresion:
+    """Tests para la compresión gzip/brotli negociada con Accept-Encoding"""
+
+    @pytest.fixture
+    def client(self):
+        app = Flask(__name__)
+        registrar_compresion(app, minimo_bytes=100)
+        productos = [{"id": f"prod-{i:03d}", "nombre": "Gasa estéril", "categoria": "insumos"} for i in range(50)]
+
+        @app.route("/productos")
+        def listado():
+            return jsonify(productos)
+
+        @app.route("/pequeno")
+        def pequeno():
+            return jsonify({"id": "prod-001"})
+
+        @app.route("/export")
+        def export():
+            def generar():
+                for producto in productos:
+                    yield f'{{"id": "{producto["id"]}"}}\n'
+
+            return Response(stream_with_context(generar()), mimetype="application/x-ndjson")
+
+        @app.route("/no-modificado")
+        def no_modificado():
+            return Response(status=304)
+
+        @app.route("/codificada")
+        def codificada():
+            respuesta = Response(gzip.compress(b"x" * 500), mimetype="application/json")
+            respuesta.headers["Content-Encoding"] = "gzip"
+            return respuesta
+
+        @app.route("/msgpack")
+        def listado_msgpack():
+            return Response(b"\x91\x81\xa2id\xa8prod-001" * 50, mimetype="application/x-msgpack")
+
+        @app.route("/binario")
+        def binario():
+            return Response(b"\x00" * 500, mimetype="application/octet-stream")
+
+        return app.test_client()
+
+    @pytest.fixture
+    def sin_brotli(self, monkeypatch):
+        monkeypatch.setattr(compresion, "brotli", None)
+
+    def test_elegir_codificacion(self, sin_brotli):
+        """Test de negociación: se respeta la calidad y q=0 excluye la codificación"""
+        assert elegir_codificacion(parse_accept_header("gzip, deflate", Accept)) == "gzip"
+        assert elegir_codificacion(parse_accept_header("*", Accept)) == "gzip"
+        assert elegir_codificacion(parse_accept_header("gzip;q=0, deflate", Accept)) is None
+        assert elegir_codificacion(parse_accept_header("br", Accept)) is None
+        assert elegir_codificacion(parse_accept_header("", Accept)) is None
+
+    def test_comprimir_stream_equivale_a_comprimir(self):
+        """Test de que comprimir por bloques produce un gzip válido con el mismo contenido"""
+        bloques = [b'{"id": 1}\n', '{"id": 2}\n', b""]
+
+        cuerpo = b"".join(comprimir_stream(iter(bloques), "gzip"))
+
+        assert gzip.decompress(cuerpo) == b'{"id": 1}\n{"id": 2}\n'
+        assert gzip.decompress(comprimir(b"abc" * 100, "gzip")) == b"abc" * 100
+
+    def test_listado_grande_se_comprime(self, client, sin_brotli):
+        """Test de que un listado JSON por encima del umbral se envía con gzip"""
+        sin_comprimir = client.get("/productos").get_data()
+
+        response = client.get("/productos", headers={"Accept-Encoding": "gzip, deflate"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) == len(response.get_data()) < len(sin_comprimir)
+        assert gzip.decompress(response.get_data()) == sin_comprimir
+
+    def test_sin_accept_encoding_no_comprime(self, client):
+        """Test de que sin Accept-Encoding el cuerpo va sin comprimir pero con Vary"""
+        response = client.get("/productos")
+
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_respuesta_pequena_no_se_comprime(self, client):
+        """Test de que los cuerpos por debajo del umbral no se comprimen"""
+        response = client.get("/pequeno", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == {"id": "prod-001"}
+
+    def test_stream_se_comprime_por_bloques(self, client, sin_brotli):
+        """Test de que las respuestas en streaming se comprimen sin Content-Length"""
+        response = client.get("/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        lineas = gzip.decompress(response.get_data()).decode().splitlines()
+        assert len(lineas) == 50
+        assert lineas[0] == '{"id": "prod-000"}'
+
+    def test_msgpack_se_comprime(self, client, sin_brotli):
+        """Test de que el listado en MessagePack entre servicios también viaja comprimido"""
+        response = client.get("/msgpack", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.get_data()) == b"\x91\x81\xa2id\xa8prod-001" * 50
+
+    @pytest.mark.parametrize("ruta", ["/no-modificado", "/codificada", "/binario"])
+    def test_respuestas_que_no_se_comprimen(self, client, ruta):
+        """Test de que 304, cuerpos ya codificados y tipos no comprimibles no se tocan"""
+        response = client.get(ruta, headers={"Accept-Encoding": "gzip"})
+
+        if ruta == "/codificada":
+            assert gzip.decompress(response.get_data()) == b"x" * 500
+        else:
+            assert "Content-Encoding" not in response.headers
+        # El 304 lleva el Vary de la respuesta completa, aunque no tenga cuerpo
+        assert ("Accept-Encoding" in response.headers.get("Vary", "")) == (ruta == "/no-modificado")
+
+    def test_brotli_preferido_si_esta_instalado(self, client):
+        """Test de que con brotli instalado se prefiere br ante igual calidad"""
+        brotli = pytest.importorskip("brotli")
+
+        response = client.get("/productos", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["Content-Encoding"] == "br"
+        assert brotli.decompress(response.get_data()) == client.get("/productos").get_data()
@@ -0,0 +1,109 @@
+"""
+Tests del enrutamiento de lecturas a réplicas de la base de datos
+"""
+
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from src.dominio.entities.producto import Producto
+from src.infraestructura.config import db as modulo_db
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.dto.cambios import SecuenciaCambiosModel, StockPendienteModel
+from src.infraestructura.dto.producto import ProductoModel
+from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+from src.infraestructura.repositorios.reserva_repository import ReservaRepositoryImpl
+
+
+def _producto(producto_id: str) -> Producto:
+    return Producto(
+        id=producto_id,
+        nombre=f"Producto {producto_id}",
+        descripcion="Descripción",
+        categoria="insumos",
+        condiciones_almacenamiento="Temperatura ambiente",
+        valor_unitario=10.0,
+        cantidad_disponible=5,
+        fecha_vencimiento=datetime(2030, 1, 1),
+        lote="LOT-REP",
+        tiempo_estimado_entrega="2 días",
+        id_proveedor="prov-001",
+        ubicacion="Bodega 1",
+    )
+
+
+class TestReplicasDeLectura:
+    """Tests de SesionConReplicas y del decorador solo_lectura"""
+
+    @pytest.fixture
+    def app(self, tmp_path, monkeypatch):
+        """Primaria y réplica en archivos distintos, con un producto distinto en cada una"""
+        monkeypatch.setattr(modulo_db, "_ultima_escritura", float("-inf"))
+        # init_app registra un MetaData por bind; se descarta al terminar para no afectar a los demás tests
+        monkeypatch.setattr(db_productos, "metadatas", dict(db_productos.metadatas))
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'primaria.db'}"
+        app.config["SQLALCHEMY_BINDS"] = {"replica_1": f"sqlite:///{tmp_path / 'replica.db'}"}
+        app.config["REPLICAS_VENTANA_SEGUNDOS"] = 0
+        init_db_productos(app)
+
+        with app.app_context():
+            for clave, producto_id in ((None, "en-primaria"), ("replica_1", "en-replica")):
+                engine = db_productos.engines[clave]
+                db_productos.metadata.create_all(engine)
+                with engine.begin() as conexion:
+                    conexion.execute(ProductoModel.__table__.insert(), [_producto(producto_id).to_dict()])
+        return app
+
+    def _ids(self, productos):
+        return [producto.id for producto in productos]
+
+    def test_lecturas_marcadas_van_a_la_replica(self, app):
+        """Test de que los métodos @solo_lectura leen de la réplica y los demás de la primaria"""
+        repository = ProductoRepositoryImpl()
+        with app.app_context():
+            assert self._ids(repository.obtener_todos()) == ["en-replica"]
+            assert [fila[0] for fila in repository.iterar_filas(["id"], 10)] == ["en-replica"]
+            # Sin marcar: el stock de los lotes debe estar al día
+            lotes = repository.obtener_lotes_disponibles(["Producto en-primaria"], datetime(2020, 1, 1))
+            assert list(lotes) == ["Producto en-primaria"]
+
+    def test_version_del_catalogo_se_lee_de_la_primaria(self, app):
+        """Test de que la versión del ETag no sale de una réplica, que puede ir atrasada"""
+        with app.app_context():
+            with db_productos.engines["replica_1"].begin() as conexion:
+                conexion.execute(SecuenciaCambiosModel.__table__.update().values(valor=99))
+
+            assert ProductoRepositoryImpl().version_catalogo() == "1"
+
+    def test_escrituras_van_a_la_primaria_y_la_sesion_lee_lo_escrito(self, app):
+        """Test de que una escritura va a la primaria y la misma sesión deja de leer de la réplica"""
+        repository = ProductoRepositoryImpl()
+        with app.app_context():
+            repository.guardar_lote([_producto("nuevo")])
+
+            assert self._ids(repository.obtener_todos()) == ["en-primaria", "nuevo"]
+
+    def test_escrituras_de_core_marcan_la_sesion(self, app):
+        """Test de que publicar el stock pendiente, que escribe con Core, deja la sesión leyendo de la primaria"""
+        repository = ProductoRepositoryImpl()
+        with app.app_context():
+            with db_productos.engines[None].begin() as conexion:
+                conexion.execute(StockPendienteModel.__table__.insert().values(producto_id="en-primaria"))
+
+            assert ReservaRepositoryImpl().publicar_stock_pendiente(10) == 1
+            assert self._ids(repository.obtener_todos()) == ["en-primaria"]
+
+    def test_ventana_tras_escribir_lee_de_la_primaria(self, app):
+        """Test de que otras sesiones del proceso leen de la primaria durante la ventana tras un commit"""
+        repository = ProductoRepositoryImpl()
+        app.config["REPLICAS_VENTANA_SEGUNDOS"] = 60
+        with app.app_context():
+            repository.guardar_lote([_producto("nuevo")])
+
+        with app.app_context():
+            assert "nuevo" in self._ids(repository.obtener_todos())
+
+        app.config["REPLICAS_VENTANA_SEGUNDOS"] = 0
+        with app.app_context():
+            assert self._ids(repository.obtener_todos()) == ["en-replica"]
@@ -0,0 +1,137 @@
+"""
+Tests unitarios para las métricas de /metrics
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+from src.infraestructura.config import metricas
+from src.infraestructura.config.metricas import RegistroMetricas, etiquetar_consultas, registrar_metricas
+
+
+@etiquetar_consultas
+class _RepositorioDePrueba:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def contar(self) -> int:
+        with self.engine.connect() as conexion:
+            return conexion.execute(text("SELECT 1")).scalar() + self.contar_otra_vez()
+
+    def contar_otra_vez(self) -> int:
+        with self.engine.connect() as conexion:
+            return conexion.execute(text("SELECT 1")).scalar()
+
+
+class TestMetricas:
+    """Tests del registro sin locks, la exposición en texto y la suma entre procesos"""
+
+    def _crear_app(self) -> Flask:
+        app = Flask(__name__)
+        registrar_metricas(app)
+
+        @app.route("/productos/<producto_id>")
+        def obtener(producto_id):
+            return {"id": producto_id}
+
+        return app
+
+    def test_metrics_por_regla_de_ruta(self):
+        """Test de que /metrics etiqueta por la regla de Flask y agrupa las peticiones sin regla"""
+        cliente = self._crear_app().test_client()
+        antes = metricas.PETICIONES.valores().get(("GET", "/productos/<producto_id>", "200"), 0)
+
+        cliente.get("/productos/prod-1")
+        cliente.get("/productos/prod-2")
+        cliente.get("/no-existe")
+        texto = cliente.get("/metrics").get_data(as_text=True)
+
+        assert metricas.PETICIONES.valores()[("GET", "/productos/<producto_id>", "200")] == antes + 2
+        assert 'http_peticiones_total{metodo="GET",ruta="sin_ruta",estado="404"}' in texto
+        assert "# TYPE http_peticion_duracion_segundos histogram" in texto
+        assert 'http_peticion_duracion_segundos_bucket{metodo="GET",ruta="/productos/<producto_id>",le="+Inf"}' in texto
+        # La propia petición a /metrics está en curso mientras se genera el texto
+        assert "http_peticiones_en_curso 1\n" in texto
+
+    def test_metrics_con_token(self):
+        """Test de que con token /metrics exige Authorization: Bearer y responde 401 sin él"""
+        app = Flask(__name__)
+        registrar_metricas(app, token="secreto")
+        cliente = app.test_client()
+
+        sin_token = cliente.get("/metrics")
+        assert sin_token.status_code == 401
+        assert sin_token.headers["WWW-Authenticate"] == "Bearer"
+        assert cliente.get("/metrics", headers={"Authorization": "Basic secreto"}).status_code == 401
+        assert cliente.get("/metrics", headers={"Authorization": "Bearer secreto"}).status_code == 200
+
+    def test_metrics_sin_exponer(self):
+        """Test de que sin exponer se mide cada petición pero no se registra /metrics"""
+        app = Flask(__name__)
+        registrar_metricas(app, exponer=False)
+        antes = metricas.PETICIONES.valores().get(("GET", "sin_ruta", "404"), 0)
+
+        assert app.test_client().get("/metrics").status_code == 404
+        assert metricas.PETICIONES.valores()[("GET", "sin_ruta", "404")] == antes + 1
+
+    def test_registro_concurrente_sin_perdidas(self):
+        """Test de que los incrementos de varios hilos se suman exactos sin lock en el registro"""
+        registro = RegistroMetricas()
+        contador = registro.contador("pruebas_total", "Pruebas", ("resultado",))
+        histograma = registro.histograma("prueba_segundos", "Pruebas", (), (0.1, 1.0))
+
+        def registrar():
+            for _ in range(5000):
+                contador.inc("ok")
+                histograma.observar(0.5)
+
+        hilos = [threading.Thread(target=registrar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert contador.valores() == {("ok",): 40000}
+        assert histograma.valores()[()] == [0, 40000, 0, 20000.0]
+
+    def test_consultas_por_metodo_de_repositorio(self):
+        """Test de que las consultas se etiquetan con el método que llamó el servicio, no con los internos"""
+        self._crear_app()
+        repositorio = _RepositorioDePrueba(create_engine("sqlite://"))
+
+        assert repositorio.contar() == 2
+
+        serie = metricas.DURACION_CONSULTAS.valores()[("_RepositorioDePrueba.contar",)]
+        assert sum(serie[:-1]) == 2
+        assert ("_RepositorioDePrueba.contar_otra_vez",) not in metricas.DURACION_CONSULTAS.valores()
+
+    def test_suma_de_workers_y_acumulado_de_los_terminados(self, tmp_path):
+        """Test de que /metrics suma los archivos de otros workers y acumula los de los terminados"""
+        terminado = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+        pid_terminado = int(terminado.stdout)
+        registro = RegistroMetricas()
+        contador = registro.contador("pruebas_total", "Pruebas")
+        en_curso = registro.indicador("pruebas_en_curso", "Pruebas")
+        contador.inc(cantidad=1)
+        otro = {
+            "pruebas_total": {"tipo": "counter", "valores": [[[], 10]]},
+            "pruebas_en_curso": {"tipo": "gauge", "valores": [[[], 3]]},
+        }
+        (tmp_path / f"{os.getppid()}.json").write_text(json.dumps(otro))
+        (tmp_path / f"{pid_terminado}.json").write_text(json.dumps(otro))
+        registro._directorio = str(tmp_path)
+
+        texto = registro.exponer()
+
+        assert "pruebas_total 21\n" in texto
+        # Las peticiones en curso de un worker terminado no cuentan
+        assert "pruebas_en_curso 3\n" in texto
+        assert not (tmp_path / f"{pid_terminado}.json").exists()
+        assert registro.exponer() == texto
+        en_curso.inc()
+        assert "pruebas_en_curso 4\n" in registro.exponer()
@@ -0,0 +1,79 @@
+"""
+Tests unitarios para las opciones del motor de base de datos
+"""
+
+import pytest
+from src.infraestructura.config.motor import binds_replicas, normalizar_uri, opciones_motor
+
+
+class TestMotor:
+    """Tests para el pool y el statement timeout según el backend"""
+
+    @pytest.mark.parametrize(
+        "uri, esperada",
+        [
+            ("postgres://u:p@db/productos", "postgresql+psycopg2://u:p@db/productos"),
+            ("postgresql://u:p@db/productos", "postgresql+psycopg2://u:p@db/productos"),
+            ("postgresql+psycopg://u:p@db/productos", "postgresql+psycopg://u:p@db/productos"),
+            ("sqlite:///productos.db", "sqlite:///productos.db"),
+        ],
+    )
+    def test_normalizar_uri(self, uri, esperada):
+        """Test de que las URIs de PostgreSQL sin driver usan psycopg2 y las demás no cambian"""
+        assert normalizar_uri(uri) == esperada
+
+    def test_sqlite_sin_opciones_de_pool(self):
+        """Test de que SQLite no recibe opciones de pool (en memoria ni siquiera las admite)"""
+        assert opciones_motor("sqlite:///:memory:", {"DB_POOL_SIZE": "20"}) == {}
+
+    def test_postgresql_por_defecto(self):
+        """Test de los valores por defecto del pool y del statement timeout"""
+        assert opciones_motor("postgresql+psycopg2://u:p@db/productos", {}) == {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "connect_args": {"options": "-c statement_timeout=30000"},
+        }
+
+    def test_postgresql_desde_entorno(self):
+        """Test de que las variables de entorno sobrescriben el pool y 0 desactiva el statement timeout"""
+        entorno = {
+            "DB_POOL_SIZE": "20",
+            "DB_MAX_OVERFLOW": "0",
+            "DB_POOL_PRE_PING": "false",
+            "DB_POOL_RECYCLE": "300",
+            "DB_STATEMENT_TIMEOUT_MS": "0",
+        }
+
+        opciones = opciones_motor("postgresql+psycopg2://u:p@db/productos", entorno)
+
+        assert opciones["pool_size"] == 20
+        assert opciones["max_overflow"] == 0
+        assert opciones["pool_pre_ping"] is False
+        assert opciones["pool_recycle"] == 300
+        assert "connect_args" not in opciones
+
+    @pytest.mark.parametrize("entorno", [{"DB_POOL_SIZE": "muchas"}, {"DB_POOL_PRE_PING": "quizas"}])
+    def test_valores_invalidos(self, entorno):
+        """Test de que un valor inválido falla al arrancar con el nombre de la variable"""
+        with pytest.raises(ValueError, match=next(iter(entorno))):
+            opciones_motor("postgresql+psycopg2://u:p@db/productos", entorno)
+
+    def test_binds_replicas(self):
+        """Test de un bind por réplica, con la réplica de PostgreSQL en transacciones de solo lectura"""
+        binds = binds_replicas(
+            {
+                "DATABASE_REPLICA_URLS": "postgres://u:p@replica1/productos, sqlite:///replica.db,",
+                "DB_STATEMENT_TIMEOUT_MS": "5000",
+            }
+        )
+
+        assert list(binds) == ["replica_1", "replica_2"]
+        assert binds["replica_1"]["url"] == "postgresql+psycopg2://u:p@replica1/productos"
+        assert binds["replica_1"]["connect_args"] == {
+            "options": "-c statement_timeout=5000 -c default_transaction_read_only=on"
+        }
+        assert binds["replica_2"] == {"url": "sqlite:///replica.db"}
+        assert binds_replicas({}) == {}
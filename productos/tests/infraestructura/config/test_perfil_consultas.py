@@ -0,0 +1,104 @@
+"""
+Tests unitarios para el perfil de consultas SQL por petición
+"""
+
+import logging
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from src.infraestructura.config import perfil_consultas
+from src.infraestructura.config.metricas import etiquetar_consultas
+from src.infraestructura.config.perfil_consultas import registrar_perfil_consultas
+
+
+@etiquetar_consultas
+class _RepositorioDePrueba:
+    def __init__(self, engine):
+        self.engine = engine
+        with engine.begin() as conexion:
+            conexion.execute(text("CREATE TABLE productos (id INTEGER PRIMARY KEY, categoria TEXT)"))
+            conexion.execute(text("CREATE INDEX ix_productos_categoria ON productos (categoria)"))
+
+    def por_categoria(self, categoria: str) -> list:
+        with self.engine.connect() as conexion:
+            return conexion.execute(text("SELECT id FROM productos WHERE categoria = :c"), {"c": categoria}).all()
+
+    def por_id(self, producto_id: int) -> list:
+        with self.engine.connect() as conexion:
+            return conexion.execute(text("SELECT id FROM productos WHERE id = :id"), {"id": producto_id}).all()
+
+
+class TestPerfilConsultas:
+    """Tests de las cabeceras de debug, las métricas por petición, el aviso de N+1 y las consultas lentas"""
+
+    @pytest.fixture(autouse=True)
+    def ajustes(self, monkeypatch):
+        # Los umbrales son del proceso: cada test deja los de la suite como estaban
+        monkeypatch.setattr(perfil_consultas, "_ajustes", perfil_consultas._Ajustes())
+
+    def _crear_app(self, umbral_lenta_ms=0, umbral_repeticiones=0, cabeceras=True) -> Flask:
+        app = Flask(__name__)
+        registrar_perfil_consultas(app, umbral_lenta_ms, umbral_repeticiones, cabeceras)
+        repositorio = _RepositorioDePrueba(create_engine("sqlite://"))
+
+        @app.route("/productos")
+        def listar():
+            ids = [fila.id for fila in repositorio.por_categoria("frio")]
+            # N+1: una consulta por cada producto además de la del listado
+            for producto_id in range(5):
+                repositorio.por_id(producto_id)
+            return {"ids": ids}
+
+        return app
+
+    def test_cabeceras_y_metricas_por_peticion(self):
+        """Test de que la petición devuelve sus consultas en cabeceras y las publica por ruta"""
+        antes = perfil_consultas.CONSULTAS_POR_PETICION.valores().get(("/productos",), [0] * 11)
+        cliente = self._crear_app().test_client()
+
+        respuesta = cliente.get("/productos")
+
+        assert respuesta.headers["X-Consultas-SQL"] == "6"
+        assert float(respuesta.headers["X-Tiempo-SQL-Ms"]) > 0
+        assert respuesta.headers["Server-Timing"].startswith("db;dur=")
+        lentas = respuesta.headers["X-Consultas-SQL-Lentas"].split(", ")
+        assert len(lentas) == 3
+        assert all(lenta.endswith(("_RepositorioDePrueba.por_id", "_RepositorioDePrueba.por_categoria")) for lenta in lentas)
+        despues = perfil_consultas.CONSULTAS_POR_PETICION.valores()[("/productos",)]
+        # 6 consultas caen en la cubeta le="10"
+        assert despues[5] == antes[5] + 1
+
+    def test_sin_cabeceras_fuera_de_debug(self):
+        """Test de que sin modo debug la respuesta no lleva el perfil"""
+        respuesta = self._crear_app(cabeceras=False).test_client().get("/productos")
+
+        assert "X-Consultas-SQL" not in respuesta.headers
+        assert "Server-Timing" not in respuesta.headers
+
+    def test_aviso_de_consulta_repetida(self, caplog):
+        """Test de que una consulta repetida umbral_repeticiones veces se avisa como posible N+1"""
+        antes = perfil_consultas.CONSULTAS_REPETIDAS.valores().get(("/productos", "_RepositorioDePrueba.por_id"), 0)
+        cliente = self._crear_app(umbral_repeticiones=5).test_client()
+
+        with caplog.at_level(logging.WARNING, logger=perfil_consultas.__name__):
+            cliente.get("/productos")
+
+        (aviso,) = [registro.getMessage() for registro in caplog.records]
+        assert "Posible N+1 en GET /productos: _RepositorioDePrueba.por_id repitió 5 veces" in aviso
+        assert perfil_consultas.CONSULTAS_REPETIDAS.valores()[("/productos", "_RepositorioDePrueba.por_id")] == antes + 1
+
+    def test_consulta_lenta_con_su_plan(self, caplog):
+        """Test de que una consulta sobre el umbral se registra con su EXPLAIN QUERY PLAN"""
+        cliente = self._crear_app(umbral_lenta_ms=1e-6).test_client()
+
+        with caplog.at_level(logging.WARNING, logger=perfil_consultas.__name__):
+            cliente.get("/productos")
+
+        avisos = [registro.getMessage() for registro in caplog.records]
+        (categoria,) = [aviso for aviso in avisos if "WHERE categoria" in aviso]
+        assert "en _RepositorioDePrueba.por_categoria" in categoria
+        assert "USING COVERING INDEX ix_productos_categoria" in categoria
+        assert len([aviso for aviso in avisos if "Plan:\nSEARCH productos" in aviso]) == 6
+        # Fuera de la petición también se avisa; el DDL no tiene plan
+        assert "CREATE INDEX" in avisos[1] and avisos[1].endswith("(sin plan)")
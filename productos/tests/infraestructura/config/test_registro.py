@@ -0,0 +1,132 @@
+"""
+Tests unitarios para el registro de accesos en JSON
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+from flask import Flask, Response, jsonify
+from src.infraestructura.config import registro
+from src.infraestructura.config.registro import (
+    FormateadorJson,
+    configurar_registro_asincrono,
+    leer_muestreo,
+    registrar_accesos,
+)
+
+
+class _Lista(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.registros = []
+
+    def emit(self, record):
+        self.registros.append(record)
+
+
+class TestRegistro:
+    """Tests del formateador JSON, la cola de registros y el muestreo de accesos"""
+
+    @pytest.fixture
+    def accesos(self):
+        """Registros del logger request_logger, sin la cola para leerlos en el mismo hilo"""
+        logger = logging.getLogger("request_logger")
+        manejadores, nivel = logger.handlers[:], logger.level
+        lista = _Lista()
+        logger.handlers = [lista]
+        logger.setLevel(logging.INFO)
+        yield lista.registros
+        logger.handlers, logger.level = manejadores, nivel
+
+    def _crear_app(self, muestreo=None) -> Flask:
+        app = Flask(__name__)
+        registrar_accesos(app, muestreo or {})
+
+        @app.route("/productos")
+        def productos():
+            return jsonify([{"id": "prod-1"}])
+
+        @app.route("/productos/export")
+        def exportar():
+            return Response((linea for linea in ("a\n", "b\n")), mimetype="text/csv")
+
+        @app.route("/health")
+        def health():
+            return {"status": "healthy"}
+
+        return app
+
+    def test_formateador_json_incluye_campos_extra(self):
+        """Test de que cada registro es un objeto JSON con los campos pasados en extra"""
+        record = logging.LogRecord("request_logger", logging.INFO, __file__, 1, "GET %s", ("/productos",), None)
+        record.estado = 200
+
+        datos = json.loads(FormateadorJson().format(record))
+
+        assert datos["mensaje"] == "GET /productos"
+        assert datos["nivel"] == "INFO"
+        assert datos["estado"] == 200
+        assert datos["fecha"].endswith("+00:00")
+
+    def test_acceso_con_content_length_y_streaming_sin_leer(self, accesos):
+        """Test de que el tamaño sale de Content-Length y las respuestas en streaming no se leen"""
+        cliente = self._crear_app().test_client()
+
+        respuesta = cliente.get("/productos")
+        cliente.get("/productos/export")
+
+        listado, exportacion = accesos
+        assert (listado.metodo, listado.ruta, listado.estado) == ("GET", "/productos", 200)
+        assert listado.bytes == len(respuesta.data)
+        assert listado.duracion_ms >= 0
+        assert exportacion.bytes is None
+
+    def test_muestreo_por_prefijo_y_errores_siempre(self, accesos):
+        """Test de que las rutas muestreadas se omiten y sus errores se registran igual"""
+        cliente = self._crear_app({"/health": 0.0, "/productos": 0.0, "/productos/export": 1.0}).test_client()
+
+        cliente.get("/health")
+        cliente.get("/productos")
+        cliente.get("/productos/export")
+        cliente.get("/health/no-existe")
+
+        assert [(r.ruta, r.estado) for r in accesos] == [("/productos/export", 200), ("/health/no-existe", 404)]
+        assert accesos[1].muestreo == 0.0
+
+    @pytest.mark.parametrize("valor", ["/health", "health:0", "/health:2", "/health:mucho"])
+    def test_muestreo_invalido(self, valor):
+        """Test de que un muestreo mal escrito falla al arrancar"""
+        with pytest.raises(ValueError, match="REGISTRO_ACCESOS_MUESTREO"):
+            leer_muestreo(valor)
+
+    def test_registro_asincrono_escribe_json_desde_otro_hilo(self, capsys):
+        """Test de que el logger solo encola y el listener escribe el JSON en stderr"""
+        logger = logging.getLogger("test_registro_asincrono")
+        configurar_registro_asincrono(logger, logging.INFO)
+        configurar_registro_asincrono(logger, logging.INFO)
+        manejador, oyente = registro._oyentes[-1]
+        try:
+            assert logger.handlers == [manejador]
+            logger.info("hola", extra={"estado": 201})
+        finally:
+            oyente.stop()
+            logger.removeHandler(manejador)
+            registro._oyentes.remove((manejador, oyente))
+
+        assert json.loads(capsys.readouterr().err)["estado"] == 201
+
+    def test_cola_llena_descarta_sin_bloquear(self):
+        """Test de que con la cola llena el registro se descarta en lugar de esperar"""
+        manejador = registro._ManejadorCola(queue.Queue(1))
+        logger = logging.getLogger("test_cola_llena")
+        logger.addHandler(manejador)
+        try:
+            logger.warning("primero")
+            logger.warning("segundo")
+        finally:
+            logger.removeHandler(manejador)
+
+        assert manejador.queue.qsize() == 1
+        assert manejador.descartados == 1
@@ -0,0 +1,101 @@
+"""
+Tests unitarios para la configuración de gunicorn
+"""
+
+import json
+import os
+import runpy
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+from src.infraestructura.config import servidor
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.config.metricas import RegistroMetricas
+
+
+def _cargar(monkeypatch, **entorno):
+    """Ejecuta el archivo de configuración como lo hace gunicorn, con las variables indicadas"""
+    for variable in ("GUNICORN_BIND", "GUNICORN_WORKERS", "GUNICORN_PRELOAD", "HOST", "PORT"):
+        monkeypatch.delenv(variable, raising=False)
+    for variable, valor in entorno.items():
+        monkeypatch.setenv(variable, valor)
+    return runpy.run_path(servidor.__file__)
+
+
+class TestServidor:
+    """Tests de los valores de gunicorn y de los hooks de los workers"""
+
+    def test_valores_por_defecto(self, monkeypatch):
+        """Test de un worker gthread por CPU, preload y reciclado con jitter"""
+        monkeypatch.setattr("multiprocessing.cpu_count", lambda: 6)
+
+        configuracion = _cargar(monkeypatch, PORT="5002")
+
+        assert configuracion["bind"] == "0.0.0.0:5002"
+        assert configuracion["workers"] == 6
+        assert configuracion["worker_class"] == "gthread"
+        assert configuracion["threads"] == 4
+        assert configuracion["preload_app"] is True
+        assert configuracion["max_requests"] == 10000
+        assert configuracion["max_requests_jitter"] == 1000
+
+    def test_valores_desde_entorno(self, monkeypatch):
+        """Test de que las variables de entorno sobrescriben los valores por defecto"""
+        configuracion = _cargar(
+            monkeypatch, GUNICORN_BIND="unix:/tmp/productos.sock", GUNICORN_WORKERS="3", GUNICORN_PRELOAD="false"
+        )
+
+        assert configuracion["bind"] == "unix:/tmp/productos.sock"
+        assert configuracion["workers"] == 3
+        assert configuracion["preload_app"] is False
+
+    def test_valor_invalido(self, monkeypatch):
+        """Test de que un valor inválido falla al arrancar"""
+        with pytest.raises(ValueError, match="GUNICORN_WORKERS"):
+            _cargar(monkeypatch, GUNICORN_WORKERS="todos")
+
+    def test_hooks_del_worker(self, tmp_path, monkeypatch):
+        """Test de que el worker descarta las conexiones heredadas e inicia y detiene sus tareas"""
+        monkeypatch.setattr(db_productos, "metadatas", dict(db_productos.metadatas))
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'productos.db'}"
+        init_db_productos(app)
+        tareas = Mock()
+        app.extensions["tareas_en_segundo_plano"] = tareas
+        with app.app_context():
+            with db_productos.engine.connect() as conexion:
+                conexion.execute(text("SELECT 1"))
+            assert db_productos.engine.pool.checkedin() == 1
+        worker = SimpleNamespace(wsgi=app)
+
+        servidor.post_worker_init(worker)
+
+        with app.app_context():
+            assert db_productos.engine.pool.checkedin() == 0
+        tareas.start_background_tasks.assert_called_once_with()
+
+        servidor.worker_exit(None, worker)
+
+        tareas.stop_background_tasks.assert_called_once_with(servidor.graceful_timeout)
+
+    def test_volcado_de_metricas_del_worker(self, tmp_path, monkeypatch):
+        """Test de que el master descarta métricas viejas y el worker al terminar deja las acumulables, sin las en curso"""
+        monkeypatch.setenv("METRICAS_DIRECTORIO", str(tmp_path))
+        (tmp_path / "12345.json").write_text("{}")
+        registro = RegistroMetricas()
+        registro.contador("pruebas_total", "Pruebas").inc()
+        registro.indicador("pruebas_en_curso", "Pruebas").inc()
+        app = Flask(__name__)
+        app.extensions["metricas"] = registro
+        worker = SimpleNamespace(wsgi=app)
+
+        servidor.on_starting(None)
+        servidor.post_worker_init(worker)
+        servidor.worker_exit(None, worker)
+
+        assert sorted(os.listdir(tmp_path)) == [f"{os.getpid()}.json"]
+        datos = json.loads((tmp_path / f"{os.getpid()}.json").read_text())
+        assert datos == {"pruebas_total": {"tipo": "counter", "valores": [[[], 1]]}}
@@ -0,0 +1,116 @@
+"""
+Tests unitarios para los pragmas de SQLite
+"""
+
+import logging
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+from src.infraestructura.config.sqlite import configurar_sqlite, leer_pragmas_sqlite, pragmas_sqlite
+
+
+class TestSqlite:
+    """Tests para la configuración por conexión de los motores SQLite"""
+
+    def _crear_app(self, uri: str, pragmas=None):
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = uri
+        if pragmas is not None:
+            app.config["SQLITE_PRAGMAS"] = pragmas
+        db = SQLAlchemy()
+        db.init_app(app)
+        return app, db
+
+    def test_pragmas_por_defecto(self):
+        """Test de los valores por defecto: WAL, NORMAL, 64 MiB de cache, mmap y temp_store en memoria"""
+        assert pragmas_sqlite({}) == {
+            "busy_timeout": "5000",
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": "-65536",
+            "mmap_size": "268435456",
+            "temp_store": "MEMORY",
+        }
+
+    def test_pragmas_desde_entorno(self):
+        """Test de que las variables de entorno sobrescriben los valores por defecto"""
+        pragmas = pragmas_sqlite({"SQLITE_SYNCHRONOUS": "full", "SQLITE_BUSY_TIMEOUT_MS": " 250 "})
+
+        assert pragmas["synchronous"] == "FULL"
+        assert pragmas["busy_timeout"] == "250"
+        assert pragmas["journal_mode"] == "WAL"
+
+    @pytest.mark.parametrize(
+        "entorno, mensaje",
+        [
+            ({"SQLITE_JOURNAL_MODE": "WAL; DROP TABLE productos"}, "SQLITE_JOURNAL_MODE"),
+            ({"SQLITE_CACHE_SIZE": "mucho"}, "SQLITE_CACHE_SIZE"),
+        ],
+    )
+    def test_pragmas_invalidos(self, entorno, mensaje):
+        """Test de que un valor inválido falla al arrancar en lugar de llegar al SQL"""
+        with pytest.raises(ValueError, match=mensaje):
+            pragmas_sqlite(entorno)
+
+    def test_configurar_sqlite_aplica_pragmas_en_cada_conexion(self, tmp_path, caplog):
+        """Test de que los pragmas quedan activos en conexiones nuevas y se verifican al arrancar"""
+        pragmas = pragmas_sqlite({})
+        app, db = self._crear_app(f"sqlite:///{tmp_path / 'productos.db'}", pragmas)
+
+        with caplog.at_level(logging.INFO, logger="src.infraestructura.config.sqlite"):
+            configurar_sqlite(app, db)
+
+        assert "pragmas activos" in caplog.text
+        with app.app_context():
+            # Tras vaciar el pool la lectura usa una conexión nueva
+            db.engine.dispose()
+            assert leer_pragmas_sqlite(db.engine, pragmas) == pragmas
+
+    def test_wal_lector_no_bloquea_escritor(self, tmp_path):
+        """Test de que con WAL una lectura abierta no bloquea un commit de otra conexión"""
+        pragmas = {**pragmas_sqlite({}), "busy_timeout": "100"}
+        app, db = self._crear_app(f"sqlite:///{tmp_path / 'productos.db'}", pragmas)
+        configurar_sqlite(app, db)
+
+        with app.app_context():
+            with db.engine.begin() as conexion:
+                conexion.exec_driver_sql("CREATE TABLE stock (cantidad INTEGER)")
+                conexion.exec_driver_sql("INSERT INTO stock VALUES (1)")
+
+            with db.engine.connect() as lector, db.engine.connect() as escritor:
+                lector.exec_driver_sql("BEGIN")
+                assert lector.exec_driver_sql("SELECT cantidad FROM stock").scalar() == 1
+
+                escritor.exec_driver_sql("UPDATE stock SET cantidad = 2")
+                escritor.commit()
+
+                # El lector conserva su snapshot hasta terminar la transacción
+                assert lector.exec_driver_sql("SELECT cantidad FROM stock").scalar() == 1
+                lector.rollback()
+
+    def test_configurar_sqlite_avisa_pragmas_no_aplicados(self, tmp_path, caplog):
+        """Test de que la verificación avisa si SQLite no aplicó un pragma pedido"""
+        pragmas = {**pragmas_sqlite({}), "mmap_size": str(2**62)}
+        app, db = self._crear_app(f"sqlite:///{tmp_path / 'productos.db'}", pragmas)
+
+        with caplog.at_level(logging.WARNING, logger="src.infraestructura.config.sqlite"):
+            configurar_sqlite(app, db)
+
+        assert "pragmas no aplicados" in caplog.text
+        assert "mmap_size" in caplog.text
+
+    def test_configurar_sqlite_en_memoria(self, caplog):
+        """Test de que en memoria los pragmas se aplican pero no se verifican"""
+        app, db = self._crear_app("sqlite:///:memory:")
+
+        with caplog.at_level(logging.INFO, logger="src.infraestructura.config.sqlite"):
+            configurar_sqlite(app, db)
+
+        assert app.config["SQLITE_PRAGMAS"] == pragmas_sqlite()
+        assert caplog.text == ""
+        with app.app_context():
+            assert db.session.execute(text("PRAGMA busy_timeout")).scalar() == int(
+                app.config["SQLITE_PRAGMAS"]["busy_timeout"]
+            )
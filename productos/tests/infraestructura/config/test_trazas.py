@@ -0,0 +1,153 @@
+"""
+Tests unitarios para las trazas distribuidas (W3C traceparent)
+"""
+
+import json
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import create_engine, text
+from src.infraestructura.config.metricas import etiquetar_consultas
+from src.infraestructura.config.trazas import (
+    ExportadorArchivo,
+    ExportadorMemoria,
+    crear_exportador,
+    leer_traceparent,
+    registrar_trazas,
+    trazar,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PADRE_ID = "00f067aa0ba902b7"
+
+
+@etiquetar_consultas
+class _RepositorioDePrueba:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def contar(self) -> int:
+        with self.engine.connect() as conexion:
+            return conexion.execute(text("SELECT 1")).scalar()
+
+
+class _ExportadorPropio(ExportadorMemoria):
+    pass
+
+
+class TestTrazas:
+    """Tests de la propagación de traceparent, los spans de cada petición y los exportadores"""
+
+    def _crear_app(self, exportador, muestreo: float = 1.0) -> Flask:
+        app = Flask(__name__)
+        registrar_trazas(app, exportador, muestreo)
+        repositorio = _RepositorioDePrueba(create_engine("sqlite://"))
+        autorizar = trazar("autorizacion")(lambda: True)
+
+        @app.route("/productos/<producto_id>")
+        def obtener(producto_id):
+            autorizar()
+            return jsonify({"id": producto_id, "total": repositorio.contar()})
+
+        @app.route("/falla")
+        def falla():
+            raise RuntimeError("sin conexión")
+
+        return app
+
+    @pytest.mark.parametrize(
+        "valor, esperado",
+        [
+            (f"00-{TRACE_ID}-{PADRE_ID}-01", (TRACE_ID, PADRE_ID, True)),
+            (f"00-{TRACE_ID}-{PADRE_ID}-00", (TRACE_ID, PADRE_ID, False)),
+            # Una versión futura puede añadir campos al final
+            (f"01-{TRACE_ID}-{PADRE_ID}-01-extra", (TRACE_ID, PADRE_ID, True)),
+            (f"00-{TRACE_ID}-{PADRE_ID}-01-extra", None),
+            (f"ff-{TRACE_ID}-{PADRE_ID}-01", None),
+            (f"00-{'0' * 32}-{PADRE_ID}-01", None),
+            (f"00-{TRACE_ID.upper()}-{PADRE_ID}-01", None),
+            (f"00-{TRACE_ID}-{PADRE_ID[:-1]}-01", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_leer_traceparent(self, valor, esperado):
+        """Test de que solo se acepta un traceparent válido según W3C Trace Context"""
+        assert leer_traceparent(valor) == esperado
+
+    def test_continua_la_traza_del_gateway(self):
+        """Test de que la petición, la autorización, la consulta y la serialización forman una traza hija del traceparent"""
+        exportador = ExportadorMemoria()
+        cliente = self._crear_app(exportador).test_client()
+
+        respuesta = cliente.get("/productos/prod-1", headers={"traceparent": f"00-{TRACE_ID}-{PADRE_ID}-01"})
+
+        assert respuesta.get_json() == {"id": "prod-1", "total": 1}
+        spans = {span.nombre: span for span in exportador.spans}
+        assert set(spans) == {"GET /productos/<producto_id>", "autorizacion", "db.consulta", "serializacion"}
+        raiz = spans["GET /productos/<producto_id>"]
+        assert raiz.padre_id == PADRE_ID
+        assert raiz.atributos == {"http.metodo": "GET", "http.ruta": "/productos/<producto_id>", "http.estado": 200}
+        assert all(span.trace_id == TRACE_ID for span in exportador.spans)
+        assert all(spans[nombre].padre_id == raiz.span_id for nombre in ("autorizacion", "db.consulta", "serializacion"))
+        assert spans["db.consulta"].atributos == {"db.metodo": "_RepositorioDePrueba.contar", "db.sql": "SELECT 1"}
+        assert all(span.duracion >= 0 for span in exportador.spans)
+
+    def test_sin_traceparent_empieza_una_traza_nueva(self):
+        """Test de que cada petición sin traceparent es una traza nueva con su propio id"""
+        exportador = ExportadorMemoria()
+        cliente = self._crear_app(exportador).test_client()
+
+        cliente.get("/productos/prod-1")
+        cliente.get("/productos/prod-2")
+
+        raices = [span for span in exportador.spans if span.padre_id is None]
+        assert len(raices) == 2
+        assert raices[0].trace_id != raices[1].trace_id
+        assert len(raices[0].trace_id) == 32
+
+    def test_respeta_la_decision_de_muestreo(self):
+        """Test de que no se exporta nada de las trazas no muestreadas aquí ni en quien las empezó"""
+        exportador = ExportadorMemoria()
+        cliente = self._crear_app(exportador).test_client()
+        sin_muestreo = self._crear_app(exportador, muestreo=0).test_client()
+
+        cliente.get("/productos/prod-1", headers={"traceparent": f"00-{TRACE_ID}-{PADRE_ID}-00"})
+        sin_muestreo.get("/productos/prod-1")
+        sin_muestreo.get("/productos/prod-1", headers={"traceparent": f"00-{TRACE_ID}-{PADRE_ID}-01"})
+
+        assert {span.trace_id for span in exportador.spans} == {TRACE_ID}
+        assert len(exportador.spans) == 4
+
+    def test_error_de_la_peticion_en_el_span(self):
+        """Test de que la excepción de la vista queda en el span de la petición"""
+        exportador = ExportadorMemoria()
+        cliente = self._crear_app(exportador).test_client()
+
+        assert cliente.get("/falla").status_code == 500
+
+        (raiz,) = exportador.spans
+        assert raiz.error == "RuntimeError: sin conexión"
+        assert raiz.atributos["http.estado"] == 500
+
+    def test_exportador_archivo(self, tmp_path):
+        """Test de que el exportador de archivo escribe una línea JSON por span"""
+        ruta = tmp_path / "trazas.jsonl"
+        cliente = self._crear_app(ExportadorArchivo(str(ruta))).test_client()
+
+        cliente.get("/productos/prod-1", headers={"traceparent": f"00-{TRACE_ID}-{PADRE_ID}-01"})
+        cliente.get("/productos/prod-2")
+
+        spans = [json.loads(linea) for linea in ruta.read_text().splitlines()]
+        assert len(spans) == 8
+        assert spans[3]["nombre"] == "GET /productos/<producto_id>"
+        assert spans[3]["padre_id"] == PADRE_ID
+
+    def test_crear_exportador(self, tmp_path):
+        """Test de los valores de TRAZAS_EXPORTADOR"""
+        assert crear_exportador("") is None
+        assert isinstance(crear_exportador("memoria"), ExportadorMemoria)
+        assert isinstance(crear_exportador(f"archivo:{tmp_path / 'trazas.jsonl'}"), ExportadorArchivo)
+        assert isinstance(crear_exportador(f"{__name__}:_ExportadorPropio"), _ExportadorPropio)
+        with pytest.raises(ValueError):
+            crear_exportador("jaeger")
@@ -0,0 +1,121 @@
+"""
+Tests del seguimiento de cambios del catálogo (secuencia, updated_at y tombstones)
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.config.motor import normalizar_uri
+from src.infraestructura.dto.cambios import (
+    ProductoEliminadoModel,
+    SecuenciaCambiosModel,
+    secuencia_actual,
+    siguiente_secuencia,
+)
+from src.infraestructura.dto.producto import ProductoModel
+
+
+def _producto(producto_id: str, cantidad: int = 10) -> ProductoModel:
+    return ProductoModel(
+        id=producto_id,
+        nombre=f"Producto {producto_id}",
+        descripcion="Descripción",
+        categoria="insumos",
+        condiciones_almacenamiento="Temperatura ambiente",
+        valor_unitario=10.0,
+        cantidad_disponible=cantidad,
+        fecha_vencimiento=datetime(2026, 1, 1),
+        lote="LOT-001",
+        tiempo_estimado_entrega="2 días",
+        id_proveedor="prov-001",
+        ubicacion="Bodega 1",
+    )
+
+
+@pytest.fixture
+def session():
+    """Base de datos aislada para cada test (en memoria, o la de TEST_DATABASE_URL)"""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = normalizar_uri(os.environ.get("TEST_DATABASE_URL", "sqlite:///:memory:"))
+    init_db_productos(app)
+    with app.app_context():
+        db_productos.drop_all()
+        db_productos.create_all()
+        yield db_productos.session
+        db_productos.session.remove()
+
+
+class TestSeguimientoCambios:
+    """Tests del seguimiento de cambios en ProductoModel"""
+
+    def test_tabla_secuencia_se_inicializa(self, session):
+        """Test de que el contador arranca en cero al crear la tabla"""
+        assert session.query(SecuenciaCambiosModel).count() == 1
+        assert secuencia_actual(session.connection()) == 0
+
+    def test_insercion_asigna_secuencias_crecientes(self, session):
+        """Test de que cada inserción toma la siguiente secuencia"""
+        session.add(_producto("p1"))
+        session.add(_producto("p2"))
+        session.commit()
+
+        secuencias = [p.secuencia for p in session.query(ProductoModel).order_by(ProductoModel.id)]
+        assert secuencias == [1, 2]
+        assert all(p.updated_at is not None for p in session.query(ProductoModel))
+
+    def test_actualizacion_orm_avanza_secuencia(self, session):
+        """Test de que una actualización por el ORM avanza la secuencia"""
+        session.add(_producto("p1"))
+        session.commit()
+
+        producto = session.get(ProductoModel, "p1")
+        producto.cantidad_disponible = 5
+        session.commit()
+
+        assert session.get(ProductoModel, "p1").secuencia == 2
+
+    def test_actualizacion_core_avanza_secuencia(self, session):
+        """Test de que un UPDATE de Core (sin pasar por el ORM) también avanza la secuencia"""
+        session.add(_producto("p1"))
+        session.commit()
+
+        session.execute(ProductoModel.__table__.update().where(ProductoModel.id == "p1").values(cantidad_disponible=1))
+        session.commit()
+
+        assert session.get(ProductoModel, "p1").secuencia == 2
+
+    def test_eliminacion_registra_tombstone(self, session):
+        """Test de que eliminar un producto registra un tombstone con secuencia nueva"""
+        session.add(_producto("p1"))
+        session.commit()
+
+        session.delete(session.get(ProductoModel, "p1"))
+        session.commit()
+
+        tombstone = session.get(ProductoEliminadoModel, "p1")
+        assert tombstone is not None
+        assert tombstone.secuencia == 2
+
+    def test_reinsercion_retira_tombstone(self, session):
+        """Test de que reinsertar un producto eliminado retira su tombstone"""
+        session.add(_producto("p1"))
+        session.commit()
+        session.delete(session.get(ProductoModel, "p1"))
+        session.commit()
+
+        session.add(_producto("p1"))
+        session.commit()
+
+        assert session.get(ProductoEliminadoModel, "p1") is None
+        assert session.get(ProductoModel, "p1").secuencia == 3
+
+    def test_siguiente_secuencia_reserva_bloque(self, session):
+        """Test de reservar un bloque de secuencias"""
+        conexion = session.connection()
+
+        assert siguiente_secuencia(conexion, cantidad=100) == 100
+        assert siguiente_secuencia(conexion) == 101
+        assert secuencia_actual(conexion) == 101
@@ -0,0 +1,49 @@
+"""
+Tests unitarios para los lectores de importación
+"""
+
+import io
+
+from src.infraestructura.importacion.lectores import LECTORES, leer_csv, leer_ndjson
+
+
+class TestLectores:
+    """Tests para leer_csv y leer_ndjson"""
+
+    def test_leer_csv(self):
+        """Test de lectura de CSV con cabecera, BOM y campos entre comillas"""
+        contenido = '\ufeffid,nombre\r\nprod-001,"Gasa, estéril"\r\nprod-002,Jeringa\r\n'.encode("utf-8")
+
+        registros = list(leer_csv(io.BytesIO(contenido)))
+
+        assert registros == [(2, {"id": "prod-001", "nombre": "Gasa, estéril"}), (3, {"id": "prod-002", "nombre": "Jeringa"})]
+
+    def test_leer_csv_desde_stream_crudo(self, tmp_path):
+        """Test de lectura de CSV desde un stream sin buffer, como el cuerpo de una petición"""
+        archivo = tmp_path / "productos.csv"
+        archivo.write_bytes(b"id\nprod-001\n")
+
+        with io.FileIO(archivo) as stream:
+            assert list(leer_csv(stream)) == [(2, {"id": "prod-001"})]
+
+    def test_leer_ndjson(self):
+        """Test de lectura de NDJSON ignorando líneas vacías"""
+        contenido = b'{"id": "prod-001"}\n\n{"id": "prod-002"}'
+
+        registros = list(leer_ndjson(io.BytesIO(contenido)))
+
+        assert registros == [(1, {"id": "prod-001"}), (3, {"id": "prod-002"})]
+
+    def test_leer_ndjson_linea_invalida(self):
+        """Test de que una línea inválida se entrega como error sin detener la lectura"""
+        contenido = b'no es json\n{"id": "prod-002"}\n'
+
+        registros = list(leer_ndjson(io.BytesIO(contenido)))
+
+        assert registros[0][0] == 1
+        assert isinstance(registros[0][1], ValueError)
+        assert registros[1] == (2, {"id": "prod-002"})
+
+    def test_lectores_disponibles(self):
+        """Test de los formatos soportados"""
+        assert LECTORES == {"csv": leer_csv, "ndjson": leer_ndjson}
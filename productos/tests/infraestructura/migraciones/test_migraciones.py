@@ -0,0 +1,103 @@
+"""
+Tests de las migraciones versionadas del esquema de productos
+"""
+
+import logging
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, inspect, select
+from src.infraestructura.config.db import db_productos, init_db_productos
+from src.infraestructura.config.migraciones import (
+    aplicar_migraciones,
+    create_migraciones_cli,
+    migraciones_pendientes,
+    verificar_migraciones,
+)
+from src.infraestructura.dto.cambios import SecuenciaCambiosModel
+from src.infraestructura.dto.producto import ProductoModel
+from src.infraestructura.dto.reserva import ReservaModel  # noqa: F401
+from src.infraestructura.migraciones import MIGRACIONES
+from src.infraestructura.migraciones.v0001_esquema_inicial import productos as productos_v1
+
+
+def _fila_v1(producto_id: str) -> dict:
+    return {
+        "id": producto_id,
+        "nombre": f"Producto {producto_id}",
+        "descripcion": "Descripción",
+        "categoria": "insumos",
+        "condiciones_almacenamiento": "Temperatura ambiente",
+        "valor_unitario": 10.0,
+        "cantidad_disponible": 5,
+        "fecha_vencimiento": datetime(2030, 1, 1),
+        "lote": "LOT-MIG",
+        "tiempo_estimado_entrega": "2 días",
+        "id_proveedor": "prov-001",
+        "ubicacion": "Bodega 1",
+    }
+
+
+class TestMigraciones:
+    """Tests del runner de migraciones y de las migraciones de productos"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'productos.db'}")
+        yield engine
+        engine.dispose()
+
+    def test_base_vacia_queda_igual_que_los_modelos(self, engine):
+        """Test de que las migraciones crean las mismas tablas, columnas e índices que los modelos"""
+        assert [m.version for m in aplicar_migraciones(engine, MIGRACIONES)] == [1, 2, 3, 4, 5, 6, 7, 8]
+
+        inspector = inspect(engine)
+        for tabla in db_productos.metadata.sorted_tables:
+            assert {c["name"] for c in inspector.get_columns(tabla.name)} == set(tabla.columns.keys()), tabla.name
+            assert {i["name"] for i in inspector.get_indexes(tabla.name)} == {i.name for i in tabla.indexes}, tabla.name
+        with engine.connect() as conexion:
+            assert conexion.execute(select(SecuenciaCambiosModel.valor)).scalar_one() == 0
+
+        # Una segunda ejecución no tiene nada pendiente
+        assert aplicar_migraciones(engine, MIGRACIONES) == []
+
+    def test_base_existente_se_rellena_por_lotes(self, engine, monkeypatch):
+        """Test de que los productos existentes reciben secuencias únicas en orden, de a lotes"""
+        monkeypatch.setenv("MIGRACIONES_TAMANO_LOTE", "2")
+        aplicar_migraciones(engine, MIGRACIONES[:1])
+        with engine.begin() as conexion:
+            conexion.execute(productos_v1.insert(), [_fila_v1(f"mig-{i}") for i in (3, 1, 5, 2, 4)])
+
+        assert [m.version for m in migraciones_pendientes(engine, MIGRACIONES)] == [2, 3, 4, 5, 6, 7, 8]
+        aplicar_migraciones(engine, MIGRACIONES)
+
+        tabla = ProductoModel.__table__
+        with engine.connect() as conexion:
+            filas = conexion.execute(select(tabla.c.id, tabla.c.secuencia, tabla.c.updated_at).order_by(tabla.c.id)).all()
+            assert conexion.execute(select(SecuenciaCambiosModel.valor)).scalar_one() == 5
+        assert [(fila.id, fila.secuencia) for fila in filas] == [(f"mig-{i}", i) for i in range(1, 6)]
+        assert all(fila.updated_at is not None for fila in filas)
+
+    def test_cli_y_verificacion_al_arrancar(self, tmp_path, monkeypatch, caplog):
+        """Test de `flask migraciones` y del aviso de migraciones pendientes al arrancar"""
+        monkeypatch.setattr(db_productos, "metadatas", dict(db_productos.metadatas))
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'productos.db'}"
+        init_db_productos(app)
+        app.cli.add_command(create_migraciones_cli(db_productos, MIGRACIONES))
+        runner = app.test_cli_runner()
+
+        with caplog.at_level(logging.WARNING, logger="src.infraestructura.config.migraciones"):
+            verificar_migraciones(app, db_productos, MIGRACIONES)
+        assert "Migraciones pendientes: 0001, 0002, 0003, 0004, 0005, 0006, 0007, 0008" in caplog.text
+
+        # Los comandos usan el contexto activo; sin este, el de la app de sesión de conftest
+        with app.app_context():
+            assert "Migraciones aplicadas: 8" in runner.invoke(args=["migraciones", "aplicar"]).output
+            assert runner.invoke(args=["migraciones", "estado"]).output.count("aplicada ") == 8
+
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="src.infraestructura.config.migraciones"):
+            verificar_migraciones(app, db_productos, MIGRACIONES)
+        assert caplog.text == ""
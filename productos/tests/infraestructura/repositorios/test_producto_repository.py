@@ -2,6 +2,7 @@
 Tests unitarios para ProductoRepositoryImpl
 """
 
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -237,3 +238,553 @@ class TestProductoRepositoryImpl:
 
         # Assert
         assert len(result) == 0
+
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_obtener_filas_exitoso(self, mock_db):
+        """Test de obtener filas de productos exitosamente"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_query = MagicMock()
+        mock_query.all.return_value = [("prod-001", "Laptop")]
+        mock_db.session.query.return_value = mock_query
+        repository = ProductoRepositoryImpl()
+
+        # Act
+        result = repository.obtener_filas(("id", "nombre"))
+
+        # Assert
+        assert result == [("prod-001", "Laptop")]
+        assert mock_db.session.query.call_count == 1
+        assert len(mock_db.session.query.call_args.args) == 2
+
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_obtener_filas_error(self, mock_db):
+        """Test de obtener filas de productos con error"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_db.session.query.side_effect = Exception("Error de base de datos")
+        repository = ProductoRepositoryImpl()
+
+        # Act
+        result = repository.obtener_filas(("id", "nombre"))
+
+        # Assert
+        assert result == []
+
+    def test_iterar_filas_por_lotes(self, app_context):
+        """Test de recorrer filas en lotes contra una base de datos real"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        for i in (3, 1, 2):
+            db_productos.session.add(
+                ProductoModel(
+                    id=f"exp-{i}",
+                    nombre=f"Producto {i}",
+                    descripcion="Descripción",
+                    categoria="insumos",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=10.0,
+                    cantidad_disponible=i,
+                    fecha_vencimiento=datetime(2026, 1, 1),
+                    lote="LOT-EXP",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor="prov-001",
+                    ubicacion="Bodega 1",
+                )
+            )
+        db_productos.session.commit()
+        repository = ProductoRepositoryImpl()
+
+        try:
+            # Act
+            result = list(repository.iterar_filas(("id", "cantidad_disponible"), tamano_lote=2))
+
+            # Assert
+            assert result == [("exp-1", 1), ("exp-2", 2), ("exp-3", 3)]
+        finally:
+            db_productos.session.query(ProductoModel).filter(ProductoModel.id.like("exp-%")).delete()
+            db_productos.session.commit()
+
+    def test_consultar_filas_filtra_ordena_y_pagina(self, app_context):
+        """Test de la consulta filtrada contra una base de datos real, con el total de la página"""
+        from src.dominio.entities.consulta import ConsultaProductos
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange: (id, valor, stock, proveedor, vencimiento)
+        datos = [
+            ("flt-1", 5.0, 0, "prov-a", datetime(2026, 1, 1)),
+            ("flt-2", 20.0, 4, "prov-a", datetime(2026, 3, 1)),
+            ("flt-3", 15.0, 2, "prov-a", datetime(2026, 2, 1)),
+            ("flt-4", 20.0, 1, "prov-a", datetime(2027, 1, 1)),
+            ("flt-5", 30.0, 9, "prov-b", datetime(2026, 1, 1)),
+        ]
+        for producto_id, valor, stock, proveedor, vence in datos:
+            db_productos.session.add(
+                ProductoModel(
+                    id=producto_id,
+                    nombre=f"Producto {producto_id}",
+                    descripcion="Descripción",
+                    categoria="filtros",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=valor,
+                    cantidad_disponible=stock,
+                    fecha_vencimiento=vence,
+                    lote="LOT-FLT",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor=proveedor,
+                    ubicacion="Bodega 1",
+                )
+            )
+        db_productos.session.commit()
+        repository = ProductoRepositoryImpl()
+        consulta = ConsultaProductos(
+            categoria="filtros", id_proveedor="prov-a", valor_min=10.0, con_stock=True, orden=(("valor_unitario", True),)
+        )
+
+        try:
+            # Act
+            todas = repository.consultar_filas(("id",), consulta)
+            pagina = repository.consultar_filas(("id", "valor_unitario"), replace(consulta, limite=1, desplazamiento=1))
+            vacia = repository.consultar_filas(("id",), replace(consulta, limite=10, desplazamiento=10))
+            por_vencer = repository.consultar_filas(
+                ("id",), ConsultaProductos(categoria="filtros", vence_antes=datetime(2026, 2, 1), valor_max=10.0)
+            )
+
+            # Assert: empates de valor se ordenan por ID
+            assert todas.filas == [("flt-2",), ("flt-4",), ("flt-3",)]
+            assert todas.total == 3
+            assert pagina.filas == [("flt-4", 20.0)]
+            assert pagina.total == 3
+            assert vacia.filas == []
+            assert vacia.total == 3
+            assert por_vencer.filas == [("flt-1",)]
+        finally:
+            db_productos.session.query(ProductoModel).filter(ProductoModel.id.like("flt-%")).delete()
+            db_productos.session.commit()
+
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_iterar_filas_propaga_errores(self, mock_db):
+        """Test de que los errores al recorrer filas se propagan"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_db.session.query.side_effect = Exception("Error de base de datos")
+        repository = ProductoRepositoryImpl()
+
+        # Act / Assert
+        with pytest.raises(Exception, match="Error de base de datos"):
+            list(repository.iterar_filas(("id",), tamano_lote=100))
+
+    def test_obtener_cambios_paginados(self, app_context):
+        """Test de obtener cambios por páginas, mezclando actualizaciones y eliminaciones"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.cambios import ProductoEliminadoModel, secuencia_actual
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        session = db_productos.session
+        desde = secuencia_actual(session.connection())
+        for i in range(3):
+            session.add(
+                ProductoModel(
+                    id=f"cam-{i}",
+                    nombre=f"Producto {i}",
+                    descripcion="Descripción",
+                    categoria="insumos",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=10.0,
+                    cantidad_disponible=i,
+                    fecha_vencimiento=datetime(2026, 1, 1),
+                    lote="LOT-CAM",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor="prov-001",
+                    ubicacion="Bodega 1",
+                )
+            )
+        session.commit()
+        session.delete(session.get(ProductoModel, "cam-0"))
+        session.commit()
+        repository = ProductoRepositoryImpl()
+
+        try:
+            # Act
+            primera = repository.obtener_cambios(desde, limite=2)
+            segunda = repository.obtener_cambios(primera.hasta, limite=2)
+            tercera = repository.obtener_cambios(segunda.hasta, limite=2)
+
+            # Assert
+            assert [c.producto.id for c in primera.cambios] == ["cam-1", "cam-2"]
+            assert primera.eliminados == []
+            assert primera.hay_mas is True
+            assert primera.hasta == desde + 3
+
+            assert segunda.cambios == []
+            assert [e.id for e in segunda.eliminados] == ["cam-0"]
+            assert segunda.eliminados[0].secuencia == desde + 4
+            assert segunda.hay_mas is False
+            assert segunda.hasta == desde + 4
+
+            assert tercera.cambios == [] and tercera.eliminados == []
+            assert tercera.hasta == segunda.hasta
+        finally:
+            session.execute(ProductoModel.__table__.delete().where(ProductoModel.id.like("cam-%")))
+            session.execute(ProductoEliminadoModel.__table__.delete().where(ProductoEliminadoModel.id.like("cam-%")))
+            session.commit()
+
+    @patch("src.infraestructura.repositorios.producto_repository.secuencia_actual")
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_obtener_cambios_propaga_errores(self, mock_db, mock_secuencia):
+        """Test de que los errores al obtener cambios se propagan"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_secuencia.return_value = 10
+        mock_db.session.query.side_effect = Exception("Error de base de datos")
+        repository = ProductoRepositoryImpl()
+
+        # Act / Assert
+        with pytest.raises(Exception, match="Error de base de datos"):
+            repository.obtener_cambios(0, 100)
+
+    def test_version_catalogo_cambia_con_cada_escritura(self, app_context):
+        """Test de que la versión del catálogo avanza al insertar, actualizar y eliminar"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.cambios import ProductoEliminadoModel
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        session = db_productos.session
+        repository = ProductoRepositoryImpl()
+        versiones = [repository.version_catalogo()]
+
+        try:
+            # Act
+            session.add(
+                ProductoModel(
+                    id="ver-1",
+                    nombre="Producto versión",
+                    descripcion="Descripción",
+                    categoria="insumos",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=10.0,
+                    cantidad_disponible=5,
+                    fecha_vencimiento=datetime(2026, 1, 1),
+                    lote="LOT-VER",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor="prov-001",
+                    ubicacion="Bodega 1",
+                )
+            )
+            session.commit()
+            versiones.append(repository.version_catalogo())
+            session.execute(ProductoModel.__table__.update().where(ProductoModel.id == "ver-1").values(cantidad_disponible=4))
+            session.commit()
+            versiones.append(repository.version_catalogo())
+            session.delete(session.get(ProductoModel, "ver-1"))
+            session.commit()
+            versiones.append(repository.version_catalogo())
+
+            # Assert
+            assert len(set(versiones)) == len(versiones)
+        finally:
+            session.execute(ProductoModel.__table__.delete().where(ProductoModel.id == "ver-1"))
+            session.execute(ProductoEliminadoModel.__table__.delete().where(ProductoEliminadoModel.id == "ver-1"))
+            session.commit()
+
+    def test_guardar_lote_inserta_y_actualiza(self, app_context):
+        """Test de upsert de un lote: inserta nuevos, actualiza existentes y retira tombstones"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.cambios import ProductoEliminadoModel, secuencia_actual
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        session = db_productos.session
+        repository = ProductoRepositoryImpl()
+
+        def producto(producto_id, nombre, cantidad):
+            return Producto(
+                id=producto_id,
+                nombre=nombre,
+                descripcion="Descripción",
+                categoria="insumos",
+                condiciones_almacenamiento="Temperatura ambiente",
+                valor_unitario=10.0,
+                cantidad_disponible=cantidad,
+                fecha_vencimiento=datetime(2026, 1, 1),
+                lote="LOT-IMP",
+                tiempo_estimado_entrega="2 días",
+                id_proveedor="prov-001",
+                ubicacion="Bodega 1",
+            )
+
+        session.add(ProductoEliminadoModel(id="imp-2", secuencia=0))
+        session.commit()
+        desde = secuencia_actual(session.connection())
+
+        try:
+            # Act
+            primero = repository.guardar_lote([producto("imp-1", "Gasa", 1)])
+            segundo = repository.guardar_lote(
+                [producto("imp-1", "Gasa", 2), producto("imp-2", "Suero", 3), producto("imp-1", "Gasa estéril", 4)]
+            )
+
+            # Assert
+            assert primero == 1
+            assert segundo == 3
+            imp_1 = session.get(ProductoModel, "imp-1")
+            assert imp_1.nombre == "Gasa estéril"
+            assert imp_1.cantidad_disponible == 4
+            assert imp_1.secuencia == desde + 2
+            assert session.get(ProductoModel, "imp-2").secuencia == desde + 3
+            assert session.get(ProductoEliminadoModel, "imp-2") is None
+            assert secuencia_actual(session.connection()) == desde + 3
+        finally:
+            session.execute(ProductoModel.__table__.delete().where(ProductoModel.id.like("imp-%")))
+            session.commit()
+
+    @patch("src.infraestructura.repositorios.producto_repository.TAMANO_BLOQUE_IN", 2)
+    def test_guardar_lote_retira_tombstones_en_bloques(self, app_context, sample_producto):
+        """Test de que los tombstones de un lote se retiran con un DELETE por bloque de IDs"""
+        from sqlalchemy import event
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.cambios import ProductoEliminadoModel
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        session = db_productos.session
+        ids = [f"tomb-{i}" for i in range(1, 6)]
+        session.add_all(ProductoEliminadoModel(id=producto_id, secuencia=0) for producto_id in ids)
+        session.commit()
+        productos = [replace(sample_producto, id=producto_id) for producto_id in ids]
+        borrados = []
+
+        def contar(_conexion, _cursor, sentencia, _parametros, _contexto, _executemany):
+            if sentencia.startswith("DELETE FROM productos_eliminados"):
+                borrados.append(sentencia)
+
+        engine = db_productos.engine
+        event.listen(engine, "before_cursor_execute", contar)
+        try:
+            # Act
+            ProductoRepositoryImpl().guardar_lote(productos)
+
+            # Assert
+            assert len(borrados) == 3
+            assert session.query(ProductoEliminadoModel).filter(ProductoEliminadoModel.id.in_(ids)).count() == 0
+        finally:
+            event.remove(engine, "before_cursor_execute", contar)
+            session.execute(ProductoModel.__table__.delete().where(ProductoModel.id.like("tomb-%")))
+            session.commit()
+
+    def test_guardar_lote_vacio(self):
+        """Test de guardar un lote vacío"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        assert ProductoRepositoryImpl().guardar_lote([]) == 0
+
+    @patch("src.infraestructura.repositorios.producto_repository.siguiente_secuencia")
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_guardar_lote_error_revierte(self, mock_db, mock_siguiente_secuencia, sample_producto):
+        """Test de que un error al guardar revierte el lote y se propaga"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_siguiente_secuencia.return_value = 1
+        mock_db.session.connection.return_value.dialect.name = "sqlite"
+        mock_db.session.execute.side_effect = Exception("Error de base de datos")
+        repository = ProductoRepositoryImpl()
+
+        # Act / Assert
+        with pytest.raises(Exception, match="Error de base de datos"):
+            repository.guardar_lote([sample_producto])
+        mock_db.session.rollback.assert_called_once()
+        mock_db.session.commit.assert_not_called()
+
+    @patch("src.infraestructura.repositorios.producto_repository.TAMANO_BLOQUE_IN", 2)
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_obtener_por_ids_en_bloques(self, mock_db, sample_producto_model):
+        """Test de obtener productos por IDs con una consulta IN por bloque"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_query = MagicMock()
+        mock_query.filter.return_value.all.side_effect = [[sample_producto_model], []]
+        mock_db.session.query.return_value = mock_query
+        repository = ProductoRepositoryImpl()
+
+        # Act
+        result = repository.obtener_por_ids(["prod-001", "prod-002", "prod-001", "prod-003"])
+
+        # Assert
+        assert list(result) == ["prod-001"]
+        assert result["prod-001"].nombre == sample_producto_model.nombre
+        assert mock_query.filter.call_count == 2
+
+    def test_obtener_por_ids_contra_base_de_datos(self, app_context):
+        """Test de obtener productos por IDs contra una base de datos real"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        for producto_id in ("ids-1", "ids-2"):
+            db_productos.session.add(
+                ProductoModel(
+                    id=producto_id,
+                    nombre="Producto",
+                    descripcion="Descripción",
+                    categoria="insumos",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=10.0,
+                    cantidad_disponible=1,
+                    fecha_vencimiento=datetime(2026, 1, 1),
+                    lote="LOT-IDS",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor="prov-001",
+                    ubicacion="Bodega 1",
+                )
+            )
+        db_productos.session.commit()
+
+        try:
+            # Act
+            result = ProductoRepositoryImpl().obtener_por_ids(["ids-2", "no-existe", "ids-1"])
+
+            # Assert
+            assert sorted(result) == ["ids-1", "ids-2"]
+        finally:
+            db_productos.session.query(ProductoModel).filter(ProductoModel.id.like("ids-%")).delete()
+            db_productos.session.commit()
+
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_obtener_por_ids_propaga_errores(self, mock_db):
+        """Test de que los errores al obtener por IDs se propagan"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        mock_db.session.query.side_effect = Exception("Error de base de datos")
+
+        with pytest.raises(Exception, match="Error de base de datos"):
+            ProductoRepositoryImpl().obtener_por_ids(["prod-001"])
+
+    def test_obtener_lotes_disponibles_fefo(self, app_context):
+        """Test de lotes vigentes con stock, agrupados por nombre y ordenados por vencimiento"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        lotes = [
+            ("fefo-1", "Gasa FEFO", datetime(2031, 1, 1), 5),
+            ("fefo-2", "Gasa FEFO", datetime(2030, 1, 1), 3),
+            ("fefo-3", "Gasa FEFO", datetime(2020, 1, 1), 9),  # vencido
+            ("fefo-4", "Gasa FEFO", datetime(2029, 1, 1), 0),  # sin stock
+            ("fefo-5", "Suero FEFO", datetime(2030, 6, 1), 4),
+            ("fefo-6", "Otro FEFO", datetime(2030, 6, 1), 4),
+        ]
+        for producto_id, nombre, vencimiento, cantidad in lotes:
+            db_productos.session.add(
+                ProductoModel(
+                    id=producto_id,
+                    nombre=nombre,
+                    descripcion="Descripción",
+                    categoria="insumos",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=10.0,
+                    cantidad_disponible=cantidad,
+                    fecha_vencimiento=vencimiento,
+                    lote=f"LOT-{producto_id}",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor="prov-001",
+                    ubicacion="Bodega 1",
+                )
+            )
+        db_productos.session.commit()
+
+        try:
+            # Act
+            result = ProductoRepositoryImpl().obtener_lotes_disponibles(
+                ["Gasa FEFO", "Suero FEFO", "Gasa FEFO", "No existe"], datetime(2025, 1, 1)
+            )
+
+            # Assert
+            assert sorted(result) == ["Gasa FEFO", "Suero FEFO"]
+            assert [lote.producto_id for lote in result["Gasa FEFO"]] == ["fefo-2", "fefo-1"]
+            assert result["Gasa FEFO"][0].lote == "LOT-fefo-2"
+            assert result["Gasa FEFO"][0].cantidad_disponible == 3
+            assert [lote.producto_id for lote in result["Suero FEFO"]] == ["fefo-5"]
+        finally:
+            db_productos.session.query(ProductoModel).filter(ProductoModel.id.like("fefo-%")).delete()
+            db_productos.session.commit()
+
+    @patch("src.infraestructura.repositorios.producto_repository.TAMANO_BLOQUE_IN", 2)
+    @patch("src.infraestructura.repositorios.producto_repository.db_productos")
+    def test_obtener_lotes_disponibles_en_bloques(self, mock_db):
+        """Test de una consulta por bloque de nombres y propagación de errores"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        mock_query = mock_db.session.query.return_value
+        mock_query.filter.return_value.order_by.return_value.all.side_effect = [[], Exception("Error de base de datos")]
+        repository = ProductoRepositoryImpl()
+
+        # Act / Assert
+        with pytest.raises(Exception, match="Error de base de datos"):
+            repository.obtener_lotes_disponibles(["a", "b", "c"], datetime(2025, 1, 1))
+        assert mock_query.filter.call_count == 2
+
+    def test_contar_por(self, app_context):
+        """Test del conteo agrupado en SQL, ordenado por cantidad de productos y luego por clave"""
+        from src.infraestructura.config.db import db_productos
+        from src.infraestructura.dto.producto import ProductoModel
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        # Arrange
+        for producto_id, proveedor, cantidad in [("cnt-1", "prov-b", 5), ("cnt-2", "prov-a", 3), ("cnt-3", "prov-b", 0)]:
+            db_productos.session.add(
+                ProductoModel(
+                    id=producto_id,
+                    nombre="Producto",
+                    descripcion="Descripción",
+                    categoria="conteo",
+                    condiciones_almacenamiento="Temperatura ambiente",
+                    valor_unitario=10.0,
+                    cantidad_disponible=cantidad,
+                    fecha_vencimiento=datetime(2030, 1, 1),
+                    lote="LOT-001",
+                    tiempo_estimado_entrega="2 días",
+                    id_proveedor=proveedor,
+                    ubicacion="Bodega 1",
+                )
+            )
+        db_productos.session.commit()
+
+        try:
+            # Act
+            result = ProductoRepositoryImpl().contar_por("id_proveedor")
+
+            # Assert
+            conteos = {conteo.clave: (conteo.total, conteo.unidades) for conteo in result}
+            assert conteos["prov-b"] == (2, 5)
+            assert conteos["prov-a"] == (1, 3)
+            assert [conteo.clave for conteo in result].index("prov-b") < [conteo.clave for conteo in result].index("prov-a")
+        finally:
+            db_productos.session.query(ProductoModel).filter(ProductoModel.id.like("cnt-%")).delete()
+            db_productos.session.commit()
+
+    def test_contar_por_campo_desconocido(self, app_context):
+        """Test de que solo se agrupa por columnas existentes"""
+        from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+
+        with pytest.raises(KeyError):
+            ProductoRepositoryImpl().contar_por("no_existe")
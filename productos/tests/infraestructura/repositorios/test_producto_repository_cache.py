@@ -0,0 +1,202 @@
+"""
+Tests unitarios para ProductoRepositoryCache
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from src.dominio.entities.resumen import ConteoGrupo
+from src.infraestructura.cache.cache_lru import CacheLRU
+from src.infraestructura.repositorios.producto_repository_cache import ProductoRepositoryCache
+
+
+class TestProductoRepositoryCache:
+    """Tests para ProductoRepositoryCache"""
+
+    @pytest.fixture
+    def repositorio(self):
+        """Mock del repositorio decorado"""
+        return MagicMock()
+
+    @pytest.fixture
+    def repositorio_cache(self, repositorio):
+        """Repositorio con cache"""
+        return ProductoRepositoryCache(
+            repositorio,
+            cache_por_id=CacheLRU(max_entradas=10, ttl_segundos=60),
+            cache_por_categoria=CacheLRU(max_entradas=10, ttl_segundos=60),
+        )
+
+    def test_obtener_por_id_cachea(self, repositorio, repositorio_cache, sample_producto):
+        """Test de que la segunda lectura por ID no consulta el repositorio"""
+        repositorio.obtener_por_id.return_value = sample_producto
+
+        primero = repositorio_cache.obtener_por_id("prod-001")
+        segundo = repositorio_cache.obtener_por_id("prod-001")
+
+        assert primero == sample_producto
+        assert segundo == sample_producto
+        repositorio.obtener_por_id.assert_called_once_with("prod-001")
+
+    def test_obtener_por_id_no_cachea_no_encontrados(self, repositorio, repositorio_cache):
+        """Test de que los productos inexistentes no se cachean"""
+        repositorio.obtener_por_id.return_value = None
+
+        assert repositorio_cache.obtener_por_id("prod-999") is None
+        assert repositorio_cache.obtener_por_id("prod-999") is None
+        assert repositorio.obtener_por_id.call_count == 2
+
+    def test_obtener_por_categoria_cachea(self, repositorio, repositorio_cache, sample_producto):
+        """Test de que las listas por categoría se cachean"""
+        repositorio.obtener_por_categoria.return_value = [sample_producto]
+
+        primero = repositorio_cache.obtener_por_categoria("electronicos")
+        segundo = repositorio_cache.obtener_por_categoria("electronicos")
+
+        assert primero == [sample_producto]
+        assert segundo == [sample_producto]
+        repositorio.obtener_por_categoria.assert_called_once_with("electronicos")
+
+    def test_obtener_por_categoria_no_cachea_vacias(self, repositorio, repositorio_cache):
+        """Test de que las listas vacías no se cachean"""
+        repositorio.obtener_por_categoria.return_value = []
+
+        repositorio_cache.obtener_por_categoria("ropa")
+        repositorio_cache.obtener_por_categoria("ropa")
+
+        assert repositorio.obtener_por_categoria.call_count == 2
+
+    def test_obtener_todos_y_buscar_delegan(self, repositorio, repositorio_cache, sample_producto):
+        """Test de que las consultas no cacheadas se delegan siempre"""
+        repositorio.obtener_todos.return_value = [sample_producto]
+        repositorio.buscar_por_nombre.return_value = [sample_producto]
+
+        repositorio_cache.obtener_todos()
+        repositorio_cache.obtener_todos()
+        repositorio_cache.buscar_por_nombre("Lap")
+        repositorio_cache.consultar_filas(("id",), "consulta")
+        repositorio_cache.version_catalogo()
+        repositorio_cache.version_catalogo()
+
+        assert repositorio.obtener_todos.call_count == 2
+        assert repositorio.version_catalogo.call_count == 2
+        repositorio.buscar_por_nombre.assert_called_once_with("Lap")
+        repositorio.consultar_filas.assert_called_once_with(("id",), "consulta")
+
+    def test_invalidar_producto(self, repositorio, repositorio_cache, sample_producto):
+        """Test de invalidación de un producto y de las listas por categoría"""
+        repositorio.obtener_por_id.return_value = sample_producto
+        repositorio.obtener_por_categoria.return_value = [sample_producto]
+        repositorio_cache.obtener_por_id("prod-001")
+        repositorio_cache.obtener_por_categoria("electronicos")
+
+        repositorio_cache.invalidar_producto("prod-001")
+        repositorio_cache.obtener_por_id("prod-001")
+        repositorio_cache.obtener_por_categoria("electronicos")
+
+        assert repositorio.obtener_por_id.call_count == 2
+        assert repositorio.obtener_por_categoria.call_count == 2
+
+    def test_invalidar_todo(self, repositorio, repositorio_cache, sample_producto):
+        """Test de invalidación total"""
+        repositorio.obtener_por_id.return_value = sample_producto
+        repositorio_cache.obtener_por_id("prod-001")
+
+        repositorio_cache.invalidar_todo()
+        repositorio_cache.obtener_por_id("prod-001")
+
+        assert repositorio.obtener_por_id.call_count == 2
+
+    def test_estadisticas(self, repositorio, repositorio_cache, sample_producto):
+        """Test de estadísticas de ambas caches"""
+        repositorio.obtener_por_id.return_value = sample_producto
+        repositorio_cache.obtener_por_id("prod-001")
+        repositorio_cache.obtener_por_id("prod-001")
+
+        estadisticas = repositorio_cache.estadisticas()
+
+        assert estadisticas["por_id"]["aciertos"] == 1
+        assert estadisticas["por_id"]["fallos"] == 1
+        assert estadisticas["por_id"]["tasa_aciertos"] == 0.5
+        assert estadisticas["por_categoria"]["tasa_aciertos"] is None
+
+    def test_guardar_lote_invalida(self, repositorio, repositorio_cache, sample_producto):
+        """Test de que guardar un lote invalida los productos y las listas por categoría"""
+        repositorio.obtener_por_id.return_value = sample_producto
+        repositorio.obtener_por_categoria.return_value = [sample_producto]
+        repositorio.guardar_lote.return_value = 1
+        repositorio_cache.obtener_por_id("prod-001")
+        repositorio_cache.obtener_por_categoria("electronicos")
+
+        guardados = repositorio_cache.guardar_lote([sample_producto])
+        repositorio_cache.obtener_por_id("prod-001")
+        repositorio_cache.obtener_por_categoria("electronicos")
+
+        assert guardados == 1
+        repositorio.guardar_lote.assert_called_once_with([sample_producto])
+        assert repositorio.obtener_por_id.call_count == 2
+        assert repositorio.obtener_por_categoria.call_count == 2
+
+    def test_obtener_por_ids_consulta_solo_faltantes(self, repositorio, repositorio_cache, sample_producto):
+        """Test de que solo se consultan al repositorio los IDs que no están en cache"""
+        repositorio.obtener_por_id.return_value = sample_producto
+        repositorio_cache.obtener_por_id("prod-001")
+        otro = MagicMock()
+        repositorio.obtener_por_ids.return_value = {"prod-002": otro}
+
+        productos = repositorio_cache.obtener_por_ids(["prod-001", "prod-002", "prod-003"])
+        repositorio_cache.obtener_por_ids(["prod-002"])
+
+        assert productos == {"prod-001": sample_producto, "prod-002": otro}
+        repositorio.obtener_por_ids.assert_called_once_with(["prod-002", "prod-003"])
+
+    def test_obtener_por_ids_todo_en_cache(self, repositorio, repositorio_cache, sample_producto):
+        """Test de que no se consulta el repositorio si todos los IDs están en cache"""
+        repositorio.obtener_por_id.return_value = sample_producto
+        repositorio_cache.obtener_por_id("prod-001")
+
+        productos = repositorio_cache.obtener_por_ids(["prod-001", "prod-001"])
+
+        assert productos == {"prod-001": sample_producto}
+        repositorio.obtener_por_ids.assert_not_called()
+
+    def test_obtener_lotes_disponibles_no_se_cachea(self, repositorio, repositorio_cache):
+        """Test de que los lotes disponibles siempre se consultan al repositorio"""
+        desde = datetime(2025, 1, 1)
+        repositorio.obtener_lotes_disponibles.return_value = {}
+
+        repositorio_cache.obtener_lotes_disponibles(["Gasa"], desde)
+        repositorio_cache.obtener_lotes_disponibles(["Gasa"], desde)
+
+        assert repositorio.obtener_lotes_disponibles.call_count == 2
+
+    def test_contar_por_cachea_e_invalida_con_guardar_lote(self, repositorio, sample_producto):
+        """Test de que los conteos se cachean por campo y se descartan al guardar un lote"""
+        repositorio_cache = ProductoRepositoryCache(
+            repositorio,
+            cache_por_id=CacheLRU(max_entradas=10, ttl_segundos=60),
+            cache_por_categoria=CacheLRU(max_entradas=10, ttl_segundos=60),
+            cache_resumen=CacheLRU(max_entradas=3, ttl_segundos=30),
+        )
+        repositorio.contar_por.return_value = [ConteoGrupo("insumos", 2, 5)]
+
+        assert repositorio_cache.contar_por("categoria") == [ConteoGrupo("insumos", 2, 5)]
+        assert repositorio_cache.contar_por("categoria") == [ConteoGrupo("insumos", 2, 5)]
+        repositorio_cache.contar_por("ubicacion")
+        assert repositorio.contar_por.call_count == 2
+
+        repositorio_cache.guardar_lote([sample_producto])
+        repositorio_cache.contar_por("categoria")
+        assert repositorio.contar_por.call_count == 3
+        assert repositorio_cache.estadisticas()["resumen"]["aciertos"] == 1
+
+    def test_contar_por_sin_cache_resumen(self, repositorio, repositorio_cache):
+        """Test de que sin cache de resúmenes el conteo se delega siempre"""
+        repositorio.contar_por.return_value = []
+
+        repositorio_cache.contar_por("categoria")
+        repositorio_cache.contar_por("categoria")
+
+        assert repositorio.contar_por.call_count == 2
+        assert "resumen" not in repositorio_cache.estadisticas()
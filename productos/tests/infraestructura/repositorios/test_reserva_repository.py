@@ -0,0 +1,336 @@
+"""
+Tests para ReservaRepositoryImpl contra base de datos real
+"""
+
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+from src.dominio.entities.reserva import EstadoReserva, LineaReserva
+from src.dominio.exceptions import (
+    EstadoReservaInvalidoError,
+    ProductoNoEncontradoError,
+    ReservaNoEncontradaError,
+    StockInsuficienteError,
+)
+from src.infraestructura.config.db import db_productos
+from src.infraestructura.config.motor import normalizar_uri, opciones_motor
+from src.infraestructura.dto.cambios import SecuenciaCambiosModel, StockPendienteModel
+from src.infraestructura.dto.producto import ProductoModel
+from src.infraestructura.dto.reserva import ReservaLineaModel, ReservaModel
+from src.infraestructura.repositorios.producto_repository import ProductoRepositoryImpl
+from src.infraestructura.repositorios.reserva_repository import ReservaRepositoryImpl
+
+
+def _crear_producto(producto_id: str, cantidad: int) -> ProductoModel:
+    return ProductoModel(
+        id=producto_id,
+        nombre=f"Producto {producto_id}",
+        descripcion="Descripción",
+        categoria="insumos",
+        condiciones_almacenamiento="Temperatura ambiente",
+        valor_unitario=10.0,
+        cantidad_disponible=cantidad,
+        fecha_vencimiento=datetime(2026, 1, 1),
+        lote="LOT-RES",
+        tiempo_estimado_entrega="2 días",
+        id_proveedor="prov-001",
+        ubicacion="Bodega 1",
+    )
+
+
+def _stock(producto_id: str) -> int:
+    return db_productos.session.execute(
+        db_productos.select(ProductoModel.cantidad_disponible).where(ProductoModel.id == producto_id)
+    ).scalar_one()
+
+
+def _secuencias() -> dict:
+    """Secuencia global y de cada producto de los tests."""
+    session = db_productos.session
+    filas = session.execute(
+        db_productos.select(ProductoModel.id, ProductoModel.secuencia).where(ProductoModel.id.like("res-%"))
+    )
+    return {"global": session.execute(db_productos.select(SecuenciaCambiosModel.valor)).scalar_one(), **dict(filas.all())}
+
+
+def _pendientes() -> list:
+    return (
+        db_productos.session.execute(db_productos.select(StockPendienteModel.producto_id).order_by("producto_id"))
+        .scalars()
+        .all()
+    )
+
+
+def _limpiar():
+    session = db_productos.session
+    session.rollback()
+    session.execute(StockPendienteModel.__table__.delete())
+    session.execute(ReservaLineaModel.__table__.delete())
+    session.execute(ReservaModel.__table__.delete())
+    session.execute(ProductoModel.__table__.delete().where(ProductoModel.id.like("res-%")))
+    session.commit()
+
+
+class TestReservaRepositoryImpl:
+    """Tests para ReservaRepositoryImpl"""
+
+    @pytest.fixture
+    def productos(self, app_context):
+        session = db_productos.session
+        session.add_all([_crear_producto("res-1", 5), _crear_producto("res-2", 3)])
+        session.commit()
+        yield
+        _limpiar()
+
+    @pytest.fixture
+    def repository(self):
+        return ReservaRepositoryImpl()
+
+    def _expira_en(self, segundos: int = 600) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=segundos)
+
+    def test_crear_descuenta_stock_de_todas_las_lineas(self, productos, repository):
+        """Test de una reserva multi-línea que descuenta el stock y suma líneas repetidas"""
+        # Act
+        reserva = repository.crear(
+            [LineaReserva("res-2", 1), LineaReserva("res-1", 2), LineaReserva("res-2", 1)], self._expira_en()
+        )
+
+        # Assert
+        assert reserva.estado == EstadoReserva.PENDIENTE
+        assert reserva.lineas == (LineaReserva("res-1", 2), LineaReserva("res-2", 2))
+        assert _stock("res-1") == 3
+        assert _stock("res-2") == 1
+        assert repository.obtener_por_id(reserva.id) == reserva
+
+    def test_reserva_no_toma_la_secuencia_global(self, productos, repository):
+        """Test de que reservar no avanza la secuencia de cambios: los productos quedan pendientes de publicar"""
+        antes = _secuencias()
+
+        repository.crear([LineaReserva("res-1", 1), LineaReserva("res-2", 1)], self._expira_en())
+        repository.crear([LineaReserva("res-1", 1)], self._expira_en())
+
+        assert _secuencias() == antes
+        assert _pendientes() == ["res-1", "res-2"]
+
+    def test_version_del_catalogo_cambia_con_cada_reserva(self, productos, repository):
+        """Test de que la versión del catálogo (y el ETag) cambia con cada reserva antes de publicarla"""
+        catalogo = ProductoRepositoryImpl()
+        versiones = [catalogo.version_catalogo()]
+
+        reserva = repository.crear([LineaReserva("res-1", 1)], self._expira_en())
+        versiones.append(catalogo.version_catalogo())
+        repository.crear([LineaReserva("res-1", 1)], self._expira_en())
+        versiones.append(catalogo.version_catalogo())
+        repository.liberar(reserva.id)
+        versiones.append(catalogo.version_catalogo())
+        repository.publicar_stock_pendiente(limite=10)
+        versiones.append(catalogo.version_catalogo())
+
+        assert len(set(versiones)) == len(versiones)
+        assert versiones[-1] == str(int(versiones[0]) + 1)
+
+    def test_publicar_stock_pendiente(self, productos, repository):
+        """Test de que publicar asigna secuencias en lote y los cambios de stock llegan a /productos/cambios"""
+        repository.crear([LineaReserva("res-1", 2), LineaReserva("res-2", 1)], self._expira_en())
+        antes = _secuencias()
+
+        assert repository.publicar_stock_pendiente(limite=1) == 1
+        assert repository.publicar_stock_pendiente(limite=10) == 1
+        assert repository.publicar_stock_pendiente(limite=10) == 0
+
+        assert _pendientes() == []
+        despues = _secuencias()
+        assert despues == {"global": antes["global"] + 2, "res-1": antes["global"] + 1, "res-2": antes["global"] + 2}
+        cambios = ProductoRepositoryImpl().obtener_cambios(antes["global"], limite=10)
+        assert [(c.producto.id, c.producto.cantidad_disponible) for c in cambios.cambios] == [("res-1", 3), ("res-2", 2)]
+
+    def test_crear_sin_stock_suficiente_no_descuenta_nada(self, productos, repository):
+        """Test de que si una línea no tiene stock la reserva completa se revierte"""
+        # Act
+        with pytest.raises(StockInsuficienteError) as error:
+            repository.crear([LineaReserva("res-1", 2), LineaReserva("res-2", 4)], self._expira_en())
+
+        # Assert
+        assert (error.value.producto_id, error.value.solicitada, error.value.disponible) == ("res-2", 4, 3)
+        assert _stock("res-1") == 5
+        assert _stock("res-2") == 3
+        assert db_productos.session.query(ReservaModel).count() == 0
+        assert _pendientes() == []
+
+    def test_crear_producto_inexistente(self, productos, repository):
+        """Test de reservar un producto que no existe"""
+        with pytest.raises(ProductoNoEncontradoError):
+            repository.crear([LineaReserva("res-1", 1), LineaReserva("res-x", 1)], self._expira_en())
+
+        assert _stock("res-1") == 5
+
+    def test_obtener_por_id_no_encontrada(self, app_context, repository):
+        """Test de obtener una reserva inexistente"""
+        assert repository.obtener_por_id("no-existe") is None
+
+    def test_confirmar(self, productos, repository):
+        """Test de confirmar una reserva: el stock queda descontado"""
+        reserva = repository.crear([LineaReserva("res-1", 2)], self._expira_en())
+
+        confirmada = repository.confirmar(reserva.id, datetime.utcnow())
+
+        assert confirmada.estado == EstadoReserva.CONFIRMADA
+        assert _stock("res-1") == 3
+        with pytest.raises(EstadoReservaInvalidoError) as error:
+            repository.liberar(reserva.id)
+        assert error.value.estado == "CONFIRMADA"
+
+    def test_confirmar_vencida(self, productos, repository):
+        """Test de que una reserva vencida no se puede confirmar aunque el expirador no haya corrido"""
+        reserva = repository.crear([LineaReserva("res-1", 2)], self._expira_en(-1))
+
+        with pytest.raises(EstadoReservaInvalidoError) as error:
+            repository.confirmar(reserva.id, datetime.utcnow())
+
+        assert error.value.estado == "EXPIRADA"
+
+    def test_confirmar_no_encontrada(self, app_context, repository):
+        """Test de confirmar una reserva inexistente"""
+        with pytest.raises(ReservaNoEncontradaError):
+            repository.confirmar("no-existe", datetime.utcnow())
+
+    def test_liberar_devuelve_stock_una_sola_vez(self, productos, repository):
+        """Test de liberar una reserva: devuelve el stock y no se puede liberar de nuevo"""
+        reserva = repository.crear([LineaReserva("res-1", 2), LineaReserva("res-2", 3)], self._expira_en())
+
+        liberada = repository.liberar(reserva.id)
+
+        assert liberada.estado == EstadoReserva.LIBERADA
+        assert _stock("res-1") == 5
+        assert _stock("res-2") == 3
+        with pytest.raises(EstadoReservaInvalidoError):
+            repository.liberar(reserva.id)
+        assert _stock("res-1") == 5
+
+    def test_expirar_vencidas(self, productos, repository):
+        """Test de expirar solo las reservas pendientes vencidas"""
+        vencida = repository.crear([LineaReserva("res-1", 1)], self._expira_en(-10))
+        vigente = repository.crear([LineaReserva("res-1", 1)], self._expira_en())
+        confirmada = repository.crear([LineaReserva("res-2", 1)], self._expira_en(-10))
+        db_productos.session.execute(
+            ReservaModel.__table__.update().where(ReservaModel.id == confirmada.id).values(estado="CONFIRMADA")
+        )
+        db_productos.session.commit()
+
+        expiradas = repository.expirar_vencidas(datetime.utcnow(), limite=10)
+
+        assert [r.id for r in expiradas] == [vencida.id]
+        assert expiradas[0].estado == EstadoReserva.EXPIRADA
+        assert repository.obtener_por_id(vigente.id).estado == EstadoReserva.PENDIENTE
+        assert _stock("res-1") == 4
+        assert _stock("res-2") == 2
+
+
+class TestReservaConcurrencia:
+    """
+    Prueba de estrés: muchas reservas concurrentes sobre una base de datos en archivo
+    (cada hilo con su propia conexión) nunca reservan más stock del disponible.
+    """
+
+    HILOS = 16
+    INTENTOS_POR_HILO = 25
+    STOCK_INICIAL = 120
+
+    @pytest.fixture
+    def app_archivo(self, tmp_path):
+        app = Flask(__name__)
+        uri = normalizar_uri(os.environ.get("TEST_DATABASE_URL", f"sqlite:///{tmp_path / 'reservas.db'}"))
+        app.config["SQLALCHEMY_DATABASE_URI"] = uri
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones_motor(uri) or {"connect_args": {"timeout": 30}}
+        db_productos.init_app(app)
+        with app.app_context():
+            db_productos.drop_all()
+            db_productos.create_all()
+            db_productos.session.add_all([_crear_producto("res-a", self.STOCK_INICIAL), _crear_producto("res-b", 60)])
+            db_productos.session.commit()
+        yield app
+        with app.app_context():
+            db_productos.engine.dispose()
+
+    def _en_paralelo(self, app, trabajo):
+        barrera = threading.Barrier(self.HILOS)
+        errores = []
+
+        def correr(indice):
+            try:
+                with app.app_context():
+                    barrera.wait()
+                    trabajo(indice)
+            except Exception as e:  # pragma: no cover - se reporta en la aserción
+                errores.append(e)
+
+        hilos = [threading.Thread(target=correr, args=(i,)) for i in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        assert errores == []
+
+    def test_no_sobrevende_bajo_concurrencia(self, app_archivo):
+        """Test de que con más demanda que stock se reserva exactamente el stock disponible"""
+        repository = ReservaRepositoryImpl()
+        reservadas = Counter()
+        rechazos = Counter()
+        lock = threading.Lock()
+
+        def trabajo(indice):
+            for intento in range(self.INTENTOS_POR_HILO):
+                # Mezcla reservas de una línea y multi-línea para cubrir la atomicidad entre productos
+                lineas = [LineaReserva("res-a", 1)]
+                if (indice + intento) % 3 == 0:
+                    lineas.append(LineaReserva("res-b", 1))
+                try:
+                    repository.crear(lineas, datetime.utcnow() + timedelta(minutes=5))
+                except StockInsuficienteError:
+                    with lock:
+                        rechazos["total"] += 1
+                    continue
+                with lock:
+                    for linea in lineas:
+                        reservadas[linea.producto_id] += linea.cantidad
+
+        self._en_paralelo(app_archivo, trabajo)
+
+        with app_archivo.app_context():
+            assert reservadas["res-a"] == self.STOCK_INICIAL
+            assert rechazos["total"] == self.HILOS * self.INTENTOS_POR_HILO - self.STOCK_INICIAL
+            assert _stock("res-a") == 0
+            assert _stock("res-b") == 60 - reservadas["res-b"]
+            lineas = db_productos.session.query(ReservaLineaModel).all()
+            assert sum(linea.cantidad for linea in lineas if linea.producto_id == "res-a") == self.STOCK_INICIAL
+
+    def test_liberar_y_expirar_concurrentes_devuelven_stock_una_vez(self, app_archivo):
+        """Test de que liberaciones y expiraciones simultáneas de las mismas reservas no duplican stock"""
+        repository = ReservaRepositoryImpl()
+        with app_archivo.app_context():
+            ids = [
+                repository.crear([LineaReserva("res-b", 1)], datetime.utcnow() - timedelta(seconds=1)).id for _ in range(30)
+            ]
+            assert _stock("res-b") == 30
+
+        def trabajo(indice):
+            if indice % 2:
+                repository.expirar_vencidas(datetime.utcnow(), limite=100)
+                return
+            for reserva_id in ids:
+                try:
+                    repository.liberar(reserva_id)
+                except EstadoReservaInvalidoError:
+                    pass
+
+        self._en_paralelo(app_archivo, trabajo)
+
+        with app_archivo.app_context():
+            assert _stock("res-b") == 60
+            estados = {r.estado for r in db_productos.session.query(ReservaModel).all()}
+            assert estados <= {"LIBERADA", "EXPIRADA"}
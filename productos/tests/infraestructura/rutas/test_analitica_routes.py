@@ -0,0 +1,79 @@
+"""
+Tests unitarios para las rutas de analítica
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from src.infraestructura.rutas.analitica_routes import create_analitica_routes
+
+
+class TestAnaliticaRoutes:
+    """Tests para las rutas de analítica"""
+
+    @pytest.fixture
+    def mock_controller(self):
+        controller = MagicMock()
+        controller.resumen_inventario.return_value = ({}, 200)
+        controller.resumen_vencimientos.return_value = ({}, 200)
+        controller.estado.return_value = ({"productos": 0}, 200)
+        return controller
+
+    @pytest.fixture
+    def client(self, mock_controller):
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.register_blueprint(create_analitica_routes(mock_controller))
+        return app.test_client()
+
+    def test_create_analitica_routes(self, mock_controller):
+        """Test de creación de rutas"""
+        routes = create_analitica_routes(mock_controller)
+
+        assert routes.name == "analitica"
+        assert routes.url_prefix == "/productos/analitica"
+
+    def test_inventario_agrupa_por_categoria_por_defecto(self, client, mock_controller):
+        """Test de GET /productos/analitica/inventario"""
+        assert client.get("/productos/analitica/inventario").status_code == 200
+        assert client.get("/productos/analitica/inventario?agrupar_por=ninguno").status_code == 200
+        assert client.get("/productos/analitica/inventario?agrupar_por=id_proveedor").status_code == 200
+
+        assert [c.args for c in mock_controller.resumen_inventario.call_args_list] == [
+            ("categoria",),
+            (None,),
+            ("id_proveedor",),
+        ]
+
+    def test_inventario_dimension_invalida(self, client, mock_controller):
+        """Test de agrupar por una columna no permitida"""
+        response = client.get("/productos/analitica/inventario?agrupar_por=nombre")
+
+        assert response.status_code == 400
+        mock_controller.resumen_inventario.assert_not_called()
+
+    def test_vencimientos(self, client, mock_controller):
+        """Test de GET /productos/analitica/vencimientos con y sin horizontes"""
+        client.get("/productos/analitica/vencimientos")
+        client.get("/productos/analitica/vencimientos?horizontes=90,7,7&agrupar_por=ubicacion")
+
+        assert [c.args for c in mock_controller.resumen_vencimientos.call_args_list] == [
+            ((30, 60, 90), None),
+            ([7, 90], "ubicacion"),
+        ]
+
+    @pytest.mark.parametrize("horizontes", ["", "abc", "-1", "30,99999", ",".join(str(i) for i in range(11))])
+    def test_vencimientos_horizontes_invalidos(self, client, mock_controller, horizontes):
+        """Test de horizontes inválidos"""
+        response = client.get(f"/productos/analitica/vencimientos?horizontes={horizontes}")
+
+        assert response.status_code == 400
+        mock_controller.resumen_vencimientos.assert_not_called()
+
+    def test_estado(self, client):
+        """Test de GET /productos/analitica/estado"""
+        response = client.get("/productos/analitica/estado")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"productos": 0}
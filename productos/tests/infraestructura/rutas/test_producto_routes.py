@@ -2,10 +2,14 @@
 Tests unitarios para las rutas de productos
 """
 
+import re
 from unittest.mock import MagicMock
 
 import pytest
 from flask import Flask
+from src.aplicacion.mappers.producto_mapper import ProductoMapper
+from src.dominio.entities.asignacion import SolicitudAsignacion
+from src.dominio.entities.consulta import ConsultaProductos
 from src.infraestructura.rutas.producto_routes import create_producto_routes
 
 
@@ -65,7 +69,7 @@ class TestProductoRoutes:
         response = client.get("/productos/prod-001")
 
         assert response.status_code == 200
-        mock_controller.obtener_producto_por_id.assert_called_once_with("prod-001")
+        mock_controller.obtener_producto_por_id.assert_called_once_with("prod-001", ProductoMapper.CAMPOS)
 
     def test_route_obtener_productos_por_categoria(self, client, mock_controller):
         """Test de ruta GET /productos/categoria/<categoria>"""
@@ -77,7 +81,7 @@ class TestProductoRoutes:
         response = client.get("/productos/categoria/electronicos")
 
         assert response.status_code == 200
-        mock_controller.obtener_productos_por_categoria.assert_called_once_with("electronicos")
+        mock_controller.obtener_productos_por_categoria.assert_called_once_with("electronicos", ProductoMapper.CAMPOS)
 
     def test_route_buscar_productos_por_nombre(self, client, mock_controller):
         """Test de ruta GET /productos/buscar?nombre=..."""
@@ -89,7 +93,7 @@ class TestProductoRoutes:
         response = client.get("/productos/buscar?nombre=Laptop")
 
         assert response.status_code == 200
-        mock_controller.buscar_productos_por_nombre.assert_called_once_with("Laptop")
+        mock_controller.buscar_productos_por_nombre.assert_called_once_with("Laptop", ProductoMapper.CAMPOS)
 
     def test_route_buscar_productos_sin_nombre(self, client, mock_controller):
         """Test de ruta GET /productos/buscar sin parámetro nombre"""
@@ -119,7 +123,7 @@ class TestProductoRoutes:
         response = client.get("/productos/prod-999")
 
         assert response.status_code == 200
-        mock_controller.obtener_producto_por_id.assert_called_once_with("prod-999")
+        mock_controller.obtener_producto_por_id.assert_called_once_with("prod-999", ProductoMapper.CAMPOS)
 
     def test_route_obtener_productos_por_categoria_diferentes_categorias(self, client, mock_controller):
         """Test de ruta GET /productos/categoria/<categoria> con diferentes categorías"""
@@ -131,4 +135,346 @@ class TestProductoRoutes:
         response = client.get("/productos/categoria/deportes")
 
         assert response.status_code == 200
-        mock_controller.obtener_productos_por_categoria.assert_called_once_with("deportes")
+        mock_controller.obtener_productos_por_categoria.assert_called_once_with("deportes", ProductoMapper.CAMPOS)
+
+    def test_route_fields(self, client, mock_controller):
+        """Test de ?fields= en listado, detalle y exportación"""
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+        mock_controller.obtener_producto_por_id.return_value = ({}, 200)
+        mock_controller.exportar_productos.return_value = ("", 200)
+
+        assert client.get("/productos?fields=valor_unitario,id").status_code == 200
+        assert client.get("/productos/prod-001?fields=nombre").status_code == 200
+        assert client.get("/productos/export?formato=csv&fields=id").status_code == 200
+
+        mock_controller.obtener_todos_los_productos.assert_called_once_with(
+            ("id", "valor_unitario"), mimetype="application/json"
+        )
+        mock_controller.obtener_producto_por_id.assert_called_once_with("prod-001", ("nombre",))
+        mock_controller.exportar_productos.assert_called_once_with("csv", ("id",))
+
+    def test_route_fields_invalido(self, client, mock_controller):
+        """Test de ?fields= con un campo desconocido"""
+        response = client.get("/productos?fields=id,clave")
+
+        assert response.status_code == 400
+        assert "clave" in response.get_json()["error"]
+        mock_controller.obtener_todos_los_productos.assert_not_called()
+
+    def test_route_obtener_productos_filtrados(self, client, mock_controller):
+        """Test de ruta GET /productos con filtros, orden y página"""
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+
+        response = client.get("/productos?con_stock=1&valor_max=50&orden=-fecha_vencimiento&limite=20&fields=id")
+
+        assert response.status_code == 200
+        mock_controller.obtener_todos_los_productos.assert_called_once_with(
+            ("id",),
+            ConsultaProductos(valor_max=50.0, con_stock=True, orden=(("fecha_vencimiento", True),), limite=20),
+            mimetype="application/json",
+        )
+
+    @pytest.mark.parametrize(
+        "accept, esperado",
+        [
+            ("application/x-msgpack, application/json;q=0.9", "application/x-msgpack"),
+            ("application/x-msgpack", "application/x-msgpack"),
+            ("*/*", "application/json"),
+            ("text/html", "application/json"),
+        ],
+    )
+    def test_route_obtener_productos_negocia_formato(self, client, mock_controller, accept, esperado):
+        """Test de que Accept elige MessagePack solo si se pide; si no, JSON"""
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+
+        response = client.get("/productos", headers={"Accept": accept})
+
+        assert response.status_code == 200
+        mock_controller.obtener_todos_los_productos.assert_called_once_with(ProductoMapper.CAMPOS, mimetype=esperado)
+
+    @pytest.mark.parametrize("query", ["valor_min=x", "orden=lote", "limite=0", "limite=1001"])
+    def test_route_obtener_productos_filtros_invalidos(self, client, mock_controller, query):
+        """Test de ruta GET /productos con parámetros de consulta inválidos"""
+        response = client.get(f"/productos?{query}")
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+        mock_controller.obtener_todos_los_productos.assert_not_called()
+
+    def test_route_exportar_productos(self, client, mock_controller):
+        """Test de ruta GET /productos/export con formato por defecto"""
+        mock_controller.exportar_productos.return_value = ("", 200)
+
+        response = client.get("/productos/export")
+
+        assert response.status_code == 200
+        mock_controller.exportar_productos.assert_called_once_with("ndjson", ProductoMapper.CAMPOS)
+        mock_controller.obtener_producto_por_id.assert_not_called()
+
+    def test_route_exportar_productos_csv(self, client, mock_controller):
+        """Test de ruta GET /productos/export?formato=csv"""
+        mock_controller.exportar_productos.return_value = ("", 200)
+
+        response = client.get("/productos/export?formato=CSV")
+
+        assert response.status_code == 200
+        mock_controller.exportar_productos.assert_called_once_with("csv", ProductoMapper.CAMPOS)
+
+    def test_route_exportar_productos_formato_invalido(self, client, mock_controller):
+        """Test de ruta GET /productos/export con formato no soportado"""
+        response = client.get("/productos/export?formato=xml")
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+        mock_controller.exportar_productos.assert_not_called()
+
+    def test_route_resumir_productos(self, client, mock_controller):
+        """Test de ruta GET /productos/resumen, agrupando por categoría por defecto"""
+        mock_controller.resumir_productos.return_value = ({"grupos": []}, 200)
+
+        assert client.get("/productos/resumen").status_code == 200
+        assert client.get("/productos/resumen?agrupar=id_proveedor").status_code == 200
+
+        assert [c.args for c in mock_controller.resumir_productos.call_args_list] == [("categoria",), ("id_proveedor",)]
+
+    def test_route_resumir_productos_campo_invalido(self, client, mock_controller):
+        """Test de ruta GET /productos/resumen con una columna no permitida"""
+        response = client.get("/productos/resumen?agrupar=nombre")
+
+        assert response.status_code == 400
+        mock_controller.resumir_productos.assert_not_called()
+
+    def test_route_obtener_cambios(self, client, mock_controller):
+        """Test de ruta GET /productos/cambios con parámetros por defecto"""
+        mock_controller.obtener_cambios.return_value = ({"cambios": []}, 200)
+
+        response = client.get("/productos/cambios")
+
+        assert response.status_code == 200
+        mock_controller.obtener_cambios.assert_called_once_with(0, 500)
+
+    def test_route_obtener_cambios_con_parametros(self, client, mock_controller):
+        """Test de ruta GET /productos/cambios?desde=...&limite=..."""
+        mock_controller.obtener_cambios.return_value = ({"cambios": []}, 200)
+
+        response = client.get("/productos/cambios?desde=42&limite=10")
+
+        assert response.status_code == 200
+        mock_controller.obtener_cambios.assert_called_once_with(42, 10)
+
+    @pytest.mark.parametrize("query", ["desde=abc", "desde=-1", "limite=0", "limite=1001", "limite=x"])
+    def test_route_obtener_cambios_parametros_invalidos(self, client, mock_controller, query):
+        """Test de ruta GET /productos/cambios con parámetros inválidos"""
+        response = client.get(f"/productos/cambios?{query}")
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+        mock_controller.obtener_cambios.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "url, content_type, formato",
+        [
+            ("/productos/importar", "text/csv", "csv"),
+            ("/productos/importar", "application/x-ndjson", "ndjson"),
+            ("/productos/importar?formato=NDJSON", "application/octet-stream", "ndjson"),
+        ],
+    )
+    def test_route_importar_productos(self, client, mock_controller, url, content_type, formato):
+        """Test de ruta POST /productos/importar"""
+        mock_controller.importar_productos.return_value = ({"procesadas": 0}, 200)
+
+        response = client.post(url, data=b"id\n", content_type=content_type)
+
+        assert response.status_code == 200
+        assert mock_controller.importar_productos.call_args.args[1] == formato
+
+    def test_route_importar_productos_formato_desconocido(self, client, mock_controller):
+        """Test de ruta POST /productos/importar sin formato reconocible"""
+        response = client.post("/productos/importar", data=b"<productos/>", content_type="application/xml")
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+        mock_controller.importar_productos.assert_not_called()
+
+    def test_route_obtener_productos_por_ids(self, client, mock_controller):
+        """Test de ruta POST /productos/lote-ids"""
+        mock_controller.obtener_productos_por_ids.return_value = ({"resultados": []}, 200)
+
+        response = client.post("/productos/lote-ids", json={"ids": ["prod-001", "prod-002"]})
+
+        assert response.status_code == 200
+        mock_controller.obtener_productos_por_ids.assert_called_once_with(["prod-001", "prod-002"])
+
+    @pytest.mark.parametrize(
+        "body",
+        [None, {"ids": "prod-001"}, {"ids": []}, {"ids": ["prod-001", ""]}, {"ids": [1]}, ["prod-001"]],
+    )
+    def test_route_obtener_productos_por_ids_invalido(self, client, mock_controller, body):
+        """Test de ruta POST /productos/lote-ids con cuerpo inválido"""
+        response = client.post("/productos/lote-ids", json=body)
+
+        assert response.status_code == 400
+        mock_controller.obtener_productos_por_ids.assert_not_called()
+
+    def test_route_obtener_productos_por_ids_demasiados(self, client, mock_controller):
+        """Test de ruta POST /productos/lote-ids superando el máximo de IDs"""
+        response = client.post("/productos/lote-ids", json={"ids": [f"prod-{i}" for i in range(1001)]})
+
+        assert response.status_code == 400
+        mock_controller.obtener_productos_por_ids.assert_not_called()
+
+    def test_route_planificar_asignacion(self, client, mock_controller):
+        """Test de ruta GET /productos/asignacion"""
+        mock_controller.planificar_asignacion.return_value = ({"completo": True}, 200)
+
+        response = client.get("/productos/asignacion?producto_id=prod-001&cantidad=3&vigencia_minima_dias=30")
+
+        assert response.status_code == 200
+        mock_controller.planificar_asignacion.assert_called_once_with(
+            SolicitudAsignacion(cantidad=3, producto_id="prod-001"), 30
+        )
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "nombre=Gasa",
+            "nombre=Gasa&cantidad=x",
+            "nombre=Gasa&cantidad=0",
+            "cantidad=1",
+            "nombre=Gasa&cantidad=1&vigencia_minima_dias=-1",
+        ],
+    )
+    def test_route_planificar_asignacion_invalida(self, client, mock_controller, query):
+        """Test de validación de GET /productos/asignacion"""
+        response = client.get(f"/productos/asignacion?{query}")
+
+        assert response.status_code == 400
+        mock_controller.planificar_asignacion.assert_not_called()
+
+    def test_route_planificar_asignaciones(self, client, mock_controller):
+        """Test de ruta POST /productos/asignaciones"""
+        mock_controller.planificar_asignaciones.return_value = ({"completo": True, "planes": []}, 200)
+
+        response = client.post(
+            "/productos/asignaciones",
+            json={"lineas": [{"nombre": "Gasa", "cantidad": 2}, {"producto_id": "prod-001", "cantidad": 1}]},
+        )
+
+        assert response.status_code == 200
+        mock_controller.planificar_asignaciones.assert_called_once_with(
+            [SolicitudAsignacion(cantidad=2, nombre="Gasa"), SolicitudAsignacion(cantidad=1, producto_id="prod-001")], 0
+        )
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            None,
+            {"lineas": []},
+            {"lineas": [{"nombre": "Gasa"}]},
+            {"lineas": [{"nombre": "Gasa", "cantidad": 1}], "vigencia_minima_dias": "30"},
+            {"lineas": [{"nombre": "Gasa", "cantidad": 1}] * 501},
+        ],
+    )
+    def test_route_planificar_asignaciones_invalida(self, client, mock_controller, body):
+        """Test de validación de POST /productos/asignaciones"""
+        response = client.post("/productos/asignaciones", json=body)
+
+        assert response.status_code == 400
+        mock_controller.planificar_asignaciones.assert_not_called()
+
+    def test_route_listado_responde_etag(self, client, mock_controller):
+        """Test de que GET /productos incluye un ETag débil derivado de la versión del catálogo"""
+        mock_controller.version_catalogo.return_value = 42
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+
+        response = client.get("/productos")
+
+        assert response.status_code == 200
+        assert re.fullmatch(r'W/"productos-42-[0-9a-f]{16}"', response.headers["ETag"])
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_route_etag_distinto_por_representacion(self, client, mock_controller):
+        """Test de que formato, campos, filtros y página pedidos dan ETags distintos en la misma versión"""
+        mock_controller.version_catalogo.return_value = 42
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+
+        etags = [
+            client.get(url, headers=headers).headers["ETag"]
+            for url, headers in [
+                ("/productos", {}),
+                ("/productos", {"Accept": "application/x-msgpack"}),
+                ("/productos?fields=id,nombre", {}),
+                ("/productos?categoria=insumos", {}),
+                ("/productos?categoria=insumos&limite=10", {}),
+                ("/productos?categoria=insumos&limite=10&desplazamiento=10", {}),
+            ]
+        ]
+
+        assert len(set(etags)) == len(etags)
+        # El orden de los parámetros no cambia la representación
+        assert client.get("/productos?limite=10&categoria=insumos").headers["ETag"] == etags[4]
+
+    def test_route_etag_de_otra_representacion_no_responde_304(self, client, mock_controller):
+        """Test de que revalidar el JSON con el ETag del MessagePack devuelve el listado"""
+        mock_controller.version_catalogo.return_value = 42
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+        etag_msgpack = client.get("/productos", headers={"Accept": "application/x-msgpack"}).headers["ETag"]
+
+        response = client.get("/productos", headers={"If-None-Match": etag_msgpack})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag_msgpack
+
+    @pytest.mark.parametrize("url", ["/productos?categoria=insumos", "/productos/export", "/productos/buscar?nombre=Gasa"])
+    def test_route_if_none_match_responde_304_sin_consultar(self, client, mock_controller, url):
+        """Test de que con un If-None-Match vigente se responde 304 sin llegar al controlador"""
+        mock_controller.version_catalogo.return_value = 42
+        for metodo in ("obtener_todos_los_productos", "exportar_productos", "buscar_productos_por_nombre"):
+            getattr(mock_controller, metodo).return_value = ([], 200)
+        etag = client.get(url).headers["ETag"]
+        mock_controller.reset_mock(return_value=False)
+
+        response = client.get(url, headers={"If-None-Match": f'W/"productos-41", {etag}'})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.get_data() == b""
+        # El listado se negocia por Accept: su 304 lleva el mismo Vary que la respuesta completa
+        assert ("Accept" in response.headers.get("Vary", "")) == url.startswith("/productos?")
+        mock_controller.obtener_todos_los_productos.assert_not_called()
+        mock_controller.exportar_productos.assert_not_called()
+        mock_controller.buscar_productos_por_nombre.assert_not_called()
+
+    def test_route_if_none_match_vencido(self, client, mock_controller):
+        """Test de que un ETag de una versión anterior devuelve el listado completo"""
+        mock_controller.version_catalogo.return_value = 42
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+        etag = client.get("/productos").headers["ETag"]
+        mock_controller.version_catalogo.return_value = 43
+        mock_controller.obtener_todos_los_productos.reset_mock()
+
+        response = client.get("/productos", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"productos-43-')
+        mock_controller.obtener_todos_los_productos.assert_called_once()
+
+    def test_route_sin_version_no_responde_etag(self, client, mock_controller):
+        """Test de que si la versión no está disponible se responde sin ETag"""
+        mock_controller.version_catalogo.return_value = None
+        mock_controller.obtener_todos_los_productos.return_value = ([], 200)
+
+        response = client.get("/productos", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+    def test_route_error_no_responde_etag(self, client, mock_controller):
+        """Test de que las respuestas de error no llevan ETag"""
+        mock_controller.version_catalogo.return_value = 42
+        mock_controller.obtener_todos_los_productos.return_value = ({"error": "Error de base de datos"}, 500)
+
+        response = client.get("/productos")
+
+        assert response.status_code == 500
+        assert "ETag" not in response.headers
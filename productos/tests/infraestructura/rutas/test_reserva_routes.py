@@ -0,0 +1,90 @@
+"""
+Tests unitarios para las rutas de reservas
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from src.dominio.entities.reserva import LineaReserva
+from src.infraestructura.cmd.reserva_cmd import ReservaCmd
+from src.infraestructura.rutas.reserva_routes import create_reserva_routes
+
+
+class TestReservaRoutes:
+    """Tests para las rutas de reservas"""
+
+    @pytest.fixture
+    def mock_controller(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def client(self, mock_controller):
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.register_blueprint(create_reserva_routes(mock_controller))
+        return app.test_client()
+
+    def test_create_reserva_routes(self, mock_controller):
+        """Test de creación de rutas"""
+        routes = create_reserva_routes(mock_controller)
+
+        assert routes.name == "reservas"
+        assert routes.url_prefix == "/productos/reservas"
+
+    def test_route_reservar(self, client, mock_controller):
+        """Test de ruta POST /productos/reservas"""
+        mock_controller.reservar.return_value = ({"id": "res-001"}, 201)
+
+        response = client.post(
+            "/productos/reservas", json={"lineas": [{"producto_id": "prod-001", "cantidad": 2}], "ttl_segundos": 60}
+        )
+
+        assert response.status_code == 201
+        mock_controller.reservar.assert_called_once_with([LineaReserva("prod-001", 2)], 60)
+
+    def test_route_reservar_sin_ttl(self, client, mock_controller):
+        """Test de ruta POST /productos/reservas sin ttl_segundos"""
+        mock_controller.reservar.return_value = ({"id": "res-001"}, 201)
+
+        client.post("/productos/reservas", json={"lineas": [{"producto_id": "prod-001", "cantidad": 1}]})
+
+        mock_controller.reservar.assert_called_once_with([LineaReserva("prod-001", 1)], None)
+
+    @pytest.mark.parametrize(
+        "cuerpo",
+        [
+            None,
+            [],
+            {},
+            {"lineas": [{"producto_id": "prod-001", "cantidad": -1}]},
+            {"lineas": [{"producto_id": "prod-001", "cantidad": 1}], "ttl_segundos": 0},
+            {"lineas": [{"producto_id": "prod-001", "cantidad": 1}], "ttl_segundos": "60"},
+            {"lineas": [{"producto_id": "prod-001", "cantidad": 1}], "ttl_segundos": ReservaCmd.TTL_MAXIMO_SEGUNDOS + 1},
+            {"lineas": [{"producto_id": f"prod-{i}", "cantidad": 1} for i in range(ReservaCmd.LIMITE_LINEAS_POR_RESERVA + 1)]},
+        ],
+    )
+    def test_route_reservar_cuerpo_invalido(self, client, mock_controller, cuerpo):
+        """Test de validación del cuerpo de POST /productos/reservas"""
+        response = client.post("/productos/reservas", json=cuerpo)
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+        mock_controller.reservar.assert_not_called()
+
+    def test_route_obtener_reserva(self, client, mock_controller):
+        """Test de ruta GET /productos/reservas/<id>"""
+        mock_controller.obtener_reserva.return_value = ({"id": "res-001"}, 200)
+
+        assert client.get("/productos/reservas/res-001").status_code == 200
+        mock_controller.obtener_reserva.assert_called_once_with("res-001")
+
+    def test_route_confirmar_y_liberar(self, client, mock_controller):
+        """Test de rutas POST /productos/reservas/<id>/confirmar y /liberar"""
+        mock_controller.confirmar_reserva.return_value = ({"estado": "CONFIRMADA"}, 200)
+        mock_controller.liberar_reserva.return_value = ({"estado": "LIBERADA"}, 200)
+
+        assert client.post("/productos/reservas/res-001/confirmar").status_code == 200
+        assert client.post("/productos/reservas/res-002/liberar").status_code == 200
+        mock_controller.confirmar_reserva.assert_called_once_with("res-001")
+        mock_controller.liberar_reserva.assert_called_once_with("res-002")
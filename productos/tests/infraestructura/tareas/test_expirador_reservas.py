@@ -0,0 +1,50 @@
+"""
+Tests unitarios para ExpiradorReservas
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from flask import Flask
+from src.infraestructura.tareas.expirador_reservas import ExpiradorReservas
+
+
+class TestExpiradorReservas:
+    """Tests para ExpiradorReservas"""
+
+    def test_ejecutar_ciclo_agota_vencidas(self):
+        """Test de que un ciclo repite mientras haya lotes completos de reservas vencidas"""
+        mock_use_case = MagicMock()
+        mock_use_case.expirar_reservas.side_effect = [["r1", "r2"], ["r3"]]
+        mock_use_case.publicar_stock.side_effect = [2, 1]
+        expirador = ExpiradorReservas(Flask(__name__), mock_use_case, intervalo_segundos=60, limite_por_ciclo=2)
+
+        assert expirador.ejecutar_ciclo() == 3
+        assert mock_use_case.expirar_reservas.call_count == 2
+        # El stock pendiente también se publica en lotes hasta agotarlo
+        assert mock_use_case.publicar_stock.call_count == 2
+
+    def test_hilo_en_segundo_plano(self):
+        """Test de que el hilo ejecuta ciclos periódicamente, sobrevive a errores y se detiene"""
+        ciclos = threading.Event()
+        llamadas = []
+
+        def expirar(limite):
+            llamadas.append(limite)
+            if len(llamadas) == 1:
+                raise Exception("Error de base de datos")
+            ciclos.set()
+            return []
+
+        mock_use_case = MagicMock()
+        mock_use_case.expirar_reservas.side_effect = expirar
+        mock_use_case.publicar_stock.return_value = 0
+        expirador = ExpiradorReservas(Flask(__name__), mock_use_case, intervalo_segundos=0.01)
+
+        expirador.iniciar()
+        expirador.iniciar()
+        assert ciclos.wait(2)
+        expirador.detener(timeout=2)
+
+        assert len(llamadas) >= 2
+        assert expirador._hilo is None
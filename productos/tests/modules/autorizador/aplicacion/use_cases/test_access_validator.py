@@ -124,6 +124,15 @@ class TestAccessValidator:
         with pytest.raises(InsufficientPermissionsError):
             validator.validate_access(viewer_payload, "/productos", "POST")
 
+    def test_validate_access_viewer_lote_ids(self, validator, viewer_payload):
+        """Test de que la consulta por lote de IDs (POST) solo requiere lectura"""
+        result = validator.validate_access(viewer_payload, "/productos/lote-ids", "POST")
+        assert result is True
+
+    def test_validate_access_viewer_asignaciones(self, validator, viewer_payload):
+        """Test de que planificar asignaciones FEFO (POST) solo requiere lectura"""
+        assert validator.validate_access(viewer_payload, "/productos/asignaciones", "POST") is True
+
     def test_validate_access_unauthorized_route(self, validator, admin_payload):
         """Test de validación de acceso a ruta no autorizada"""
         with pytest.raises(InsufficientPermissionsError):
@@ -200,3 +200,46 @@ class TestTokenValidator:
         }
         with pytest.raises(InvalidTokenError):
             validator._validate_payload_structure(payload)
+
+    def _token(self, secret_key, user_id="user-001"):
+        exp = datetime.utcnow() + timedelta(hours=1)
+        return jwt.encode({"user_id": user_id, "role": "ADMIN", "exp": exp}, secret_key, algorithm="HS256")
+
+    def test_validate_token_desde_cache(self, validator, secret_key):
+        """Test de que un token ya validado no vuelve a verificar la firma"""
+        token = self._token(secret_key)
+        primero = validator.validate_token(token)
+
+        with patch("src.modules.autorizador.aplicacion.use_cases.token_validator.jwt.decode") as mock_decode:
+            segundo = validator.validate_token(token)
+
+        mock_decode.assert_not_called()
+        assert segundo is primero
+        assert validator.estadisticas_cache() == {"entradas": 1, "aciertos": 1, "fallos": 1}
+
+    def test_validate_token_en_cache_expirado(self, validator, secret_key):
+        """Test de que un token en cache se vuelve a verificar (y se rechaza) cuando expira"""
+        token = self._token(secret_key)
+        validator.validate_token(token).exp = datetime.utcnow() - timedelta(seconds=1)
+
+        with patch(
+            "src.modules.autorizador.aplicacion.use_cases.token_validator.jwt.decode", side_effect=jwt.ExpiredSignatureError
+        ) as mock_decode:
+            with pytest.raises(ExpiredTokenError):
+                validator.validate_token(token)
+
+        mock_decode.assert_called_once()
+
+    def test_cache_de_tokens_acotada(self, secret_key):
+        """Test de que la cache no pasa de cache_max_entradas y con 0 queda desactivada"""
+        acotado = TokenValidator(secret_key, "HS256", cache_max_entradas=2)
+        sin_cache = TokenValidator(secret_key, "HS256", cache_max_entradas=0)
+
+        for user_id in ("user-001", "user-002", "user-003"):
+            token = self._token(secret_key, user_id)
+            acotado.validate_token(token)
+            sin_cache.validate_token(token)
+            sin_cache.validate_token(token)
+
+        assert acotado.estadisticas_cache()["entradas"] <= 2
+        assert sin_cache.estadisticas_cache() == {"entradas": 0, "aciertos": 0, "fallos": 0}
@@ -2,13 +2,19 @@
 Tests unitarios para main.py
 """
 
+import json
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask
 from src.main import create_application, setup_logging
 
+_DIRECTORIO_SERVICIO = Path(__file__).resolve().parent.parent
+
 
 class TestMain:
     """Tests para main.py"""
@@ -60,6 +66,7 @@ class TestMain:
         mock_config_class.assert_called_once()
         mock_config_instance.create_app.assert_called_once()
         mock_setup_logging.assert_called_once_with(mock_app)
+        mock_config_instance.start_background_tasks.assert_called_once()
 
     @patch("src.main.Config")
     @patch("src.main.setup_logging")
@@ -81,3 +88,32 @@ class TestMain:
         from src import main
 
         assert main is not None
+
+
+class TestArranque:
+    """Tests de lo que importa el arranque (los tiempos se miden en benchmarks/bench_arranque.py)"""
+
+    # Solo los necesita la analítica, que los importa con su primera consulta
+    MODULOS_DIFERIDOS = ("numpy", "src.infraestructura.analitica.snapshot_columnar")
+
+    def test_arranque_no_importa_la_analitica(self, tmp_path):
+        """Test de que crear la aplicación en un proceso nuevo no importa numpy ni el snapshot de analítica"""
+        # En un proceso nuevo: en el de la suite otros tests ya los importaron
+        codigo = "import json, sys\nfrom src.main import app\nprint(json.dumps([m for m in sys.argv[1:] if m in sys.modules]))"
+        entorno = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'productos.db'}",
+            "LOG_LEVEL": "WARNING",
+            "RESERVAS_INTERVALO_EXPIRACION": "0",
+        }
+
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo, *self.MODULOS_DIFERIDOS],
+            cwd=_DIRECTORIO_SERVICIO,
+            env=entorno,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert json.loads(salida.stdout.strip().splitlines()[-1]) == []
@@ -1,10 +1,16 @@
+from typing import Any, Iterable, Optional, Sequence
+
 from src.aplicacion.dtos.provedor_dto import PaisDto, ProvedorDto
 from src.dominio.entities.provedor import Pais, Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class ProvedorMapper:
     """Mapper para convertir entre entidades y DTOs de proveedores."""
 
+    # Campos expuestos por la API, en el orden de dto_to_dict; son también las columnas de ProvedorModel
+    CAMPOS = ("id", "nit", "nombre", "pais", "direccion", "telefono", "email")
+
     @staticmethod
     def entity_to_dto(provedor: Provedor) -> ProvedorDto:
         """Convierte una entidad Provedor a ProvedorDto."""
@@ -54,6 +60,48 @@ class ProvedorMapper:
         """Convierte una lista de ProvedorDto a lista de diccionarios para serialización JSON."""
         return [ProvedorMapper.dto_to_dict(provedor_dto) for provedor_dto in provedores_dto]
 
+    @staticmethod
+    def parsear_campos(fields: Optional[str]) -> tuple[str, ...]:
+        """
+        Convierte el parámetro `fields` ("id,nombre,pais") en los campos a devolver.
+
+        Sin `fields` se devuelven todos. Los campos quedan en el orden de CAMPOS y sin repetir.
+
+        Raises:
+            ValueError: Si se pide un campo que la API no expone
+        """
+        pedidos = {campo.strip() for campo in (fields or "").split(",") if campo.strip()}
+        if not pedidos:
+            return ProvedorMapper.CAMPOS
+        desconocidos = sorted(pedidos.difference(ProvedorMapper.CAMPOS))
+        if desconocidos:
+            raise ValueError(
+                f"Campos desconocidos en fields: {', '.join(desconocidos)}. "
+                f"Campos disponibles: {', '.join(ProvedorMapper.CAMPOS)}"
+            )
+        return tuple(campo for campo in ProvedorMapper.CAMPOS if campo in pedidos)
+
+    @staticmethod
+    def proyectar(provedor_dict: dict, campos: Sequence[str]) -> dict:
+        """Deja en el diccionario de un proveedor solo los `campos` pedidos."""
+        if len(campos) == len(ProvedorMapper.CAMPOS):
+            return provedor_dict
+        return {campo: provedor_dict[campo] for campo in campos}
+
+    @staticmethod
+    def filas_to_dicts(campos: Sequence[str], filas: Iterable[tuple[Any, ...]]) -> list[dict]:
+        """Convierte filas de columnas (obtener_filas) a diccionarios, sin pasar por entidades ni DTOs."""
+        return [dict(zip(campos, fila)) for fila in filas]
+
+    @staticmethod
+    def conteos_to_dict(campo: str, conteos: list[ConteoGrupo]) -> dict:
+        """Convierte los conteos agrupados a diccionario para serialización JSON."""
+        return {
+            "agrupar": campo,
+            "total": sum(conteo.total for conteo in conteos),
+            "grupos": [{"clave": conteo.clave, "total": conteo.total} for conteo in conteos],
+        }
+
     @staticmethod
     def dict_to_entity(provedor_dict: dict) -> Provedor:
         """Convierte un diccionario a entidad Provedor. El ID se genera automáticamente en el repositorio."""
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.dominio.entities.provedor import Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 from src.dominio.repositorios.provedor_repository import ProvedorRepository
 
 
@@ -14,6 +15,10 @@ class ProvedorService:
         """Obtiene todos los proveedores."""
         return self.provedor_repository.obtener_todos()
 
+    def obtener_filas_provedores(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los proveedores."""
+        return self.provedor_repository.obtener_filas(columnas)
+
     def obtener_provedor_por_id(self, provedor_id: int) -> Optional[Provedor]:
         """Obtiene un proveedor por su ID."""
         return self.provedor_repository.obtener_por_id(provedor_id)
@@ -30,6 +35,10 @@ class ProvedorService:
         """Busca proveedores por nombre."""
         return self.provedor_repository.buscar_por_nombre(nombre)
 
+    def contar_provedores_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta proveedores agrupados por `campo`."""
+        return self.provedor_repository.contar_por(campo)
+
     def crear_provedor(self, provedor: Provedor) -> Provedor:
         """Crea un nuevo proveedor."""
         return self.provedor_repository.crear(provedor)
@@ -41,3 +50,7 @@ class ProvedorService:
     def eliminar_provedor(self, provedor_id: int) -> bool:
         """Elimina un proveedor por su ID."""
         return self.provedor_repository.eliminar(provedor_id)
+
+    def obtener_version_provedores(self) -> int:
+        """Obtiene la versión actual de la tabla de proveedores."""
+        return self.provedor_repository.version()
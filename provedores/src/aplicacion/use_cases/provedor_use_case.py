@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.aplicacion.servicios.provedor_service import ProvedorService
 from src.dominio.entities.provedor import Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class ProvedorUseCase:
@@ -14,6 +15,10 @@ class ProvedorUseCase:
         """Obtiene todos los proveedores."""
         return self.provedor_service.obtener_todos_los_provedores()
 
+    def obtener_filas_provedores(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los proveedores."""
+        return self.provedor_service.obtener_filas_provedores(columnas)
+
     def obtener_provedor_por_id(self, provedor_id: int) -> Optional[Provedor]:
         """Obtiene un proveedor por su ID."""
         return self.provedor_service.obtener_provedor_por_id(provedor_id)
@@ -30,6 +35,10 @@ class ProvedorUseCase:
         """Busca proveedores por nombre."""
         return self.provedor_service.buscar_provedores_por_nombre(nombre)
 
+    def contar_provedores_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta proveedores agrupados por `campo`."""
+        return self.provedor_service.contar_provedores_por(campo)
+
     def crear_provedor(self, provedor: Provedor) -> Provedor:
         """Crea un nuevo proveedor."""
         return self.provedor_service.crear_provedor(provedor)
@@ -41,3 +50,7 @@ class ProvedorUseCase:
     def eliminar_provedor(self, provedor_id: int) -> bool:
         """Elimina un proveedor por su ID."""
         return self.provedor_service.eliminar_provedor(provedor_id)
+
+    def obtener_version_provedores(self) -> int:
+        """Obtiene la versión actual de la tabla de proveedores."""
+        return self.provedor_service.obtener_version_provedores()
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConteoGrupo:
+    """
+    Cantidad de proveedores de un valor de la columna agrupada.
+    """
+
+    clave: str
+    total: int
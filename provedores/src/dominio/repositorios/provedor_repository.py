@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.dominio.entities.provedor import Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class ProvedorRepository(ABC):
@@ -12,6 +13,11 @@ class ProvedorRepository(ABC):
         """Obtiene todos los proveedores."""
         pass
 
+    @abstractmethod
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los proveedores, como tuplas."""
+        pass
+
     @abstractmethod
     def obtener_por_id(self, provedor_id: int) -> Optional[Provedor]:
         """Obtiene un proveedor por su ID."""
@@ -32,6 +38,11 @@ class ProvedorRepository(ABC):
         """Busca proveedores por nombre."""
         pass
 
+    @abstractmethod
+    def contar_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta proveedores agrupando por una columna, de mayor a menor cantidad."""
+        pass
+
     @abstractmethod
     def crear(self, provedor: Provedor) -> Provedor:
         """Crea un nuevo proveedor."""
@@ -46,3 +57,8 @@ class ProvedorRepository(ABC):
     def eliminar(self, provedor_id: int) -> bool:
         """Elimina un proveedor por su ID."""
         pass
+
+    @abstractmethod
+    def version(self) -> int:
+        """Número que cambia con cada creación, actualización o eliminación de proveedores."""
+        pass
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from flask import jsonify
 from src.aplicacion.mappers.provedor_mapper import ProvedorMapper
@@ -9,20 +9,31 @@ from src.dominio.entities.provedor import Provedor
 class ProvedorCmd:
     """Controlador para la gestión de proveedores."""
 
+    # Columnas por las que se puede agrupar en /provedores/resumen
+    CAMPOS_RESUMEN = ("pais",)
+
     def __init__(self, provedor_use_case: ProvedorUseCase):
         self.provedor_use_case = provedor_use_case
 
-    def obtener_todos_los_provedores(self):
-        """Obtiene todos los proveedores."""
+    def obtener_todos_los_provedores(self, campos: Optional[Sequence[str]] = None):
+        """
+        Obtiene todos los proveedores.
+
+        Con `campos` solo se leen esas columnas de la base de datos, sin construir entidades.
+        """
         try:
-            provedores = self.provedor_use_case.obtener_todos_los_provedores()
-            provedores_dto = ProvedorMapper.entities_to_dtos(provedores)
-            provedores_dict = ProvedorMapper.dtos_to_dicts(provedores_dto)
+            if campos is None:
+                provedores = self.provedor_use_case.obtener_todos_los_provedores()
+                provedores_dto = ProvedorMapper.entities_to_dtos(provedores)
+                provedores_dict = ProvedorMapper.dtos_to_dicts(provedores_dto)
+            else:
+                filas = self.provedor_use_case.obtener_filas_provedores(campos)
+                provedores_dict = ProvedorMapper.filas_to_dicts(campos, filas)
             return jsonify({"success": True, "data": provedores_dict, "total": len(provedores_dict)}), 200
         except Exception as e:
             return jsonify({"success": False, "error": f"Error al obtener proveedores: {str(e)}"}), 500
 
-    def obtener_provedor_por_id(self, provedor_id: int):
+    def obtener_provedor_por_id(self, provedor_id: int, campos: Optional[Sequence[str]] = None):
         """Obtiene un proveedor por su ID."""
         try:
             provedor = self.provedor_use_case.obtener_provedor_por_id(provedor_id)
@@ -31,11 +42,13 @@ class ProvedorCmd:
 
             provedor_dto = ProvedorMapper.entity_to_dto(provedor)
             provedor_dict = ProvedorMapper.dto_to_dict(provedor_dto)
+            if campos is not None:
+                provedor_dict = ProvedorMapper.proyectar(provedor_dict, campos)
             return jsonify({"success": True, "data": provedor_dict}), 200
         except Exception as e:
             return jsonify({"success": False, "error": f"Error al obtener proveedor: {str(e)}"}), 500
 
-    def obtener_provedor_por_nit(self, nit: int):
+    def obtener_provedor_por_nit(self, nit: int, campos: Optional[Sequence[str]] = None):
         """Obtiene un proveedor por su NIT."""
         try:
             provedor = self.provedor_use_case.obtener_provedor_por_nit(nit)
@@ -44,30 +57,51 @@ class ProvedorCmd:
 
             provedor_dto = ProvedorMapper.entity_to_dto(provedor)
             provedor_dict = ProvedorMapper.dto_to_dict(provedor_dto)
+            if campos is not None:
+                provedor_dict = ProvedorMapper.proyectar(provedor_dict, campos)
             return jsonify({"success": True, "data": provedor_dict}), 200
         except Exception as e:
             return jsonify({"success": False, "error": f"Error al obtener proveedor: {str(e)}"}), 500
 
-    def obtener_provedores_por_pais(self, pais: str):
+    def obtener_provedores_por_pais(self, pais: str, campos: Optional[Sequence[str]] = None):
         """Obtiene proveedores por país."""
         try:
             provedores = self.provedor_use_case.obtener_provedores_por_pais(pais)
             provedores_dto = ProvedorMapper.entities_to_dtos(provedores)
             provedores_dict = ProvedorMapper.dtos_to_dicts(provedores_dto)
+            if campos is not None:
+                provedores_dict = [ProvedorMapper.proyectar(p, campos) for p in provedores_dict]
             return jsonify({"success": True, "data": provedores_dict, "total": len(provedores_dict)}), 200
         except Exception as e:
             return jsonify({"success": False, "error": f"Error al obtener proveedores: {str(e)}"}), 500
 
-    def buscar_provedores_por_nombre(self, nombre: str):
+    def buscar_provedores_por_nombre(self, nombre: str, campos: Optional[Sequence[str]] = None):
         """Busca proveedores por nombre."""
         try:
             provedores = self.provedor_use_case.buscar_provedores_por_nombre(nombre)
             provedores_dto = ProvedorMapper.entities_to_dtos(provedores)
             provedores_dict = ProvedorMapper.dtos_to_dicts(provedores_dto)
+            if campos is not None:
+                provedores_dict = [ProvedorMapper.proyectar(p, campos) for p in provedores_dict]
             return jsonify({"success": True, "data": provedores_dict, "total": len(provedores_dict)}), 200
         except Exception as e:
             return jsonify({"success": False, "error": f"Error al buscar proveedores: {str(e)}"}), 500
 
+    def resumir_provedores(self, campo: str):
+        """Cuenta proveedores agrupados por `campo`."""
+        try:
+            conteos = self.provedor_use_case.contar_provedores_por(campo)
+            return jsonify({"success": True, "data": ProvedorMapper.conteos_to_dict(campo, conteos)}), 200
+        except Exception as e:
+            return jsonify({"success": False, "error": f"Error al resumir proveedores: {str(e)}"}), 500
+
+    def version_provedores(self) -> Optional[int]:
+        """Versión actual de los proveedores para los ETag; None si no se pudo consultar."""
+        try:
+            return self.provedor_use_case.obtener_version_provedores()
+        except Exception:
+            return None
+
     def registrar_provedor(self, provedor_data: dict):
         """Registra un nuevo proveedor."""
         try:
@@ -1,17 +1,24 @@
-import logging
 import os
-from datetime import datetime
 
 from dotenv import load_dotenv
-from flask import Flask, g, request
+from flask import Flask
 from src.aplicacion.servicios.provedor_service import ProvedorService
 from src.aplicacion.use_cases.provedor_use_case import ProvedorUseCase
+from src.infraestructura.cache.cache_lru import CacheLRU
 from src.infraestructura.cmd.provedor_cmd import ProvedorCmd
 from src.infraestructura.config.db import db_provedores, init_db_provedores
+from src.infraestructura.config.metricas import REGISTRO, registrar_metricas
+from src.infraestructura.config.migraciones import create_migraciones_cli, verificar_migraciones
+from src.infraestructura.config.motor import binds_replicas, normalizar_uri, opciones_motor
+from src.infraestructura.config.perfil_consultas import registrar_perfil_consultas
+from src.infraestructura.config.registro import leer_muestreo, registrar_accesos
+from src.infraestructura.config.sqlite import pragmas_sqlite
+from src.infraestructura.config.trazas import crear_exportador, registrar_trazas, trazar
+from src.infraestructura.migraciones import MIGRACIONES
 from src.infraestructura.rutas.provedor_routes import create_provedor_routes
 
 # Módulo de autorización
-from src.modules.autorizador import create_authorization_middleware, create_authorization_module
+from src.modules.autorizador import create_authorization_middleware
 
 load_dotenv(".env")
 
@@ -40,6 +47,15 @@ class Config:
         # Configurar logging de requests
         self._configure_request_logging()
 
+        # Métricas de peticiones y consultas SQL en /metrics
+        self._configure_metrics()
+
+        # Trazas W3C (traceparent) de peticiones, autorización, consultas SQL y serialización
+        self._configure_tracing()
+
+        # Consultas SQL por petición, consultas lentas con su plan y posibles N+1
+        self._configure_query_profiling()
+
         # Inyección de dependencias
         self._setup_dependencies()
 
@@ -55,81 +71,118 @@ class Config:
         self.app.config["HOST"] = os.getenv("HOST", "0.0.0.0")
         self.app.config["PORT"] = int(os.getenv("PORT", 5003))
         self.app.config["LOG_LEVEL"] = os.getenv("LOG_LEVEL", "INFO")
+        # Fracción de peticiones registradas por prefijo de ruta, p. ej. "/health:0,/productos:0.1"
+        self.app.config["REGISTRO_ACCESOS_MUESTREO"] = leer_muestreo(os.getenv("REGISTRO_ACCESOS_MUESTREO", ""))
+        # Destino de las trazas ("" las desactiva, "memoria", "archivo:<ruta>" o "modulo:Clase") y fracción muestreada
+        self.app.config["TRAZAS_EXPORTADOR"] = os.getenv("TRAZAS_EXPORTADOR", "")
+        self.app.config["TRAZAS_MUESTREO"] = float(os.getenv("TRAZAS_MUESTREO", 1))
 
         # Configuración de base de datos
-        self.app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URI", "sqlite:///instance/provedores.db")
+        # DATABASE_URL como en los demás servicios; DATABASE_URI se mantiene por compatibilidad
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = normalizar_uri(
+            os.getenv("DATABASE_URL", os.getenv("DATABASE_URI", "sqlite:///provedores.db"))
+        )
         self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-        # Inicializar base de datos
+        # Pool de conexiones y statement timeout para un servidor de base de datos (PostgreSQL)
+        self.app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones_motor(self.app.config["SQLALCHEMY_DATABASE_URI"])
+        # Réplicas de lectura para los métodos @solo_lectura de los repositorios; tras cada escritura
+        # el proceso lee de la primaria durante REPLICAS_VENTANA_SEGUNDOS (retraso máximo esperado)
+        self.app.config["SQLALCHEMY_BINDS"] = binds_replicas()
+        self.app.config["REPLICAS_VENTANA_SEGUNDOS"] = float(os.getenv("REPLICAS_VENTANA_SEGUNDOS", 5))
+        # Pragmas de SQLite por conexión (WAL, synchronous, cache, mmap, temp_store y busy_timeout)
+        self.app.config["SQLITE_PRAGMAS"] = pragmas_sqlite()
+        # Consultas lentas (se registran con su EXPLAIN) y repetidas en una petición (posible N+1); 0 desactiva el aviso
+        self.app.config["SQL_UMBRAL_LENTA_MS"] = float(os.getenv("SQL_UMBRAL_LENTA_MS", 200))
+        self.app.config["SQL_UMBRAL_REPETICIONES"] = int(os.getenv("SQL_UMBRAL_REPETICIONES", 10))
+
+        # Inicializar base de datos; el esquema (incluida la tabla secuencia_cambios que versiona los
+        # listados) lo crea `flask migraciones aplicar`, no el arranque
         init_db_provedores(self.app)
+        self._import_models()
+        verificar_migraciones(self.app, db_provedores, MIGRACIONES)
+        self.app.cli.add_command(create_migraciones_cli(db_provedores, MIGRACIONES))
 
         # Configuración JWT para autorización
         self.app.config["JWT_SECRET"] = os.getenv("JWT_SECRET", "your-secret-key-here")
         self.app.config["ALGORITHM"] = os.getenv("ALGORITHM", "HS256")
+        # Tokens ya validados que cada proceso recuerda para no verificar su firma en cada petición
+        self.app.config["JWT_CACHE_MAX_ENTRADAS"] = int(os.getenv("JWT_CACHE_MAX_ENTRADAS", 10000))
+
+        # TTL de la cache de conteos de /provedores/resumen
+        self.app.config["RESUMEN_CACHE_TTL_SEGUNDOS"] = float(os.getenv("RESUMEN_CACHE_TTL_SEGUNDOS", 30))
+
+    def _import_models(self):
+        """Importa los modelos de base de datos para que SQLAlchemy los registre."""
+        from src.infraestructura.dto.provedor import ProvedorModel  # noqa: F401
 
     def _configure_request_logging(self):
-        """Configura el middleware para logging de requests y responses."""
-        logger = logging.getLogger("request_logger")
-
-        @self.app.before_request
-        def log_request():
-            """Log cuando entra una petición."""
-            g.start_time = datetime.now().time()
-            logger.info(f"INCOMING REQUEST: {request.method} {request.url}")
-
-            # Log headers si está en modo debug
-            if self.app.config.get("DEBUG"):
-                logger.debug(f"Headers: {dict(request.headers)}")
-                if request.is_json:
-                    logger.debug(f"Request Body: {request.get_json()}")
-
-        @self.app.after_request
-        def log_response(response):
-            """Log cuando sale una respuesta."""
-            if hasattr(g, "start_time"):
-                duration = (datetime.now() - datetime.combine(datetime.today(), g.start_time)).total_seconds()
-                logger.info(
-                    f"OUTGOING RESPONSE: {response.status_code} - Duration: {duration * 1000:.0f}ms - Size: {len(response.get_data())} bytes"
-                )
-            else:
-                logger.info(f"OUTGOING RESPONSE: {response.status_code}")
-            return response
+        """Registra una línea JSON por petición, escrita fuera del hilo de la petición (ver registro.py)."""
+        registrar_accesos(self.app, self.app.config.get("REGISTRO_ACCESOS_MUESTREO", {}))
+
+    def _configure_metrics(self):
+        """Expone /metrics en el formato de Prometheus: peticiones, consultas SQL y cache de tokens (ver metricas.py)."""
+        registrar_metricas(self.app)
+
+    def _configure_tracing(self):
+        """Traza cada petición y la exporta a TRAZAS_EXPORTADOR (ver trazas.py)."""
+        registrar_trazas(self.app, crear_exportador(self.app.config["TRAZAS_EXPORTADOR"]), self.app.config["TRAZAS_MUESTREO"])
+
+    def _configure_query_profiling(self):
+        """Perfila las consultas SQL de cada petición; en modo debug lo devuelve en cabeceras (ver perfil_consultas.py)."""
+        registrar_perfil_consultas(
+            self.app,
+            self.app.config["SQL_UMBRAL_LENTA_MS"],
+            self.app.config["SQL_UMBRAL_REPETICIONES"],
+            cabeceras=self.app.config["DEBUG"],
+        )
 
     def _setup_dependencies(self):
         """Configura la inyección de dependencias siguiendo arquitectura hexagonal."""
         # Importar aquí para evitar importación circular
         from src.infraestructura.repositorios.provedor_repository import ProvedorRepositoryImpl
+        from src.infraestructura.repositorios.provedor_repository_cache import ProvedorRepositoryCache
 
-        # Capa de Infraestructura
-        provedor_repository = ProvedorRepositoryImpl()
+        # Capa de Infraestructura (con cache de conteos delante de la base de datos)
+        self.provedor_repository = ProvedorRepositoryCache(
+            ProvedorRepositoryImpl(),
+            cache_resumen=CacheLRU(len(ProvedorCmd.CAMPOS_RESUMEN), self.app.config.get("RESUMEN_CACHE_TTL_SEGUNDOS")),
+        )
         # Capa de Dominio
-        provedor_service = ProvedorService(provedor_repository)
+        provedor_service = ProvedorService(self.provedor_repository)
         # Capa de Aplicación
         provedor_use_case = ProvedorUseCase(provedor_service)
         # Capa de Presentación (Controladores)
         self.provedor_controller = ProvedorCmd(provedor_use_case)
 
-        # Configuración del módulo de autorización
-        self.authorization_service = create_authorization_module(
-            self.app.config.get("JWT_SECRET"), self.app.config.get("ALGORITHM")
-        )
-
     def _register_routes(self):
         """Registra todas las rutas de la aplicación."""
-        # Activar middleware de autorización para seguridad del microservicio
-        create_authorization_middleware(self.app, self.app.config.get("JWT_SECRET"), self.app.config.get("ALGORITHM"))
+        # Activar middleware de autorización para seguridad del microservicio; su AuthService
+        # atiende también las rutas /auth
+        auth_service = create_authorization_middleware(
+            self.app,
+            self.app.config.get("JWT_SECRET"),
+            self.app.config.get("ALGORITHM"),
+            self.app.config.get("JWT_CACHE_MAX_ENTRADAS", 10000),
+        )
+        token_validator = auth_service.token_validator
+        REGISTRO.contador_externo(
+            "jwt_cache_consultas_total",
+            "Validaciones de tokens JWT resueltas por la cache (acierto) o verificando la firma (fallo)",
+            ("resultado",),
+            lambda: {("acierto",): token_validator.cache_aciertos, ("fallo",): token_validator.cache_fallos},
+        )
+        # La autorización de cada petición es un span de su traza
+        auth_service.authorize_access = trazar("autorizacion")(auth_service.authorize_access)
 
         # Registrar rutas de proveedores
         provedor_routes = create_provedor_routes(self.provedor_controller)
         self.app.register_blueprint(provedor_routes)
 
         # Registrar rutas de autorización (para que el Gateway pueda usar)
-        from src.modules.autorizador.aplicacion.servicios.auth_service import AuthService
         from src.modules.autorizador.infraestructura.cmd.auth_cmd import AuthCmd
         from src.modules.autorizador.infraestructura.rutas.auth_routes import create_auth_routes
 
-        # Crear servicio y controlador de autorización
-        auth_service = AuthService(self.app.config.get("JWT_SECRET"), self.app.config.get("ALGORITHM"))
+        # Crear controlador de autorización
         auth_controller = AuthCmd(auth_service)
         auth_routes = create_auth_routes(auth_controller)
         self.app.register_blueprint(auth_routes)
@@ -160,7 +213,13 @@ class Config:
         # Ruta de health check
         @self.app.route("/health")
         def health():
-            return {"status": "healthy", "service": "provedores", "version": "2.0.0", "auth_enabled": True}
+            return {
+                "status": "healthy",
+                "service": "provedores",
+                "version": "2.0.0",
+                "auth_enabled": True,
+                "cache": self.provedor_repository.estadisticas(),
+            }
 
     def get_app(self) -> Flask:
         """
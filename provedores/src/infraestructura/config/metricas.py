@@ -0,0 +1,452 @@
+import bisect
+import contextvars
+import fcntl
+import functools
+import hmac
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from flask import Flask, Response, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Límites (segundos) de las cubetas de los histogramas: peticiones HTTP y consultas SQL
+CUBETAS_PETICION = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CUBETAS_CONSULTA = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+Etiquetas = Tuple[str, ...]
+
+
+class _Metrica:
+    """
+    Métrica con etiquetas cuyo registro no toma ningún lock.
+
+    Cada hilo escribe en su propio diccionario (etiquetas -> valor) y la lectura suma los
+    de todos los hilos. Solo el primer registro de un hilo toma un lock, para agregar su
+    diccionario a la lista.
+    """
+
+    tipo = ""
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str]):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self._local = threading.local()
+        self._fragmentos: List[dict] = []
+        self._lock = threading.Lock()
+
+    def _fragmento(self) -> dict:
+        try:
+            return self._local.valores
+        except AttributeError:
+            valores = {}
+            with self._lock:
+                self._fragmentos.append(valores)
+            self._local.valores = valores
+            return valores
+
+    def valores(self) -> Dict[Etiquetas, object]:
+        total: Dict[Etiquetas, object] = {}
+        for fragmento in list(self._fragmentos):
+            # dict.copy() es atómica con el GIL aunque el hilo dueño siga escribiendo
+            for etiquetas, valor in fragmento.copy().items():
+                total[etiquetas] = _sumar(total.get(etiquetas), valor)
+        return total
+
+
+class Contador(_Metrica):
+    tipo = "counter"
+
+    def inc(self, *etiquetas: str, cantidad: float = 1) -> None:
+        fragmento = self._fragmento()
+        fragmento[etiquetas] = fragmento.get(etiquetas, 0) + cantidad
+
+
+class Indicador(Contador):
+    """Valor que sube y baja (p. ej. peticiones en curso): cada hilo acumula sus incrementos."""
+
+    tipo = "gauge"
+
+    def dec(self, *etiquetas: str) -> None:
+        self.inc(*etiquetas, cantidad=-1)
+
+
+class Histograma(_Metrica):
+    """Histograma con cubetas fijas. Cada serie es [cuenta por cubeta..., cuenta > último límite, suma]."""
+
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str], limites: Sequence[float]):
+        self.limites = tuple(limites)
+        super().__init__(nombre, ayuda, etiquetas)
+
+    def observar(self, valor: float, *etiquetas: str) -> None:
+        fragmento = self._fragmento()
+        serie = fragmento.get(etiquetas)
+        if serie is None:
+            serie = fragmento[etiquetas] = [0] * (len(self.limites) + 2)
+        serie[bisect.bisect_left(self.limites, valor)] += 1
+        serie[-1] += valor
+
+    def valores(self) -> Dict[Etiquetas, object]:
+        # Copiar cada serie: el hilo dueño puede seguir incrementándola durante la lectura
+        total: Dict[Etiquetas, object] = {}
+        for fragmento in list(self._fragmentos):
+            for etiquetas, serie in fragmento.copy().items():
+                total[etiquetas] = _sumar(total.get(etiquetas), list(serie))
+        return total
+
+
+def _sumar(acumulado, valor):
+    if acumulado is None:
+        return valor
+    if isinstance(valor, list):
+        return [a + b for a, b in zip(acumulado, valor)]
+    return acumulado + valor
+
+
+class RegistroMetricas:
+    """
+    Métricas del proceso y su exposición en el formato de texto de Prometheus.
+
+    Con gunicorn cada worker es un proceso con sus propias métricas: cada uno vuelca las
+    suyas periódicamente en un archivo de METRICAS_DIRECTORIO y /metrics suma las del
+    worker que atiende la petición con las de los archivos de los demás.
+    """
+
+    def __init__(self):
+        self._metricas: Dict[str, _Metrica] = {}
+        self._externos: List[Tuple[Contador, Callable[[], Mapping[Etiquetas, float]]]] = []
+        self._directorio: Optional[str] = None
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def _agregar(self, metrica: _Metrica) -> _Metrica:
+        self._metricas[metrica.nombre] = metrica
+        return metrica
+
+    def contador(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Contador:
+        return self._agregar(Contador(nombre, ayuda, etiquetas))
+
+    def indicador(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Indicador:
+        return self._agregar(Indicador(nombre, ayuda, etiquetas))
+
+    def histograma(self, nombre: str, ayuda: str, etiquetas: Sequence[str], limites: Sequence[float]) -> Histograma:
+        return self._agregar(Histograma(nombre, ayuda, etiquetas, limites))
+
+    def contador_externo(
+        self, nombre: str, ayuda: str, etiquetas: Sequence[str], leer: Callable[[], Mapping[Etiquetas, float]]
+    ) -> None:
+        """Contador que mantiene otro componente (p. ej. los aciertos de una cache); `leer` se llama en cada lectura."""
+        self._externos = [(contador, f) for contador, f in self._externos if contador.nombre != nombre]
+        self._externos.append((Contador(nombre, ayuda, etiquetas), leer))
+
+    def reiniciar(self) -> None:
+        """Pone a cero las métricas propias (en el proceso hijo tras un fork)."""
+        for metrica in self._metricas.values():
+            metrica.reiniciar()
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def instantanea(self, con_indicadores: bool = True) -> Dict[str, dict]:
+        """Valores actuales de este proceso, serializables a JSON."""
+        datos = {}
+        for metrica in self._metricas.values():
+            if con_indicadores or metrica.tipo != "gauge":
+                datos[metrica.nombre] = {"tipo": metrica.tipo, "valores": list(metrica.valores().items())}
+        for contador, leer in self._externos:
+            datos[contador.nombre] = {"tipo": "counter", "valores": list(leer().items())}
+        return datos
+
+    def iniciar_volcado(self, directorio: str, intervalo: float) -> None:
+        """Vuelca las métricas de este proceso en `directorio` cada `intervalo` segundos, en un hilo aparte."""
+        self._directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+        self._hilo = threading.Thread(target=self._volcar_periodicamente, args=(intervalo,), daemon=True)
+        self._hilo.start()
+
+    def detener_volcado(self) -> None:
+        """Último volcado, sin indicadores: los valores de un proceso que termina ya no están en curso."""
+        if self._hilo is None:
+            return
+        self._detener.set()
+        self._hilo.join()
+        self._hilo = None
+        self._volcar(con_indicadores=False)
+
+    def _volcar_periodicamente(self, intervalo: float) -> None:
+        while not self._detener.wait(intervalo):
+            self._volcar()
+
+    def _volcar(self, con_indicadores: bool = True) -> None:
+        ruta = os.path.join(self._directorio, f"{os.getpid()}.json")
+        with open(f"{ruta}.tmp", "w") as archivo:
+            json.dump(self.instantanea(con_indicadores), archivo)
+        os.replace(f"{ruta}.tmp", ruta)
+
+    def _instantaneas_de_otros_procesos(self) -> List[Dict[str, dict]]:
+        if self._directorio is None:
+            return []
+        # El lock entre procesos evita que dos workers acumulen a la vez el archivo de un worker terminado
+        with open(os.path.join(self._directorio, ".lock"), "a") as cerrojo:
+            fcntl.flock(cerrojo, fcntl.LOCK_EX)
+            try:
+                return self._leer_y_acumular()
+            finally:
+                fcntl.flock(cerrojo, fcntl.LOCK_UN)
+
+    def _leer_y_acumular(self) -> List[Dict[str, dict]]:
+        # Los archivos de los workers ya terminados (reciclados por max_requests) se suman a
+        # acumulado.json y se borran, para que el directorio no crezca con cada reciclado
+        ruta_acumulado = os.path.join(self._directorio, "acumulado.json")
+        acumulado = _leer_json(ruta_acumulado) or {}
+        vivos, terminados = [], []
+        for nombre in os.listdir(self._directorio):
+            pid, _, extension = nombre.partition(".")
+            if extension != "json" or not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            datos = _leer_json(os.path.join(self._directorio, nombre))
+            if datos is None:
+                continue
+            if _proceso_vivo(int(pid)):
+                vivos.append(datos)
+            else:
+                _acumular(acumulado, {clave: metrica for clave, metrica in datos.items() if metrica["tipo"] != "gauge"})
+                terminados.append(nombre)
+
+        if terminados:
+            with open(f"{ruta_acumulado}.tmp", "w") as archivo:
+                json.dump(acumulado, archivo)
+            os.replace(f"{ruta_acumulado}.tmp", ruta_acumulado)
+            for nombre in terminados:
+                os.remove(os.path.join(self._directorio, nombre))
+        return [acumulado, *vivos]
+
+    def exponer(self) -> str:
+        """Texto para /metrics con la suma de todos los procesos."""
+        totales: Dict[str, dict] = {}
+        for instantanea in (self.instantanea(), *self._instantaneas_de_otros_procesos()):
+            _acumular(totales, instantanea)
+        series = {
+            nombre: {tuple(etiquetas): valor for etiquetas, valor in metrica["valores"]} for nombre, metrica in totales.items()
+        }
+
+        lineas = []
+        for metrica in [*self._metricas.values(), *(contador for contador, _ in self._externos)]:
+            lineas.extend(_formatear(metrica, series.get(metrica.nombre, {})))
+        return "\n".join(lineas) + "\n"
+
+
+def _acumular(destino: Dict[str, dict], instantanea: Mapping[str, dict]) -> None:
+    # Suma en `destino` los valores de otra instantánea, serie a serie
+    for nombre, metrica in instantanea.items():
+        actual = destino.setdefault(nombre, {"tipo": metrica["tipo"], "valores": []})
+        indice = {tuple(etiquetas): posicion for posicion, (etiquetas, _) in enumerate(actual["valores"])}
+        for etiquetas, valor in metrica["valores"]:
+            posicion = indice.get(tuple(etiquetas))
+            if posicion is None:
+                indice[tuple(etiquetas)] = len(actual["valores"])
+                actual["valores"].append([list(etiquetas), valor])
+            else:
+                actual["valores"][posicion][1] = _sumar(actual["valores"][posicion][1], valor)
+
+
+def _leer_json(ruta: str) -> Optional[dict]:
+    try:
+        with open(ruta) as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError):
+        return None
+
+
+def _proceso_vivo(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiquetas_texto(nombres: Sequence[str], valores: Sequence[str], extra: str = "") -> str:
+    pares = [f'{nombre}="{_escapar(valor)}"' for nombre, valor in zip(nombres, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _numero(valor: float) -> str:
+    return repr(float(valor)) if isinstance(valor, float) and not valor.is_integer() else str(int(valor))
+
+
+def _formatear(metrica: _Metrica, series: Mapping[Etiquetas, object]) -> List[str]:
+    limites = getattr(metrica, "limites", None)
+    lineas = [f"# HELP {metrica.nombre} {metrica.ayuda}", f"# TYPE {metrica.nombre} {metrica.tipo}"]
+    for etiquetas, valor in sorted(series.items()):
+        if limites is None:
+            lineas.append(f"{metrica.nombre}{_etiquetas_texto(metrica.etiquetas, etiquetas)} {_numero(valor)}")
+            continue
+        acumulado = 0
+        for limite, cuenta in zip((*limites, "+Inf"), valor[:-1]):
+            acumulado += cuenta
+            le = f'le="{limite}"'
+            lineas.append(f"{metrica.nombre}_bucket{_etiquetas_texto(metrica.etiquetas, etiquetas, le)} {acumulado}")
+        texto_etiquetas = _etiquetas_texto(metrica.etiquetas, etiquetas)
+        lineas.append(f"{metrica.nombre}_sum{texto_etiquetas} {_numero(valor[-1])}")
+        lineas.append(f"{metrica.nombre}_count{texto_etiquetas} {acumulado}")
+    return lineas
+
+
+REGISTRO = RegistroMetricas()
+
+PETICIONES = REGISTRO.contador("http_peticiones_total", "Peticiones HTTP atendidas", ("metodo", "ruta", "estado"))
+DURACION_PETICIONES = REGISTRO.histograma(
+    "http_peticion_duracion_segundos",
+    "Tiempo hasta que la vista devuelve la respuesta (sin el envío de los cuerpos en streaming)",
+    ("metodo", "ruta"),
+    CUBETAS_PETICION,
+)
+PETICIONES_EN_CURSO = REGISTRO.indicador("http_peticiones_en_curso", "Peticiones HTTP que se están atendiendo")
+DURACION_UPSTREAM = REGISTRO.histograma(
+    "upstream_duracion_segundos",
+    "Tiempo hasta recibir las cabeceras de la respuesta de otro servicio",
+    ("servicio", "metodo", "estado"),
+    CUBETAS_PETICION,
+)
+DURACION_CONSULTAS = REGISTRO.histograma(
+    "db_consulta_duracion_segundos", "Consultas SQL por método de repositorio", ("metodo",), CUBETAS_CONSULTA
+)
+
+# Las métricas heredadas del master (p. ej. las consultas de la verificación de migraciones
+# con gunicorn preload) no son del worker: cada hijo empieza de cero
+os.register_at_fork(after_in_child=REGISTRO.reiniciar)
+
+# Método de repositorio que está ejecutando consultas en este contexto
+_metodo_repositorio: contextvars.ContextVar[str] = contextvars.ContextVar("metodo_repositorio", default="sin_repositorio")
+
+
+def _con_etiqueta(metodo, etiqueta: str):
+    # Gana el método más externo: el que llamó el servicio, no los que este use por dentro
+    if inspect.isgeneratorfunction(metodo):
+
+        @functools.wraps(metodo)
+        def generador(*args, **kwargs):
+            anterior = _metodo_repositorio.get()
+            _metodo_repositorio.set(etiqueta if anterior == "sin_repositorio" else anterior)
+            try:
+                yield from metodo(*args, **kwargs)
+            finally:
+                _metodo_repositorio.set(anterior)
+
+        return generador
+
+    @functools.wraps(metodo)
+    def envoltura(*args, **kwargs):
+        anterior = _metodo_repositorio.get()
+        _metodo_repositorio.set(etiqueta if anterior == "sin_repositorio" else anterior)
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            _metodo_repositorio.set(anterior)
+
+    return envoltura
+
+
+def metodo_repositorio() -> str:
+    """Método de repositorio (Clase.metodo) que está ejecutando consultas, o "sin_repositorio"."""
+    return _metodo_repositorio.get()
+
+
+def etiquetar_consultas(cls):
+    """Decorador de clase: las consultas SQL de sus métodos públicos se miden con la etiqueta Clase.metodo."""
+    for nombre, metodo in list(vars(cls).items()):
+        if not nombre.startswith("_") and inspect.isfunction(metodo):
+            setattr(cls, nombre, _con_etiqueta(metodo, f"{cls.__name__}.{nombre}"))
+    return cls
+
+
+def _iniciar_consulta(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._inicio_metricas = time.perf_counter()
+
+
+def _terminar_consulta(conn, cursor, statement, parameters, context, executemany):
+    inicio = getattr(context, "_inicio_metricas", None)
+    if inicio is not None:
+        DURACION_CONSULTAS.observar(time.perf_counter() - inicio, _metodo_repositorio.get())
+
+
+def medir_upstream(servicio: str, metodo: str, peticion: Callable, *args, **kwargs):
+    """Hace la petición a otro servicio (p. ej. requests.get con sus argumentos) y registra su duración."""
+    inicio = time.perf_counter()
+    estado = "error"
+    try:
+        respuesta = peticion(*args, **kwargs)
+        estado = str(getattr(respuesta, "status_code", "error"))
+        return respuesta
+    finally:
+        DURACION_UPSTREAM.observar(time.perf_counter() - inicio, servicio, metodo, estado)
+
+
+def _autorizado(token: str) -> bool:
+    esquema, _, credencial = request.headers.get("Authorization", "").partition(" ")
+    return esquema.lower() == "bearer" and hmac.compare_digest(credencial.strip().encode(), token.encode())
+
+
+def registrar_metricas(app: Flask, exponer: bool = True, token: Optional[str] = None) -> None:
+    """
+    Mide cada petición y cada consulta SQL y expone GET /metrics en el formato de Prometheus.
+
+    La ruta de las etiquetas es la regla de Flask (/productos/<producto_id>), no la URL, para
+    que el número de series no crezca con los ids; las peticiones sin regla son "sin_ruta".
+
+    /metrics publica rutas, latencias de los servicios y métodos de repositorio. Sin `token`
+    queda abierta, como /health: solo vale para un servicio que no se expone fuera de la red
+    interna. Con `token` exige la cabecera `Authorization: Bearer <token>` y sin `exponer` no
+    se registra la ruta, aunque las métricas se sigan midiendo.
+    """
+    app.extensions["metricas"] = REGISTRO
+    if not event.contains(Engine, "before_cursor_execute", _iniciar_consulta):
+        event.listen(Engine, "before_cursor_execute", _iniciar_consulta)
+        event.listen(Engine, "after_cursor_execute", _terminar_consulta)
+
+    @app.before_request
+    def iniciar_metricas():
+        g.inicio_metricas = time.perf_counter()
+        PETICIONES_EN_CURSO.inc()
+
+    @app.after_request
+    def registrar_metricas_peticion(response):
+        inicio = g.get("inicio_metricas")
+        if inicio is not None:
+            ruta = request.url_rule.rule if request.url_rule is not None else "sin_ruta"
+            DURACION_PETICIONES.observar(time.perf_counter() - inicio, request.method, ruta)
+            PETICIONES.inc(request.method, ruta, str(response.status_code))
+        return response
+
+    @app.teardown_request
+    def terminar_metricas(_error=None):
+        if g.pop("inicio_metricas", None) is not None:
+            PETICIONES_EN_CURSO.dec()
+
+    if not exponer:
+        return
+
+    @app.route("/metrics")
+    def metrics():
+        if token and not _autorizado(token):
+            return Response("No autorizado\n", status=401, mimetype="text/plain", headers={"WWW-Authenticate": "Bearer"})
+        return Response(REGISTRO.exponer(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,282 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, Set
+
+import click
+from flask import Flask
+from flask.cli import AppGroup
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.types import TypeEngine
+
+logger = logging.getLogger(__name__)
+
+# Versiones aplicadas en esta base de datos (una fila por migración)
+_tabla_migraciones = Table(
+    "schema_migraciones",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("descripcion", String, nullable=False),
+    Column("aplicada_en", DateTime, nullable=False),
+)
+
+# Clave del advisory lock de PostgreSQL que impide que dos procesos migren la misma base a la vez
+_CLAVE_BLOQUEO = 720_001
+
+# Intentos de un ALTER TABLE que no consigue el bloqueo de la tabla en DDL_LOCK_TIMEOUT_MS
+_INTENTOS_DDL = 5
+
+
+@dataclass(frozen=True)
+class Migracion:
+    """
+    Paso versionado del esquema.
+
+    `aplicar` recibe el motor y abre sus propias transacciones, para que los rellenos por lotes
+    y los índices concurrentes no retengan bloqueos durante toda la migración. Debe poder
+    repetirse: si falla a la mitad, la versión no se registra y se ejecuta completa otra vez.
+    """
+
+    version: int
+    descripcion: str
+    aplicar: Callable[[Engine], None]
+
+
+def versiones_aplicadas(engine: Engine) -> Set[int]:
+    """Versiones registradas en schema_migraciones (vacío si la tabla todavía no existe)."""
+    with engine.connect() as conexion:
+        if not inspect(conexion).has_table(_tabla_migraciones.name):
+            return set()
+        return set(conexion.execute(select(_tabla_migraciones.c.version)).scalars())
+
+
+def migraciones_pendientes(engine: Engine, migraciones: Sequence[Migracion]) -> List[Migracion]:
+    """Migraciones sin aplicar, ordenadas por versión."""
+    aplicadas = versiones_aplicadas(engine)
+    return sorted((m for m in migraciones if m.version not in aplicadas), key=lambda m: m.version)
+
+
+@contextmanager
+def _bloqueo_migraciones(engine: Engine):
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect() as conexion:
+        conexion.execute(select(func.pg_advisory_lock(_CLAVE_BLOQUEO)))
+        # Sin transacción abierta: CREATE INDEX CONCURRENTLY espera a todas las transacciones en curso
+        conexion.commit()
+        try:
+            yield
+        finally:
+            conexion.execute(select(func.pg_advisory_unlock(_CLAVE_BLOQUEO)))
+            conexion.commit()
+
+
+def aplicar_migraciones(engine: Engine, migraciones: Sequence[Migracion]) -> List[Migracion]:
+    """Aplica en orden las migraciones pendientes y devuelve las que se aplicaron."""
+    aplicadas = []
+    with _bloqueo_migraciones(engine):
+        _tabla_migraciones.create(engine, checkfirst=True)
+        for migracion in migraciones_pendientes(engine, migraciones):
+            logger.info(f"Aplicando migración {migracion.version:04d}: {migracion.descripcion}")
+            inicio = time.perf_counter()
+            migracion.aplicar(engine)
+            with engine.begin() as conexion:
+                conexion.execute(
+                    _tabla_migraciones.insert().values(
+                        version=migracion.version, descripcion=migracion.descripcion, aplicada_en=datetime.utcnow()
+                    )
+                )
+            logger.info(f"Migración {migracion.version:04d} aplicada en {time.perf_counter() - inicio:.1f} s")
+            aplicadas.append(migracion)
+    return aplicadas
+
+
+def verificar_migraciones(app: Flask, db: SQLAlchemy, migraciones: Sequence[Migracion]) -> None:
+    """
+    Avisa al arrancar si la base de datos no tiene todas las migraciones aplicadas.
+
+    No ejecuta DDL: el esquema se crea y actualiza con `flask migraciones aplicar`, fuera del
+    arranque de la aplicación.
+    """
+    with app.app_context():
+        try:
+            pendientes = migraciones_pendientes(db.engine, migraciones)
+        except SQLAlchemyError as e:
+            logger.warning(f"No se pudo verificar el estado de las migraciones: {e}")
+            return
+    if pendientes:
+        versiones = ", ".join(f"{m.version:04d}" for m in pendientes)
+        logger.warning(f"Migraciones pendientes: {versiones}. Ejecutar 'flask migraciones aplicar'")
+
+
+def create_migraciones_cli(db: SQLAlchemy, migraciones: Sequence[Migracion]) -> AppGroup:
+    """Crea los comandos de línea de comandos de las migraciones (flask migraciones ...)."""
+
+    migraciones_cli = AppGroup("migraciones", help="Migraciones versionadas del esquema de la base de datos.")
+
+    @migraciones_cli.command("aplicar")
+    def aplicar():
+        """Aplica las migraciones pendientes."""
+        aplicadas = aplicar_migraciones(db.engine, migraciones)
+        click.echo(f"Migraciones aplicadas: {len(aplicadas)}")
+
+    @migraciones_cli.command("estado")
+    def estado():
+        """Lista las migraciones y si ya están aplicadas."""
+        aplicadas = versiones_aplicadas(db.engine)
+        for migracion in sorted(migraciones, key=lambda m: m.version):
+            marca = "aplicada " if migracion.version in aplicadas else "pendiente"
+            click.echo(f"{migracion.version:04d}  {marca}  {migracion.descripcion}")
+
+    return migraciones_cli
+
+
+def crear_tablas(engine: Engine, *tablas: Table) -> None:
+    """Crea las tablas (con sus índices) que todavía no existen."""
+    with engine.begin() as conexion:
+        for tabla in tablas:
+            tabla.create(conexion, checkfirst=True)
+
+
+def _ejecutar_ddl(engine: Engine, sentencia: str) -> None:
+    """
+    Ejecuta un ALTER TABLE que necesita un bloqueo exclusivo breve sobre la tabla.
+
+    En PostgreSQL la espera por el bloqueo se limita a DDL_LOCK_TIMEOUT_MS (default 5000) y se
+    reintenta: así el ALTER no queda encolado detrás de una transacción larga bloqueando a su
+    vez todas las consultas que llegan después.
+    """
+    if engine.dialect.name != "postgresql":
+        with engine.begin() as conexion:
+            conexion.exec_driver_sql(sentencia)
+        return
+
+    espera_ms = int(os.environ.get("DDL_LOCK_TIMEOUT_MS", 5000))
+    for intento in range(1, _INTENTOS_DDL + 1):
+        try:
+            with engine.begin() as conexion:
+                conexion.exec_driver_sql(f"SET LOCAL lock_timeout = {espera_ms}")
+                conexion.exec_driver_sql(sentencia)
+            return
+        except OperationalError as e:
+            if getattr(e.orig, "pgcode", None) != "55P03" or intento == _INTENTOS_DDL:
+                raise
+            logger.warning(f"Tabla ocupada, reintentando ({intento}/{_INTENTOS_DDL}): {sentencia}")
+            time.sleep(intento)
+
+
+def agregar_columna(
+    engine: Engine, tabla: str, columna: str, tipo: TypeEngine, predeterminado: Optional[str] = None, nula: bool = True
+) -> None:
+    """
+    Agrega una columna si no existe.
+
+    Una columna nula, o con un `predeterminado` constante, no reescribe la tabla: tanto SQLite
+    como PostgreSQL 11+ solo cambian el catálogo. Las columnas que necesitan un valor calculado
+    se agregan nulas, se rellenan con rellenar_en_lotes y luego se aplica exigir_no_nula.
+    """
+    if columna in {c["name"] for c in inspect(engine).get_columns(tabla)}:
+        return
+    sentencia = f"ALTER TABLE {tabla} ADD COLUMN {columna} {tipo.compile(dialect=engine.dialect)}"
+    if predeterminado is not None:
+        sentencia += f" DEFAULT {predeterminado}"
+    if not nula:
+        sentencia += " NOT NULL"
+    _ejecutar_ddl(engine, sentencia)
+
+
+def eliminar_columna(engine: Engine, tabla: str, columna: str) -> None:
+    """
+    Elimina una columna si existe.
+
+    En PostgreSQL solo cambia el catálogo; SQLite (3.35+) reescribe la tabla y bloquea la base
+    mientras dura, como cualquier escritura. El código que todavía escriba la columna falla
+    desde ese momento: la migración va en una versión posterior a la que dejó de usarla.
+    """
+    if columna not in {c["name"] for c in inspect(engine).get_columns(tabla)}:
+        return
+    _ejecutar_ddl(engine, f"ALTER TABLE {tabla} DROP COLUMN {columna}")
+
+
+def rellenar_en_lotes(
+    engine: Engine, actualizar_lote: Callable[[Connection, int], int], tamano_lote: Optional[int] = None
+) -> int:
+    """
+    Llama a `actualizar_lote(conexion, tamano_lote)` en una transacción por lote hasta que devuelve 0.
+
+    Cada lote bloquea solo sus filas y se confirma enseguida, así que la aplicación puede seguir
+    escribiendo en la tabla durante el relleno. El tamaño por defecto es MIGRACIONES_TAMANO_LOTE
+    (1000). Devuelve el total de filas actualizadas.
+    """
+    tamano_lote = tamano_lote or int(os.environ.get("MIGRACIONES_TAMANO_LOTE", 1000))
+    total = 0
+    while True:
+        with engine.begin() as conexion:
+            filas = actualizar_lote(conexion, tamano_lote)
+        if not filas:
+            return total
+        total += filas
+        logger.info(f"Relleno por lotes: {total} filas actualizadas")
+
+
+def exigir_no_nula(engine: Engine, tabla: str, columna: str) -> None:
+    """
+    Marca como NOT NULL una columna ya rellenada.
+
+    En PostgreSQL se valida primero un CHECK NOT VALID, lo que recorre la tabla sin bloquear las
+    escrituras; SET NOT NULL aprovecha ese CHECK (PostgreSQL 12+) y solo toma el bloqueo un
+    instante. SQLite no permite cambiar la nulabilidad sin reconstruir la tabla, así que ahí la
+    columna queda nula y el NOT NULL lo garantiza el modelo.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    if not next(c["nullable"] for c in inspect(engine).get_columns(tabla) if c["name"] == columna):
+        return
+    restriccion = f"{tabla}_{columna}_no_nula"
+    _ejecutar_ddl(engine, f"ALTER TABLE {tabla} DROP CONSTRAINT IF EXISTS {restriccion}")
+    _ejecutar_ddl(engine, f"ALTER TABLE {tabla} ADD CONSTRAINT {restriccion} CHECK ({columna} IS NOT NULL) NOT VALID")
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("SET LOCAL statement_timeout = 0")
+        conexion.exec_driver_sql(f"ALTER TABLE {tabla} VALIDATE CONSTRAINT {restriccion}")
+    _ejecutar_ddl(engine, f"ALTER TABLE {tabla} ALTER COLUMN {columna} SET NOT NULL")
+    _ejecutar_ddl(engine, f"ALTER TABLE {tabla} DROP CONSTRAINT {restriccion}")
+
+
+def crear_indice(engine: Engine, nombre: str, tabla: str, columnas: Sequence[str]) -> None:
+    """
+    Crea un índice si no existe, sin bloquear las escrituras sobre la tabla.
+
+    En PostgreSQL usa CREATE INDEX CONCURRENTLY, que no puede ir dentro de una transacción; si
+    un intento anterior se interrumpió y dejó el índice inválido, se elimina y se vuelve a
+    crear. En SQLite la creación bloquea la base mientras dura, como cualquier escritura.
+    """
+    definicion = f"{nombre} ON {tabla} ({', '.join(columnas)})"
+    if engine.dialect.name != "postgresql":
+        with engine.begin() as conexion:
+            conexion.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS {definicion}")
+        return
+
+    with engine.connect() as conexion:
+        conexion = conexion.execution_options(isolation_level="AUTOCOMMIT")
+        conexion.exec_driver_sql("SET statement_timeout = 0")
+        invalido = conexion.execute(
+            text(
+                "SELECT NOT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid"
+                " WHERE c.relname = :nombre AND pg_table_is_visible(c.oid)"
+            ),
+            {"nombre": nombre},
+        ).scalar()
+        try:
+            if invalido:
+                conexion.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {nombre}")
+            conexion.exec_driver_sql(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {definicion}")
+        finally:
+            # La conexión vuelve al pool: recupera el statement timeout de DB_STATEMENT_TIMEOUT_MS
+            conexion.exec_driver_sql("RESET statement_timeout")
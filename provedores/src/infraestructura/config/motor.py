@@ -0,0 +1,84 @@
+import os
+from typing import Any, Dict, Mapping
+
+from sqlalchemy.engine import make_url
+
+# Prefijo de las claves de SQLALCHEMY_BINDS que son réplicas de lectura de la base primaria
+PREFIJO_REPLICA = "replica_"
+
+
+def _leer_entero(entorno: Mapping[str, str], variable: str, defecto: int) -> int:
+    try:
+        return int(entorno.get(variable, defecto))
+    except ValueError:
+        raise ValueError(f"{variable} debe ser un entero") from None
+
+
+def _leer_booleano(entorno: Mapping[str, str], variable: str, defecto: bool) -> bool:
+    valor = entorno.get(variable)
+    if valor is None:
+        return defecto
+    if valor.strip().lower() not in ("true", "false", "1", "0"):
+        raise ValueError(f"{variable} debe ser true o false")
+    return valor.strip().lower() in ("true", "1")
+
+
+def normalizar_uri(uri: str) -> str:
+    """
+    Fija el driver de PostgreSQL en psycopg2 (el que se instala con el servicio) si la URI no indica uno.
+
+    Acepta también postgres://, el esquema que entregan algunos proveedores.
+    """
+    for esquema in ("postgres://", "postgresql://"):
+        if uri.startswith(esquema):
+            return "postgresql+psycopg2://" + uri[len(esquema) :]
+    return uri
+
+
+def opciones_motor(uri: str, entorno: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    """
+    SQLALCHEMY_ENGINE_OPTIONS para la base de datos de `uri`.
+
+    Con un servidor de base de datos se configura el pool: DB_POOL_SIZE conexiones abiertas
+    (default 5), hasta DB_MAX_OVERFLOW más en los picos (10), DB_POOL_TIMEOUT segundos de
+    espera por una conexión libre (30), pre-ping antes de entregar una conexión del pool
+    (DB_POOL_PRE_PING, true) y reciclado de las conexiones con más de DB_POOL_RECYCLE
+    segundos (1800). En PostgreSQL, DB_STATEMENT_TIMEOUT_MS (30000; 0 lo desactiva) corta
+    en el servidor las sentencias que tardan más. SQLite usa su propio pool y pragmas
+    (ver sqlite.py), así que para SQLite no se devuelve ninguna opción.
+    """
+    url = make_url(uri)
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        return {}
+
+    opciones: Dict[str, Any] = {
+        "pool_size": _leer_entero(entorno, "DB_POOL_SIZE", 5),
+        "max_overflow": _leer_entero(entorno, "DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _leer_entero(entorno, "DB_POOL_TIMEOUT", 30),
+        "pool_pre_ping": _leer_booleano(entorno, "DB_POOL_PRE_PING", True),
+        "pool_recycle": _leer_entero(entorno, "DB_POOL_RECYCLE", 1800),
+    }
+    statement_timeout = _leer_entero(entorno, "DB_STATEMENT_TIMEOUT_MS", 30000)
+    if backend == "postgresql" and statement_timeout > 0:
+        opciones["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+    return opciones
+
+
+def binds_replicas(entorno: Mapping[str, str] = os.environ) -> Dict[str, Dict[str, Any]]:
+    """
+    SQLALCHEMY_BINDS con un motor por cada réplica de lectura de DATABASE_REPLICA_URLS (separadas por comas).
+
+    Las claves empiezan con PREFIJO_REPLICA y cada motor usa las mismas opciones de pool que
+    la base primaria. En PostgreSQL las transacciones de la réplica son de solo lectura, así
+    que una escritura enviada por error a una réplica falla en lugar de perderse.
+    """
+    uris = [normalizar_uri(uri.strip()) for uri in entorno.get("DATABASE_REPLICA_URLS", "").split(",") if uri.strip()]
+    binds = {}
+    for indice, uri in enumerate(uris, start=1):
+        opciones = opciones_motor(uri, entorno)
+        if make_url(uri).get_backend_name() == "postgresql":
+            connect_args = opciones.setdefault("connect_args", {})
+            connect_args["options"] = f"{connect_args.get('options', '')} -c default_transaction_read_only=on".strip()
+        binds[f"{PREFIJO_REPLICA}{indice}"] = {"url": uri, **opciones}
+    return binds
@@ -1,5 +1,6 @@
 from src.dominio.entities.provedor import Pais
 from src.infraestructura.config.db import db_provedores
+from src.infraestructura.dto.cambios import registrar_cambios
 
 
 class ProvedorModel(db_provedores.Model):
@@ -17,3 +18,6 @@ class ProvedorModel(db_provedores.Model):
 
     def __repr__(self):
         return f"<ProvedorModel {self.id}: {self.nombre}>"
+
+
+registrar_cambios(ProvedorModel)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_tablas
+
+provedores = Table(
+    "provedores",
+    MetaData(),
+    Column("id", Integer, nullable=False, primary_key=True, autoincrement=True),
+    Column("nit", Integer, nullable=False, unique=True),
+    Column("nombre", String, nullable=False),
+    Column("pais", String, nullable=False),
+    Column("direccion", String, nullable=False),
+    Column("telefono", Integer, nullable=False),
+    Column("email", String, nullable=False),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Tabla de proveedores original; en bases creadas antes de las migraciones ya existe y no se toca."""
+    crear_tablas(engine, provedores)
+
+
+MIGRACION = Migracion(1, "Tabla de proveedores", aplicar)
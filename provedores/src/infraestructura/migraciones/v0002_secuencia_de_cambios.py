@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, Column, Integer, MetaData, Table, select
+from sqlalchemy.engine import Engine
+from src.infraestructura.config.migraciones import Migracion, crear_tablas
+
+secuencia_cambios = Table(
+    "secuencia_cambios",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("valor", BigInteger, nullable=False),
+)
+
+
+def aplicar(engine: Engine) -> None:
+    """Contador de cambios que versiona los listados (ETag); arranca en 0 también con proveedores existentes."""
+    crear_tablas(engine, secuencia_cambios)
+    with engine.begin() as conexion:
+        if conexion.execute(select(secuencia_cambios.c.id)).first() is None:
+            conexion.execute(secuencia_cambios.insert().values(id=1, valor=0))
+
+
+MIGRACION = Migracion(2, "Secuencia de cambios de proveedores", aplicar)
@@ -1,11 +1,16 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
+from sqlalchemy import func
 from src.dominio.entities.provedor import Pais, Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 from src.dominio.repositorios.provedor_repository import ProvedorRepository
-from src.infraestructura.config.db import db_provedores
+from src.infraestructura.config.db import db_provedores, solo_lectura
+from src.infraestructura.config.metricas import etiquetar_consultas
+from src.infraestructura.dto.cambios import secuencia_actual
 from src.infraestructura.dto.provedor import ProvedorModel
 
 
+@etiquetar_consultas
 class ProvedorRepositoryImpl(ProvedorRepository):
     """Implementación del repositorio de proveedores con base de datos SQLAlchemy."""
 
@@ -35,6 +40,7 @@ class ProvedorRepositoryImpl(ProvedorRepository):
             model.id = entity.id
         return model
 
+    @solo_lectura
     def obtener_todos(self) -> List[Provedor]:
         """Obtiene todos los proveedores."""
         try:
@@ -43,6 +49,16 @@ class ProvedorRepositoryImpl(ProvedorRepository):
         except Exception:
             return []
 
+    @solo_lectura
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene solo las columnas indicadas de todos los proveedores, sin construir modelos ni entidades."""
+        try:
+            query = db_provedores.session.query(*[getattr(ProvedorModel, columna) for columna in columnas])
+            return [tuple(fila) for fila in query.all()]
+        except Exception:
+            return []
+
+    @solo_lectura
     def obtener_por_id(self, provedor_id: int) -> Optional[Provedor]:
         """Obtiene un proveedor por su ID."""
         try:
@@ -63,6 +79,7 @@ class ProvedorRepositoryImpl(ProvedorRepository):
         except Exception:
             return None
 
+    @solo_lectura
     def obtener_por_pais(self, pais: str) -> List[Provedor]:
         """Obtiene proveedores por país."""
         try:
@@ -71,6 +88,7 @@ class ProvedorRepositoryImpl(ProvedorRepository):
         except Exception:
             return []
 
+    @solo_lectura
     def buscar_por_nombre(self, nombre: str) -> List[Provedor]:
         """Busca proveedores por nombre."""
         try:
@@ -79,6 +97,18 @@ class ProvedorRepositoryImpl(ProvedorRepository):
         except Exception:
             return []
 
+    @solo_lectura
+    def contar_por(self, campo: str) -> List[ConteoGrupo]:
+        """
+        Cuenta proveedores por `campo` con un único GROUP BY en la base de datos.
+
+        Los errores se propagan: un resumen vacío se confundiría con no tener proveedores.
+        """
+        columna = ProvedorModel.__table__.c[campo]
+        total = func.count()
+        filas = db_provedores.session.query(columna, total).group_by(columna).order_by(total.desc(), columna).all()
+        return [ConteoGrupo(clave=clave, total=cantidad) for clave, cantidad in filas]
+
     def crear(self, provedor: Provedor) -> Provedor:
         """Crea un nuevo proveedor."""
         try:
@@ -127,3 +157,8 @@ class ProvedorRepositoryImpl(ProvedorRepository):
         except Exception:
             db_provedores.session.rollback()
             return False
+
+    @solo_lectura
+    def version(self) -> int:
+        """Última secuencia de cambios confirmada; los errores se propagan."""
+        return secuencia_actual(db_provedores.session.connection())
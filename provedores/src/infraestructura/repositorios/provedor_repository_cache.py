@@ -0,0 +1,82 @@
+from typing import Any, List, Optional, Sequence, Tuple
+
+from src.dominio.entities.provedor import Provedor
+from src.dominio.entities.resumen import ConteoGrupo
+from src.dominio.repositorios.provedor_repository import ProvedorRepository
+from src.infraestructura.cache.cache_lru import CacheLRU
+
+
+class ProvedorRepositoryCache(ProvedorRepository):
+    """
+    Decorador de lectura sobre un ProvedorRepository que cachea los conteos agrupados.
+
+    El TTL de la cache es corto y además se vacía con cada alta, modificación o baja
+    hecha a través de este repositorio. Las demás consultas se delegan sin cachear.
+    """
+
+    def __init__(self, repositorio: ProvedorRepository, cache_resumen: CacheLRU):
+        self.repositorio = repositorio
+        self.cache_resumen = cache_resumen
+
+    def obtener_todos(self) -> List[Provedor]:
+        """Obtiene todos los proveedores."""
+        return self.repositorio.obtener_todos()
+
+    def obtener_filas(self, columnas: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Obtiene columnas de todos los proveedores como tuplas."""
+        return self.repositorio.obtener_filas(columnas)
+
+    def obtener_por_id(self, provedor_id: int) -> Optional[Provedor]:
+        """Obtiene un proveedor por su ID."""
+        return self.repositorio.obtener_por_id(provedor_id)
+
+    def obtener_por_nit(self, nit: int) -> Optional[Provedor]:
+        """Obtiene un proveedor por su NIT."""
+        return self.repositorio.obtener_por_nit(nit)
+
+    def obtener_por_pais(self, pais: str) -> List[Provedor]:
+        """Obtiene proveedores por país."""
+        return self.repositorio.obtener_por_pais(pais)
+
+    def buscar_por_nombre(self, nombre: str) -> List[Provedor]:
+        """Busca proveedores por nombre."""
+        return self.repositorio.buscar_por_nombre(nombre)
+
+    def contar_por(self, campo: str) -> List[ConteoGrupo]:
+        """Cuenta proveedores agrupados por `campo`, consultando primero la cache."""
+        encontrado, conteos = self.cache_resumen.obtener(campo)
+        if encontrado:
+            return list(conteos)
+
+        conteos = self.repositorio.contar_por(campo)
+        self.cache_resumen.guardar(campo, tuple(conteos))
+        return conteos
+
+    def version(self) -> int:
+        """Versión de la tabla; nunca se cachea."""
+        return self.repositorio.version()
+
+    def crear(self, provedor: Provedor) -> Provedor:
+        """Crea un nuevo proveedor e invalida los conteos."""
+        try:
+            return self.repositorio.crear(provedor)
+        finally:
+            self.cache_resumen.limpiar()
+
+    def actualizar(self, provedor: Provedor) -> Provedor:
+        """Actualiza un proveedor existente e invalida los conteos."""
+        try:
+            return self.repositorio.actualizar(provedor)
+        finally:
+            self.cache_resumen.limpiar()
+
+    def eliminar(self, provedor_id: int) -> bool:
+        """Elimina un proveedor por su ID e invalida los conteos."""
+        try:
+            return self.repositorio.eliminar(provedor_id)
+        finally:
+            self.cache_resumen.limpiar()
+
+    def estadisticas(self) -> dict:
+        """Estadísticas de uso de la cache de conteos."""
+        return {"resumen": self.cache_resumen.estadisticas()}
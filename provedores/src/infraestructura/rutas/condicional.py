@@ -0,0 +1,57 @@
+import hashlib
+from functools import wraps
+from typing import Callable, Optional, Sequence, Union
+from urllib.parse import urlencode
+
+from flask import Response, make_response, request
+
+# Las respuestas se pueden guardar en el cliente, pero siempre se revalidan con If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+def _representacion(mimetypes: Sequence[str]) -> str:
+    """Hash de lo que distingue dos respuestas de una misma versión: formato, ruta y consulta."""
+    mimetype = request.accept_mimetypes.best_match(mimetypes, default=mimetypes[0])
+    # Los parámetros se ordenan: ?a=1&b=2 y ?b=2&a=1 son la misma representación
+    consulta = urlencode(sorted(request.args.items(multi=True)))
+    return hashlib.blake2s(f"{mimetype} {request.path}?{consulta}".encode(), digest_size=8).hexdigest()
+
+
+def respuesta_condicional(
+    prefijo: str, version: Callable[[], Optional[Union[int, str]]], mimetypes: Sequence[str] = ("application/json",)
+):
+    """
+    Decorador de vistas GET que responden con ETag y atienden If-None-Match.
+
+    El ETag (débil) se arma con `prefijo`, el contador de cambios que devuelve `version` y
+    un hash de la representación pedida (el mimetype de `mimetypes` que negocia Accept, la
+    ruta y los parámetros de consulta), sin serializar ni hashear el cuerpo: si coincide con
+    el que envía el cliente se responde 304 sin ejecutar la vista. Si la versión no se puede
+    obtener (None) la vista se ejecuta normalmente, sin ETag. Con varios `mimetypes` la
+    respuesta, también el 304, lleva Vary: Accept, para que una cache no la use con otro formato.
+    """
+
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            numero = version()
+            if numero is None:
+                return vista(*args, **kwargs)
+
+            etag = f"{prefijo}-{numero}-{_representacion(mimetypes)}"
+            if request.if_none_match.contains_weak(etag):
+                respuesta = Response(status=304)
+            else:
+                respuesta = make_response(vista(*args, **kwargs))
+                if respuesta.status_code != 200:
+                    return respuesta
+
+            if len(mimetypes) > 1:
+                respuesta.vary.add("Accept")
+            respuesta.set_etag(etag, weak=True)
+            respuesta.headers["Cache-Control"] = CACHE_CONTROL
+            return respuesta
+
+        return envoltura
+
+    return decorador
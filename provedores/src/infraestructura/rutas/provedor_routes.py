@@ -1,5 +1,37 @@
 from flask import Blueprint, request
+from src.aplicacion.mappers.provedor_mapper import ProvedorMapper
 from src.infraestructura.cmd.provedor_cmd import ProvedorCmd
+from src.infraestructura.rutas.condicional import respuesta_condicional
+from src.infraestructura.rutas.parametros import con_parametros
+
+
+def _campos():
+    """Campos pedidos con ?fields=... (todos si no se indica)."""
+    return {"campos": ProvedorMapper.parsear_campos(request.args.get("fields"))}
+
+
+def _nombre():
+    """Nombre buscado, obligatorio."""
+    nombre = request.args.get("nombre", "")
+    if not nombre:
+        raise ValueError("Parámetro nombre es requerido")
+    return {"nombre": nombre}
+
+
+def _agrupacion():
+    """Campo de agrupación del resumen (pais por defecto)."""
+    campo = request.args.get("agrupar", "pais")
+    if campo not in ProvedorCmd.CAMPOS_RESUMEN:
+        raise ValueError(f"Parámetro agrupar debe ser uno de: {', '.join(ProvedorCmd.CAMPOS_RESUMEN)}")
+    return {"campo": campo}
+
+
+def _datos():
+    """Cuerpo JSON del proveedor, obligatorio."""
+    data = request.get_json()
+    if not data:
+        raise ValueError("El cuerpo de la petición debe contener datos JSON")
+    return {"data": data}
 
 
 def create_provedor_routes(provedor_controller: ProvedorCmd) -> Blueprint:
@@ -7,42 +39,52 @@ def create_provedor_routes(provedor_controller: ProvedorCmd) -> Blueprint:
 
     provedor_routes = Blueprint("provedores", __name__, url_prefix="/provedores")
 
+    # Listados que responden 304 mientras la tabla no cambie
+    condicional = respuesta_condicional("provedores", provedor_controller.version_provedores)
+
     @provedor_routes.route("", methods=["GET"])
-    def obtener_todos_los_provedores():
-        """Obtiene todos los proveedores."""
-        return provedor_controller.obtener_todos_los_provedores()
+    @condicional
+    @con_parametros(_campos)
+    def obtener_todos_los_provedores(campos):
+        """Obtiene todos los proveedores (?fields=id,nombre limita las columnas leídas y devueltas)."""
+        return provedor_controller.obtener_todos_los_provedores(campos)
 
     @provedor_routes.route("/<int:provedor_id>", methods=["GET"])
-    def obtener_provedor_por_id(provedor_id: int):
+    @con_parametros(_campos)
+    def obtener_provedor_por_id(provedor_id: int, campos):
         """Obtiene un proveedor por su ID."""
-        return provedor_controller.obtener_provedor_por_id(provedor_id)
+        return provedor_controller.obtener_provedor_por_id(provedor_id, campos)
 
     @provedor_routes.route("/nit/<int:nit>", methods=["GET"])
-    def obtener_provedor_por_nit(nit: int):
+    @con_parametros(_campos)
+    def obtener_provedor_por_nit(nit: int, campos):
         """Obtiene un proveedor por su NIT."""
-        return provedor_controller.obtener_provedor_por_nit(nit)
+        return provedor_controller.obtener_provedor_por_nit(nit, campos)
 
     @provedor_routes.route("/pais/<string:pais>", methods=["GET"])
-    def obtener_provedores_por_pais(pais: str):
+    @condicional
+    @con_parametros(_campos)
+    def obtener_provedores_por_pais(pais: str, campos):
         """Obtiene proveedores por país."""
-        return provedor_controller.obtener_provedores_por_pais(pais)
+        return provedor_controller.obtener_provedores_por_pais(pais, campos)
 
     @provedor_routes.route("/buscar", methods=["GET"])
-    def buscar_provedores_por_nombre():
+    @condicional
+    @con_parametros(_nombre, _campos)
+    def buscar_provedores_por_nombre(nombre, campos):
         """Busca proveedores por nombre."""
-        nombre = request.args.get("nombre", "")
-        if not nombre:
-            return {"success": False, "error": "Parámetro nombre es requerido"}, 400
+        return provedor_controller.buscar_provedores_por_nombre(nombre, campos)
 
-        return provedor_controller.buscar_provedores_por_nombre(nombre)
+    @provedor_routes.route("/resumen", methods=["GET"])
+    @con_parametros(_agrupacion)
+    def resumir_provedores(campo):
+        """Cuenta proveedores agrupados (agrupar=pais)."""
+        return provedor_controller.resumir_provedores(campo)
 
     @provedor_routes.route("", methods=["POST"])
-    def registrar_provedor():
+    @con_parametros(_datos)
+    def registrar_provedor(data):
         """Registra un nuevo proveedor."""
-        data = request.get_json()
-        if not data:
-            return {"success": False, "error": "El cuerpo de la petición debe contener datos JSON"}, 400
-
         return provedor_controller.registrar_provedor(data)
 
     return provedor_routes
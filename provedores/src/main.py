@@ -1,6 +1,7 @@
 import logging
 
 from src.infraestructura.config import Config
+from src.infraestructura.config.registro import configurar_registro_asincrono
 
 
 def setup_logging(app):
@@ -13,17 +14,8 @@ def setup_logging(app):
         format="%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
     )
 
-    # Configurar el logger específico para requests
-    request_logger = logging.getLogger("request_logger")
-    request_logger.setLevel(getattr(logging, log_level))
-
-    # Evitar que se dupliquen los logs
-    if not request_logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        request_logger.addHandler(handler)
-        request_logger.propagate = False
+    # Registro de accesos en JSON, escrito por un hilo aparte
+    configurar_registro_asincrono(logging.getLogger("request_logger"), getattr(logging, log_level))
 
 
 def create_application():
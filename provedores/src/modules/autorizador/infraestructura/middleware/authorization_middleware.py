@@ -3,6 +3,7 @@ Middleware de autorización simplificado.
 Intercepta requests y aplica las dos funcionalidades principales.
 """
 
+import logging
 from datetime import datetime
 from typing import Optional
 
@@ -10,6 +11,8 @@ from flask import Flask, jsonify, request
 
 from ...aplicacion.servicios.auth_service import AuthService
 
+logger = logging.getLogger(__name__)
+
 
 class AuthorizationMiddleware:
     """
@@ -41,9 +44,6 @@ class AuthorizationMiddleware:
         authorization_header = request.headers.get("Authorization")
 
         # Log para debugging (sin exponer el token completo)
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.debug(f"Validating access for {method} {route}")
 
         # Autorizar request usando el servicio simplificado (incluye validación de firma)
@@ -71,7 +71,9 @@ class AuthorizationMiddleware:
         return None
 
 
-def create_authorization_middleware(app: Flask, secret_key: str, algorithm: str = "HS256") -> AuthService:
+def create_authorization_middleware(
+    app: Flask, secret_key: str, algorithm: str = "HS256", cache_max_entradas: int = 10000
+) -> AuthService:
     """
     Factory para crear y registrar el middleware de autorización.
     Configura validación robusta de tokens JWT con verificación de integridad.
@@ -80,6 +82,7 @@ def create_authorization_middleware(app: Flask, secret_key: str, algorithm: str
         app: Aplicación Flask
         secret_key: Clave secreta para validar tokens JWT
         algorithm: Algoritmo JWT (por defecto HS256)
+        cache_max_entradas: Tokens validados que se recuerdan para no verificar su firma otra vez (0 la desactiva)
 
     Returns:
         AuthService configurado
@@ -92,7 +95,7 @@ def create_authorization_middleware(app: Flask, secret_key: str, algorithm: str
         raise ValueError("La clave secreta debe tener al menos 32 caracteres para seguridad")
 
     # Crear servicio de autorización
-    auth_service = AuthService(secret_key, algorithm)
+    auth_service = AuthService(secret_key, algorithm, cache_max_entradas)
 
     # Crear middleware
     middleware = AuthorizationMiddleware(auth_service)
@@ -100,12 +103,6 @@ def create_authorization_middleware(app: Flask, secret_key: str, algorithm: str
     # Registrar middleware en Flask
     app.before_request(middleware.before_request)
 
-    print(f"✅ Middleware de autorización activado")
-    print(f"   - Validación de tokens JWT: ✅")
-    print(f"   - Verificación de integridad (anti-alteración): ✅")
-    print(f"   - Validación de acceso por rol: ✅")
-    print(f"   - Algoritmo: {algorithm}")
-    print(f"   - Rutas protegidas: /provedores")
-    print(f"   - Rutas públicas: /, /health, /auth/*")
+    logger.info(f"Middleware de autorización activado: tokens JWT {algorithm}, rutas públicas /, /health, /metrics y /auth/*")
 
     return auth_service
@@ -6,6 +6,7 @@ import pytest
 from src.aplicacion.dtos.provedor_dto import PaisDto, ProvedorDto
 from src.aplicacion.mappers.provedor_mapper import ProvedorMapper
 from src.dominio.entities.provedor import Pais, Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class TestProvedorMapper:
@@ -165,3 +166,30 @@ class TestProvedorMapper:
 
         assert len(dicts) == 0
         assert isinstance(dicts, list)
+
+    def test_parsear_campos(self):
+        """Test de que fields se normaliza al orden de CAMPOS y sin repetidos"""
+        assert ProvedorMapper.parsear_campos("pais, nombre,pais") == ("nombre", "pais")
+        assert ProvedorMapper.parsear_campos(None) == ProvedorMapper.CAMPOS
+
+    def test_parsear_campos_desconocido(self):
+        """Test de fields con un campo que la API no expone"""
+        with pytest.raises(ValueError, match="Campos desconocidos en fields: clave"):
+            ProvedorMapper.parsear_campos("id,clave")
+
+    def test_proyectar_y_filas_to_dicts(self, sample_provedor_dto):
+        """Test de proyección de diccionarios y de filas de columnas"""
+        provedor_dict = ProvedorMapper.dto_to_dict(sample_provedor_dto)
+
+        assert ProvedorMapper.proyectar(provedor_dict, ("id", "pais")) == {"id": 1, "pais": "colombia"}
+        assert ProvedorMapper.filas_to_dicts(("id", "pais"), [(1, "colombia")]) == [{"id": 1, "pais": "colombia"}]
+
+    def test_conteos_to_dict(self):
+        """Test de conversión de conteos agrupados"""
+        result = ProvedorMapper.conteos_to_dict("pais", [ConteoGrupo("colombia", 2), ConteoGrupo("chile", 1)])
+
+        assert result == {
+            "agrupar": "pais",
+            "total": 3,
+            "grupos": [{"clave": "colombia", "total": 2}, {"clave": "chile", "total": 1}],
+        }
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 from src.aplicacion.servicios.provedor_service import ProvedorService
 from src.dominio.entities.provedor import Pais, Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 
 
 class TestProvedorService:
@@ -120,6 +121,14 @@ class TestProvedorService:
         assert result is None
         mock_provedor_repository.obtener_por_nit.assert_called_once_with(999999999)
 
+    def test_contar_provedores_por(self, mock_provedor_repository):
+        """Test de conteo agrupado de proveedores"""
+        mock_provedor_repository.contar_por.return_value = [ConteoGrupo("colombia", 2)]
+        service = ProvedorService(mock_provedor_repository)
+
+        assert service.contar_provedores_por("pais") == [ConteoGrupo("colombia", 2)]
+        mock_provedor_repository.contar_por.assert_called_once_with("pais")
+
     def test_obtener_provedores_por_pais(self, mock_provedor_repository):
         """Test de obtener proveedores por país"""
         # Arrange
@@ -253,3 +262,12 @@ class TestProvedorService:
         # Assert
         assert result is False
         mock_provedor_repository.eliminar.assert_called_once_with(999)
+
+    def test_obtener_version_provedores(self, mock_provedor_repository):
+        """Test de obtener la versión de la tabla de proveedores"""
+        # Arrange
+        mock_provedor_repository.version.return_value = 7
+        service = ProvedorService(mock_provedor_repository)
+
+        # Act / Assert
+        assert service.obtener_version_provedores() == 7
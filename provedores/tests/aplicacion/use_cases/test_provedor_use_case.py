@@ -114,6 +114,16 @@ class TestProvedorUseCase:
         assert result is None
         mock_service.obtener_provedor_por_nit.assert_called_once_with(999999999)
 
+    def test_contar_provedores_por(self):
+        """Test de conteo agrupado de proveedores"""
+        mock_service = MagicMock()
+        use_case = ProvedorUseCase(mock_service)
+
+        result = use_case.contar_provedores_por("pais")
+
+        assert result is mock_service.contar_provedores_por.return_value
+        mock_service.contar_provedores_por.assert_called_once_with("pais")
+
     def test_obtener_provedores_por_pais(self):
         """Test de obtener proveedores por país"""
         # Arrange
@@ -240,3 +250,13 @@ class TestProvedorUseCase:
         # Assert
         assert result is False
         mock_service.eliminar_provedor.assert_called_once_with(999)
+
+    def test_obtener_version_provedores(self):
+        """Test de obtener la versión de la tabla de proveedores"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.obtener_version_provedores.return_value = 7
+        use_case = ProvedorUseCase(mock_service)
+
+        # Act / Assert
+        assert use_case.obtener_version_provedores() == 7
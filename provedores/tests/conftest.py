@@ -16,6 +16,7 @@ import pytest
 from flask import Flask
 from src.aplicacion.dtos.provedor_dto import PaisDto, ProvedorDto
 from src.dominio.entities.provedor import Pais, Provedor
+from src.infraestructura.config.motor import normalizar_uri, opciones_motor
 
 
 @pytest.fixture(scope="session")
@@ -23,8 +24,10 @@ def app():
     """Crea una aplicación Flask para los tests que requieren contexto de aplicación"""
     test_app = Flask(__name__)
     test_app.config["TESTING"] = True
-    test_app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    # TEST_DATABASE_URL corre la suite contra otro backend, por ejemplo PostgreSQL (ver README)
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = normalizar_uri(os.environ.get("TEST_DATABASE_URL", "sqlite:///:memory:"))
     test_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    test_app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones_motor(test_app.config["SQLALCHEMY_DATABASE_URI"])
 
     # Inicializar la base de datos en el contexto de la app
     from src.infraestructura.config.db import db_provedores, init_db_provedores
@@ -34,6 +37,8 @@ def app():
 
     with test_app.app_context():
         init_db_provedores(test_app)
+        # Un servidor de base de datos conserva las tablas entre corridas: se parte de cero
+        db_provedores.drop_all()
         db_provedores.create_all()
         yield test_app
 
@@ -0,0 +1,92 @@
+"""
+Tests unitarios para CacheLRU
+"""
+
+import pytest
+from src.infraestructura.cache.cache_lru import CacheLRU
+
+
+class RelojFalso:
+    """Reloj controlable para probar expiraciones"""
+
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+class TestCacheLRU:
+    """Tests para CacheLRU"""
+
+    def test_guardar_y_obtener(self):
+        """Test de guardar y obtener un valor"""
+        cache = CacheLRU(max_entradas=2, ttl_segundos=10)
+
+        cache.guardar("a", 1)
+
+        assert cache.obtener("a") == (True, 1)
+        assert cache.obtener("b") == (False, None)
+
+    def test_expulsa_menos_usado(self):
+        """Test de expulsión LRU al superar la capacidad"""
+        cache = CacheLRU(max_entradas=2, ttl_segundos=10)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        cache.obtener("a")
+
+        cache.guardar("c", 3)
+
+        assert cache.obtener("b") == (False, None)
+        assert cache.obtener("a") == (True, 1)
+        assert cache.obtener("c") == (True, 3)
+        assert cache.estadisticas()["expulsiones"] == 1
+
+    def test_expira_por_ttl(self):
+        """Test de expiración de entradas por TTL"""
+        reloj = RelojFalso()
+        cache = CacheLRU(max_entradas=10, ttl_segundos=5, reloj=reloj)
+        cache.guardar("a", 1)
+
+        reloj.ahora = 4.9
+        assert cache.obtener("a") == (True, 1)
+
+        reloj.ahora = 5.0
+        assert cache.obtener("a") == (False, None)
+        assert len(cache) == 0
+        assert cache.estadisticas()["expiraciones"] == 1
+
+    def test_invalidar_y_limpiar(self):
+        """Test de invalidación individual y total"""
+        cache = CacheLRU(max_entradas=10, ttl_segundos=10)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+
+        cache.invalidar("a")
+        cache.invalidar("inexistente")
+        assert cache.obtener("a") == (False, None)
+
+        cache.limpiar()
+        assert len(cache) == 0
+
+    def test_estadisticas_tasa_aciertos(self):
+        """Test del cálculo de la tasa de aciertos"""
+        cache = CacheLRU(max_entradas=10, ttl_segundos=10)
+        assert cache.estadisticas()["tasa_aciertos"] is None
+
+        cache.guardar("a", 1)
+        cache.obtener("a")
+        cache.obtener("a")
+        cache.obtener("a")
+        cache.obtener("b")
+
+        estadisticas = cache.estadisticas()
+        assert estadisticas["aciertos"] == 3
+        assert estadisticas["fallos"] == 1
+        assert estadisticas["tasa_aciertos"] == 0.75
+
+    @pytest.mark.parametrize("max_entradas, ttl_segundos", [(0, 10), (10, 0)])
+    def test_parametros_invalidos(self, max_entradas, ttl_segundos):
+        """Test de validación de parámetros"""
+        with pytest.raises(ValueError):
+            CacheLRU(max_entradas=max_entradas, ttl_segundos=ttl_segundos)
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from src.dominio.entities.provedor import Pais, Provedor
+from src.dominio.entities.resumen import ConteoGrupo
 from src.infraestructura.cmd.provedor_cmd import ProvedorCmd
 
 
@@ -44,6 +45,22 @@ class TestProvedorCmd:
         assert status_code == 200
         mock_use_case.obtener_todos_los_provedores.assert_called_once()
 
+    def test_obtener_todos_los_provedores_con_campos(self, app_context):
+        """Test de que con campos solo se consultan esas columnas"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_filas_provedores.return_value = [(1, "Proveedor 1")]
+        cmd = ProvedorCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.obtener_todos_los_provedores(("id", "nombre"))
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json() == {"success": True, "data": [{"id": 1, "nombre": "Proveedor 1"}], "total": 1}
+        mock_use_case.obtener_filas_provedores.assert_called_once_with(("id", "nombre"))
+        mock_use_case.obtener_todos_los_provedores.assert_not_called()
+
     def test_obtener_todos_los_provedores_error(self, app_context):
         """Test de obtener todos los proveedores con error"""
         # Arrange
@@ -208,6 +225,52 @@ class TestProvedorCmd:
         assert status_code == 200
         mock_use_case.obtener_provedores_por_pais.assert_called_once_with("colombia")
 
+    def test_resumir_provedores_exitoso(self, app_context):
+        """Test de resumen de proveedores por país"""
+        # Arrange
+        mock_use_case = MagicMock()
+        mock_use_case.contar_provedores_por.return_value = [ConteoGrupo("colombia", 3), ConteoGrupo("peru", 1)]
+        cmd = ProvedorCmd(mock_use_case)
+
+        # Act
+        response, status_code = cmd.resumir_provedores("pais")
+
+        # Assert
+        assert status_code == 200
+        assert response.get_json() == {
+            "success": True,
+            "data": {
+                "agrupar": "pais",
+                "total": 4,
+                "grupos": [{"clave": "colombia", "total": 3}, {"clave": "peru", "total": 1}],
+            },
+        }
+        mock_use_case.contar_provedores_por.assert_called_once_with("pais")
+
+    def test_resumir_provedores_error(self, app_context):
+        """Test de resumen de proveedores con error"""
+        mock_use_case = MagicMock()
+        mock_use_case.contar_provedores_por.side_effect = Exception("Error de base de datos")
+
+        response, status_code = ProvedorCmd(mock_use_case).resumir_provedores("pais")
+
+        assert status_code == 500
+        assert response.get_json()["success"] is False
+
+    def test_version_provedores(self):
+        """Test de obtener la versión de los proveedores"""
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_version_provedores.return_value = 7
+
+        assert ProvedorCmd(mock_use_case).version_provedores() == 7
+
+    def test_version_provedores_error(self):
+        """Test de que un error al obtener la versión devuelve None (respuesta sin ETag)"""
+        mock_use_case = MagicMock()
+        mock_use_case.obtener_version_provedores.side_effect = Exception("Error de base de datos")
+
+        assert ProvedorCmd(mock_use_case).version_provedores() is None
+
     def test_obtener_provedores_por_pais_error(self, app_context):
         """Test de obtener proveedores por país con error"""
         # Arrange
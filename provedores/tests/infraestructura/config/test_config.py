@@ -44,6 +44,7 @@ class TestConfig:
 
         assert config.app.config["ENV"] is not None
         assert config.app.config["PORT"] == 5003
+        assert config.app.config["RESUMEN_CACHE_TTL_SEGUNDOS"] == 30
         assert "SQLALCHEMY_DATABASE_URI" in config.app.config
 
     @patch("src.infraestructura.config.config.load_dotenv")
@@ -0,0 +1,32 @@
+"""
+Tests de las migraciones versionadas del esquema de provedores
+"""
+
+from sqlalchemy import UniqueConstraint, create_engine, inspect, select
+from src.infraestructura.config.db import db_provedores
+from src.infraestructura.config.migraciones import aplicar_migraciones
+from src.infraestructura.dto.cambios import SecuenciaCambiosModel
+from src.infraestructura.dto.provedor import ProvedorModel  # noqa: F401
+from src.infraestructura.migraciones import MIGRACIONES
+
+
+class TestMigraciones:
+    """Tests de las migraciones de provedores"""
+
+    def test_base_vacia_queda_igual_que_los_modelos(self, tmp_path):
+        """Test de que las migraciones crean las mismas tablas, columnas y restricciones que los modelos"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'provedores.db'}")
+
+        assert [m.version for m in aplicar_migraciones(engine, MIGRACIONES)] == [1, 2]
+
+        inspector = inspect(engine)
+        for tabla in db_provedores.metadata.sorted_tables:
+            assert {c["name"] for c in inspector.get_columns(tabla.name)} == set(tabla.columns.keys()), tabla.name
+            assert {tuple(u["column_names"]) for u in inspector.get_unique_constraints(tabla.name)} == {
+                tuple(c.name for c in u.columns) for u in tabla.constraints if isinstance(u, UniqueConstraint)
+            }, tabla.name
+        with engine.connect() as conexion:
+            assert conexion.execute(select(SecuenciaCambiosModel.valor)).scalar_one() == 0
+
+        assert aplicar_migraciones(engine, MIGRACIONES) == []
+        engine.dispose()
@@ -285,6 +285,97 @@ class TestProvedorRepositoryImpl:
         # Assert
         assert len(result) == 0
 
+    def test_contar_por(self, app_context):
+        """Test del conteo agrupado en SQL, de mayor a menor y luego por clave"""
+        from src.infraestructura.config.db import db_provedores
+        from src.infraestructura.dto.provedor import ProvedorModel
+        from src.infraestructura.repositorios.provedor_repository import ProvedorRepositoryImpl
+
+        # Arrange
+        for nit, pais in [(800000001, "peru"), (800000002, "chile"), (800000003, "peru")]:
+            db_provedores.session.add(
+                ProvedorModel(nit=nit, nombre="Proveedor", pais=pais, direccion="Dirección", telefono=123, email="p@test.com")
+            )
+        db_provedores.session.commit()
+
+        try:
+            # Act
+            result = ProvedorRepositoryImpl().contar_por("pais")
+
+            # Assert
+            assert [(conteo.clave, conteo.total) for conteo in result] == [("peru", 2), ("chile", 1)]
+        finally:
+            db_provedores.session.query(ProvedorModel).filter(ProvedorModel.nit.between(800000001, 800000003)).delete()
+            db_provedores.session.commit()
+
+    def test_version_cambia_con_cada_escritura(self, app_context):
+        """Test de que la versión avanza al crear, actualizar y eliminar y no al leer"""
+        from src.infraestructura.config.db import db_provedores
+        from src.infraestructura.dto.provedor import ProvedorModel
+        from src.infraestructura.repositorios.provedor_repository import ProvedorRepositoryImpl
+
+        # Arrange
+        session = db_provedores.session
+        repository = ProvedorRepositoryImpl()
+        inicial = repository.version()
+
+        try:
+            # Act
+            model = ProvedorModel(
+                nit=800000010, nombre="Proveedor", pais="peru", direccion="Dirección", telefono=123, email="p@test.com"
+            )
+            session.add(model)
+            session.commit()
+            creado = repository.version()
+            model.nombre = "Proveedor actualizado"
+            session.commit()
+            actualizado = repository.version()
+            repository.obtener_todos()
+            leido = repository.version()
+            session.delete(model)
+            session.commit()
+            eliminado = repository.version()
+
+            # Assert
+            assert inicial < creado < actualizado == leido < eliminado
+        finally:
+            session.query(ProvedorModel).filter_by(nit=800000010).delete()
+            session.commit()
+
+    @patch("src.infraestructura.repositorios.provedor_repository.db_provedores")
+    def test_obtener_filas(self, mock_db):
+        """Test de que obtener_filas consulta solo las columnas pedidas"""
+        from src.infraestructura.repositorios.provedor_repository import ProvedorRepositoryImpl
+
+        # Arrange
+        mock_db.session.query.return_value.all.return_value = [(1, "colombia")]
+
+        # Act
+        result = ProvedorRepositoryImpl().obtener_filas(("id", "pais"))
+
+        # Assert
+        assert result == [(1, "colombia")]
+        assert len(mock_db.session.query.call_args.args) == 2
+
+    @patch("src.infraestructura.repositorios.provedor_repository.db_provedores")
+    def test_obtener_filas_error(self, mock_db):
+        """Test de obtener filas con error"""
+        from src.infraestructura.repositorios.provedor_repository import ProvedorRepositoryImpl
+
+        mock_db.session.query.side_effect = Exception("Error de base de datos")
+
+        assert ProvedorRepositoryImpl().obtener_filas(("id",)) == []
+
+    @patch("src.infraestructura.repositorios.provedor_repository.db_provedores")
+    def test_contar_por_error(self, mock_db):
+        """Test de que los errores del conteo se propagan"""
+        from src.infraestructura.repositorios.provedor_repository import ProvedorRepositoryImpl
+
+        mock_db.session.query.side_effect = Exception("Error de base de datos")
+
+        with pytest.raises(Exception, match="Error de base de datos"):
+            ProvedorRepositoryImpl().contar_por("pais")
+
     @patch("src.infraestructura.repositorios.provedor_repository.db_provedores")
     def test_crear_exitoso(self, mock_db, sample_provedor):
         """Test de crear proveedor exitosamente"""
@@ -0,0 +1,66 @@
+"""
+Tests unitarios para ProvedorRepositoryCache
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from src.dominio.entities.resumen import ConteoGrupo
+from src.infraestructura.cache.cache_lru import CacheLRU
+from src.infraestructura.repositorios.provedor_repository_cache import ProvedorRepositoryCache
+
+
+class TestProvedorRepositoryCache:
+    """Tests para ProvedorRepositoryCache"""
+
+    @pytest.fixture
+    def repositorio(self):
+        """Mock del repositorio decorado"""
+        return MagicMock()
+
+    @pytest.fixture
+    def repositorio_cache(self, repositorio):
+        """Repositorio con cache de conteos"""
+        return ProvedorRepositoryCache(repositorio, cache_resumen=CacheLRU(max_entradas=1, ttl_segundos=30))
+
+    def test_contar_por_cachea(self, repositorio, repositorio_cache):
+        """Test de que el segundo conteo no consulta el repositorio"""
+        repositorio.contar_por.return_value = [ConteoGrupo("colombia", 2)]
+
+        assert repositorio_cache.contar_por("pais") == [ConteoGrupo("colombia", 2)]
+        assert repositorio_cache.contar_por("pais") == [ConteoGrupo("colombia", 2)]
+
+        repositorio.contar_por.assert_called_once_with("pais")
+        assert repositorio_cache.estadisticas()["resumen"]["aciertos"] == 1
+
+    @pytest.mark.parametrize("metodo, argumento", [("crear", "provedor"), ("actualizar", "provedor"), ("eliminar", 1)])
+    def test_escrituras_invalidan(self, repositorio, repositorio_cache, metodo, argumento):
+        """Test de que altas, modificaciones y bajas vacían la cache, incluso si fallan"""
+        repositorio.contar_por.return_value = []
+        repositorio_cache.contar_por("pais")
+        getattr(repositorio, metodo).side_effect = ValueError("Error")
+
+        with pytest.raises(ValueError):
+            getattr(repositorio_cache, metodo)(argumento)
+        repositorio_cache.contar_por("pais")
+
+        assert repositorio.contar_por.call_count == 2
+
+    def test_lecturas_se_delegan(self, repositorio, repositorio_cache, sample_provedor):
+        """Test de que las demás consultas se delegan al repositorio"""
+        repositorio.obtener_por_id.return_value = sample_provedor
+        repositorio.obtener_todos.return_value = [sample_provedor]
+
+        assert repositorio_cache.obtener_por_id(1) == sample_provedor
+        assert repositorio_cache.obtener_todos() == [sample_provedor]
+        repositorio_cache.obtener_por_nit(900123456)
+        repositorio_cache.obtener_por_pais("colombia")
+        repositorio_cache.buscar_por_nombre("Tec")
+        repositorio_cache.obtener_filas(("id",))
+        repositorio.version.return_value = 7
+        assert repositorio_cache.version() == 7
+
+        repositorio.obtener_por_nit.assert_called_once_with(900123456)
+        repositorio.obtener_por_pais.assert_called_once_with("colombia")
+        repositorio.buscar_por_nombre.assert_called_once_with("Tec")
+        repositorio.obtener_filas.assert_called_once_with(("id",))
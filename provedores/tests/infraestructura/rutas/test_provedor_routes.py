@@ -2,10 +2,12 @@
 Tests unitarios para las rutas de proveedores
 """
 
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask
+from src.aplicacion.mappers.provedor_mapper import ProvedorMapper
 from src.infraestructura.cmd.provedor_cmd import ProvedorCmd
 from src.infraestructura.rutas.provedor_routes import create_provedor_routes
 
@@ -57,7 +59,7 @@ class TestProvedorRoutes:
         with app.test_client() as client:
             response = client.get("/provedores/1")
             assert response.status_code == 200
-            mock_controller.obtener_provedor_por_id.assert_called_once_with(1)
+            mock_controller.obtener_provedor_por_id.assert_called_once_with(1, ProvedorMapper.CAMPOS)
 
     def test_obtener_provedor_por_nit(self, mock_controller, app, routes):
         """Test de ruta GET /provedores/nit/<nit>"""
@@ -67,7 +69,7 @@ class TestProvedorRoutes:
         with app.test_client() as client:
             response = client.get("/provedores/nit/900123456")
             assert response.status_code == 200
-            mock_controller.obtener_provedor_por_nit.assert_called_once_with(900123456)
+            mock_controller.obtener_provedor_por_nit.assert_called_once_with(900123456, ProvedorMapper.CAMPOS)
 
     def test_obtener_provedores_por_pais(self, mock_controller, app, routes):
         """Test de ruta GET /provedores/pais/<pais>"""
@@ -77,7 +79,16 @@ class TestProvedorRoutes:
         with app.test_client() as client:
             response = client.get("/provedores/pais/colombia")
             assert response.status_code == 200
-            mock_controller.obtener_provedores_por_pais.assert_called_once_with("colombia")
+            mock_controller.obtener_provedores_por_pais.assert_called_once_with("colombia", ProvedorMapper.CAMPOS)
+
+    def test_resumir_provedores(self, mock_controller, app, routes):
+        """Test de ruta GET /provedores/resumen, agrupando por país por defecto"""
+        mock_controller.resumir_provedores.return_value = ({"success": True, "data": {}}, 200)
+
+        with app.test_client() as client:
+            assert client.get("/provedores/resumen").status_code == 200
+            assert client.get("/provedores/resumen?agrupar=nombre").status_code == 400
+            mock_controller.resumir_provedores.assert_called_once_with("pais")
 
     def test_buscar_provedores_por_nombre(self, mock_controller, app, routes):
         """Test de ruta GET /provedores/buscar?nombre=<nombre>"""
@@ -87,7 +98,7 @@ class TestProvedorRoutes:
         with app.test_client() as client:
             response = client.get("/provedores/buscar?nombre=Tecnología")
             assert response.status_code == 200
-            mock_controller.buscar_provedores_por_nombre.assert_called_once_with("Tecnología")
+            mock_controller.buscar_provedores_por_nombre.assert_called_once_with("Tecnología", ProvedorMapper.CAMPOS)
 
     def test_buscar_provedores_sin_nombre(self, mock_controller, app, routes):
         """Test de ruta GET /provedores/buscar sin parámetro nombre"""
@@ -95,3 +106,70 @@ class TestProvedorRoutes:
             response = client.get("/provedores/buscar")
             assert response.status_code == 400
             mock_controller.buscar_provedores_por_nombre.assert_not_called()
+
+    def test_fields(self, mock_controller, app, routes):
+        """Test de ?fields= en listado y detalle"""
+        mock_controller.obtener_todos_los_provedores.return_value = ({"success": True, "data": []}, 200)
+        mock_controller.obtener_provedor_por_id.return_value = ({"success": True, "data": {}}, 200)
+
+        with app.test_client() as client:
+            assert client.get("/provedores?fields=nombre,id").status_code == 200
+            assert client.get("/provedores/1?fields=email").status_code == 200
+
+        mock_controller.obtener_todos_los_provedores.assert_called_once_with(("id", "nombre"))
+        mock_controller.obtener_provedor_por_id.assert_called_once_with(1, ("email",))
+
+    def test_fields_invalido(self, mock_controller, app, routes):
+        """Test de ?fields= con un campo desconocido"""
+        with app.test_client() as client:
+            response = client.get("/provedores?fields=clave")
+
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+        mock_controller.obtener_todos_los_provedores.assert_not_called()
+
+    def test_listado_responde_etag(self, mock_controller, app, routes):
+        """Test de que GET /provedores incluye un ETag débil derivado de la versión de la tabla"""
+        mock_controller.version_provedores.return_value = 7
+        mock_controller.obtener_todos_los_provedores.return_value = ({"success": True, "data": []}, 200)
+
+        with app.test_client() as client:
+            response = client.get("/provedores")
+            otra_consulta = client.get("/provedores/buscar?nombre=Tec")
+
+        assert response.status_code == 200
+        assert re.fullmatch(r'W/"provedores-7-[0-9a-f]{16}"', response.headers["ETag"])
+        # Cada consulta es otra representación, con su propio ETag
+        assert otra_consulta.headers["ETag"] != response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    @pytest.mark.parametrize("url", ["/provedores", "/provedores/pais/colombia", "/provedores/buscar?nombre=Tec"])
+    def test_if_none_match_responde_304_sin_consultar(self, mock_controller, app, routes, url):
+        """Test de que con un If-None-Match vigente se responde 304 sin llegar al controlador"""
+        mock_controller.version_provedores.return_value = 7
+        for metodo in ("obtener_todos_los_provedores", "obtener_provedores_por_pais", "buscar_provedores_por_nombre"):
+            getattr(mock_controller, metodo).return_value = ({"success": True, "data": []}, 200)
+
+        with app.test_client() as client:
+            etag = client.get(url).headers["ETag"]
+            mock_controller.reset_mock(return_value=False)
+            response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        mock_controller.obtener_todos_los_provedores.assert_not_called()
+        mock_controller.obtener_provedores_por_pais.assert_not_called()
+        mock_controller.buscar_provedores_por_nombre.assert_not_called()
+
+    def test_if_none_match_vencido(self, mock_controller, app, routes):
+        """Test de que un ETag de una versión anterior devuelve el listado completo"""
+        mock_controller.version_provedores.return_value = 7
+        mock_controller.obtener_todos_los_provedores.return_value = ({"success": True, "data": []}, 200)
+
+        with app.test_client() as client:
+            etag = client.get("/provedores").headers["ETag"]
+            mock_controller.version_provedores.return_value = 8
+            response = client.get("/provedores", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"provedores-8-')